@@ -19,6 +19,9 @@ from .providers import AuthProvider, LoginFlow, auth_provider_from_config
 EVENT_USER_ADDED = "user_added"
 EVENT_USER_REMOVED = "user_removed"
 
+# Number of validated access tokens to remember
+ACCESS_TOKEN_CACHE_SIZE = 1024
+
 _MfaModuleDict = Dict[str, MultiFactorAuthModule]
 _ProviderKey = Tuple[str, Optional[str]]
 _ProviderDict = Dict[_ProviderKey, AuthProvider]
@@ -144,6 +147,10 @@ class AuthManager:
         self._providers = providers
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
+        # Access token -> (refresh token, expiration timestamp)
+        self._access_token_cache: "OrderedDict[str, Tuple[models.RefreshToken, float]]" = (
+            OrderedDict()
+        )
 
     @property
     def auth_providers(self) -> List[AuthProvider]:
@@ -277,6 +284,7 @@ class AuthManager:
             await asyncio.wait(tasks)
 
         await self._store.async_remove_user(user)
+        self._async_forget_access_tokens(user=user)
 
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
 
@@ -310,6 +318,7 @@ class AuthManager:
         if user.is_owner:
             raise ValueError("Unable to deactivate the owner")
         await self._store.async_deactivate_user(user)
+        self._async_forget_access_tokens(user=user)
 
     async def async_remove_credentials(self, credentials: models.Credentials) -> None:
         """Remove credentials."""
@@ -434,6 +443,21 @@ class AuthManager:
     ) -> None:
         """Delete a refresh token."""
         await self._store.async_remove_refresh_token(refresh_token)
+        self._async_forget_access_tokens(refresh_token=refresh_token)
+
+    @callback
+    def _async_forget_access_tokens(
+        self,
+        user: Optional[models.User] = None,
+        refresh_token: Optional[models.RefreshToken] = None,
+    ) -> None:
+        """Drop cached access tokens of a user or a refresh token."""
+        for token, (cached_refresh_token, _) in list(self._access_token_cache.items()):
+            if (
+                cached_refresh_token is refresh_token
+                or cached_refresh_token.user is user
+            ):
+                del self._access_token_cache[token]
 
     @callback
     def async_create_access_token(
@@ -457,6 +481,15 @@ class AuthManager:
         self, token: str
     ) -> Optional[models.RefreshToken]:
         """Return refresh token if an access token is valid."""
+        cached = self._access_token_cache.get(token)
+
+        if cached is not None:
+            refresh_token, expiration = cached
+            if dt_util.utcnow().timestamp() < expiration:
+                self._access_token_cache.move_to_end(token)
+                return refresh_token if refresh_token.user.is_active else None
+            del self._access_token_cache[token]
+
         try:
             unverif_claims = jwt.decode(token, verify=False)
         except jwt.InvalidTokenError:
@@ -474,13 +507,21 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt.decode(token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"])
+            claims = jwt.decode(
+                token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
+            )
         except jwt.InvalidTokenError:
             return None
 
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        if "exp" in claims:
+            # Stop using the cached result once the token expires
+            self._access_token_cache[token] = (refresh_token, claims["exp"])
+            if len(self._access_token_cache) > ACCESS_TOKEN_CACHE_SIZE:
+                self._access_token_cache.popitem(last=False)
+
         return refresh_token
 
     @callback
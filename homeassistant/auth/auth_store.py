@@ -7,7 +7,9 @@ from logging import getLogger
 from typing import Any, Dict, List, Optional
 
 from homeassistant.auth.const import ACCESS_TOKEN_EXPIRATION
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
+from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.util import dt as dt_util
 
 from . import models
@@ -37,6 +39,8 @@ class AuthStore:
         self._users: Optional[Dict[str, models.User]] = None
         self._groups: Optional[Dict[str, models.Group]] = None
         self._perm_lookup: Optional[PermissionLookup] = None
+        # Refresh tokens by token, built on first lookup
+        self._refresh_token_index: Optional[Dict[str, models.RefreshToken]] = None
         self._store = hass.helpers.storage.Store(
             STORAGE_VERSION, STORAGE_KEY, private=True
         )
@@ -141,6 +145,7 @@ class AuthStore:
             assert self._users is not None
 
         self._users.pop(user.id)
+        self._refresh_token_index = None
         self._async_schedule_save()
 
     async def async_update_user(
@@ -223,6 +228,7 @@ class AuthStore:
 
         refresh_token = models.RefreshToken(**kwargs)
         user.refresh_tokens[refresh_token.id] = refresh_token
+        self._refresh_token_index = None
 
         self._async_schedule_save()
         return refresh_token
@@ -237,6 +243,7 @@ class AuthStore:
 
         for user in self._users.values():
             if user.refresh_tokens.pop(refresh_token.id, None):
+                self._refresh_token_index = None
                 self._async_schedule_save()
                 break
 
@@ -263,12 +270,19 @@ class AuthStore:
             await self._async_load()
             assert self._users is not None
 
-        found = None
+        index = self._refresh_token_index
 
-        for user in self._users.values():
-            for refresh_token in user.refresh_tokens.values():
-                if hmac.compare_digest(refresh_token.token, token):
-                    found = refresh_token
+        if index is None:
+            index = self._refresh_token_index = {
+                refresh_token.token: refresh_token
+                for user in self._users.values()
+                for refresh_token in user.refresh_tokens.values()
+            }
+
+        found = index.get(token)
+
+        if found is None or not hmac.compare_digest(found.token, token):
+            return None
 
         return found
 
@@ -303,6 +317,17 @@ class AuthStore:
 
         self._perm_lookup = perm_lookup = PermissionLookup(ent_reg, dev_reg)
 
+        @callback
+        def registry_updated(event: Event) -> None:
+            """Forget cached entity permissions when a registry changes."""
+            perm_lookup.invalidate_entity_caches()
+
+        for event_type in (
+            EVENT_ENTITY_REGISTRY_UPDATED,
+            EVENT_DEVICE_REGISTRY_UPDATED,
+        ):
+            self.hass.bus.async_listen(event_type, registry_updated)
+
         if data is None:
             self._set_defaults()
             return
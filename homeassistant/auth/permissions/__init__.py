@@ -1,6 +1,7 @@
 """Permissions for Home Assistant."""
+import json
 import logging
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import voluptuous as vol
 
@@ -46,6 +47,7 @@ class PolicyPermissions(AbstractPermissions):
         """Initialize the permission class."""
         self._policy = policy
         self._perm_lookup = perm_lookup
+        self._entity_cache: Optional[Dict[Tuple[str, str], bool]] = None
 
     def access_all_entities(self, key: str) -> bool:
         """Check if we have a certain access to all entities."""
@@ -55,6 +57,25 @@ class PolicyPermissions(AbstractPermissions):
         """Return a function that can test entity access."""
         return compile_entities(self._policy.get(CAT_ENTITIES), self._perm_lookup)
 
+    def check_entity(self, entity_id: str, key: str) -> bool:
+        """Check if we can access entity, caching the result per policy."""
+        cache = self._entity_cache
+
+        if cache is None:
+            if self._perm_lookup is None:
+                cache = self._entity_cache = {}
+            else:
+                cache = self._entity_cache = self._perm_lookup.entity_cache(
+                    json.dumps(self._policy, sort_keys=True)
+                )
+
+        result = cache.get((entity_id, key))
+
+        if result is None:
+            result = cache[(entity_id, key)] = super().check_entity(entity_id, key)
+
+        return result
+
     def __eq__(self, other: Any) -> bool:
         """Equals check."""
         return isinstance(other, PolicyPermissions) and other._policy == self._policy
@@ -1,5 +1,5 @@
 """Models for permissions."""
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, Tuple
 
 import attr
 
@@ -17,3 +17,22 @@ class PermissionLookup:
 
     entity_registry: "ent_reg.EntityRegistry" = attr.ib()
     device_registry: "dev_reg.DeviceRegistry" = attr.ib()
+    # Entity permission results per policy, shared by users with equal policies
+    entity_caches: Dict[str, Dict[Tuple[str, str], bool]] = attr.ib(factory=dict)
+
+    def entity_cache(self, policy_key: str) -> Dict[Tuple[str, str], bool]:
+        """Return the entity permission cache of a policy."""
+        cache = self.entity_caches.get(policy_key)
+
+        if cache is None:
+            cache = self.entity_caches[policy_key] = {}
+
+        return cache
+
+    def invalidate_entity_caches(self) -> None:
+        """Forget cached entity permissions.
+
+        Area and device lookups depend on the registries.
+        """
+        for cache in self.entity_caches.values():
+            cache.clear()
@@ -17,10 +17,12 @@ from homeassistant import config as conf_util, config_entries, core, loader
 from homeassistant.components import http
 from homeassistant.const import REQUIRED_NEXT_PYTHON_DATE, REQUIRED_NEXT_PYTHON_VER
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_per_platform, warm_restart
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
     DATA_SETUP,
     DATA_SETUP_STARTED,
+    async_get_setup_timeline,
     async_set_domains_to_be_loaded,
     async_setup_component,
 )
@@ -197,6 +199,8 @@ async def async_from_config_dict(
     This method is a coroutine.
     """
     start = monotonic()
+    # Start the setup timeline here so it covers loading config entries
+    async_get_setup_timeline(hass)
 
     hass.config_entries = config_entries.ConfigEntries(hass, config)
     await hass.config_entries.async_initialize()
@@ -231,6 +235,9 @@ async def async_from_config_dict(
         )
         return None
 
+    if not hass.config.safe_mode:
+        await warm_restart.async_load(hass)
+
     await _async_set_up_integrations(hass, config)
 
     stop = monotonic()
@@ -423,6 +430,34 @@ async def async_setup_multi_components(
         )
 
 
+async def _async_preimport_integrations(
+    hass: core.HomeAssistant,
+    config: Dict[str, Any],
+    integrations: Dict[str, loader.Integration],
+) -> None:
+    """Import the integrations to set up and their platforms in the executor."""
+    entry_domains = set(hass.config_entries.async_domains())
+    platforms: Dict[str, Set[str]] = {}
+
+    for domain, integration in integrations.items():
+        if integration.config_flow and domain in entry_domains:
+            integration.async_preimport(["config_flow"])
+        else:
+            integration.async_preimport()
+
+        for platform_name, _ in config_per_platform(config, domain):
+            if isinstance(platform_name, str):
+                platforms.setdefault(platform_name, set()).add(domain)
+
+    for int_or_exc in await gather_with_concurrency(
+        loader.MAX_LOAD_CONCURRENTLY,
+        *(loader.async_get_integration(hass, domain) for domain in platforms),
+        return_exceptions=True,
+    ):
+        if isinstance(int_or_exc, loader.Integration):
+            int_or_exc.async_preimport(platforms[int_or_exc.domain])
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: Dict[str, Any]
 ) -> None:
@@ -471,6 +506,9 @@ async def _async_set_up_integrations(
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
+    # Import the integrations in the executor while the first ones set up
+    asyncio.create_task(_async_preimport_integrations(hass, config, integration_cache))
+
     logging_domains = domains_to_setup & LOGGING_INTEGRATIONS
 
     # Load logging as soon as possible
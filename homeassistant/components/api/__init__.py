@@ -1,9 +1,11 @@
 """Rest API for Home Assistant."""
 import asyncio
+from functools import lru_cache, partial
 import json
 import logging
+import uuid
 
-from aiohttp import web
+from aiohttp import hdrs, web
 from aiohttp.web_exceptions import HTTPBadRequest
 import async_timeout
 import voluptuous as vol
@@ -12,7 +14,12 @@ from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.bootstrap import DATA_LOGGING
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    EVENT_COMPONENT_LOADED,
+    EVENT_CORE_CONFIG_UPDATE,
     EVENT_HOMEASSISTANT_STOP,
+    EVENT_SERVICE_REGISTERED,
+    EVENT_SERVICE_REMOVED,
     EVENT_TIME_CHANGED,
     HTTP_BAD_REQUEST,
     HTTP_CREATED,
@@ -26,23 +33,34 @@ from homeassistant.const import (
     URL_API_ERROR_LOG,
     URL_API_EVENTS,
     URL_API_SERVICES,
+    URL_API_STARTUP_TRACE,
     URL_API_STATES,
     URL_API_STREAM,
     URL_API_TEMPLATE,
     __version__,
 )
 import homeassistant.core as ha
-from homeassistant.exceptions import ServiceNotFound, TemplateError, Unauthorized
+from homeassistant.exceptions import (
+    HomeAssistantError,
+    ServiceNotFound,
+    TemplateError,
+    Unauthorized,
+)
 from homeassistant.helpers import template
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import json_dumps
 from homeassistant.helpers.network import NoURLAvailableError, get_url
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.state import AsyncTrackStates
 from homeassistant.helpers.system_info import async_get_system_info
+from homeassistant.setup import async_get_setup_timeline
 
 _LOGGER = logging.getLogger(__name__)
 
 ATTR_BASE_URL = "base_url"
+ATTR_CREATED = "created"
+ATTR_ERROR = "error"
+ATTR_STATE = "state"
+ATTR_SUCCESS = "success"
 ATTR_EXTERNAL_URL = "external_url"
 ATTR_INTERNAL_URL = "internal_url"
 ATTR_LOCATION_NAME = "location_name"
@@ -52,8 +70,60 @@ ATTR_UUID = "uuid"
 ATTR_VERSION = "version"
 
 DOMAIN = "api"
+DATA_VERSIONS = "api_versions"
+VERSION_CONFIG = "config"
+VERSION_SERVICES = "services"
+VERSION_INSTANCE = "instance"
+
 STREAM_PING_PAYLOAD = "ping"
 STREAM_PING_INTERVAL = 50  # seconds
+STREAM_MAX_PENDING = 1024
+STREAM_OVERFLOW_DROP_OLDEST = "drop_oldest"
+STREAM_OVERFLOW_DISCONNECT = "disconnect"
+
+ATTR_ATTRIBUTES = "attributes"
+ATTR_FORCE_UPDATE = "force_update"
+ATTR_DOMAIN = "domain"
+ATTR_SERVICE = "service"
+ATTR_SERVICE_DATA = "service_data"
+
+# Items of batch requests, errors use the message of the first error
+BATCH_STATE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTITY_ID, msg="No entity_id specified."): vol.All(
+            str, msg="entity_id should be a string."
+        ),
+        vol.Required(ATTR_STATE, msg="No state specified."): vol.All(
+            vol.Any(str, int, float), msg="state should be a string or number."
+        ),
+        vol.Optional(ATTR_ATTRIBUTES): vol.All(
+            vol.Any(None, dict), msg="attributes should be an object."
+        ),
+        vol.Optional(ATTR_FORCE_UPDATE, default=False): vol.All(
+            bool, msg="force_update should be a boolean."
+        ),
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+BATCH_SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DOMAIN, msg="No domain and service specified."): vol.All(
+            str, msg="domain should be a string."
+        ),
+        vol.Required(ATTR_SERVICE, msg="No domain and service specified."): vol.All(
+            str, msg="service should be a string."
+        ),
+        vol.Optional(ATTR_SERVICE_DATA): vol.All(
+            vol.Any(None, dict), msg="service_data should be an object."
+        ),
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+# Counters shared by all event streams
+DATA_STREAM_STATS = "api_stream_stats"
+ATTR_DROPPED_EVENTS = "dropped_events"
+ATTR_DISCONNECTED_STREAMS = "disconnected_streams"
 
 
 async def async_setup(hass, config):
@@ -70,13 +140,38 @@ async def async_setup(hass, config):
     hass.http.register_view(APIDomainServicesView)
     hass.http.register_view(APIComponentsView)
     hass.http.register_view(APITemplateView)
+    hass.http.register_view(APIStartupTraceView)
 
     if DATA_LOGGING in hass.data:
         hass.http.register_view(APIErrorLog)
 
+    # Versions of the config and service data, used as ETags
+    versions = hass.data[DATA_VERSIONS] = {
+        VERSION_CONFIG: 0,
+        VERSION_SERVICES: 0,
+        VERSION_INSTANCE: uuid.uuid4().hex,
+    }
+
+    @ha.callback
+    def bump_version(key, event):
+        """Bump a version when its data changes."""
+        versions[key] += 1
+
+    for event_type in (EVENT_CORE_CONFIG_UPDATE, EVENT_COMPONENT_LOADED):
+        hass.bus.async_listen(event_type, partial(bump_version, VERSION_CONFIG))
+    for event_type in (EVENT_SERVICE_REGISTERED, EVENT_SERVICE_REMOVED):
+        hass.bus.async_listen(event_type, partial(bump_version, VERSION_SERVICES))
+
     return True
 
 
+@ha.callback
+def _async_etag(hass, key):
+    """Return the ETag of versioned data."""
+    versions = hass.data[DATA_VERSIONS]
+    return f"{versions[VERSION_INSTANCE]}-{key}-{versions[key]}"
+
+
 class APIStatusView(HomeAssistantView):
     """View to handle Status requests."""
 
@@ -101,28 +196,70 @@ class APIEventStream(HomeAssistantView):
             raise Unauthorized()
         hass = request.app["hass"]
         stop_obj = object()
-        to_write = asyncio.Queue()
+        to_write = asyncio.Queue(maxsize=STREAM_MAX_PENDING)
+        stats = hass.data.setdefault(
+            DATA_STREAM_STATS, {ATTR_DROPPED_EVENTS: 0, ATTR_DISCONNECTED_STREAMS: 0}
+        )
+        dropped = 0
 
         restrict = request.query.get("restrict")
         if restrict:
             restrict = restrict.split(",") + [EVENT_HOMEASSISTANT_STOP]
 
-        async def forward_events(event):
+        entity_ids = _split_query(request.query.get("entity_id"))
+        domains = _split_query(request.query.get("domain"))
+
+        overflow = request.query.get("overflow", STREAM_OVERFLOW_DROP_OLDEST)
+        if overflow not in (STREAM_OVERFLOW_DROP_OLDEST, STREAM_OVERFLOW_DISCONNECT):
+            return self.json_message("Invalid overflow policy.", HTTP_BAD_REQUEST)
+
+        @ha.callback
+        def forward_events(event):
             """Forward events to the open request."""
+            nonlocal dropped
+
             if event.event_type == EVENT_TIME_CHANGED:
                 return
 
             if restrict and event.event_type not in restrict:
                 return
 
+            if event.event_type == EVENT_HOMEASSISTANT_STOP:
+                data = stop_obj
+            else:
+                if (entity_ids or domains) and not _entity_matches(
+                    event, entity_ids, domains
+                ):
+                    return
+                data = _cached_event_payload(event)
+
             _LOGGER.debug("STREAM %s FORWARDING %s", id(stop_obj), event)
 
-            if event.event_type == EVENT_HOMEASSISTANT_STOP:
+            if not to_write.full():
+                to_write.put_nowait(data)
+                return
+
+            if data is not stop_obj and overflow == STREAM_OVERFLOW_DISCONNECT:
+                stats[ATTR_DISCONNECTED_STREAMS] += 1
+                _LOGGER.warning(
+                    "STREAM %s client exceeded %s pending events, disconnecting "
+                    "(%s streams disconnected since start)",
+                    id(stop_obj),
+                    STREAM_MAX_PENDING,
+                    stats[ATTR_DISCONNECTED_STREAMS],
+                )
                 data = stop_obj
+                # Free room for the stop marker
+                while not to_write.empty():
+                    to_write.get_nowait()
+                    dropped += 1
+                    stats[ATTR_DROPPED_EVENTS] += 1
             else:
-                data = json.dumps(event, cls=JSONEncoder)
+                to_write.get_nowait()
+                dropped += 1
+                stats[ATTR_DROPPED_EVENTS] += 1
 
-            await to_write.put(data)
+            to_write.put_nowait(data)
 
         response = web.StreamResponse()
         response.content_type = "text/event-stream"
@@ -148,18 +285,53 @@ class APIEventStream(HomeAssistantView):
                     _LOGGER.debug("STREAM %s WRITING %s", id(stop_obj), msg.strip())
                     await response.write(msg.encode("UTF-8"))
                 except asyncio.TimeoutError:
-                    await to_write.put(STREAM_PING_PAYLOAD)
+                    if not to_write.full():
+                        to_write.put_nowait(STREAM_PING_PAYLOAD)
 
         except asyncio.CancelledError:
             _LOGGER.debug("STREAM %s ABORT", id(stop_obj))
 
         finally:
+            if dropped:
+                _LOGGER.warning(
+                    "STREAM %s client was too slow, %s events dropped "
+                    "(%s events dropped since start)",
+                    id(stop_obj),
+                    dropped,
+                    stats[ATTR_DROPPED_EVENTS],
+                )
             _LOGGER.debug("STREAM %s RESPONSE CLOSED", id(stop_obj))
             unsub_stream()
 
         return response
 
 
+def _split_query(value):
+    """Split a comma separated query value into a set."""
+    if not value:
+        return None
+    return set(value.split(","))
+
+
+def _entity_matches(event, entity_ids, domains):
+    """Return if an event is about one of the entities or domains."""
+    entity_id = event.data.get(ATTR_ENTITY_ID)
+
+    if not isinstance(entity_id, str):
+        return False
+
+    if entity_ids and entity_id in entity_ids:
+        return True
+
+    return bool(domains) and ha.split_entity_id(entity_id)[0] in domains
+
+
+@lru_cache(maxsize=128)
+def _cached_event_payload(event):
+    """Serialize an event once for all open streams."""
+    return json_dumps(event, allow_nan=True)
+
+
 class APIConfigView(HomeAssistantView):
     """View to handle Configuration requests."""
 
@@ -169,7 +341,10 @@ class APIConfigView(HomeAssistantView):
     @ha.callback
     def get(self, request):
         """Get current configuration."""
-        return self.json(request.app["hass"].config.as_dict())
+        hass = request.app["hass"]
+        # The core state is part of the config but does not bump the version
+        etag = f"{_async_etag(hass, VERSION_CONFIG)}-{hass.state.value}"
+        return self.json_etag(request, etag, hass.config.as_dict())
 
 
 class APIDiscoveryView(HomeAssistantView):
@@ -231,6 +406,61 @@ class APIStatesView(HomeAssistantView):
         ]
         return self.json(states)
 
+    async def post(self, request):
+        """Update the states of several entities.
+
+        Returns a result for each state write, in order.
+        """
+        if not request["hass_user"].is_admin:
+            raise Unauthorized()
+        hass = request.app["hass"]
+        try:
+            data = await request.json()
+        except ValueError:
+            return self.json_message("Invalid JSON specified.", HTTP_BAD_REQUEST)
+
+        if not isinstance(data, list):
+            return self.json_message(
+                "A list of states should be specified.", HTTP_BAD_REQUEST
+            )
+
+        context = self.context(request)
+        results = []
+
+        # Write all states in one pass of the event loop
+        for item in data:
+            try:
+                item = _validate_batch_item(BATCH_STATE_SCHEMA, item)
+            except vol.Invalid as err:
+                results.append(_batch_error(err.msg, _batch_entity_id(item)))
+                continue
+
+            entity_id = item[ATTR_ENTITY_ID]
+            is_new_state = hass.states.get(entity_id) is None
+
+            try:
+                hass.states.async_set(
+                    entity_id,
+                    item[ATTR_STATE],
+                    item.get(ATTR_ATTRIBUTES),
+                    item[ATTR_FORCE_UPDATE],
+                    context,
+                )
+            except HomeAssistantError as err:
+                results.append(_batch_error(str(err), entity_id))
+                continue
+
+            results.append(
+                {
+                    ATTR_ENTITY_ID: entity_id,
+                    ATTR_SUCCESS: True,
+                    ATTR_CREATED: is_new_state,
+                    ATTR_STATE: hass.states.get(entity_id),
+                }
+            )
+
+        return self.json(results)
+
 
 class APIEntityStateView(HomeAssistantView):
     """View to handle EntityState requests."""
@@ -352,8 +582,57 @@ class APIServicesView(HomeAssistantView):
 
     async def get(self, request):
         """Get registered services."""
-        services = await async_services_json(request.app["hass"])
-        return self.json(services)
+        hass = request.app["hass"]
+        etag = _async_etag(hass, VERSION_SERVICES)
+        services = await async_services_json(hass)
+        return self.json_etag(request, etag, services)
+
+    async def post(self, request):
+        """Call several services.
+
+        The calls run concurrently. Returns a result for each call, in order.
+        """
+        hass = request.app["hass"]
+        try:
+            data = await request.json()
+        except ValueError:
+            return self.json_message("Data should be valid JSON.", HTTP_BAD_REQUEST)
+
+        if not isinstance(data, list):
+            return self.json_message(
+                "A list of service calls should be specified.", HTTP_BAD_REQUEST
+            )
+
+        context = self.context(request)
+
+        async def async_call(item):
+            """Call one service and return its result."""
+            try:
+                item = _validate_batch_item(BATCH_SERVICE_SCHEMA, item)
+            except vol.Invalid as err:
+                return _batch_error(err.msg)
+
+            try:
+                await hass.services.async_call(
+                    item[ATTR_DOMAIN],
+                    item[ATTR_SERVICE],
+                    item.get(ATTR_SERVICE_DATA),
+                    True,
+                    context,
+                )
+            except Unauthorized:
+                return _batch_error("Unauthorized.")
+            except (vol.Invalid, HomeAssistantError) as err:
+                return _batch_error(str(err))
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error calling %s.%s", item[ATTR_DOMAIN], item[ATTR_SERVICE]
+                )
+                return _batch_error("Unknown error.")
+
+            return {ATTR_SUCCESS: True}
+
+        return self.json(await asyncio.gather(*(async_call(item) for item in data)))
 
 
 class APIDomainServicesView(HomeAssistantView):
@@ -385,6 +664,28 @@ class APIDomainServicesView(HomeAssistantView):
         return self.json(changed_states)
 
 
+def _validate_batch_item(schema, item):
+    """Validate an item of a batch request."""
+    if not isinstance(item, dict):
+        raise vol.Invalid("Each item should be an object.")
+    return schema(item)
+
+
+def _batch_entity_id(item):
+    """Return the entity ID of an item of a batch request, if valid."""
+    if isinstance(item, dict) and isinstance(item.get(ATTR_ENTITY_ID), str):
+        return item[ATTR_ENTITY_ID]
+    return None
+
+
+def _batch_error(message, entity_id=None):
+    """Return the result of a failed item of a batch request."""
+    result = {ATTR_SUCCESS: False, ATTR_ERROR: message}
+    if entity_id is not None:
+        result[ATTR_ENTITY_ID] = entity_id
+    return result
+
+
 class APIComponentsView(HomeAssistantView):
     """View to handle Components requests."""
 
@@ -417,6 +718,26 @@ class APITemplateView(HomeAssistantView):
             )
 
 
+class APIStartupTraceView(HomeAssistantView):
+    """View to download the startup timeline as a Chrome trace."""
+
+    url = URL_API_STARTUP_TRACE
+    name = "api:startup-trace"
+
+    @ha.callback
+    def get(self, request):
+        """Return the startup timeline in the Chrome trace format."""
+        if not request["hass_user"].is_admin:
+            raise Unauthorized()
+        timeline = async_get_setup_timeline(request.app["hass"])
+        return self.json(
+            timeline.as_chrome_trace(),
+            headers={
+                hdrs.CONTENT_DISPOSITION: 'attachment; filename="startup_trace.json"'
+            },
+        )
+
+
 class APIErrorLog(HomeAssistantView):
     """View to fetch the API error log."""
 
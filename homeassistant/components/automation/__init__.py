@@ -1,4 +1,7 @@
 """Allow to set up simple automation rules via the config file."""
+import asyncio
+import hashlib
+import json
 import logging
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Union, cast
 
@@ -36,6 +39,10 @@ from homeassistant.helpers import condition, extract_domain_configs, template
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.reference_index import (
+    ReferenceIndex,
+    async_get_reference_index,
+)
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -76,6 +83,9 @@ CONF_SKIP_CONDITION = "skip_condition"
 CONF_STOP_ACTIONS = "stop_actions"
 DEFAULT_STOP_ACTIONS = True
 
+DATA_ENTITY_INDEX = "automation_entity_index"
+DATA_DEVICE_INDEX = "automation_device_index"
+
 EVENT_AUTOMATION_RELOADED = "automation_reloaded"
 EVENT_AUTOMATION_TRIGGERED = "automation_triggered"
 
@@ -97,19 +107,39 @@ def is_on(hass, entity_id):
     return hass.states.is_state(entity_id, STATE_ON)
 
 
+@callback
+def _async_entity_index(hass: HomeAssistant) -> ReferenceIndex:
+    """Return the index of entities referenced by automations."""
+    return async_get_reference_index(
+        hass,
+        DATA_ENTITY_INDEX,
+        lambda: (
+            (automation_entity.entity_id, automation_entity.referenced_entities)
+            for automation_entity in hass.data[DOMAIN].entities
+        ),
+    )
+
+
+@callback
+def _async_device_index(hass: HomeAssistant) -> ReferenceIndex:
+    """Return the index of devices referenced by automations."""
+    return async_get_reference_index(
+        hass,
+        DATA_DEVICE_INDEX,
+        lambda: (
+            (automation_entity.entity_id, automation_entity.referenced_devices)
+            for automation_entity in hass.data[DOMAIN].entities
+        ),
+    )
+
+
 @callback
 def automations_with_entity(hass: HomeAssistant, entity_id: str) -> List[str]:
     """Return all automations that reference the entity."""
     if DOMAIN not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if entity_id in automation_entity.referenced_entities
-    ]
+    return _async_entity_index(hass).async_referencing(entity_id)
 
 
 @callback
@@ -118,14 +148,7 @@ def entities_in_automation(hass: HomeAssistant, entity_id: str) -> List[str]:
     if DOMAIN not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    automation_entity = component.get_entity(entity_id)
-
-    if automation_entity is None:
-        return []
-
-    return list(automation_entity.referenced_entities)
+    return _async_entity_index(hass).async_referenced(entity_id)
 
 
 @callback
@@ -134,13 +157,7 @@ def automations_with_device(hass: HomeAssistant, device_id: str) -> List[str]:
     if DOMAIN not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if device_id in automation_entity.referenced_devices
-    ]
+    return _async_device_index(hass).async_referencing(device_id)
 
 
 @callback
@@ -149,14 +166,7 @@ def devices_in_automation(hass: HomeAssistant, entity_id: str) -> List[str]:
     if DOMAIN not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    automation_entity = component.get_entity(entity_id)
-
-    if automation_entity is None:
-        return []
-
-    return list(automation_entity.referenced_devices)
+    return _async_device_index(hass).async_referenced(entity_id)
 
 
 async def async_setup(hass, config):
@@ -194,8 +204,8 @@ async def async_setup(hass, config):
     )
 
     async def reload_service_handler(service_call):
-        """Remove all automations and load new ones from config."""
-        conf = await component.async_prepare_reload()
+        """Reload automations whose config was added, removed or changed."""
+        conf = await component.async_prepare_reload(skip_reset=True)
         if conf is None:
             return
         async_get_blueprints(hass).async_reset_cache()
@@ -221,6 +231,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         action_script,
         initial_state,
         variables,
+        config_fingerprint=None,
     ):
         """Initialize an automation entity."""
         self._id = automation_id
@@ -236,6 +247,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         self._referenced_devices: Optional[Set[str]] = None
         self._logger = LOGGER
         self._variables: ScriptVariables = variables
+        self.config_fingerprint: Optional[str] = config_fingerprint
 
     @property
     def name(self):
@@ -312,6 +324,9 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         """Startup with initial state or previous state."""
         await super().async_added_to_hass()
 
+        self._async_invalidate_indexes()
+        self.async_on_remove(self._async_invalidate_indexes)
+
         self._logger = logging.getLogger(
             f"{__name__}.{split_entity_id(self.entity_id)[1]}"
         )
@@ -350,6 +365,12 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         if enable_automation:
             await self.async_enable()
 
+    @callback
+    def _async_invalidate_indexes(self) -> None:
+        """Invalidate the reference indexes after this automation changed."""
+        _async_entity_index(self.hass).async_invalidate()
+        _async_device_index(self.hass).async_invalidate()
+
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on and update the state."""
         await self.async_enable()
@@ -491,8 +512,20 @@ async def _async_process_config(
 ) -> bool:
     """Process config and add automations.
 
+    Automations that are already running and whose config did not change are
+    kept untouched, all other existing automations are removed.
+
     Returns if blueprints were used.
     """
+    unchanged: Dict[str, List[AutomationEntity]] = {}
+    for existing in component.entities:
+        fingerprint = cast(AutomationEntity, existing).config_fingerprint
+        if fingerprint is not None:
+            unchanged.setdefault(fingerprint, []).append(
+                cast(AutomationEntity, existing)
+            )
+
+    kept: Set[str] = set()
     entities = []
     blueprints_used = False
 
@@ -525,6 +558,13 @@ async def _async_process_config(
             automation_id = config_block.get(CONF_ID)
             name = config_block.get(CONF_ALIAS) or f"{config_key} {list_no}"
 
+            config_fingerprint = _async_config_fingerprint(
+                name, getattr(config_block, "raw_config", None)
+            )
+            if unchanged.get(config_fingerprint):
+                kept.add(unchanged[config_fingerprint].pop().entity_id)
+                continue
+
             initial_state = config_block.get(CONF_INITIAL_STATE)
 
             action_script = Script(
@@ -558,22 +598,49 @@ async def _async_process_config(
                 action_script,
                 initial_state,
                 config_block.get(CONF_VARIABLES),
+                config_fingerprint,
             )
 
             entities.append(entity)
 
+    # Remove automations that were changed or removed before adding the new
+    # ones, so a changed automation can take over its old entity ID.
+    removed = [
+        component.async_remove_entity(existing.entity_id)
+        for existing in component.entities
+        if existing.entity_id not in kept
+    ]
+    if removed:
+        await asyncio.gather(*removed)
+
     if entities:
         await component.async_add_entities(entities)
 
     return blueprints_used
 
 
+@callback
+def _async_config_fingerprint(
+    name: str, raw_config: Optional[Dict[str, Any]]
+) -> Optional[str]:
+    """Return a hash identifying the config of an automation."""
+    if raw_config is None:
+        return None
+
+    try:
+        serialized = json.dumps([name, raw_config], sort_keys=True, default=repr)
+    except (TypeError, ValueError):
+        return None
+
+    return hashlib.sha256(serialized.encode()).hexdigest()
+
+
 async def _async_process_if(hass, config, p_config):
     """Process if checks."""
     if_configs = p_config[CONF_CONDITION]
 
     checks = []
-    for if_config in if_configs:
+    for if_config in sorted(if_configs, key=condition.async_condition_cost):
         try:
             checks.append(await condition.async_from_config(hass, if_config, False))
         except HomeAssistantError as ex:
@@ -51,12 +51,19 @@ PLATFORM_SCHEMA = vol.All(
 )
 
 
+class AutomationConfig(dict):
+    """Validated automation config that keeps a reference to the raw config."""
+
+    raw_config = None
+
+
 async def async_validate_config_item(hass, config, full_config=None):
     """Validate config item."""
     if blueprint.is_blueprint_instance_config(config):
         blueprints = async_get_blueprints(hass)
         return await blueprints.async_inputs_from_config(config)
 
+    raw_config = config
     config = PLATFORM_SCHEMA(config)
 
     config[CONF_TRIGGER] = await async_validate_trigger_config(
@@ -75,7 +82,10 @@ async def async_validate_config_item(hass, config, full_config=None):
         hass, config[CONF_ACTION]
     )
 
-    return config
+    automation_config = AutomationConfig(config)
+    automation_config.raw_config = raw_config
+
+    return automation_config
 
 
 async def _try_async_validate_config_item(hass, config, full_config=None):
@@ -259,15 +259,17 @@ async def async_setup(hass, config):
     is_dev = repo_path is not None
     root_path = _frontend_root(repo_path)
 
-    for path, should_cache in (
-        ("service_worker.js", False),
-        ("robots.txt", False),
-        ("onboarding.html", True),
-        ("static", True),
-        ("frontend_latest", True),
-        ("frontend_es5", True),
+    for path, should_cache, content_hashed in (
+        ("service_worker.js", False, False),
+        ("robots.txt", False, False),
+        ("onboarding.html", True, False),
+        ("static", True, True),
+        ("frontend_latest", True, True),
+        ("frontend_es5", True, True),
     ):
-        hass.http.register_static_path(f"/{path}", str(root_path / path), should_cache)
+        hass.http.register_static_path(
+            f"/{path}", str(root_path / path), should_cache, content_hashed
+        )
 
     hass.http.register_static_path(
         "/auth/authorize", str(root_path / "authorize.html"), False
@@ -30,6 +30,10 @@ from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
 )
+from homeassistant.helpers.reference_index import (
+    ReferenceIndex,
+    async_get_reference_index,
+)
 from homeassistant.helpers.reload import async_reload_integration_platforms
 from homeassistant.helpers.typing import HomeAssistantType
 from homeassistant.loader import bind_hass
@@ -39,6 +43,8 @@ from homeassistant.loader import bind_hass
 DOMAIN = "group"
 GROUP_ORDER = "group_order"
 
+DATA_ENTITY_INDEX = "group_entity_index"
+
 ENTITY_ID_FORMAT = DOMAIN + ".{}"
 
 CONF_ENTITIES = "entities"
@@ -200,13 +206,19 @@ def groups_with_entity(hass: HomeAssistantType, entity_id: str) -> List[str]:
     if DOMAIN not in hass.data:
         return []
 
-    groups = []
+    return _async_entity_index(hass).async_referencing(entity_id)
 
-    for group in hass.data[DOMAIN].entities:
-        if entity_id in group.tracking:
-            groups.append(group.entity_id)
 
-    return groups
+@callback
+def _async_entity_index(hass: HomeAssistantType) -> ReferenceIndex:
+    """Return the index of entities tracked by groups."""
+    return async_get_reference_index(
+        hass,
+        DATA_ENTITY_INDEX,
+        lambda: (
+            (group.entity_id, group.tracking) for group in hass.data[DOMAIN].entities
+        ),
+    )
 
 
 async def async_setup(hass, config):
@@ -575,6 +587,7 @@ class Group(Entity):
         """
         self._async_stop()
         self._set_tracked(entity_ids)
+        _async_entity_index(self.hass).async_invalidate()
         self._reset_tracked_state()
         self._async_start()
 
@@ -639,6 +652,9 @@ class Group(Entity):
 
     async def async_added_to_hass(self):
         """Handle addition to Home Assistant."""
+        _async_entity_index(self.hass).async_invalidate()
+        self.async_on_remove(_async_entity_index(self.hass).async_invalidate)
+
         if self.hass.state != CoreState.running:
             self.hass.bus.async_listen_once(
                 EVENT_HOMEASSISTANT_START, self._async_start
@@ -27,6 +27,10 @@ from homeassistant.helpers import (
     config_validation as cv,
     entity_platform,
 )
+from homeassistant.helpers.reference_index import (
+    ReferenceIndex,
+    async_get_reference_index,
+)
 from homeassistant.helpers.state import async_reproduce_state
 from homeassistant.loader import async_get_integration
 
@@ -75,6 +79,7 @@ def _ensure_no_intersection(value):
 CONF_SCENE_ID = "scene_id"
 CONF_SNAPSHOT = "snapshot_entities"
 DATA_PLATFORM = "homeassistant_scene"
+DATA_ENTITY_INDEX = "homeassistant_scene_entity_index"
 EVENT_SCENE_RELOADED = "scene_reloaded"
 STATES_SCHEMA = vol.All(dict, _convert_states)
 
@@ -117,19 +122,26 @@ SCENECONFIG = namedtuple("SceneConfig", [CONF_ID, CONF_NAME, CONF_ICON, STATES])
 _LOGGER = logging.getLogger(__name__)
 
 
+@callback
+def _async_entity_index(hass: HomeAssistant) -> ReferenceIndex:
+    """Return the index of entities in scenes."""
+    return async_get_reference_index(
+        hass,
+        DATA_ENTITY_INDEX,
+        lambda: (
+            (scene_entity.entity_id, scene_entity.scene_config.states)
+            for scene_entity in hass.data[DATA_PLATFORM].entities.values()
+        ),
+    )
+
+
 @callback
 def scenes_with_entity(hass: HomeAssistant, entity_id: str) -> List[str]:
     """Return all scenes that reference the entity."""
     if DATA_PLATFORM not in hass.data:
         return []
 
-    platform = hass.data[DATA_PLATFORM]
-
-    return [
-        scene_entity.entity_id
-        for scene_entity in platform.entities.values()
-        if entity_id in scene_entity.scene_config.states
-    ]
+    return _async_entity_index(hass).async_referencing(entity_id)
 
 
 @callback
@@ -138,14 +150,7 @@ def entities_in_scene(hass: HomeAssistant, entity_id: str) -> List[str]:
     if DATA_PLATFORM not in hass.data:
         return []
 
-    platform = hass.data[DATA_PLATFORM]
-
-    entity = platform.entities.get(entity_id)
-
-    if entity is None:
-        return []
-
-    return list(entity.scene_config.states)
+    return _async_entity_index(hass).async_referenced(entity_id)
 
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
@@ -306,6 +311,11 @@ class HomeAssistantScene(Scene):
             attributes[CONF_ID] = unique_id
         return attributes
 
+    async def async_added_to_hass(self) -> None:
+        """Update the reference index when added to Home Assistant."""
+        _async_entity_index(self.hass).async_invalidate()
+        self.async_on_remove(_async_entity_index(self.hass).async_invalidate)
+
     async def async_activate(self, **kwargs: Any) -> None:
         """Activate scene. Try to get entities into requested state."""
         await async_reproduce_state(
@@ -365,14 +365,22 @@ class HomeAssistantHTTP:
 
         self.app.router.add_route("GET", url, redirect)
 
-    def register_static_path(self, url_path, path, cache_headers=True):
-        """Register a folder or file to serve as a static path."""
+    def register_static_path(
+        self, url_path, path, cache_headers=True, content_hashed=False
+    ):
+        """Register a folder or file to serve as a static path.
+
+        Set content_hashed for folders of build output, where a file name
+        with a content hash always has the same content.
+        """
         if os.path.isdir(path):
             if cache_headers:
-                resource = CachingStaticResource
+                resource = CachingStaticResource(
+                    url_path, path, content_hashed=content_hashed
+                )
             else:
-                resource = web.StaticResource
-            self.app.router.register_resource(resource(url_path, path))
+                resource = web.StaticResource(url_path, path)
+            self.app.router.register_resource(resource)
             return
 
         if cache_headers:
@@ -1,22 +1,87 @@
 """Static file handling for HTTP component."""
+import mimetypes
 from pathlib import Path
+import re
+from typing import Dict, Optional
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse
+from aiohttp.web import FileResponse, Response
 from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
 from aiohttp.web_urldispatcher import StaticResource
+import attr
+
+from homeassistant.const import HTTP_NOT_MODIFIED
 
 # mypy: allow-untyped-defs
 
 CACHE_TIME = 31 * 86400  # = 1 month
 CACHE_HEADERS = {hdrs.CACHE_CONTROL: f"public, max-age={CACHE_TIME}"}
 
+IMMUTABLE_CACHE_TIME = 365 * 86400  # = 1 year
+IMMUTABLE_CACHE_HEADERS = {
+    hdrs.CACHE_CONTROL: f"public, max-age={IMMUTABLE_CACHE_TIME}, immutable"
+}
+
+# Build tools put a hash of the content in the file name, like
+# chunk.0a1b2c3d4e5f.js, so those files never change under the same name.
+CONTENT_HASHED_FILENAME = re.compile(r"(?:^|[._-])[0-9a-f]{8,}\.[0-9a-z]+$")
+
+# Precompressed variants that are served next to the original file,
+# in order of preference.
+PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+IDENTITY = "identity"
+
+MAX_MEMORY_FILE_SIZE = 128 * 1024
+MAX_MEMORY_CACHE_SIZE = 16 * 1024 * 1024
+
+
+@attr.s(slots=True)
+class StaticFile:
+    """A static file and its precompressed variants."""
+
+    path: Path = attr.ib()
+    content_type: str = attr.ib()
+    immutable: bool = attr.ib()
+    # Encoding -> path of the variant, always contains IDENTITY.
+    variants: Dict[str, Path] = attr.ib()
+    # Encoding -> content of the variants that are kept in memory.
+    bodies: Dict[str, bytes] = attr.ib(factory=dict)
+    last_modified: Optional[float] = attr.ib(default=None)
+
+
+def _accepted_encodings(request):
+    """Return the content codings the client accepts."""
+    accepted = set()
+    for coding in request.headers.get(hdrs.ACCEPT_ENCODING, "").split(","):
+        name, _, params = coding.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = params.strip().replace(" ", "")
+        if quality in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(name)
+    return accepted
+
 
 class CachingStaticResource(StaticResource):
-    """Static Resource handler that will add cache headers."""
+    """Static Resource handler that will add cache headers.
 
-    async def _handle(self, request):
-        rel_url = request.match_info["filename"]
+    Precompressed variants are served when the client accepts them. For
+    directories of build output, content_hashed marks content-hashed file
+    names as never changing, those files are indexed on first request and
+    small ones are kept in memory.
+    """
+
+    def __init__(self, *args, content_hashed=False, **kwargs):
+        """Initialize the resource."""
+        super().__init__(*args, **kwargs)
+        self._content_hashed = content_hashed
+        self._immutable_files: Dict[str, StaticFile] = {}
+        self._memory_size = 0
+
+    def _resolve(self, request, rel_url):
+        """Resolve a relative url to a file, None for a directory."""
         try:
             filename = Path(rel_url)
             if filename.anchor:
@@ -37,12 +102,85 @@ class CachingStaticResource(StaticResource):
 
         # on opening a dir, load its contents if allowed
         if filepath.is_dir():
-            return await super()._handle(request)
-        if filepath.is_file():
+            return None
+        if not filepath.is_file():
+            raise HTTPNotFound
+
+        content_type, _ = mimetypes.guess_type(str(filepath))
+        static_file = StaticFile(
+            filepath,
+            content_type or "application/octet-stream",
+            self._content_hashed
+            and CONTENT_HASHED_FILENAME.search(filepath.name) is not None,
+            {IDENTITY: filepath},
+        )
+        for encoding, extension in PRECOMPRESSED_ENCODINGS:
+            variant = filepath.with_name(filepath.name + extension)
+            if variant.is_file():
+                static_file.variants[encoding] = variant
+
+        if static_file.immutable:
+            static_file.last_modified = filepath.stat().st_mtime
+            for encoding, path in static_file.variants.items():
+                if path.stat().st_size <= MAX_MEMORY_FILE_SIZE:
+                    static_file.bodies[encoding] = path.read_bytes()
+
+        return static_file
+
+    def _add_immutable_file(self, rel_url, static_file):
+        """Index an immutable file, keeping its bodies if there is room."""
+        size = sum(len(body) for body in static_file.bodies.values())
+        if self._memory_size + size > MAX_MEMORY_CACHE_SIZE:
+            static_file.bodies.clear()
+        else:
+            self._memory_size += size
+        self._immutable_files[rel_url] = static_file
+
+    async def _handle(self, request):
+        rel_url = request.match_info["filename"]
+        static_file = self._immutable_files.get(rel_url)
+
+        if static_file is None:
+            static_file = await request.app.loop.run_in_executor(
+                None, self._resolve, request, rel_url
+            )
+            if static_file is None:
+                return await super()._handle(request)
+            if static_file.immutable and rel_url not in self._immutable_files:
+                self._add_immutable_file(rel_url, static_file)
+
+        accepted = _accepted_encodings(request)
+        encoding = IDENTITY
+        for candidate, _ in PRECOMPRESSED_ENCODINGS:
+            if candidate in accepted and candidate in static_file.variants:
+                encoding = candidate
+                break
+
+        headers = dict(
+            IMMUTABLE_CACHE_HEADERS if static_file.immutable else CACHE_HEADERS
+        )
+        headers[hdrs.CONTENT_TYPE] = static_file.content_type
+        if len(static_file.variants) > 1:
+            headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+        if encoding != IDENTITY:
+            headers[hdrs.CONTENT_ENCODING] = encoding
+
+        body = static_file.bodies.get(encoding)
+        if body is None:
             return FileResponse(
-                filepath,
+                static_file.variants[encoding],
                 chunk_size=self._chunk_size,
                 # type ignore: https://github.com/aio-libs/aiohttp/pull/3976
-                headers=CACHE_HEADERS,  # type: ignore
+                headers=headers,  # type: ignore
             )
-        raise HTTPNotFound
+
+        modified_since = request.if_modified_since
+        if (
+            modified_since is not None
+            and static_file.last_modified <= modified_since.timestamp()
+        ):
+            return Response(status=HTTP_NOT_MODIFIED, headers=headers)
+
+        response = Response(body=body, headers=headers)
+        response.last_modified = static_file.last_modified
+        return response
@@ -1,10 +1,9 @@
 """Support for views."""
 import asyncio
-import json
 import logging
 from typing import Any, Callable, List, Optional
 
-from aiohttp import web
+from aiohttp import hdrs, web
 from aiohttp.typedefs import LooseHeaders
 from aiohttp.web_exceptions import (
     HTTPBadRequest,
@@ -14,14 +13,22 @@ from aiohttp.web_exceptions import (
 import voluptuous as vol
 
 from homeassistant import exceptions
-from homeassistant.const import CONTENT_TYPE_JSON, HTTP_OK, HTTP_SERVICE_UNAVAILABLE
+from homeassistant.const import (
+    CONTENT_TYPE_JSON,
+    HTTP_NOT_MODIFIED,
+    HTTP_OK,
+    HTTP_SERVICE_UNAVAILABLE,
+)
 from homeassistant.core import Context, is_callback
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import json_bytes
 
 from .const import KEY_AUTHENTICATED, KEY_HASS
 
 _LOGGER = logging.getLogger(__name__)
 
+# Smaller JSON responses are not worth compressing
+JSON_COMPRESS_MIN_SIZE = 1024
+
 
 class HomeAssistantView:
     """Base view for all views."""
@@ -49,7 +56,7 @@ class HomeAssistantView:
     ) -> web.Response:
         """Return a JSON response."""
         try:
-            msg = json.dumps(result, cls=JSONEncoder, allow_nan=False).encode("UTF-8")
+            msg = json_bytes(result)
         except (ValueError, TypeError) as err:
             _LOGGER.error("Unable to serialize to JSON: %s\n%s", err, result)
             raise HTTPInternalServerError from err
@@ -59,9 +66,31 @@ class HomeAssistantView:
             status=status_code,
             headers=headers,
         )
-        response.enable_compression()
+        if len(msg) >= JSON_COMPRESS_MIN_SIZE:
+            response.enable_compression()
         return response
 
+    def json_etag(
+        self,
+        request: web.Request,
+        etag: str,
+        result: Any,
+        status_code: int = HTTP_OK,
+    ) -> web.Response:
+        """Return a JSON response tagged with a version.
+
+        Returns 304 without serializing when the client has that version.
+        """
+        etag = f'"{etag}"'
+        if_none_match = request.headers.get(hdrs.IF_NONE_MATCH)
+        if if_none_match is not None and (
+            if_none_match.strip() == "*"
+            or etag in (value.strip() for value in if_none_match.split(","))
+        ):
+            return web.Response(status=HTTP_NOT_MODIFIED, headers={hdrs.ETAG: etag})
+
+        return self.json(result, status_code, headers={hdrs.ETAG: etag})
+
     def json_message(
         self,
         message: str,
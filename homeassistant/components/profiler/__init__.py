@@ -11,7 +11,8 @@ from pyprof2calltree import convert
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.helpers.condition import async_get_condition_timings
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
@@ -24,6 +25,7 @@ SERVICE_MEMORY = "memory"
 SERVICE_START_LOG_OBJECTS = "start_log_objects"
 SERVICE_STOP_LOG_OBJECTS = "stop_log_objects"
 SERVICE_DUMP_LOG_OBJECTS = "dump_log_objects"
+SERVICE_LOG_CONDITION_TIMINGS = "log_condition_timings"
 
 SERVICES = (
     SERVICE_START,
@@ -31,6 +33,7 @@ SERVICES = (
     SERVICE_START_LOG_OBJECTS,
     SERVICE_STOP_LOG_OBJECTS,
     SERVICE_DUMP_LOG_OBJECTS,
+    SERVICE_LOG_CONDITION_TIMINGS,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -38,6 +41,7 @@ DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 CONF_SECONDS = "seconds"
 CONF_SCAN_INTERVAL = "scan_interval"
 CONF_TYPE = "type"
+CONF_LIMIT = "limit"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
 
@@ -99,6 +103,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
             notification_id="profile_object_dump",
         )
 
+    @callback
+    def _async_log_condition_timings(call: ServiceCall):
+        timings = async_get_condition_timings(hass)[: call.data[CONF_LIMIT]]
+
+        _LOGGER.critical(
+            "Slowest conditions: %s",
+            "".join(
+                f"\n{timing['condition']}: {timing['count']} evaluations, "
+                f"total {timing['total_time']:.6f}s, "
+                f"average {timing['average_time']:.6f}s, "
+                f"max {timing['max_time']:.6f}s"
+                for timing in timings
+            ),
+        )
+
+        hass.components.persistent_notification.async_create(
+            "Condition evaluation timings have been logged. See [the logs](/config/logs) to find the slowest conditions.",
+            title="Condition timings logged",
+            notification_id="profile_condition_timings",
+        )
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -149,6 +174,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         schema=vol.Schema({vol.Required(CONF_TYPE): str}),
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_LOG_CONDITION_TIMINGS,
+        _async_log_condition_timings,
+        schema=vol.Schema({vol.Optional(CONF_LIMIT, default=20): cv.positive_int}),
+    )
+
     return True
 
 
@@ -24,6 +24,10 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import make_entity_service_schema
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.reference_index import (
+    ReferenceIndex,
+    async_get_reference_index,
+)
 from homeassistant.helpers.script import (
     ATTR_CUR,
     ATTR_MAX,
@@ -41,6 +45,9 @@ _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "script"
 
+DATA_ENTITY_INDEX = "script_entity_index"
+DATA_DEVICE_INDEX = "script_device_index"
+
 ATTR_LAST_ACTION = "last_action"
 ATTR_LAST_TRIGGERED = "last_triggered"
 ATTR_VARIABLES = "variables"
@@ -88,19 +95,39 @@ def is_on(hass, entity_id):
     return hass.states.is_state(entity_id, STATE_ON)
 
 
+@callback
+def _async_entity_index(hass: HomeAssistant) -> ReferenceIndex:
+    """Return the index of entities referenced by scripts."""
+    return async_get_reference_index(
+        hass,
+        DATA_ENTITY_INDEX,
+        lambda: (
+            (script_entity.entity_id, script_entity.script.referenced_entities)
+            for script_entity in hass.data[DOMAIN].entities
+        ),
+    )
+
+
+@callback
+def _async_device_index(hass: HomeAssistant) -> ReferenceIndex:
+    """Return the index of devices referenced by scripts."""
+    return async_get_reference_index(
+        hass,
+        DATA_DEVICE_INDEX,
+        lambda: (
+            (script_entity.entity_id, script_entity.script.referenced_devices)
+            for script_entity in hass.data[DOMAIN].entities
+        ),
+    )
+
+
 @callback
 def scripts_with_entity(hass: HomeAssistant, entity_id: str) -> List[str]:
     """Return all scripts that reference the entity."""
     if DOMAIN not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if entity_id in script_entity.script.referenced_entities
-    ]
+    return _async_entity_index(hass).async_referencing(entity_id)
 
 
 @callback
@@ -109,14 +136,7 @@ def entities_in_script(hass: HomeAssistant, entity_id: str) -> List[str]:
     if DOMAIN not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    script_entity = component.get_entity(entity_id)
-
-    if script_entity is None:
-        return []
-
-    return list(script_entity.script.referenced_entities)
+    return _async_entity_index(hass).async_referenced(entity_id)
 
 
 @callback
@@ -125,13 +145,7 @@ def scripts_with_device(hass: HomeAssistant, device_id: str) -> List[str]:
     if DOMAIN not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if device_id in script_entity.script.referenced_devices
-    ]
+    return _async_device_index(hass).async_referencing(device_id)
 
 
 @callback
@@ -140,14 +154,7 @@ def devices_in_script(hass: HomeAssistant, entity_id: str) -> List[str]:
     if DOMAIN not in hass.data:
         return []
 
-    component = hass.data[DOMAIN]
-
-    script_entity = component.get_entity(entity_id)
-
-    if script_entity is None:
-        return []
-
-    return list(script_entity.script.referenced_devices)
+    return _async_device_index(hass).async_referenced(entity_id)
 
 
 async def async_setup(hass, config):
@@ -331,6 +338,17 @@ class ScriptEntity(ToggleEntity):
         """Turn script off."""
         await self.script.async_stop()
 
+    async def async_added_to_hass(self):
+        """Update the reference indexes when added to Home Assistant."""
+        self._async_invalidate_indexes()
+        self.async_on_remove(self._async_invalidate_indexes)
+
+    @callback
+    def _async_invalidate_indexes(self):
+        """Invalidate the reference indexes after this script changed."""
+        _async_entity_index(self.hass).async_invalidate()
+        _async_device_index(self.hass).async_invalidate()
+
     async def async_will_remove_from_hass(self):
         """Stop script and remove service when it will be removed from Home Assistant."""
         await self.script.async_stop()
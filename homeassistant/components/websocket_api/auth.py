@@ -7,6 +7,7 @@ from homeassistant.components.http.ban import process_success_login, process_wro
 from homeassistant.const import __version__
 
 from .connection import ActiveConnection
+from .const import CONF_COALESCE_MESSAGES
 from .error import Disconnect
 
 # mypy: allow-untyped-calls, allow-untyped-defs
@@ -21,13 +22,17 @@ AUTH_MESSAGE_SCHEMA = vol.Schema(
         vol.Required("type"): TYPE_AUTH,
         vol.Exclusive("api_password", "auth"): str,
         vol.Exclusive("access_token", "auth"): str,
+        vol.Optional(CONF_COALESCE_MESSAGES, default=False): bool,
     }
 )
 
 
-def auth_ok_message():
+def auth_ok_message(coalesce_messages=False):
     """Return an auth_ok message."""
-    return {"type": TYPE_AUTH_OK, "ha_version": __version__}
+    message = {"type": TYPE_AUTH_OK, "ha_version": __version__}
+    if coalesce_messages:
+        message[CONF_COALESCE_MESSAGES] = True
+    return message
 
 
 def auth_required_message():
@@ -51,6 +56,7 @@ class AuthPhase:
         self._request = request
         self._authenticated = False
         self._connection = None
+        self.coalesce_messages = False
 
     async def async_handle(self, msg):
         """Handle authentication."""
@@ -64,6 +70,8 @@ class AuthPhase:
             self._send_message(auth_invalid_message(error_msg))
             raise Disconnect from err
 
+        self.coalesce_messages = msg[CONF_COALESCE_MESSAGES]
+
         if "access_token" in msg:
             self._logger.debug("Received access_token")
             refresh_token = await self._hass.auth.async_validate_access_token(
@@ -82,7 +90,7 @@ class AuthPhase:
         """Create an active connection."""
         self._logger.debug("Auth OK")
         await process_success_login(self._request)
-        self._send_message(auth_ok_message())
+        self._send_message(auth_ok_message(self.coalesce_messages))
         return ActiveConnection(
             self._logger, self._hass, self._send_message, user, refresh_token
         )
@@ -14,10 +14,15 @@ from homeassistant.exceptions import (
     Unauthorized,
 )
 from homeassistant.helpers import config_validation as cv, entity
-from homeassistant.helpers.event import TrackTemplate, async_track_template_result
+from homeassistant.helpers.event import (
+    TrackTemplate,
+    async_track_state_change_event,
+    async_track_template_result,
+)
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.helpers.template import Template
 from homeassistant.loader import IntegrationNotFound, async_get_integration
+from homeassistant.setup import async_get_setup_timeline
 
 from . import const, decorators, messages
 
@@ -29,6 +34,7 @@ def async_register_commands(hass, async_reg):
     """Register commands."""
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_unsubscribe_events)
+    async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_call_service)
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_get_services)
@@ -37,6 +43,7 @@ def async_register_commands(hass, async_reg):
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_manifest_get)
+    async_reg(hass, handle_startup_timeline)
     async_reg(hass, handle_entity_source)
     async_reg(hass, handle_subscribe_trigger)
     async_reg(hass, handle_test_condition)
@@ -94,6 +101,45 @@ def handle_subscribe_events(hass, connection, msg):
     connection.send_message(messages.result_message(msg["id"]))
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "subscribe_entities",
+        vol.Required("entity_ids"): cv.entity_ids,
+    }
+)
+def handle_subscribe_entities(hass, connection, msg):
+    """Handle subscribe entities command.
+
+    Sends the current states of the entities once, then only what changes.
+    """
+    entity_perm = connection.user.permissions.check_entity
+    entity_ids = [
+        entity_id
+        for entity_id in msg["entity_ids"]
+        if entity_perm(entity_id, POLICY_READ)
+    ]
+
+    @callback
+    def forward_entity_changes(event):
+        """Forward entity state changes to websocket."""
+        connection.send_message(messages.cached_state_diff_message(msg["id"], event))
+
+    connection.subscriptions[msg["id"]] = async_track_state_change_event(
+        hass, entity_ids, forward_entity_changes
+    )
+
+    connection.send_message(messages.result_message(msg["id"]))
+    states = {}
+    for entity_id in entity_ids:
+        state = hass.states.get(entity_id)
+        if state is not None:
+            states[entity_id] = messages.compressed_state_dict(state)
+    connection.send_message(
+        messages.event_message(msg["id"], {messages.ENTITY_EVENT_ADD: states})
+    )
+
+
 @callback
 @decorators.websocket_command(
     {
@@ -168,29 +214,93 @@ async def handle_call_service(hass, connection, msg):
         )
 
 
-@callback
 @decorators.websocket_command({vol.Required("type"): "get_states"})
-def handle_get_states(hass, connection, msg):
+@decorators.async_response
+async def handle_get_states(hass, connection, msg):
     """Handle get states command."""
     if connection.user.permissions.access_all_entities("read"):
-        states = hass.states.async_all()
-    else:
-        entity_perm = connection.user.permissions.check_entity
-        states = [
-            state
-            for state in hass.states.async_all()
-            if entity_perm(state.entity_id, "read")
-        ]
+        states_json = hass.data.get(const.DATA_STATES_JSON)
+        if states_json is None:
+            states_json = hass.data[const.DATA_STATES_JSON] = _StatesJSON(hass)
+
+        # Events after the states are taken are sent after the result
+        place = connection.async_hold_messages()
+        message = None
+        try:
+            result = await states_json.async_get()
+        except (ValueError, TypeError):
+            # Let the regular serialization report what is wrong
+            message = messages.result_message(msg["id"], hass.states.async_all())
+        else:
+            message = messages.result_message_json(msg["id"], result)
+        finally:
+            connection.async_release_messages(place, message)
+        return
+
+    entity_perm = connection.user.permissions.check_entity
+    states = [
+        state
+        for state in hass.states.async_all()
+        if entity_perm(state.entity_id, "read")
+    ]
 
     connection.send_message(messages.result_message(msg["id"], states))
 
 
+class _StatesJSON:
+    """All states serialized to JSON, shared by connections until a state changes.
+
+    The states are taken on the loop and serialized in the executor, so large
+    installs do not stall the loop when many clients fetch the states at once.
+    """
+
+    def __init__(self, hass):
+        """Initialize the shared states JSON."""
+        self._hass = hass
+        self._json = None
+        self._pending = None
+        hass.bus.async_listen(EVENT_STATE_CHANGED, self._async_state_changed)
+
+    @callback
+    def _async_state_changed(self, event):
+        """Forget the serialized states."""
+        self._json = None
+        self._pending = None
+
+    async def async_get(self):
+        """Return the states as they are when called, as JSON."""
+        if self._json is not None:
+            return self._json
+
+        pending = self._pending
+        if pending is None:
+            pending = self._pending = self._hass.async_add_executor_job(
+                const.JSON_DUMP, self._hass.states.async_all()
+            )
+
+        # Other connections may be waiting for the same result
+        result = await asyncio.shield(pending)
+        if self._pending is pending:
+            self._pending = None
+            self._json = result
+        return result
+
+
 @decorators.websocket_command({vol.Required("type"): "get_services"})
 @decorators.async_response
 async def handle_get_services(hass, connection, msg):
     """Handle get services command."""
     descriptions = await async_get_all_descriptions(hass)
-    connection.send_message(messages.result_message(msg["id"], descriptions))
+
+    # Serialized once and shared until the descriptions change
+    services_json = hass.data.get(const.DATA_SERVICES_JSON)
+    if services_json is None or services_json[0] is not descriptions:
+        services_json = hass.data[const.DATA_SERVICES_JSON] = (
+            descriptions,
+            const.JSON_DUMP(descriptions),
+        )
+
+    connection.send_message(messages.result_message_json(msg["id"], services_json[1]))
 
 
 @callback
@@ -230,6 +340,14 @@ async def handle_manifest_get(hass, connection, msg):
         connection.send_error(msg["id"], const.ERR_NOT_FOUND, "Integration not found")
 
 
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "startup/timeline"})
+def handle_startup_timeline(hass, connection, msg):
+    """Handle startup timeline command."""
+    connection.send_result(msg["id"], async_get_setup_timeline(hass).as_dict())
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(hass, connection, msg):
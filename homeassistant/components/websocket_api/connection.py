@@ -1,6 +1,6 @@
 """Connection session."""
 import asyncio
-from typing import Any, Callable, Dict, Hashable, Optional
+from typing import Any, Callable, Dict, Hashable, List, Optional
 
 import voluptuous as vol
 
@@ -12,6 +12,10 @@ from . import const, messages
 # mypy: allow-untyped-calls, allow-untyped-defs
 
 
+class _HeldMessage:
+    """Place of a message sent once it is ready, messages after it are held."""
+
+
 class ActiveConnection:
     """Handle an active websocket client connection."""
 
@@ -19,7 +23,8 @@ class ActiveConnection:
         """Initialize an active connection."""
         self.logger = logger
         self.hass = hass
-        self.send_message = send_message
+        self._send_message = send_message
+        self._held_messages: List[Any] = []
         self.user = user
         if refresh_token:
             self.refresh_token_id = refresh_token.id
@@ -36,6 +41,39 @@ class ActiveConnection:
             return Context()
         return Context(user_id=user.id)
 
+    @callback
+    def send_message(self, message: Any) -> None:
+        """Send a message, unless it is held behind a message not ready yet."""
+        if self._held_messages:
+            self._held_messages.append(message)
+        else:
+            self._send_message(message)
+
+    @callback
+    def async_hold_messages(self) -> _HeldMessage:
+        """Hold the messages sent from now on, until the returned place is filled.
+
+        Used for results that take a while to prepare but must be sent before
+        the events that happen after they were taken.
+        """
+        place = _HeldMessage()
+        self._held_messages.append(place)
+        return place
+
+    @callback
+    def async_release_messages(
+        self, place: _HeldMessage, message: Optional[Any]
+    ) -> None:
+        """Send the message in its place and the messages held behind it."""
+        held = self._held_messages
+        if message is None:
+            held.remove(place)
+        else:
+            held[held.index(place)] = message
+
+        while held and not isinstance(held[0], _HeldMessage):
+            self._send_message(held.pop(0))
+
     @callback
     def send_result(self, msg_id: int, result: Optional[Any] = None) -> None:
         """Send a result message."""
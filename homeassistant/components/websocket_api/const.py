@@ -1,12 +1,10 @@
 """Websocket constants."""
 import asyncio
 from concurrent import futures
-from functools import partial
-import json
 from typing import TYPE_CHECKING, Callable
 
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import json_dumps
 
 if TYPE_CHECKING:
     from .connection import ActiveConnection  # noqa
@@ -20,6 +18,10 @@ PENDING_MSG_PEAK = 512
 PENDING_MSG_PEAK_TIME = 5
 MAX_PENDING_MSG = 2048
 
+# Auth message flag for clients that accept several messages per frame,
+# sent as a JSON array.
+CONF_COALESCE_MESSAGES = "coalesce_messages"
+
 ERR_ID_REUSE = "id_reuse"
 ERR_INVALID_FORMAT = "invalid_format"
 ERR_NOT_FOUND = "not_found"
@@ -45,4 +47,10 @@ SIGNAL_WEBSOCKET_DISCONNECTED = "websocket_disconnected"
 # Data used to store the current connection list
 DATA_CONNECTIONS = f"{DOMAIN}.connections"
 
-JSON_DUMP = partial(json.dumps, cls=JSONEncoder, allow_nan=False)
+# Data used to share the serialized states between connections
+DATA_STATES_JSON = f"{DOMAIN}.states_json"
+
+# Data used to share the serialized service descriptions between connections
+DATA_SERVICES_JSON = f"{DOMAIN}.services_json"
+
+JSON_DUMP = json_dumps
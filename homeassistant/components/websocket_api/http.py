@@ -63,22 +63,38 @@ class WebSocketHandler:
         self._writer_task = None
         self._logger = WebSocketAdapter(_WS_LOGGER, {"connid": id(self)})
         self._peak_checker_unsub = None
+        self._coalesce_messages = False
 
     async def _writer(self):
         """Write outgoing messages."""
         # Exceptions if Socket disconnected or cancelled by connection handler
         with suppress(RuntimeError, ConnectionResetError, *CANCELLATION_ERRORS):
-            while not self.wsock.closed:
+            closing = False
+            while not closing and not self.wsock.closed:
                 message = await self._to_write.get()
                 if message is None:
                     break
 
-                self._logger.debug("Sending %s", message)
+                messages = [message]
+                # Drain whatever else is pending into the same frame
+                if self._coalesce_messages:
+                    while not self._to_write.empty():
+                        message = self._to_write.get_nowait()
+                        if message is None:
+                            closing = True
+                            break
+                        messages.append(message)
 
-                if not isinstance(message, str):
-                    message = message_to_json(message)
+                for idx, message in enumerate(messages):
+                    self._logger.debug("Sending %s", message)
 
-                await self.wsock.send_str(message)
+                    if not isinstance(message, str):
+                        messages[idx] = message_to_json(message)
+
+                if len(messages) == 1:
+                    await self.wsock.send_str(messages[0])
+                else:
+                    await self.wsock.send_str(f"[{','.join(messages)}]")
 
         # Clean up the peaker checker when we shut down the writer
         if self._peak_checker_unsub:
@@ -185,6 +201,7 @@ class WebSocketHandler:
 
             self._logger.debug("Received %s", msg_data)
             connection = await auth.async_handle(msg_data)
+            self._coalesce_messages = auth.coalesce_messages
             self.hass.data[DATA_CONNECTIONS] = (
                 self.hass.data.get(DATA_CONNECTIONS, 0) + 1
             )
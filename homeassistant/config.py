@@ -49,6 +49,7 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as CONF_CORE, SOURCE_YAML, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_per_platform, extract_domain_configs
+from homeassistant.helpers.config_cache import async_get_config_cache
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_values import EntityValues
 from homeassistant.loader import Integration, IntegrationNotFound
@@ -58,7 +59,7 @@ from homeassistant.requirements import (
 )
 from homeassistant.util.package import is_docker_env
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM
-from homeassistant.util.yaml import SECRET_YAML, load_yaml
+from homeassistant.util.yaml import SECRET_YAML, YamlCache, load_yaml
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -309,24 +310,36 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> Dict:
 
     This function allow a component inside the asyncio loop to reload its
     configuration by itself. Include package merge.
+
+    Parsed files are cached in the configuration cache, so only the files
+    that changed since the configuration was last loaded are parsed.
     """
+    cache = await async_get_config_cache(hass)
+
     # Not using async_add_executor_job because this is an internal method.
     config = await hass.loop.run_in_executor(
-        None, load_yaml_config_file, hass.config.path(YAML_CONFIG_FILE)
+        None, load_yaml_config_file, hass.config.path(YAML_CONFIG_FILE), cache.yaml
     )
+    if cache.yaml.changed:
+        cache.async_schedule_save()
     core_config = config.get(CONF_CORE, {})
     await merge_packages_config(hass, config, core_config.get(CONF_PACKAGES, {}))
     return config
 
 
-def load_yaml_config_file(config_path: str) -> Dict[Any, Any]:
+def load_yaml_config_file(
+    config_path: str, cache: Optional[YamlCache] = None
+) -> Dict[Any, Any]:
     """Parse a YAML configuration file.
 
     Raises FileNotFoundError or HomeAssistantError.
 
     This method needs to run in an executor.
     """
-    conf_dict = load_yaml(config_path)
+    if cache is None:
+        conf_dict = load_yaml(config_path)
+    else:
+        conf_dict = cache.load(config_path)
 
     if not isinstance(conf_dict, dict):
         msg = (
@@ -775,10 +788,14 @@ async def async_process_component_config(
             _LOGGER.exception("Unknown error calling %s config validator", domain)
             return None
 
+    cache = await async_get_config_cache(hass)
+
     # No custom config validator, proceed with schema validation
     if hasattr(component, "CONFIG_SCHEMA"):
         try:
-            return component.CONFIG_SCHEMA(config)  # type: ignore
+            return await async_validate_config_schema(
+                hass, integration, component.CONFIG_SCHEMA, config  # type: ignore
+            )
         except vol.Invalid as ex:
             async_log_exception(ex, domain, config, hass, integration.documentation)
             return None
@@ -786,9 +803,12 @@ async def async_process_component_config(
             _LOGGER.exception("Unknown error calling %s CONFIG_SCHEMA", domain)
             return None
 
-    component_platform_schema = getattr(
-        component, "PLATFORM_SCHEMA_BASE", getattr(component, "PLATFORM_SCHEMA", None)
+    schema_name = (
+        "PLATFORM_SCHEMA_BASE"
+        if hasattr(component, "PLATFORM_SCHEMA_BASE")
+        else "PLATFORM_SCHEMA"
     )
+    component_platform_schema = getattr(component, schema_name, None)
 
     if component_platform_schema is None:
         return config
@@ -797,7 +817,12 @@ async def async_process_component_config(
     for p_name, p_config in config_per_platform(config, domain):
         # Validate component specific platform schema
         try:
-            p_validated = component_platform_schema(p_config)
+            p_validated = await cache.async_validate(
+                [integration],
+                f"{domain}.{schema_name}",
+                component_platform_schema,
+                p_config,
+            )
         except vol.Invalid as ex:
             async_log_exception(ex, domain, p_config, hass, integration.documentation)
             continue
@@ -831,7 +856,12 @@ async def async_process_component_config(
         # Validate platform specific schema
         if hasattr(platform, "PLATFORM_SCHEMA"):
             try:
-                p_validated = platform.PLATFORM_SCHEMA(p_config)  # type: ignore
+                p_validated = await cache.async_validate(
+                    [integration, p_integration],
+                    f"{p_name}.{domain}.PLATFORM_SCHEMA",
+                    platform.PLATFORM_SCHEMA,  # type: ignore
+                    p_config,
+                )
             except vol.Invalid as ex:
                 async_log_exception(
                     ex,
@@ -859,6 +889,29 @@ async def async_process_component_config(
     return config
 
 
+async def async_validate_config_schema(
+    hass: HomeAssistant,
+    integration: Integration,
+    config_schema: Callable[[Dict], Dict],
+    config: Dict,
+) -> Dict:
+    """Validate the configuration of an integration with its CONFIG_SCHEMA.
+
+    The schema is only given the configuration of the domain, the rest of
+    the configuration is kept as is. That is all an integration validates,
+    and it lets the result be reused while that part doesn't change.
+    """
+    filter_keys = extract_domain_configs(config, integration.domain)
+    cache = await async_get_config_cache(hass)
+    validated = await cache.async_validate(
+        [integration],
+        f"{integration.domain}.CONFIG_SCHEMA",
+        config_schema,
+        {key: config[key] for key in filter_keys},
+    )
+    return {**config_without_domain(config, integration.domain), **validated}
+
+
 @callback
 def config_without_domain(config: Dict, domain: str) -> Dict:
     """Return a config with all configuration for a domain removed."""
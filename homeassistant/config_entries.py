@@ -2,6 +2,7 @@
 import asyncio
 import functools
 import logging
+from timeit import default_timer as timer
 from types import MappingProxyType
 from typing import Any, Callable, Dict, List, Optional, Set, Union, cast
 import weakref
@@ -14,7 +15,11 @@ from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
 from homeassistant.helpers import entity_registry
 from homeassistant.helpers.event import Event
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
-from homeassistant.setup import async_process_deps_reqs, async_setup_component
+from homeassistant.setup import (
+    async_process_deps_reqs,
+    async_record_setup_phase,
+    async_setup_component,
+)
 from homeassistant.util.decorator import Registry
 import homeassistant.util.uuid as uuid_util
 
@@ -200,6 +205,7 @@ class ConfigEntry:
         if integration is None:
             integration = await loader.async_get_integration(hass, self.domain)
 
+        await integration.async_wait_preimport()
         self.supports_unload = await support_entry_unload(hass, self.domain)
 
         try:
@@ -216,6 +222,7 @@ class ConfigEntry:
             return
 
         if self.domain == integration.domain:
+            await integration.async_wait_preimport("config_flow")
             try:
                 integration.get_platform("config_flow")
             except ImportError as err:
@@ -233,6 +240,7 @@ class ConfigEntry:
                 self.state = ENTRY_STATE_MIGRATION_ERROR
                 return
 
+        start = timer()
         try:
             result = await component.async_setup_entry(hass, self)  # type: ignore
 
@@ -266,6 +274,9 @@ class ConfigEntry:
                 "Error setting up entry %s for %s", self.title, integration.domain
             )
             result = False
+        finally:
+            if self.domain == integration.domain:
+                async_record_setup_phase(hass, self.domain, "setup_entry", start)
 
         # Only store setup result as state if it was not forwarded.
         if self.domain != integration.domain:
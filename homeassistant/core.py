@@ -10,6 +10,7 @@ import enum
 import functools
 from ipaddress import ip_address
 import logging
+import math
 import os
 import pathlib
 import re
@@ -131,6 +132,19 @@ def valid_entity_id(entity_id: str) -> bool:
     return VALID_ENTITY_ID.match(entity_id) is not None
 
 
+def _has_non_finite_float(value: Any) -> bool:
+    """Test if a value contains NaN or infinite floats."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, Mapping):
+        return any(_has_non_finite_float(item) for item in value.values())
+    if isinstance(value, (list, tuple, set)):
+        return any(_has_non_finite_float(item) for item in value)
+    if hasattr(value, "as_dict"):
+        return _has_non_finite_float(value.as_dict())
+    return False
+
+
 def valid_state(state: str) -> bool:
     """Test if a state is valid."""
     return len(state) < 256
@@ -524,6 +538,7 @@ class HomeAssistant:
 
         # stage 1
         self.state = CoreState.stopping
+        self.exit_code = exit_code
         self.async_track_tasks()
         self.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
         try:
@@ -556,7 +571,6 @@ class HomeAssistant:
                 "Timed out waiting for shutdown stage 3 to complete, the shutdown will continue"
             )
 
-        self.exit_code = exit_code
         self.state = CoreState.stopped
 
         if self._stopped is not None:
@@ -838,6 +852,7 @@ class State:
         "domain",
         "object_id",
         "_as_dict",
+        "_has_non_finite_float",
     ]
 
     def __init__(
@@ -873,6 +888,7 @@ class State:
         self.context = context or Context()
         self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: Optional[Dict[str, Collection[Any]]] = None
+        self._has_non_finite_float: Optional[bool] = None
 
     @property
     def name(self) -> str:
@@ -905,6 +921,18 @@ class State:
             }
         return self._as_dict
 
+    def has_non_finite_float(self) -> bool:
+        """Return if the attributes contain NaN or infinite floats.
+
+        Async friendly.
+
+        Those can't be serialized to JSON. The result is cached, like the
+        dict representation.
+        """
+        if self._has_non_finite_float is None:
+            self._has_non_finite_float = _has_non_finite_float(self.attributes)
+        return self._has_non_finite_float
+
     @classmethod
     def from_dict(cls, json_dict: Dict) -> Any:
         """Initialize a state from a dict.
@@ -966,6 +994,8 @@ class StateMachine:
         """Initialize state machine."""
         self._states: Dict[str, State] = {}
         self._reservations: Set[str] = set()
+        # Entity IDs with a restored state that was not replaced yet
+        self._restored: Set[str] = set()
         self._bus = bus
         self._loop = loop
 
@@ -1072,6 +1102,7 @@ class StateMachine:
         """
         entity_id = entity_id.lower()
         old_state = self._states.pop(entity_id, None)
+        self._restored.discard(entity_id)
 
         if entity_id in self._reservations:
             self._reservations.remove(entity_id)
@@ -1122,7 +1153,7 @@ class StateMachine:
         entity_id are added.
         """
         entity_id = entity_id.lower()
-        if entity_id in self._states or entity_id in self._reservations:
+        if not self.async_available(entity_id):
             raise HomeAssistantError(
                 "async_reserve must not be called once the state is in the state machine."
             )
@@ -1133,7 +1164,33 @@ class StateMachine:
     def async_available(self, entity_id: str) -> bool:
         """Check to see if an entity_id is available to be used."""
         entity_id = entity_id.lower()
-        return entity_id not in self._states and entity_id not in self._reservations
+        return (
+            entity_id not in self._states or entity_id in self._restored
+        ) and entity_id not in self._reservations
+
+    @callback
+    def async_restore(self, states: Iterable[State]) -> None:
+        """Add the states from before a restart, without firing events.
+
+        The entity IDs of restored states stay available to be used, the
+        first state set for an entity replaces its restored state.
+
+        This method must be run in the event loop.
+        """
+        for state in states:
+            entity_id = state.entity_id
+            if entity_id in self._states or entity_id in self._reservations:
+                continue
+            self._states[entity_id] = state
+            self._restored.add(entity_id)
+
+    @callback
+    def async_restored_entity_ids(self) -> List[str]:
+        """Return the entity IDs with a restored state that was not replaced.
+
+        This method must be run in the event loop.
+        """
+        return list(self._restored)
 
     @callback
     def async_set(
@@ -1166,9 +1223,11 @@ class StateMachine:
             same_attr = old_state.attributes == MappingProxyType(attributes)
             last_changed = old_state.last_changed if same_state else None
 
-        if same_state and same_attr:
+        if same_state and same_attr and entity_id not in self._restored:
             return
 
+        self._restored.discard(entity_id)
+
         if context is None:
             context = Context()
 
@@ -0,0 +1,11363 @@
+"""Automatically generated by hassfest.
+
+To update, run python3 -m script.hassfest
+"""
+
+# fmt: off
+
+MANIFESTS = {
+    "abode": {
+        "domain": "abode",
+        "name": "Abode",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/abode",
+        "requirements": [
+            "abodepy==1.2.0"
+        ],
+        "codeowners": [
+            "@shred86"
+        ],
+        "homekit": {
+            "models": [
+                "Abode",
+                "Iota"
+            ]
+        }
+    },
+    "accuweather": {
+        "domain": "accuweather",
+        "name": "AccuWeather",
+        "documentation": "https://www.home-assistant.io/integrations/accuweather/",
+        "requirements": [
+            "accuweather==0.0.11"
+        ],
+        "codeowners": [
+            "@bieniu"
+        ],
+        "config_flow": True,
+        "quality_scale": "platinum"
+    },
+    "acer_projector": {
+        "domain": "acer_projector",
+        "name": "Acer Projector",
+        "documentation": "https://www.home-assistant.io/integrations/acer_projector",
+        "requirements": [
+            "pyserial==3.5"
+        ],
+        "codeowners": []
+    },
+    "acmeda": {
+        "domain": "acmeda",
+        "name": "Rollease Acmeda Automate",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/acmeda",
+        "requirements": [
+            "aiopulse==0.4.2"
+        ],
+        "codeowners": [
+            "@atmurray"
+        ]
+    },
+    "actiontec": {
+        "domain": "actiontec",
+        "name": "Actiontec",
+        "documentation": "https://www.home-assistant.io/integrations/actiontec",
+        "codeowners": []
+    },
+    "adguard": {
+        "domain": "adguard",
+        "name": "AdGuard Home",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/adguard",
+        "requirements": [
+            "adguardhome==0.4.2"
+        ],
+        "codeowners": [
+            "@frenck"
+        ]
+    },
+    "ads": {
+        "domain": "ads",
+        "name": "ADS",
+        "documentation": "https://www.home-assistant.io/integrations/ads",
+        "requirements": [
+            "pyads==3.2.2"
+        ],
+        "codeowners": []
+    },
+    "advantage_air": {
+        "domain": "advantage_air",
+        "name": "Advantage Air",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/advantage_air",
+        "codeowners": [
+            "@Bre77"
+        ],
+        "requirements": [
+            "advantage_air==0.2.1"
+        ],
+        "quality_scale": "platinum"
+    },
+    "aftership": {
+        "domain": "aftership",
+        "name": "AfterShip",
+        "documentation": "https://www.home-assistant.io/integrations/aftership",
+        "requirements": [
+            "pyaftership==0.1.2"
+        ],
+        "codeowners": []
+    },
+    "agent_dvr": {
+        "domain": "agent_dvr",
+        "name": "Agent DVR",
+        "documentation": "https://www.home-assistant.io/integrations/agent_dvr/",
+        "requirements": [
+            "agent-py==0.0.23"
+        ],
+        "config_flow": True,
+        "codeowners": [
+            "@ispysoftware"
+        ]
+    },
+    "air_quality": {
+        "domain": "air_quality",
+        "name": "Air Quality",
+        "documentation": "https://www.home-assistant.io/integrations/air_quality",
+        "codeowners": []
+    },
+    "airly": {
+        "domain": "airly",
+        "name": "Airly",
+        "documentation": "https://www.home-assistant.io/integrations/airly",
+        "codeowners": [
+            "@bieniu"
+        ],
+        "requirements": [
+            "airly==1.0.0"
+        ],
+        "config_flow": True,
+        "quality_scale": "platinum"
+    },
+    "airnow": {
+        "domain": "airnow",
+        "name": "AirNow",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/airnow",
+        "requirements": [
+            "pyairnow==1.1.0"
+        ],
+        "codeowners": [
+            "@asymworks"
+        ]
+    },
+    "airvisual": {
+        "domain": "airvisual",
+        "name": "AirVisual",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/airvisual",
+        "requirements": [
+            "pyairvisual==5.0.4"
+        ],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "aladdin_connect": {
+        "domain": "aladdin_connect",
+        "name": "Aladdin Connect",
+        "documentation": "https://www.home-assistant.io/integrations/aladdin_connect",
+        "requirements": [
+            "aladdin_connect==0.3"
+        ],
+        "codeowners": []
+    },
+    "alarm_control_panel": {
+        "domain": "alarm_control_panel",
+        "name": "Alarm Control Panel",
+        "documentation": "https://www.home-assistant.io/integrations/alarm_control_panel",
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "alarmdecoder": {
+        "domain": "alarmdecoder",
+        "name": "AlarmDecoder",
+        "documentation": "https://www.home-assistant.io/integrations/alarmdecoder",
+        "requirements": [
+            "adext==0.3"
+        ],
+        "codeowners": [
+            "@ajschmidt8"
+        ],
+        "config_flow": True
+    },
+    "alert": {
+        "domain": "alert",
+        "name": "Alert",
+        "documentation": "https://www.home-assistant.io/integrations/alert",
+        "after_dependencies": [
+            "notify"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "alexa": {
+        "domain": "alexa",
+        "name": "Amazon Alexa",
+        "documentation": "https://www.home-assistant.io/integrations/alexa",
+        "dependencies": [
+            "http"
+        ],
+        "after_dependencies": [
+            "camera"
+        ],
+        "codeowners": [
+            "@home-assistant/cloud",
+            "@ochlocracy"
+        ]
+    },
+    "almond": {
+        "domain": "almond",
+        "name": "Almond",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/almond",
+        "dependencies": [
+            "http",
+            "conversation"
+        ],
+        "codeowners": [
+            "@gcampax",
+            "@balloob"
+        ],
+        "requirements": [
+            "pyalmond==0.0.2"
+        ]
+    },
+    "alpha_vantage": {
+        "domain": "alpha_vantage",
+        "name": "Alpha Vantage",
+        "documentation": "https://www.home-assistant.io/integrations/alpha_vantage",
+        "requirements": [
+            "alpha_vantage==2.3.1"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "amazon_polly": {
+        "domain": "amazon_polly",
+        "name": "Amazon Polly",
+        "documentation": "https://www.home-assistant.io/integrations/amazon_polly",
+        "requirements": [
+            "boto3==1.9.252"
+        ],
+        "codeowners": []
+    },
+    "ambiclimate": {
+        "domain": "ambiclimate",
+        "name": "Ambiclimate",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ambiclimate",
+        "requirements": [
+            "ambiclimate==0.2.1"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@danielhiversen"
+        ]
+    },
+    "ambient_station": {
+        "domain": "ambient_station",
+        "name": "Ambient Weather Station",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ambient_station",
+        "requirements": [
+            "aioambient==1.2.1"
+        ],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "amcrest": {
+        "domain": "amcrest",
+        "name": "Amcrest",
+        "documentation": "https://www.home-assistant.io/integrations/amcrest",
+        "requirements": [
+            "amcrest==1.7.0"
+        ],
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "codeowners": [
+            "@pnbruckner"
+        ]
+    },
+    "ampio": {
+        "domain": "ampio",
+        "name": "Ampio Smart Smog System",
+        "documentation": "https://www.home-assistant.io/integrations/ampio",
+        "requirements": [
+            "asmog==0.0.6"
+        ],
+        "codeowners": []
+    },
+    "android_ip_webcam": {
+        "domain": "android_ip_webcam",
+        "name": "Android IP Webcam",
+        "documentation": "https://www.home-assistant.io/integrations/android_ip_webcam",
+        "requirements": [
+            "pydroid-ipcam==0.8"
+        ],
+        "codeowners": []
+    },
+    "androidtv": {
+        "domain": "androidtv",
+        "name": "Android TV",
+        "documentation": "https://www.home-assistant.io/integrations/androidtv",
+        "requirements": [
+            "adb-shell[async]==0.2.1",
+            "androidtv[async]==0.0.57",
+            "pure-python-adb[async]==0.3.0.dev0"
+        ],
+        "codeowners": [
+            "@JeffLIrion"
+        ]
+    },
+    "anel_pwrctrl": {
+        "domain": "anel_pwrctrl",
+        "name": "Anel NET-PwrCtrl",
+        "documentation": "https://www.home-assistant.io/integrations/anel_pwrctrl",
+        "requirements": [
+            "anel_pwrctrl-homeassistant==0.0.1.dev2"
+        ],
+        "codeowners": []
+    },
+    "anthemav": {
+        "domain": "anthemav",
+        "name": "Anthem A/V Receivers",
+        "documentation": "https://www.home-assistant.io/integrations/anthemav",
+        "requirements": [
+            "anthemav==1.1.10"
+        ],
+        "codeowners": []
+    },
+    "apache_kafka": {
+        "domain": "apache_kafka",
+        "name": "Apache Kafka",
+        "documentation": "https://www.home-assistant.io/integrations/apache_kafka",
+        "requirements": [
+            "aiokafka==0.6.0"
+        ],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "apcupsd": {
+        "domain": "apcupsd",
+        "name": "apcupsd",
+        "documentation": "https://www.home-assistant.io/integrations/apcupsd",
+        "requirements": [
+            "apcaccess==0.0.13"
+        ],
+        "codeowners": []
+    },
+    "api": {
+        "domain": "api",
+        "name": "Home Assistant API",
+        "documentation": "https://www.home-assistant.io/integrations/api",
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "apns": {
+        "domain": "apns",
+        "name": "Apple Push Notification Service (APNS)",
+        "documentation": "https://www.home-assistant.io/integrations/apns",
+        "requirements": [
+            "apns2==0.3.0"
+        ],
+        "after_dependencies": [
+            "device_tracker"
+        ],
+        "codeowners": []
+    },
+    "apple_tv": {
+        "domain": "apple_tv",
+        "name": "Apple TV",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/apple_tv",
+        "requirements": [
+            "pyatv==0.7.5"
+        ],
+        "zeroconf": [
+            "_mediaremotetv._tcp.local.",
+            "_touch-able._tcp.local."
+        ],
+        "after_dependencies": [
+            "discovery"
+        ],
+        "codeowners": [
+            "@postlund"
+        ]
+    },
+    "apprise": {
+        "domain": "apprise",
+        "name": "Apprise",
+        "documentation": "https://www.home-assistant.io/integrations/apprise",
+        "requirements": [
+            "apprise==0.8.9"
+        ],
+        "codeowners": [
+            "@caronc"
+        ]
+    },
+    "aprs": {
+        "domain": "aprs",
+        "name": "APRS",
+        "documentation": "https://www.home-assistant.io/integrations/aprs",
+        "codeowners": [
+            "@PhilRW"
+        ],
+        "requirements": [
+            "aprslib==0.6.46",
+            "geopy==1.21.0"
+        ]
+    },
+    "aqualogic": {
+        "domain": "aqualogic",
+        "name": "AquaLogic",
+        "documentation": "https://www.home-assistant.io/integrations/aqualogic",
+        "requirements": [
+            "aqualogic==1.0"
+        ],
+        "codeowners": []
+    },
+    "aquostv": {
+        "domain": "aquostv",
+        "name": "Sharp Aquos TV",
+        "documentation": "https://www.home-assistant.io/integrations/aquostv",
+        "requirements": [
+            "sharp_aquos_rc==0.3.2"
+        ],
+        "codeowners": []
+    },
+    "arcam_fmj": {
+        "domain": "arcam_fmj",
+        "name": "Arcam FMJ Receivers",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/arcam_fmj",
+        "requirements": [
+            "arcam-fmj==0.5.3"
+        ],
+        "ssdp": [
+            {
+                "deviceType": "urn:schemas-upnp-org:device:MediaRenderer:1",
+                "manufacturer": "ARCAM"
+            }
+        ],
+        "codeowners": [
+            "@elupus"
+        ]
+    },
+    "arduino": {
+        "domain": "arduino",
+        "name": "Arduino",
+        "documentation": "https://www.home-assistant.io/integrations/arduino",
+        "requirements": [
+            "PyMata==2.20"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "arest": {
+        "domain": "arest",
+        "name": "aREST",
+        "documentation": "https://www.home-assistant.io/integrations/arest",
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "arlo": {
+        "domain": "arlo",
+        "name": "Arlo",
+        "documentation": "https://www.home-assistant.io/integrations/arlo",
+        "requirements": [
+            "pyarlo==0.2.4"
+        ],
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "codeowners": []
+    },
+    "arris_tg2492lg": {
+        "domain": "arris_tg2492lg",
+        "name": "Arris TG2492LG",
+        "documentation": "https://www.home-assistant.io/integrations/arris_tg2492lg",
+        "requirements": [
+            "arris-tg2492lg==1.1.0"
+        ],
+        "codeowners": [
+            "@vanbalken"
+        ]
+    },
+    "aruba": {
+        "domain": "aruba",
+        "name": "Aruba",
+        "documentation": "https://www.home-assistant.io/integrations/aruba",
+        "requirements": [
+            "pexpect==4.6.0"
+        ],
+        "codeowners": []
+    },
+    "arwn": {
+        "domain": "arwn",
+        "name": "Ambient Radio Weather Network",
+        "documentation": "https://www.home-assistant.io/integrations/arwn",
+        "dependencies": [
+            "mqtt"
+        ],
+        "codeowners": []
+    },
+    "asterisk_cdr": {
+        "domain": "asterisk_cdr",
+        "name": "Asterisk Call Detail Records",
+        "documentation": "https://www.home-assistant.io/integrations/asterisk_cdr",
+        "dependencies": [
+            "asterisk_mbox"
+        ],
+        "codeowners": []
+    },
+    "asterisk_mbox": {
+        "domain": "asterisk_mbox",
+        "name": "Asterisk Voicemail",
+        "documentation": "https://www.home-assistant.io/integrations/asterisk_mbox",
+        "requirements": [
+            "asterisk_mbox==0.5.0"
+        ],
+        "codeowners": []
+    },
+    "asuswrt": {
+        "domain": "asuswrt",
+        "name": "ASUSWRT",
+        "documentation": "https://www.home-assistant.io/integrations/asuswrt",
+        "requirements": [
+            "aioasuswrt==1.3.1"
+        ],
+        "codeowners": [
+            "@kennedyshead"
+        ]
+    },
+    "atag": {
+        "domain": "atag",
+        "name": "Atag",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/atag/",
+        "requirements": [
+            "pyatag==0.3.4.4"
+        ],
+        "codeowners": [
+            "@MatsNL"
+        ]
+    },
+    "aten_pe": {
+        "domain": "aten_pe",
+        "name": "ATEN Rack PDU",
+        "documentation": "https://www.home-assistant.io/integrations/aten_pe",
+        "requirements": [
+            "atenpdu==0.3.0"
+        ],
+        "codeowners": [
+            "@mtdcr"
+        ]
+    },
+    "atome": {
+        "domain": "atome",
+        "name": "Atome Linky",
+        "documentation": "https://www.home-assistant.io/integrations/atome",
+        "codeowners": [
+            "@baqs"
+        ],
+        "requirements": [
+            "pyatome==0.1.1"
+        ]
+    },
+    "august": {
+        "domain": "august",
+        "name": "August",
+        "documentation": "https://www.home-assistant.io/integrations/august",
+        "requirements": [
+            "py-august==0.25.2"
+        ],
+        "dependencies": [
+            "configurator"
+        ],
+        "codeowners": [
+            "@bdraco"
+        ],
+        "dhcp": [
+            {
+                "hostname": "connect",
+                "macaddress": "D86162*"
+            },
+            {
+                "hostname": "connect",
+                "macaddress": "B8B7F1*"
+            }
+        ],
+        "config_flow": True
+    },
+    "aurora": {
+        "domain": "aurora",
+        "name": "Aurora",
+        "documentation": "https://www.home-assistant.io/integrations/aurora",
+        "config_flow": True,
+        "codeowners": [
+            "@djtimca"
+        ],
+        "requirements": [
+            "auroranoaa==0.0.2"
+        ]
+    },
+    "aurora_abb_powerone": {
+        "domain": "aurora_abb_powerone",
+        "name": "Aurora ABB Solar PV",
+        "documentation": "https://www.home-assistant.io/integrations/aurora_abb_powerone/",
+        "codeowners": [
+            "@davet2001"
+        ],
+        "requirements": [
+            "aurorapy==0.2.6"
+        ]
+    },
+    "auth": {
+        "domain": "auth",
+        "name": "Auth",
+        "documentation": "https://www.home-assistant.io/integrations/auth",
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "automation": {
+        "domain": "automation",
+        "name": "Automation",
+        "documentation": "https://www.home-assistant.io/integrations/automation",
+        "dependencies": [
+            "blueprint"
+        ],
+        "after_dependencies": [
+            "device_automation",
+            "webhook"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "avea": {
+        "domain": "avea",
+        "name": "Elgato Avea",
+        "documentation": "https://www.home-assistant.io/integrations/avea",
+        "codeowners": [
+            "@pattyland"
+        ],
+        "requirements": [
+            "avea==1.5.1"
+        ]
+    },
+    "avion": {
+        "domain": "avion",
+        "name": "Avi-on",
+        "documentation": "https://www.home-assistant.io/integrations/avion",
+        "requirements": [
+            "avion==0.10"
+        ],
+        "codeowners": []
+    },
+    "awair": {
+        "domain": "awair",
+        "name": "Awair",
+        "documentation": "https://www.home-assistant.io/integrations/awair",
+        "requirements": [
+            "python_awair==0.2.1"
+        ],
+        "codeowners": [
+            "@ahayworth",
+            "@danielsjf"
+        ],
+        "config_flow": True
+    },
+    "aws": {
+        "domain": "aws",
+        "name": "Amazon Web Services (AWS)",
+        "documentation": "https://www.home-assistant.io/integrations/aws",
+        "requirements": [
+            "aiobotocore==0.11.1"
+        ],
+        "codeowners": []
+    },
+    "axis": {
+        "domain": "axis",
+        "name": "Axis",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/axis",
+        "requirements": [
+            "axis==43"
+        ],
+        "zeroconf": [
+            {
+                "type": "_axis-video._tcp.local.",
+                "macaddress": "00408C*"
+            },
+            {
+                "type": "_axis-video._tcp.local.",
+                "macaddress": "ACCC8E*"
+            },
+            {
+                "type": "_axis-video._tcp.local.",
+                "macaddress": "B8A44F*"
+            }
+        ],
+        "dhcp": [
+            {
+                "hostname": "axis-00408c*",
+                "macaddress": "00408C*"
+            },
+            {
+                "hostname": "axis-accc8e*",
+                "macaddress": "ACCC8E*"
+            },
+            {
+                "hostname": "axis-b8a44f*",
+                "macaddress": "B8A44F*"
+            }
+        ],
+        "after_dependencies": [
+            "mqtt"
+        ],
+        "codeowners": [
+            "@Kane610"
+        ],
+        "quality_scale": "platinum"
+    },
+    "azure_devops": {
+        "domain": "azure_devops",
+        "name": "Azure DevOps",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/azure_devops",
+        "requirements": [
+            "aioazuredevops==1.3.5"
+        ],
+        "codeowners": [
+            "@timmo001"
+        ]
+    },
+    "azure_event_hub": {
+        "domain": "azure_event_hub",
+        "name": "Azure Event Hub",
+        "documentation": "https://www.home-assistant.io/integrations/azure_event_hub",
+        "requirements": [
+            "azure-eventhub==5.1.0"
+        ],
+        "codeowners": [
+            "@eavanvalkenburg"
+        ]
+    },
+    "azure_service_bus": {
+        "domain": "azure_service_bus",
+        "name": "Azure Service Bus",
+        "documentation": "https://www.home-assistant.io/integrations/azure_service_bus",
+        "requirements": [
+            "azure-servicebus==0.50.3"
+        ],
+        "codeowners": [
+            "@hfurubotten"
+        ]
+    },
+    "baidu": {
+        "domain": "baidu",
+        "name": "Baidu",
+        "documentation": "https://www.home-assistant.io/integrations/baidu",
+        "requirements": [
+            "baidu-aip==1.6.6"
+        ],
+        "codeowners": []
+    },
+    "bayesian": {
+        "domain": "bayesian",
+        "name": "Bayesian",
+        "documentation": "https://www.home-assistant.io/integrations/bayesian",
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "bbb_gpio": {
+        "domain": "bbb_gpio",
+        "name": "BeagleBone Black GPIO",
+        "documentation": "https://www.home-assistant.io/integrations/bbb_gpio",
+        "requirements": [
+            "Adafruit_BBIO==1.1.1"
+        ],
+        "codeowners": []
+    },
+    "bbox": {
+        "domain": "bbox",
+        "name": "Bbox",
+        "documentation": "https://www.home-assistant.io/integrations/bbox",
+        "requirements": [
+            "pybbox==0.0.5-alpha"
+        ],
+        "codeowners": []
+    },
+    "beewi_smartclim": {
+        "domain": "beewi_smartclim",
+        "name": "BeeWi SmartClim BLE sensor",
+        "documentation": "https://www.home-assistant.io/integrations/beewi_smartclim",
+        "requirements": [
+            "beewi_smartclim==0.0.10"
+        ],
+        "codeowners": [
+            "@alemuro"
+        ]
+    },
+    "bh1750": {
+        "domain": "bh1750",
+        "name": "BH1750",
+        "documentation": "https://www.home-assistant.io/integrations/bh1750",
+        "requirements": [
+            "i2csense==0.0.4",
+            "smbus-cffi==0.5.1"
+        ],
+        "codeowners": []
+    },
+    "binary_sensor": {
+        "domain": "binary_sensor",
+        "name": "Binary Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/binary_sensor",
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "bitcoin": {
+        "domain": "bitcoin",
+        "name": "Bitcoin",
+        "documentation": "https://www.home-assistant.io/integrations/bitcoin",
+        "requirements": [
+            "blockchain==1.4.4"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "bizkaibus": {
+        "domain": "bizkaibus",
+        "name": "Bizkaibus",
+        "documentation": "https://www.home-assistant.io/integrations/bizkaibus",
+        "codeowners": [
+            "@UgaitzEtxebarria"
+        ],
+        "requirements": [
+            "bizkaibus==0.1.1"
+        ]
+    },
+    "blackbird": {
+        "domain": "blackbird",
+        "name": "Monoprice Blackbird Matrix Switch",
+        "documentation": "https://www.home-assistant.io/integrations/blackbird",
+        "requirements": [
+            "pyblackbird==0.5"
+        ],
+        "codeowners": []
+    },
+    "blebox": {
+        "domain": "blebox",
+        "name": "BleBox devices",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/blebox",
+        "requirements": [
+            "blebox_uniapi==1.3.2"
+        ],
+        "codeowners": [
+            "@gadgetmobile"
+        ]
+    },
+    "blink": {
+        "domain": "blink",
+        "name": "Blink",
+        "documentation": "https://www.home-assistant.io/integrations/blink",
+        "requirements": [
+            "blinkpy==0.16.4"
+        ],
+        "codeowners": [
+            "@fronzbot"
+        ],
+        "config_flow": True
+    },
+    "blinksticklight": {
+        "domain": "blinksticklight",
+        "name": "BlinkStick",
+        "documentation": "https://www.home-assistant.io/integrations/blinksticklight",
+        "requirements": [
+            "blinkstick==1.1.8"
+        ],
+        "codeowners": []
+    },
+    "blinkt": {
+        "domain": "blinkt",
+        "name": "Blinkt!",
+        "documentation": "https://www.home-assistant.io/integrations/blinkt",
+        "requirements": [
+            "blinkt==0.1.0"
+        ],
+        "codeowners": []
+    },
+    "blockchain": {
+        "domain": "blockchain",
+        "name": "Blockchain.com",
+        "documentation": "https://www.home-assistant.io/integrations/blockchain",
+        "requirements": [
+            "python-blockchain-api==0.0.2"
+        ],
+        "codeowners": []
+    },
+    "bloomsky": {
+        "domain": "bloomsky",
+        "name": "BloomSky",
+        "documentation": "https://www.home-assistant.io/integrations/bloomsky",
+        "codeowners": []
+    },
+    "blueprint": {
+        "domain": "blueprint",
+        "name": "Blueprint",
+        "documentation": "https://www.home-assistant.io/integrations/blueprint",
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "bluesound": {
+        "domain": "bluesound",
+        "name": "Bluesound",
+        "documentation": "https://www.home-assistant.io/integrations/bluesound",
+        "requirements": [
+            "xmltodict==0.12.0"
+        ],
+        "codeowners": []
+    },
+    "bluetooth_le_tracker": {
+        "domain": "bluetooth_le_tracker",
+        "name": "Bluetooth LE Tracker",
+        "documentation": "https://www.home-assistant.io/integrations/bluetooth_le_tracker",
+        "requirements": [
+            "pygatt[GATTTOOL]==4.0.5"
+        ],
+        "codeowners": []
+    },
+    "bluetooth_tracker": {
+        "domain": "bluetooth_tracker",
+        "name": "Bluetooth Tracker",
+        "documentation": "https://www.home-assistant.io/integrations/bluetooth_tracker",
+        "requirements": [
+            "bt_proximity==0.2",
+            "pybluez==0.22"
+        ],
+        "codeowners": []
+    },
+    "bme280": {
+        "domain": "bme280",
+        "name": "Bosch BME280 Environmental Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/bme280",
+        "requirements": [
+            "i2csense==0.0.4",
+            "smbus-cffi==0.5.1"
+        ],
+        "codeowners": []
+    },
+    "bme680": {
+        "domain": "bme680",
+        "name": "Bosch BME680 Environmental Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/bme680",
+        "requirements": [
+            "bme680==1.0.5",
+            "smbus-cffi==0.5.1"
+        ],
+        "codeowners": []
+    },
+    "bmp280": {
+        "domain": "bmp280",
+        "name": "Bosch BMP280 Environmental Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/bmp280",
+        "codeowners": [
+            "@belidzs"
+        ],
+        "requirements": [
+            "adafruit-circuitpython-bmp280==3.1.1",
+            "RPi.GPIO==0.7.0"
+        ],
+        "quality_scale": "silver"
+    },
+    "bmw_connected_drive": {
+        "domain": "bmw_connected_drive",
+        "name": "BMW Connected Drive",
+        "documentation": "https://www.home-assistant.io/integrations/bmw_connected_drive",
+        "requirements": [
+            "bimmer_connected==0.7.14"
+        ],
+        "codeowners": [
+            "@gerard33",
+            "@rikroe"
+        ],
+        "config_flow": True
+    },
+    "bond": {
+        "domain": "bond",
+        "name": "Bond",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/bond",
+        "requirements": [
+            "bond-api==0.1.8"
+        ],
+        "zeroconf": [
+            "_bond._tcp.local."
+        ],
+        "codeowners": [
+            "@prystupa"
+        ],
+        "quality_scale": "platinum"
+    },
+    "braviatv": {
+        "domain": "braviatv",
+        "name": "Sony Bravia TV",
+        "documentation": "https://www.home-assistant.io/integrations/braviatv",
+        "requirements": [
+            "bravia-tv==1.0.8"
+        ],
+        "codeowners": [
+            "@bieniu"
+        ],
+        "config_flow": True
+    },
+    "broadlink": {
+        "domain": "broadlink",
+        "name": "Broadlink",
+        "documentation": "https://www.home-assistant.io/integrations/broadlink",
+        "requirements": [
+            "broadlink==0.16.0"
+        ],
+        "codeowners": [
+            "@danielhiversen",
+            "@felipediel"
+        ],
+        "config_flow": True
+    },
+    "brother": {
+        "domain": "brother",
+        "name": "Brother Printer",
+        "documentation": "https://www.home-assistant.io/integrations/brother",
+        "codeowners": [
+            "@bieniu"
+        ],
+        "requirements": [
+            "brother==0.1.20"
+        ],
+        "zeroconf": [
+            {
+                "type": "_printer._tcp.local.",
+                "name": "brother*"
+            }
+        ],
+        "config_flow": True,
+        "quality_scale": "platinum"
+    },
+    "brottsplatskartan": {
+        "domain": "brottsplatskartan",
+        "name": "Brottsplatskartan",
+        "documentation": "https://www.home-assistant.io/integrations/brottsplatskartan",
+        "requirements": [
+            "brottsplatskartan==0.0.1"
+        ],
+        "codeowners": []
+    },
+    "browser": {
+        "domain": "browser",
+        "name": "Browser",
+        "documentation": "https://www.home-assistant.io/integrations/browser",
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "brunt": {
+        "domain": "brunt",
+        "name": "Brunt Blind Engine",
+        "documentation": "https://www.home-assistant.io/integrations/brunt",
+        "requirements": [
+            "brunt==0.1.3"
+        ],
+        "codeowners": [
+            "@eavanvalkenburg"
+        ]
+    },
+    "bsblan": {
+        "domain": "bsblan",
+        "name": "BSB-Lan",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/bsblan",
+        "requirements": [
+            "bsblan==0.4.0"
+        ],
+        "codeowners": [
+            "@liudger"
+        ]
+    },
+    "bt_home_hub_5": {
+        "domain": "bt_home_hub_5",
+        "name": "BT Home Hub 5",
+        "documentation": "https://www.home-assistant.io/integrations/bt_home_hub_5",
+        "requirements": [
+            "bthomehub5-devicelist==0.1.1"
+        ],
+        "codeowners": []
+    },
+    "bt_smarthub": {
+        "domain": "bt_smarthub",
+        "name": "BT Smart Hub",
+        "documentation": "https://www.home-assistant.io/integrations/bt_smarthub",
+        "requirements": [
+            "btsmarthub_devicelist==0.2.0"
+        ],
+        "codeowners": [
+            "@jxwolstenholme"
+        ]
+    },
+    "buienradar": {
+        "domain": "buienradar",
+        "name": "Buienradar",
+        "documentation": "https://www.home-assistant.io/integrations/buienradar",
+        "requirements": [
+            "buienradar==1.0.4"
+        ],
+        "codeowners": [
+            "@mjj4791",
+            "@ties"
+        ]
+    },
+    "caldav": {
+        "domain": "caldav",
+        "name": "CalDAV",
+        "documentation": "https://www.home-assistant.io/integrations/caldav",
+        "requirements": [
+            "caldav==0.7.1"
+        ],
+        "codeowners": []
+    },
+    "calendar": {
+        "domain": "calendar",
+        "name": "Calendar",
+        "documentation": "https://www.home-assistant.io/integrations/calendar",
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": []
+    },
+    "camera": {
+        "domain": "camera",
+        "name": "Camera",
+        "documentation": "https://www.home-assistant.io/integrations/camera",
+        "dependencies": [
+            "http"
+        ],
+        "after_dependencies": [
+            "media_player"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "canary": {
+        "domain": "canary",
+        "name": "Canary",
+        "documentation": "https://www.home-assistant.io/integrations/canary",
+        "requirements": [
+            "py-canary==0.5.1"
+        ],
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "codeowners": [],
+        "config_flow": True
+    },
+    "cast": {
+        "domain": "cast",
+        "name": "Google Cast",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/cast",
+        "requirements": [
+            "pychromecast==7.7.2"
+        ],
+        "after_dependencies": [
+            "cloud",
+            "http",
+            "media_source",
+            "plex",
+            "tts",
+            "zeroconf"
+        ],
+        "zeroconf": [
+            "_googlecast._tcp.local."
+        ],
+        "codeowners": [
+            "@emontnemery"
+        ]
+    },
+    "cert_expiry": {
+        "domain": "cert_expiry",
+        "name": "Certificate Expiry",
+        "documentation": "https://www.home-assistant.io/integrations/cert_expiry",
+        "config_flow": True,
+        "codeowners": [
+            "@Cereal2nd",
+            "@jjlawren"
+        ]
+    },
+    "channels": {
+        "domain": "channels",
+        "name": "Channels",
+        "documentation": "https://www.home-assistant.io/integrations/channels",
+        "requirements": [
+            "pychannels==1.0.0"
+        ],
+        "codeowners": []
+    },
+    "circuit": {
+        "domain": "circuit",
+        "name": "Unify Circuit",
+        "documentation": "https://www.home-assistant.io/integrations/circuit",
+        "codeowners": [
+            "@braam"
+        ],
+        "requirements": [
+            "circuit-webhook==1.0.1"
+        ]
+    },
+    "cisco_ios": {
+        "domain": "cisco_ios",
+        "name": "Cisco IOS",
+        "documentation": "https://www.home-assistant.io/integrations/cisco_ios",
+        "requirements": [
+            "pexpect==4.6.0"
+        ],
+        "codeowners": [
+            "@fbradyirl"
+        ]
+    },
+    "cisco_mobility_express": {
+        "domain": "cisco_mobility_express",
+        "name": "Cisco Mobility Express",
+        "documentation": "https://www.home-assistant.io/integrations/cisco_mobility_express",
+        "requirements": [
+            "ciscomobilityexpress==0.3.9"
+        ],
+        "codeowners": [
+            "@fbradyirl"
+        ]
+    },
+    "cisco_webex_teams": {
+        "domain": "cisco_webex_teams",
+        "name": "Cisco Webex Teams",
+        "documentation": "https://www.home-assistant.io/integrations/cisco_webex_teams",
+        "requirements": [
+            "webexteamssdk==1.1.1"
+        ],
+        "codeowners": [
+            "@fbradyirl"
+        ]
+    },
+    "citybikes": {
+        "domain": "citybikes",
+        "name": "CityBikes",
+        "documentation": "https://www.home-assistant.io/integrations/citybikes",
+        "codeowners": []
+    },
+    "clementine": {
+        "domain": "clementine",
+        "name": "Clementine Music Player",
+        "documentation": "https://www.home-assistant.io/integrations/clementine",
+        "requirements": [
+            "python-clementine-remote==1.0.1"
+        ],
+        "codeowners": []
+    },
+    "clickatell": {
+        "domain": "clickatell",
+        "name": "Clickatell",
+        "documentation": "https://www.home-assistant.io/integrations/clickatell",
+        "codeowners": []
+    },
+    "clicksend": {
+        "domain": "clicksend",
+        "name": "ClickSend SMS",
+        "documentation": "https://www.home-assistant.io/integrations/clicksend",
+        "codeowners": []
+    },
+    "clicksend_tts": {
+        "domain": "clicksend_tts",
+        "name": "ClickSend TTS",
+        "documentation": "https://www.home-assistant.io/integrations/clicksend_tts",
+        "codeowners": []
+    },
+    "climate": {
+        "domain": "climate",
+        "name": "Climate",
+        "documentation": "https://www.home-assistant.io/integrations/climate",
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "cloud": {
+        "domain": "cloud",
+        "name": "Home Assistant Cloud",
+        "documentation": "https://www.home-assistant.io/integrations/cloud",
+        "requirements": [
+            "hass-nabucasa==0.41.0"
+        ],
+        "dependencies": [
+            "http",
+            "webhook",
+            "alexa"
+        ],
+        "after_dependencies": [
+            "google_assistant"
+        ],
+        "codeowners": [
+            "@home-assistant/cloud"
+        ]
+    },
+    "cloudflare": {
+        "domain": "cloudflare",
+        "name": "Cloudflare",
+        "documentation": "https://www.home-assistant.io/integrations/cloudflare",
+        "requirements": [
+            "pycfdns==1.2.1"
+        ],
+        "codeowners": [
+            "@ludeeus",
+            "@ctalkington"
+        ],
+        "config_flow": True
+    },
+    "cmus": {
+        "domain": "cmus",
+        "name": "cmus",
+        "documentation": "https://www.home-assistant.io/integrations/cmus",
+        "requirements": [
+            "pycmus==0.1.1"
+        ],
+        "codeowners": []
+    },
+    "co2signal": {
+        "domain": "co2signal",
+        "name": "CO2 Signal",
+        "documentation": "https://www.home-assistant.io/integrations/co2signal",
+        "requirements": [
+            "co2signal==0.4.2"
+        ],
+        "codeowners": []
+    },
+    "coinbase": {
+        "domain": "coinbase",
+        "name": "Coinbase",
+        "documentation": "https://www.home-assistant.io/integrations/coinbase",
+        "requirements": [
+            "coinbase==2.1.0"
+        ],
+        "codeowners": []
+    },
+    "coinmarketcap": {
+        "domain": "coinmarketcap",
+        "name": "CoinMarketCap",
+        "documentation": "https://www.home-assistant.io/integrations/coinmarketcap",
+        "requirements": [
+            "coinmarketcap==5.0.3"
+        ],
+        "codeowners": []
+    },
+    "color_extractor": {
+        "domain": "color_extractor",
+        "name": "ColorExtractor",
+        "config_flow": False,
+        "documentation": "https://www.home-assistant.io/integrations/color_extractor",
+        "requirements": [
+            "colorthief==0.2.1"
+        ],
+        "codeowners": [
+            "@GenericStudent"
+        ]
+    },
+    "comed_hourly_pricing": {
+        "domain": "comed_hourly_pricing",
+        "name": "ComEd Hourly Pricing",
+        "documentation": "https://www.home-assistant.io/integrations/comed_hourly_pricing",
+        "codeowners": []
+    },
+    "comfoconnect": {
+        "domain": "comfoconnect",
+        "name": "Zehnder ComfoAir Q",
+        "documentation": "https://www.home-assistant.io/integrations/comfoconnect",
+        "requirements": [
+            "pycomfoconnect==0.4"
+        ],
+        "codeowners": [
+            "@michaelarnauts"
+        ]
+    },
+    "command_line": {
+        "domain": "command_line",
+        "name": "Command Line",
+        "documentation": "https://www.home-assistant.io/integrations/command_line",
+        "codeowners": []
+    },
+    "concord232": {
+        "domain": "concord232",
+        "name": "Concord232",
+        "documentation": "https://www.home-assistant.io/integrations/concord232",
+        "requirements": [
+            "concord232==0.15"
+        ],
+        "codeowners": []
+    },
+    "config": {
+        "domain": "config",
+        "name": "Configuration",
+        "documentation": "https://www.home-assistant.io/integrations/config",
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "configurator": {
+        "domain": "configurator",
+        "name": "Configurator",
+        "documentation": "https://www.home-assistant.io/integrations/configurator",
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "control4": {
+        "domain": "control4",
+        "name": "Control4",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/control4",
+        "requirements": [
+            "pyControl4==0.0.6"
+        ],
+        "ssdp": [
+            {
+                "st": "c4:director"
+            }
+        ],
+        "codeowners": [
+            "@lawtancool"
+        ]
+    },
+    "conversation": {
+        "domain": "conversation",
+        "name": "Conversation",
+        "documentation": "https://www.home-assistant.io/integrations/conversation",
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "coolmaster": {
+        "domain": "coolmaster",
+        "name": "CoolMasterNet",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/coolmaster",
+        "requirements": [
+            "pycoolmasternet-async==0.1.2"
+        ],
+        "codeowners": [
+            "@OnFreund"
+        ]
+    },
+    "coronavirus": {
+        "domain": "coronavirus",
+        "name": "Coronavirus (COVID-19)",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/coronavirus",
+        "requirements": [
+            "coronavirus==1.1.1"
+        ],
+        "codeowners": [
+            "@home_assistant/core"
+        ]
+    },
+    "counter": {
+        "domain": "counter",
+        "name": "Counter",
+        "documentation": "https://www.home-assistant.io/integrations/counter",
+        "codeowners": [
+            "@fabaff"
+        ],
+        "quality_scale": "internal"
+    },
+    "cover": {
+        "domain": "cover",
+        "name": "Cover",
+        "documentation": "https://www.home-assistant.io/integrations/cover",
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "cppm_tracker": {
+        "domain": "cppm_tracker",
+        "name": "Aruba ClearPass",
+        "documentation": "https://www.home-assistant.io/integrations/cppm_tracker",
+        "requirements": [
+            "clearpasspy==1.0.2"
+        ],
+        "codeowners": []
+    },
+    "cpuspeed": {
+        "domain": "cpuspeed",
+        "name": "CPU Speed",
+        "documentation": "https://www.home-assistant.io/integrations/cpuspeed",
+        "requirements": [
+            "py-cpuinfo==7.0.0"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "crimereports": {
+        "domain": "crimereports",
+        "name": "Crime Reports",
+        "documentation": "https://www.home-assistant.io/integrations/crimereports",
+        "requirements": [
+            "crimereports==1.0.1"
+        ],
+        "codeowners": []
+    },
+    "cups": {
+        "domain": "cups",
+        "name": "CUPS",
+        "documentation": "https://www.home-assistant.io/integrations/cups",
+        "requirements": [
+            "pycups==1.9.73"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "currencylayer": {
+        "domain": "currencylayer",
+        "name": "currencylayer",
+        "documentation": "https://www.home-assistant.io/integrations/currencylayer",
+        "codeowners": []
+    },
+    "daikin": {
+        "domain": "daikin",
+        "name": "Daikin AC",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/daikin",
+        "requirements": [
+            "pydaikin==2.4.1"
+        ],
+        "codeowners": [
+            "@fredrike"
+        ],
+        "zeroconf": [
+            "_dkapi._tcp.local."
+        ],
+        "quality_scale": "platinum"
+    },
+    "danfoss_air": {
+        "domain": "danfoss_air",
+        "name": "Danfoss Air",
+        "documentation": "https://www.home-assistant.io/integrations/danfoss_air",
+        "requirements": [
+            "pydanfossair==0.1.0"
+        ],
+        "codeowners": []
+    },
+    "darksky": {
+        "domain": "darksky",
+        "name": "Dark Sky",
+        "documentation": "https://www.home-assistant.io/integrations/darksky",
+        "requirements": [
+            "python-forecastio==1.4.0"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "datadog": {
+        "domain": "datadog",
+        "name": "Datadog",
+        "documentation": "https://www.home-assistant.io/integrations/datadog",
+        "requirements": [
+            "datadog==0.15.0"
+        ],
+        "codeowners": []
+    },
+    "ddwrt": {
+        "domain": "ddwrt",
+        "name": "DD-WRT",
+        "documentation": "https://www.home-assistant.io/integrations/ddwrt",
+        "codeowners": []
+    },
+    "debugpy": {
+        "domain": "debugpy",
+        "name": "Remote Python Debugger",
+        "documentation": "https://www.home-assistant.io/integrations/debugpy",
+        "requirements": [
+            "debugpy==1.2.1"
+        ],
+        "codeowners": [
+            "@frenck"
+        ],
+        "quality_scale": "internal"
+    },
+    "deconz": {
+        "domain": "deconz",
+        "name": "deCONZ",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/deconz",
+        "requirements": [
+            "pydeconz==77"
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "Royal Philips Electronics"
+            }
+        ],
+        "codeowners": [
+            "@Kane610"
+        ],
+        "quality_scale": "platinum"
+    },
+    "decora": {
+        "domain": "decora",
+        "name": "Leviton Decora",
+        "documentation": "https://www.home-assistant.io/integrations/decora",
+        "requirements": [
+            "bluepy==1.3.0",
+            "decora==0.6"
+        ],
+        "codeowners": []
+    },
+    "decora_wifi": {
+        "domain": "decora_wifi",
+        "name": "Leviton Decora Wi-Fi",
+        "documentation": "https://www.home-assistant.io/integrations/decora_wifi",
+        "requirements": [
+            "decora_wifi==1.4"
+        ],
+        "codeowners": []
+    },
+    "default_config": {
+        "domain": "default_config",
+        "name": "Default Config",
+        "documentation": "https://www.home-assistant.io/integrations/default_config",
+        "dependencies": [
+            "automation",
+            "cloud",
+            "counter",
+            "dhcp",
+            "frontend",
+            "history",
+            "input_boolean",
+            "input_datetime",
+            "input_number",
+            "input_select",
+            "input_text",
+            "logbook",
+            "map",
+            "media_source",
+            "mobile_app",
+            "person",
+            "scene",
+            "script",
+            "ssdp",
+            "sun",
+            "system_health",
+            "tag",
+            "timer",
+            "updater",
+            "webhook",
+            "zeroconf",
+            "zone"
+        ],
+        "codeowners": []
+    },
+    "delijn": {
+        "domain": "delijn",
+        "name": "De Lijn",
+        "documentation": "https://www.home-assistant.io/integrations/delijn",
+        "codeowners": [
+            "@bollewolle",
+            "@Emilv2"
+        ],
+        "requirements": [
+            "pydelijn==0.6.1"
+        ]
+    },
+    "deluge": {
+        "domain": "deluge",
+        "name": "Deluge",
+        "documentation": "https://www.home-assistant.io/integrations/deluge",
+        "requirements": [
+            "deluge-client==1.7.1"
+        ],
+        "codeowners": []
+    },
+    "demo": {
+        "domain": "demo",
+        "name": "Demo",
+        "documentation": "https://www.home-assistant.io/integrations/demo",
+        "dependencies": [
+            "conversation",
+            "zone",
+            "group"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "denon": {
+        "domain": "denon",
+        "name": "Denon Network Receivers",
+        "documentation": "https://www.home-assistant.io/integrations/denon",
+        "codeowners": []
+    },
+    "denonavr": {
+        "domain": "denonavr",
+        "name": "Denon AVR Network Receivers",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/denonavr",
+        "requirements": [
+            "denonavr==0.9.10",
+            "getmac==0.8.2"
+        ],
+        "codeowners": [
+            "@scarface-4711",
+            "@starkillerOG"
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "Denon",
+                "deviceType": "urn:schemas-upnp-org:device:MediaRenderer:1"
+            },
+            {
+                "manufacturer": "DENON",
+                "deviceType": "urn:schemas-upnp-org:device:MediaRenderer:1"
+            },
+            {
+                "manufacturer": "DENON PROFESSIONAL",
+                "deviceType": "urn:schemas-upnp-org:device:MediaRenderer:1"
+            },
+            {
+                "manufacturer": "Marantz",
+                "deviceType": "urn:schemas-upnp-org:device:MediaRenderer:1"
+            },
+            {
+                "manufacturer": "Denon",
+                "deviceType": "urn:schemas-upnp-org:device:MediaServer:1"
+            },
+            {
+                "manufacturer": "DENON",
+                "deviceType": "urn:schemas-upnp-org:device:MediaServer:1"
+            },
+            {
+                "manufacturer": "DENON PROFESSIONAL",
+                "deviceType": "urn:schemas-upnp-org:device:MediaServer:1"
+            },
+            {
+                "manufacturer": "Marantz",
+                "deviceType": "urn:schemas-upnp-org:device:MediaServer:1"
+            },
+            {
+                "manufacturer": "Denon",
+                "deviceType": "urn:schemas-denon-com:device:AiosDevice:1"
+            },
+            {
+                "manufacturer": "DENON",
+                "deviceType": "urn:schemas-denon-com:device:AiosDevice:1"
+            },
+            {
+                "manufacturer": "DENON PROFESSIONAL",
+                "deviceType": "urn:schemas-denon-com:device:AiosDevice:1"
+            },
+            {
+                "manufacturer": "Marantz",
+                "deviceType": "urn:schemas-denon-com:device:AiosDevice:1"
+            }
+        ]
+    },
+    "derivative": {
+        "domain": "derivative",
+        "name": "Derivative",
+        "documentation": "https://www.home-assistant.io/integrations/derivative",
+        "codeowners": [
+            "@afaucogney"
+        ]
+    },
+    "deutsche_bahn": {
+        "domain": "deutsche_bahn",
+        "name": "Deutsche Bahn",
+        "documentation": "https://www.home-assistant.io/integrations/deutsche_bahn",
+        "requirements": [
+            "schiene==0.23"
+        ],
+        "codeowners": []
+    },
+    "device_automation": {
+        "domain": "device_automation",
+        "name": "Device Automation",
+        "documentation": "https://www.home-assistant.io/integrations/device_automation",
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "device_sun_light_trigger": {
+        "domain": "device_sun_light_trigger",
+        "name": "Presence-based Lights",
+        "documentation": "https://www.home-assistant.io/integrations/device_sun_light_trigger",
+        "after_dependencies": [
+            "device_tracker",
+            "group",
+            "light",
+            "person"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "device_tracker": {
+        "domain": "device_tracker",
+        "name": "Device Tracker",
+        "documentation": "https://www.home-assistant.io/integrations/device_tracker",
+        "dependencies": [
+            "zone"
+        ],
+        "after_dependencies": [],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "devolo_home_control": {
+        "domain": "devolo_home_control",
+        "name": "devolo Home Control",
+        "documentation": "https://www.home-assistant.io/integrations/devolo_home_control",
+        "requirements": [
+            "devolo-home-control-api==0.16.0"
+        ],
+        "after_dependencies": [
+            "zeroconf"
+        ],
+        "config_flow": True,
+        "codeowners": [
+            "@2Fake",
+            "@Shutgun"
+        ],
+        "quality_scale": "silver"
+    },
+    "dexcom": {
+        "domain": "dexcom",
+        "name": "Dexcom",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/dexcom",
+        "requirements": [
+            "pydexcom==0.2.0"
+        ],
+        "codeowners": [
+            "@gagebenne"
+        ]
+    },
+    "dhcp": {
+        "domain": "dhcp",
+        "name": "DHCP Discovery",
+        "documentation": "https://www.home-assistant.io/integrations/dhcp",
+        "requirements": [
+            "scapy==2.4.4"
+        ],
+        "codeowners": [
+            "@bdraco"
+        ]
+    },
+    "dht": {
+        "domain": "dht",
+        "name": "DHT Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/dht",
+        "requirements": [
+            "Adafruit-DHT==1.4.0"
+        ],
+        "codeowners": []
+    },
+    "dialogflow": {
+        "domain": "dialogflow",
+        "name": "Dialogflow",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/dialogflow",
+        "dependencies": [
+            "webhook"
+        ],
+        "codeowners": []
+    },
+    "digital_ocean": {
+        "domain": "digital_ocean",
+        "name": "Digital Ocean",
+        "documentation": "https://www.home-assistant.io/integrations/digital_ocean",
+        "requirements": [
+            "python-digitalocean==1.13.2"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "digitalloggers": {
+        "domain": "digitalloggers",
+        "name": "Digital Loggers",
+        "documentation": "https://www.home-assistant.io/integrations/digitalloggers",
+        "requirements": [
+            "dlipower==0.7.165"
+        ],
+        "codeowners": []
+    },
+    "directv": {
+        "domain": "directv",
+        "name": "DirecTV",
+        "documentation": "https://www.home-assistant.io/integrations/directv",
+        "requirements": [
+            "directv==0.4.0"
+        ],
+        "codeowners": [
+            "@ctalkington"
+        ],
+        "quality_scale": "gold",
+        "config_flow": True,
+        "ssdp": [
+            {
+                "manufacturer": "DIRECTV",
+                "deviceType": "urn:schemas-upnp-org:device:MediaServer:1"
+            }
+        ]
+    },
+    "discogs": {
+        "domain": "discogs",
+        "name": "Discogs",
+        "documentation": "https://www.home-assistant.io/integrations/discogs",
+        "requirements": [
+            "discogs_client==2.3.0"
+        ],
+        "codeowners": [
+            "@thibmaek"
+        ]
+    },
+    "discord": {
+        "domain": "discord",
+        "name": "Discord",
+        "documentation": "https://www.home-assistant.io/integrations/discord",
+        "requirements": [
+            "discord.py==1.6.0"
+        ],
+        "codeowners": []
+    },
+    "discovery": {
+        "domain": "discovery",
+        "name": "Discovery",
+        "documentation": "https://www.home-assistant.io/integrations/discovery",
+        "requirements": [
+            "netdisco==2.8.2"
+        ],
+        "after_dependencies": [
+            "zeroconf"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "dlib_face_detect": {
+        "domain": "dlib_face_detect",
+        "name": "Dlib Face Detect",
+        "documentation": "https://www.home-assistant.io/integrations/dlib_face_detect",
+        "requirements": [
+            "face_recognition==1.2.3"
+        ],
+        "codeowners": []
+    },
+    "dlib_face_identify": {
+        "domain": "dlib_face_identify",
+        "name": "Dlib Face Identify",
+        "documentation": "https://www.home-assistant.io/integrations/dlib_face_identify",
+        "requirements": [
+            "face_recognition==1.2.3"
+        ],
+        "codeowners": []
+    },
+    "dlink": {
+        "domain": "dlink",
+        "name": "D-Link Wi-Fi Smart Plugs",
+        "documentation": "https://www.home-assistant.io/integrations/dlink",
+        "requirements": [
+            "pyW215==0.7.0"
+        ],
+        "codeowners": []
+    },
+    "dlna_dmr": {
+        "domain": "dlna_dmr",
+        "name": "DLNA Digital Media Renderer",
+        "documentation": "https://www.home-assistant.io/integrations/dlna_dmr",
+        "requirements": [
+            "async-upnp-client==0.14.13"
+        ],
+        "codeowners": []
+    },
+    "dnsip": {
+        "domain": "dnsip",
+        "name": "DNS IP",
+        "documentation": "https://www.home-assistant.io/integrations/dnsip",
+        "requirements": [
+            "aiodns==2.0.0"
+        ],
+        "codeowners": []
+    },
+    "dominos": {
+        "domain": "dominos",
+        "name": "Dominos Pizza",
+        "documentation": "https://www.home-assistant.io/integrations/dominos",
+        "requirements": [
+            "pizzapi==0.0.3"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": []
+    },
+    "doods": {
+        "domain": "doods",
+        "name": "DOODS - Dedicated Open Object Detection Service",
+        "documentation": "https://www.home-assistant.io/integrations/doods",
+        "requirements": [
+            "pydoods==1.0.2",
+            "pillow==7.2.0"
+        ],
+        "codeowners": []
+    },
+    "doorbird": {
+        "domain": "doorbird",
+        "name": "DoorBird",
+        "documentation": "https://www.home-assistant.io/integrations/doorbird",
+        "requirements": [
+            "doorbirdpy==2.1.0"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "zeroconf": [
+            {
+                "type": "_axis-video._tcp.local.",
+                "macaddress": "1CCAE3*"
+            }
+        ],
+        "codeowners": [
+            "@oblogic7",
+            "@bdraco"
+        ],
+        "config_flow": True
+    },
+    "dovado": {
+        "domain": "dovado",
+        "name": "Dovado",
+        "documentation": "https://www.home-assistant.io/integrations/dovado",
+        "requirements": [
+            "dovado==0.4.1"
+        ],
+        "codeowners": []
+    },
+    "downloader": {
+        "domain": "downloader",
+        "name": "Downloader",
+        "documentation": "https://www.home-assistant.io/integrations/downloader",
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "dsmr": {
+        "domain": "dsmr",
+        "name": "DSMR Slimme Meter",
+        "documentation": "https://www.home-assistant.io/integrations/dsmr",
+        "requirements": [
+            "dsmr_parser==0.25"
+        ],
+        "codeowners": [
+            "@Robbie1221"
+        ],
+        "config_flow": False
+    },
+    "dsmr_reader": {
+        "domain": "dsmr_reader",
+        "name": "DSMR Reader",
+        "documentation": "https://www.home-assistant.io/integrations/dsmr_reader",
+        "dependencies": [
+            "mqtt"
+        ],
+        "codeowners": [
+            "@depl0y"
+        ]
+    },
+    "dte_energy_bridge": {
+        "domain": "dte_energy_bridge",
+        "name": "DTE Energy Bridge",
+        "documentation": "https://www.home-assistant.io/integrations/dte_energy_bridge",
+        "codeowners": []
+    },
+    "dublin_bus_transport": {
+        "domain": "dublin_bus_transport",
+        "name": "Dublin Bus",
+        "documentation": "https://www.home-assistant.io/integrations/dublin_bus_transport",
+        "codeowners": []
+    },
+    "duckdns": {
+        "domain": "duckdns",
+        "name": "Duck DNS",
+        "documentation": "https://www.home-assistant.io/integrations/duckdns",
+        "codeowners": []
+    },
+    "dunehd": {
+        "domain": "dunehd",
+        "name": "Dune HD",
+        "documentation": "https://www.home-assistant.io/integrations/dunehd",
+        "requirements": [
+            "pdunehd==1.3.2"
+        ],
+        "codeowners": [
+            "@bieniu"
+        ],
+        "config_flow": True
+    },
+    "dwd_weather_warnings": {
+        "domain": "dwd_weather_warnings",
+        "name": "Deutscher Wetterdienst (DWD) Weather Warnings",
+        "documentation": "https://www.home-assistant.io/integrations/dwd_weather_warnings",
+        "codeowners": [
+            "@runningman84",
+            "@stephan192",
+            "@Hummel95"
+        ],
+        "requirements": [
+            "dwdwfsapi==1.0.3"
+        ]
+    },
+    "dweet": {
+        "domain": "dweet",
+        "name": "dweet.io",
+        "documentation": "https://www.home-assistant.io/integrations/dweet",
+        "requirements": [
+            "dweepy==0.3.0"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "dynalite": {
+        "domain": "dynalite",
+        "name": "Philips Dynalite",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/dynalite",
+        "codeowners": [
+            "@ziv1234"
+        ],
+        "requirements": [
+            "dynalite_devices==0.1.46"
+        ]
+    },
+    "dyson": {
+        "domain": "dyson",
+        "name": "Dyson",
+        "documentation": "https://www.home-assistant.io/integrations/dyson",
+        "requirements": [
+            "libpurecool==0.6.4"
+        ],
+        "after_dependencies": [
+            "zeroconf"
+        ],
+        "codeowners": []
+    },
+    "eafm": {
+        "domain": "eafm",
+        "name": "Environment Agency Flood Gauges",
+        "documentation": "https://www.home-assistant.io/integrations/eafm",
+        "config_flow": True,
+        "codeowners": [
+            "@Jc2k"
+        ],
+        "requirements": [
+            "aioeafm==0.1.2"
+        ]
+    },
+    "ebox": {
+        "domain": "ebox",
+        "name": "EBox",
+        "documentation": "https://www.home-assistant.io/integrations/ebox",
+        "requirements": [
+            "pyebox==1.1.4"
+        ],
+        "codeowners": []
+    },
+    "ebusd": {
+        "domain": "ebusd",
+        "name": "ebusd",
+        "documentation": "https://www.home-assistant.io/integrations/ebusd",
+        "requirements": [
+            "ebusdpy==0.0.16"
+        ],
+        "codeowners": []
+    },
+    "ecoal_boiler": {
+        "domain": "ecoal_boiler",
+        "name": "eSterownik eCoal.pl Boiler",
+        "documentation": "https://www.home-assistant.io/integrations/ecoal_boiler",
+        "requirements": [
+            "ecoaliface==0.4.0"
+        ],
+        "codeowners": []
+    },
+    "ecobee": {
+        "domain": "ecobee",
+        "name": "ecobee",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ecobee",
+        "requirements": [
+            "python-ecobee-api==0.2.8"
+        ],
+        "codeowners": [
+            "@marthoc"
+        ]
+    },
+    "econet": {
+        "domain": "econet",
+        "name": "Rheem EcoNET Water Products",
+        "documentation": "https://www.home-assistant.io/integrations/econet",
+        "requirements": [
+            "pyeconet==0.0.11"
+        ],
+        "codeowners": []
+    },
+    "ecovacs": {
+        "domain": "ecovacs",
+        "name": "Ecovacs",
+        "documentation": "https://www.home-assistant.io/integrations/ecovacs",
+        "requirements": [
+            "sucks==0.9.4"
+        ],
+        "codeowners": [
+            "@OverloadUT"
+        ]
+    },
+    "eddystone_temperature": {
+        "domain": "eddystone_temperature",
+        "name": "Eddystone",
+        "documentation": "https://www.home-assistant.io/integrations/eddystone_temperature",
+        "requirements": [
+            "beacontools[scan]==1.2.3",
+            "construct==2.10.56"
+        ],
+        "codeowners": []
+    },
+    "edimax": {
+        "domain": "edimax",
+        "name": "Edimax",
+        "documentation": "https://www.home-assistant.io/integrations/edimax",
+        "requirements": [
+            "pyedimax==0.2.1"
+        ],
+        "codeowners": []
+    },
+    "edl21": {
+        "domain": "edl21",
+        "name": "EDL21",
+        "documentation": "https://www.home-assistant.io/integrations/edl21",
+        "requirements": [
+            "pysml==0.0.3"
+        ],
+        "codeowners": [
+            "@mtdcr"
+        ]
+    },
+    "ee_brightbox": {
+        "domain": "ee_brightbox",
+        "name": "EE Bright Box",
+        "documentation": "https://www.home-assistant.io/integrations/ee_brightbox",
+        "requirements": [
+            "eebrightbox==0.0.4"
+        ],
+        "codeowners": []
+    },
+    "efergy": {
+        "domain": "efergy",
+        "name": "Efergy",
+        "documentation": "https://www.home-assistant.io/integrations/efergy",
+        "codeowners": []
+    },
+    "egardia": {
+        "domain": "egardia",
+        "name": "Egardia",
+        "documentation": "https://www.home-assistant.io/integrations/egardia",
+        "requirements": [
+            "pythonegardia==1.0.40"
+        ],
+        "codeowners": [
+            "@jeroenterheerdt"
+        ]
+    },
+    "eight_sleep": {
+        "domain": "eight_sleep",
+        "name": "Eight Sleep",
+        "documentation": "https://www.home-assistant.io/integrations/eight_sleep",
+        "requirements": [
+            "pyeight==0.1.5"
+        ],
+        "codeowners": [
+            "@mezz64"
+        ]
+    },
+    "elgato": {
+        "domain": "elgato",
+        "name": "Elgato Key Light",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/elgato",
+        "requirements": [
+            "elgato==1.0.0"
+        ],
+        "zeroconf": [
+            "_elg._tcp.local."
+        ],
+        "codeowners": [
+            "@frenck"
+        ],
+        "quality_scale": "platinum"
+    },
+    "eliqonline": {
+        "domain": "eliqonline",
+        "name": "Eliqonline",
+        "documentation": "https://www.home-assistant.io/integrations/eliqonline",
+        "requirements": [
+            "eliqonline==1.2.2"
+        ],
+        "codeowners": []
+    },
+    "elkm1": {
+        "domain": "elkm1",
+        "name": "Elk-M1 Control",
+        "documentation": "https://www.home-assistant.io/integrations/elkm1",
+        "requirements": [
+            "elkm1-lib==0.8.10"
+        ],
+        "codeowners": [
+            "@gwww",
+            "@bdraco"
+        ],
+        "config_flow": True
+    },
+    "elv": {
+        "domain": "elv",
+        "name": "ELV PCA",
+        "documentation": "https://www.home-assistant.io/integrations/pca",
+        "codeowners": [
+            "@majuss"
+        ],
+        "requirements": [
+            "pypca==0.0.7"
+        ]
+    },
+    "emby": {
+        "domain": "emby",
+        "name": "Emby",
+        "documentation": "https://www.home-assistant.io/integrations/emby",
+        "requirements": [
+            "pyemby==1.7"
+        ],
+        "codeowners": [
+            "@mezz64"
+        ]
+    },
+    "emoncms": {
+        "domain": "emoncms",
+        "name": "Emoncms",
+        "documentation": "https://www.home-assistant.io/integrations/emoncms",
+        "codeowners": [
+            "@borpin"
+        ]
+    },
+    "emoncms_history": {
+        "domain": "emoncms_history",
+        "name": "Emoncms History",
+        "documentation": "https://www.home-assistant.io/integrations/emoncms_history",
+        "codeowners": []
+    },
+    "emulated_hue": {
+        "domain": "emulated_hue",
+        "name": "Emulated Hue",
+        "documentation": "https://www.home-assistant.io/integrations/emulated_hue",
+        "requirements": [
+            "aiohttp_cors==0.7.0"
+        ],
+        "after_dependencies": [
+            "http"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "emulated_kasa": {
+        "domain": "emulated_kasa",
+        "name": "Emulated Kasa",
+        "documentation": "https://www.home-assistant.io/integrations/emulated_kasa",
+        "requirements": [
+            "sense_energy==0.8.1"
+        ],
+        "codeowners": [
+            "@kbickar"
+        ],
+        "quality_scale": "internal"
+    },
+    "emulated_roku": {
+        "domain": "emulated_roku",
+        "name": "Emulated Roku",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/emulated_roku",
+        "requirements": [
+            "emulated_roku==0.2.1"
+        ],
+        "codeowners": []
+    },
+    "enigma2": {
+        "domain": "enigma2",
+        "name": "Enigma2 (OpenWebif)",
+        "documentation": "https://www.home-assistant.io/integrations/enigma2",
+        "requirements": [
+            "openwebifpy==3.2.7"
+        ],
+        "codeowners": [
+            "@fbradyirl"
+        ]
+    },
+    "enocean": {
+        "domain": "enocean",
+        "name": "EnOcean",
+        "documentation": "https://www.home-assistant.io/integrations/enocean",
+        "requirements": [
+            "enocean==0.50"
+        ],
+        "codeowners": [
+            "@bdurrer"
+        ],
+        "config_flow": True
+    },
+    "enphase_envoy": {
+        "domain": "enphase_envoy",
+        "name": "Enphase Envoy",
+        "documentation": "https://www.home-assistant.io/integrations/enphase_envoy",
+        "requirements": [
+            "envoy_reader==0.18.3"
+        ],
+        "codeowners": [
+            "@gtdiehl"
+        ]
+    },
+    "entur_public_transport": {
+        "domain": "entur_public_transport",
+        "name": "Entur",
+        "documentation": "https://www.home-assistant.io/integrations/entur_public_transport",
+        "requirements": [
+            "enturclient==0.2.1"
+        ],
+        "codeowners": [
+            "@hfurubotten"
+        ]
+    },
+    "environment_canada": {
+        "domain": "environment_canada",
+        "name": "Environment Canada",
+        "documentation": "https://www.home-assistant.io/integrations/environment_canada",
+        "requirements": [
+            "env_canada==0.2.5"
+        ],
+        "codeowners": [
+            "@michaeldavie"
+        ]
+    },
+    "envirophat": {
+        "domain": "envirophat",
+        "name": "Enviro pHAT",
+        "documentation": "https://www.home-assistant.io/integrations/envirophat",
+        "requirements": [
+            "envirophat==0.0.6",
+            "smbus-cffi==0.5.1"
+        ],
+        "codeowners": []
+    },
+    "envisalink": {
+        "domain": "envisalink",
+        "name": "Envisalink",
+        "documentation": "https://www.home-assistant.io/integrations/envisalink",
+        "requirements": [
+            "pyenvisalink==4.0"
+        ],
+        "codeowners": []
+    },
+    "ephember": {
+        "domain": "ephember",
+        "name": "EPH Controls",
+        "documentation": "https://www.home-assistant.io/integrations/ephember",
+        "requirements": [
+            "pyephember==0.3.1"
+        ],
+        "codeowners": [
+            "@ttroy50"
+        ]
+    },
+    "epson": {
+        "domain": "epson",
+        "name": "Epson",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/epson",
+        "requirements": [
+            "epson-projector==0.2.3"
+        ],
+        "codeowners": [
+            "@pszafer"
+        ]
+    },
+    "epsonworkforce": {
+        "domain": "epsonworkforce",
+        "name": "Epson Workforce",
+        "documentation": "https://www.home-assistant.io/integrations/epsonworkforce",
+        "codeowners": [
+            "@ThaStealth"
+        ],
+        "requirements": [
+            "epsonprinter==0.0.9"
+        ]
+    },
+    "eq3btsmart": {
+        "domain": "eq3btsmart",
+        "name": "EQ3 Bluetooth Smart Thermostats",
+        "documentation": "https://www.home-assistant.io/integrations/eq3btsmart",
+        "requirements": [
+            "construct==2.10.56",
+            "python-eq3bt==0.1.11"
+        ],
+        "codeowners": [
+            "@rytilahti"
+        ]
+    },
+    "esphome": {
+        "domain": "esphome",
+        "name": "ESPHome",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/esphome",
+        "requirements": [
+            "aioesphomeapi==2.6.3"
+        ],
+        "zeroconf": [
+            "_esphomelib._tcp.local."
+        ],
+        "codeowners": [
+            "@OttoWinter"
+        ],
+        "after_dependencies": [
+            "zeroconf",
+            "tag"
+        ]
+    },
+    "essent": {
+        "domain": "essent",
+        "name": "Essent",
+        "documentation": "https://www.home-assistant.io/integrations/essent",
+        "requirements": [
+            "PyEssent==0.14"
+        ],
+        "codeowners": [
+            "@TheLastProject"
+        ]
+    },
+    "etherscan": {
+        "domain": "etherscan",
+        "name": "Etherscan",
+        "documentation": "https://www.home-assistant.io/integrations/etherscan",
+        "requirements": [
+            "python-etherscan-api==0.0.3"
+        ],
+        "codeowners": []
+    },
+    "eufy": {
+        "domain": "eufy",
+        "name": "eufy",
+        "documentation": "https://www.home-assistant.io/integrations/eufy",
+        "requirements": [
+            "lakeside==0.12"
+        ],
+        "codeowners": []
+    },
+    "everlights": {
+        "domain": "everlights",
+        "name": "EverLights",
+        "documentation": "https://www.home-assistant.io/integrations/everlights",
+        "requirements": [
+            "pyeverlights==0.1.0"
+        ],
+        "codeowners": []
+    },
+    "evohome": {
+        "domain": "evohome",
+        "name": "Honeywell Total Connect Comfort (Europe)",
+        "documentation": "https://www.home-assistant.io/integrations/evohome",
+        "requirements": [
+            "evohome-async==0.3.5.post1"
+        ],
+        "codeowners": [
+            "@zxdavb"
+        ]
+    },
+    "ezviz": {
+        "disabled": "Dependency contains code that breaks Home Assistant.",
+        "domain": "ezviz",
+        "name": "Ezviz",
+        "documentation": "https://www.home-assistant.io/integrations/ezviz",
+        "codeowners": [
+            "@baqs"
+        ],
+        "requirements": [
+            "pyezviz==0.1.5"
+        ]
+    },
+    "facebook": {
+        "domain": "facebook",
+        "name": "Facebook Messenger",
+        "documentation": "https://www.home-assistant.io/integrations/facebook",
+        "codeowners": []
+    },
+    "facebox": {
+        "domain": "facebox",
+        "name": "Facebox",
+        "documentation": "https://www.home-assistant.io/integrations/facebox",
+        "codeowners": []
+    },
+    "fail2ban": {
+        "domain": "fail2ban",
+        "name": "Fail2Ban",
+        "documentation": "https://www.home-assistant.io/integrations/fail2ban",
+        "codeowners": []
+    },
+    "familyhub": {
+        "domain": "familyhub",
+        "name": "Samsung Family Hub",
+        "documentation": "https://www.home-assistant.io/integrations/familyhub",
+        "requirements": [
+            "python-family-hub-local==0.0.2"
+        ],
+        "codeowners": []
+    },
+    "fan": {
+        "domain": "fan",
+        "name": "Fan",
+        "documentation": "https://www.home-assistant.io/integrations/fan",
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "fastdotcom": {
+        "domain": "fastdotcom",
+        "name": "Fast.com",
+        "documentation": "https://www.home-assistant.io/integrations/fastdotcom",
+        "requirements": [
+            "fastdotcom==0.0.3"
+        ],
+        "codeowners": [
+            "@rohankapoorcom"
+        ]
+    },
+    "feedreader": {
+        "domain": "feedreader",
+        "name": "Feedreader",
+        "documentation": "https://www.home-assistant.io/integrations/feedreader",
+        "requirements": [
+            "feedparser==6.0.2"
+        ],
+        "codeowners": []
+    },
+    "ffmpeg": {
+        "domain": "ffmpeg",
+        "name": "FFmpeg",
+        "documentation": "https://www.home-assistant.io/integrations/ffmpeg",
+        "requirements": [
+            "ha-ffmpeg==3.0.2"
+        ],
+        "codeowners": []
+    },
+    "ffmpeg_motion": {
+        "domain": "ffmpeg_motion",
+        "name": "FFmpeg Motion",
+        "documentation": "https://www.home-assistant.io/integrations/ffmpeg_motion",
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "codeowners": []
+    },
+    "ffmpeg_noise": {
+        "domain": "ffmpeg_noise",
+        "name": "FFmpeg Noise",
+        "documentation": "https://www.home-assistant.io/integrations/ffmpeg_noise",
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "codeowners": []
+    },
+    "fibaro": {
+        "domain": "fibaro",
+        "name": "Fibaro",
+        "documentation": "https://www.home-assistant.io/integrations/fibaro",
+        "requirements": [
+            "fiblary3==0.1.7"
+        ],
+        "codeowners": []
+    },
+    "fido": {
+        "domain": "fido",
+        "name": "Fido",
+        "documentation": "https://www.home-assistant.io/integrations/fido",
+        "requirements": [
+            "pyfido==2.1.1"
+        ],
+        "codeowners": []
+    },
+    "file": {
+        "domain": "file",
+        "name": "File",
+        "documentation": "https://www.home-assistant.io/integrations/file",
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "filesize": {
+        "domain": "filesize",
+        "name": "File Size",
+        "documentation": "https://www.home-assistant.io/integrations/filesize",
+        "codeowners": []
+    },
+    "filter": {
+        "domain": "filter",
+        "name": "Filter",
+        "documentation": "https://www.home-assistant.io/integrations/filter",
+        "dependencies": [
+            "history"
+        ],
+        "codeowners": [
+            "@dgomes"
+        ],
+        "quality_scale": "internal"
+    },
+    "fints": {
+        "domain": "fints",
+        "name": "FinTS",
+        "documentation": "https://www.home-assistant.io/integrations/fints",
+        "requirements": [
+            "fints==1.0.1"
+        ],
+        "codeowners": []
+    },
+    "fireservicerota": {
+        "domain": "fireservicerota",
+        "name": "FireServiceRota",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/fireservicerota",
+        "requirements": [
+            "pyfireservicerota==0.0.40"
+        ],
+        "codeowners": [
+            "@cyberjunky"
+        ]
+    },
+    "firmata": {
+        "domain": "firmata",
+        "name": "Firmata",
+        "config_flow": False,
+        "documentation": "https://www.home-assistant.io/integrations/firmata",
+        "requirements": [
+            "pymata-express==1.19"
+        ],
+        "codeowners": [
+            "@DaAwesomeP"
+        ]
+    },
+    "fitbit": {
+        "domain": "fitbit",
+        "name": "Fitbit",
+        "documentation": "https://www.home-assistant.io/integrations/fitbit",
+        "requirements": [
+            "fitbit==0.3.1"
+        ],
+        "dependencies": [
+            "configurator",
+            "http"
+        ],
+        "codeowners": []
+    },
+    "fixer": {
+        "domain": "fixer",
+        "name": "Fixer",
+        "documentation": "https://www.home-assistant.io/integrations/fixer",
+        "requirements": [
+            "fixerio==1.0.0a0"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "fleetgo": {
+        "domain": "fleetgo",
+        "name": "FleetGO",
+        "documentation": "https://www.home-assistant.io/integrations/fleetgo",
+        "requirements": [
+            "ritassist==0.9.2"
+        ],
+        "codeowners": []
+    },
+    "flexit": {
+        "domain": "flexit",
+        "name": "Flexit",
+        "documentation": "https://www.home-assistant.io/integrations/flexit",
+        "requirements": [
+            "pyflexit==0.3"
+        ],
+        "dependencies": [
+            "modbus"
+        ],
+        "codeowners": []
+    },
+    "flic": {
+        "domain": "flic",
+        "name": "Flic",
+        "documentation": "https://www.home-assistant.io/integrations/flic",
+        "requirements": [
+            "pyflic-homeassistant==0.4.dev0"
+        ],
+        "codeowners": []
+    },
+    "flick_electric": {
+        "domain": "flick_electric",
+        "name": "Flick Electric",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/flick_electric/",
+        "requirements": [
+            "PyFlick==0.0.2"
+        ],
+        "codeowners": [
+            "@ZephireNZ"
+        ]
+    },
+    "flo": {
+        "domain": "flo",
+        "name": "Flo",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/flo",
+        "requirements": [
+            "aioflo==0.4.1"
+        ],
+        "codeowners": [
+            "@dmulcahey"
+        ]
+    },
+    "flock": {
+        "domain": "flock",
+        "name": "Flock",
+        "documentation": "https://www.home-assistant.io/integrations/flock",
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "flume": {
+        "domain": "flume",
+        "name": "Flume",
+        "documentation": "https://www.home-assistant.io/integrations/flume/",
+        "requirements": [
+            "pyflume==0.5.5"
+        ],
+        "codeowners": [
+            "@ChrisMandich",
+            "@bdraco"
+        ],
+        "config_flow": True,
+        "dhcp": [
+            {
+                "hostname": "flume-gw-*",
+                "macaddress": "ECFABC*"
+            },
+            {
+                "hostname": "flume-gw-*",
+                "macaddress": "B4E62D*"
+            }
+        ]
+    },
+    "flunearyou": {
+        "domain": "flunearyou",
+        "name": "Flu Near You",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/flunearyou",
+        "requirements": [
+            "pyflunearyou==1.0.7"
+        ],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "flux": {
+        "domain": "flux",
+        "name": "Flux",
+        "documentation": "https://www.home-assistant.io/integrations/flux",
+        "after_dependencies": [
+            "light"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "flux_led": {
+        "domain": "flux_led",
+        "name": "Flux LED/MagicLight",
+        "documentation": "https://www.home-assistant.io/integrations/flux_led",
+        "requirements": [
+            "flux_led==0.22"
+        ],
+        "codeowners": []
+    },
+    "folder": {
+        "domain": "folder",
+        "name": "Folder",
+        "documentation": "https://www.home-assistant.io/integrations/folder",
+        "codeowners": []
+    },
+    "folder_watcher": {
+        "domain": "folder_watcher",
+        "name": "Folder Watcher",
+        "documentation": "https://www.home-assistant.io/integrations/folder_watcher",
+        "requirements": [
+            "watchdog==0.8.3"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "foobot": {
+        "domain": "foobot",
+        "name": "Foobot",
+        "documentation": "https://www.home-assistant.io/integrations/foobot",
+        "requirements": [
+            "foobot_async==1.0.0"
+        ],
+        "codeowners": []
+    },
+    "forked_daapd": {
+        "domain": "forked_daapd",
+        "name": "forked-daapd",
+        "documentation": "https://www.home-assistant.io/integrations/forked-daapd",
+        "codeowners": [
+            "@uvjustin"
+        ],
+        "requirements": [
+            "pyforked-daapd==0.1.11",
+            "pylibrespot-java==0.1.0"
+        ],
+        "config_flow": True,
+        "zeroconf": [
+            "_daap._tcp.local."
+        ]
+    },
+    "fortios": {
+        "domain": "fortios",
+        "name": "FortiOS",
+        "documentation": "https://www.home-assistant.io/integrations/fortios/",
+        "requirements": [
+            "fortiosapi==0.10.8"
+        ],
+        "codeowners": [
+            "@kimfrellsen"
+        ]
+    },
+    "foscam": {
+        "domain": "foscam",
+        "name": "Foscam",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/foscam",
+        "requirements": [
+            "libpyfoscam==1.0"
+        ],
+        "codeowners": [
+            "@skgsergio"
+        ]
+    },
+    "foursquare": {
+        "domain": "foursquare",
+        "name": "Foursquare",
+        "documentation": "https://www.home-assistant.io/integrations/foursquare",
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": []
+    },
+    "free_mobile": {
+        "domain": "free_mobile",
+        "name": "Free Mobile",
+        "documentation": "https://www.home-assistant.io/integrations/free_mobile",
+        "requirements": [
+            "freesms==0.1.2"
+        ],
+        "codeowners": []
+    },
+    "freebox": {
+        "domain": "freebox",
+        "name": "Freebox",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/freebox",
+        "requirements": [
+            "aiofreepybox==0.0.8"
+        ],
+        "after_dependencies": [
+            "discovery"
+        ],
+        "codeowners": [
+            "@snoof85",
+            "@Quentame"
+        ]
+    },
+    "freedns": {
+        "domain": "freedns",
+        "name": "FreeDNS",
+        "documentation": "https://www.home-assistant.io/integrations/freedns",
+        "codeowners": []
+    },
+    "fritz": {
+        "domain": "fritz",
+        "name": "AVM FRITZ!Box",
+        "documentation": "https://www.home-assistant.io/integrations/fritz",
+        "requirements": [
+            "fritzconnection==1.4.0"
+        ],
+        "codeowners": []
+    },
+    "fritzbox": {
+        "domain": "fritzbox",
+        "name": "AVM FRITZ!SmartHome",
+        "documentation": "https://www.home-assistant.io/integrations/fritzbox",
+        "requirements": [
+            "pyfritzhome==0.4.2"
+        ],
+        "ssdp": [
+            {
+                "st": "urn:schemas-upnp-org:device:fritzbox:1"
+            }
+        ],
+        "codeowners": [],
+        "config_flow": True
+    },
+    "fritzbox_callmonitor": {
+        "domain": "fritzbox_callmonitor",
+        "name": "AVM FRITZ!Box Call Monitor",
+        "documentation": "https://www.home-assistant.io/integrations/fritzbox_callmonitor",
+        "requirements": [
+            "fritzconnection==1.4.0"
+        ],
+        "codeowners": []
+    },
+    "fritzbox_netmonitor": {
+        "domain": "fritzbox_netmonitor",
+        "name": "AVM FRITZ!Box Net Monitor",
+        "documentation": "https://www.home-assistant.io/integrations/fritzbox_netmonitor",
+        "requirements": [
+            "fritzconnection==1.4.0"
+        ],
+        "codeowners": []
+    },
+    "fronius": {
+        "domain": "fronius",
+        "name": "Fronius",
+        "documentation": "https://www.home-assistant.io/integrations/fronius",
+        "requirements": [
+            "pyfronius==0.4.6"
+        ],
+        "codeowners": [
+            "@nielstron"
+        ]
+    },
+    "frontend": {
+        "domain": "frontend",
+        "name": "Home Assistant Frontend",
+        "documentation": "https://www.home-assistant.io/integrations/frontend",
+        "requirements": [
+            "home-assistant-frontend==20201229.1"
+        ],
+        "dependencies": [
+            "api",
+            "auth",
+            "config",
+            "device_automation",
+            "http",
+            "lovelace",
+            "onboarding",
+            "search",
+            "system_log",
+            "websocket_api"
+        ],
+        "codeowners": [
+            "@home-assistant/frontend"
+        ],
+        "quality_scale": "internal"
+    },
+    "frontier_silicon": {
+        "domain": "frontier_silicon",
+        "name": "Frontier Silicon",
+        "documentation": "https://www.home-assistant.io/integrations/frontier_silicon",
+        "requirements": [
+            "afsapi==0.0.4"
+        ],
+        "codeowners": []
+    },
+    "futurenow": {
+        "domain": "futurenow",
+        "name": "P5 FutureNow",
+        "documentation": "https://www.home-assistant.io/integrations/futurenow",
+        "requirements": [
+            "pyfnip==0.2"
+        ],
+        "codeowners": []
+    },
+    "garadget": {
+        "domain": "garadget",
+        "name": "Garadget",
+        "documentation": "https://www.home-assistant.io/integrations/garadget",
+        "codeowners": []
+    },
+    "garmin_connect": {
+        "domain": "garmin_connect",
+        "name": "Garmin Connect",
+        "documentation": "https://www.home-assistant.io/integrations/garmin_connect",
+        "requirements": [
+            "garminconnect==0.1.16"
+        ],
+        "codeowners": [
+            "@cyberjunky"
+        ],
+        "config_flow": True
+    },
+    "gc100": {
+        "domain": "gc100",
+        "name": "Global Cach\u00e9 GC-100",
+        "documentation": "https://www.home-assistant.io/integrations/gc100",
+        "requirements": [
+            "python-gc100==1.0.3a"
+        ],
+        "codeowners": []
+    },
+    "gdacs": {
+        "domain": "gdacs",
+        "name": "Global Disaster Alert and Coordination System (GDACS)",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/gdacs",
+        "requirements": [
+            "aio_georss_gdacs==0.4"
+        ],
+        "codeowners": [
+            "@exxamalte"
+        ],
+        "quality_scale": "platinum"
+    },
+    "geizhals": {
+        "domain": "geizhals",
+        "name": "Geizhals",
+        "documentation": "https://www.home-assistant.io/integrations/geizhals",
+        "requirements": [
+            "geizhals==0.0.9"
+        ],
+        "codeowners": []
+    },
+    "generic": {
+        "domain": "generic",
+        "name": "Generic",
+        "documentation": "https://www.home-assistant.io/integrations/generic",
+        "codeowners": []
+    },
+    "generic_thermostat": {
+        "domain": "generic_thermostat",
+        "name": "Generic Thermostat",
+        "documentation": "https://www.home-assistant.io/integrations/generic_thermostat",
+        "dependencies": [
+            "sensor",
+            "switch"
+        ],
+        "codeowners": []
+    },
+    "geniushub": {
+        "domain": "geniushub",
+        "name": "Genius Hub",
+        "documentation": "https://www.home-assistant.io/integrations/geniushub",
+        "requirements": [
+            "geniushub-client==0.6.30"
+        ],
+        "codeowners": [
+            "@zxdavb"
+        ]
+    },
+    "geo_json_events": {
+        "domain": "geo_json_events",
+        "name": "GeoJSON",
+        "documentation": "https://www.home-assistant.io/integrations/geo_json_events",
+        "requirements": [
+            "geojson_client==0.4"
+        ],
+        "codeowners": []
+    },
+    "geo_location": {
+        "domain": "geo_location",
+        "name": "Geolocation",
+        "documentation": "https://www.home-assistant.io/integrations/geo_location",
+        "codeowners": []
+    },
+    "geo_rss_events": {
+        "domain": "geo_rss_events",
+        "name": "GeoRSS",
+        "documentation": "https://www.home-assistant.io/integrations/geo_rss_events",
+        "requirements": [
+            "georss_generic_client==0.4"
+        ],
+        "codeowners": [
+            "@exxamalte"
+        ]
+    },
+    "geofency": {
+        "domain": "geofency",
+        "name": "Geofency",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/geofency",
+        "dependencies": [
+            "webhook"
+        ],
+        "codeowners": []
+    },
+    "geonetnz_quakes": {
+        "domain": "geonetnz_quakes",
+        "name": "GeoNet NZ Quakes",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/geonetnz_quakes",
+        "requirements": [
+            "aio_geojson_geonetnz_quakes==0.12"
+        ],
+        "codeowners": [
+            "@exxamalte"
+        ],
+        "quality_scale": "platinum"
+    },
+    "geonetnz_volcano": {
+        "domain": "geonetnz_volcano",
+        "name": "GeoNet NZ Volcano",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/geonetnz_volcano",
+        "requirements": [
+            "aio_geojson_geonetnz_volcano==0.5"
+        ],
+        "codeowners": [
+            "@exxamalte"
+        ]
+    },
+    "gios": {
+        "domain": "gios",
+        "name": "GIO\u015a",
+        "documentation": "https://www.home-assistant.io/integrations/gios",
+        "codeowners": [
+            "@bieniu"
+        ],
+        "requirements": [
+            "gios==0.1.4"
+        ],
+        "config_flow": True,
+        "quality_scale": "platinum"
+    },
+    "github": {
+        "domain": "github",
+        "name": "GitHub",
+        "documentation": "https://www.home-assistant.io/integrations/github",
+        "requirements": [
+            "PyGithub==1.43.8"
+        ],
+        "codeowners": []
+    },
+    "gitlab_ci": {
+        "domain": "gitlab_ci",
+        "name": "GitLab-CI",
+        "documentation": "https://www.home-assistant.io/integrations/gitlab_ci",
+        "requirements": [
+            "python-gitlab==1.6.0"
+        ],
+        "codeowners": []
+    },
+    "gitter": {
+        "domain": "gitter",
+        "name": "Gitter",
+        "documentation": "https://www.home-assistant.io/integrations/gitter",
+        "requirements": [
+            "gitterpy==0.1.7"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "glances": {
+        "domain": "glances",
+        "name": "Glances",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/glances",
+        "requirements": [
+            "glances_api==0.2.0"
+        ],
+        "codeowners": [
+            "@fabaff",
+            "@engrbm87"
+        ]
+    },
+    "gntp": {
+        "domain": "gntp",
+        "name": "Growl (GnGNTP)",
+        "documentation": "https://www.home-assistant.io/integrations/gntp",
+        "requirements": [
+            "gntp==1.0.3"
+        ],
+        "codeowners": []
+    },
+    "goalfeed": {
+        "domain": "goalfeed",
+        "name": "Goalfeed",
+        "documentation": "https://www.home-assistant.io/integrations/goalfeed",
+        "requirements": [
+            "pysher==1.0.1"
+        ],
+        "codeowners": []
+    },
+    "goalzero": {
+        "domain": "goalzero",
+        "name": "Goal Zero Yeti",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/goalzero",
+        "requirements": [
+            "goalzero==0.1.4"
+        ],
+        "codeowners": [
+            "@tkdrob"
+        ]
+    },
+    "gogogate2": {
+        "domain": "gogogate2",
+        "name": "Gogogate2 and iSmartGate",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/gogogate2",
+        "requirements": [
+            "gogogate2-api==3.0.0"
+        ],
+        "codeowners": [
+            "@vangorra"
+        ],
+        "homekit": {
+            "models": [
+                "iSmartGate"
+            ]
+        }
+    },
+    "google": {
+        "domain": "google",
+        "name": "Google Calendars",
+        "documentation": "https://www.home-assistant.io/integrations/google",
+        "requirements": [
+            "google-api-python-client==1.6.4",
+            "httplib2==0.10.3",
+            "oauth2client==4.0.0"
+        ],
+        "codeowners": []
+    },
+    "google_assistant": {
+        "domain": "google_assistant",
+        "name": "Google Assistant",
+        "documentation": "https://www.home-assistant.io/integrations/google_assistant",
+        "dependencies": [
+            "http"
+        ],
+        "after_dependencies": [
+            "camera"
+        ],
+        "codeowners": [
+            "@home-assistant/cloud"
+        ]
+    },
+    "google_cloud": {
+        "domain": "google_cloud",
+        "name": "Google Cloud Platform",
+        "documentation": "https://www.home-assistant.io/integrations/google_cloud",
+        "requirements": [
+            "google-cloud-texttospeech==0.4.0"
+        ],
+        "codeowners": [
+            "@lufton"
+        ]
+    },
+    "google_domains": {
+        "domain": "google_domains",
+        "name": "Google Domains",
+        "documentation": "https://www.home-assistant.io/integrations/google_domains",
+        "codeowners": []
+    },
+    "google_maps": {
+        "domain": "google_maps",
+        "name": "Google Maps",
+        "documentation": "https://www.home-assistant.io/integrations/google_maps",
+        "requirements": [
+            "locationsharinglib==4.1.5"
+        ],
+        "codeowners": []
+    },
+    "google_pubsub": {
+        "domain": "google_pubsub",
+        "name": "Google Pub/Sub",
+        "documentation": "https://www.home-assistant.io/integrations/google_pubsub",
+        "requirements": [
+            "google-cloud-pubsub==2.1.0"
+        ],
+        "codeowners": []
+    },
+    "google_translate": {
+        "domain": "google_translate",
+        "name": "Google Translate Text-to-Speech",
+        "documentation": "https://www.home-assistant.io/integrations/google_translate",
+        "requirements": [
+            "gTTS==2.2.1"
+        ],
+        "codeowners": []
+    },
+    "google_travel_time": {
+        "domain": "google_travel_time",
+        "name": "Google Maps Travel Time",
+        "documentation": "https://www.home-assistant.io/integrations/google_travel_time",
+        "requirements": [
+            "googlemaps==2.5.1"
+        ],
+        "codeowners": []
+    },
+    "google_wifi": {
+        "domain": "google_wifi",
+        "name": "Google Wifi",
+        "documentation": "https://www.home-assistant.io/integrations/google_wifi",
+        "codeowners": []
+    },
+    "gpmdp": {
+        "domain": "gpmdp",
+        "name": "Google Play Music Desktop Player (GPMDP)",
+        "documentation": "https://www.home-assistant.io/integrations/gpmdp",
+        "requirements": [
+            "websocket-client==0.54.0"
+        ],
+        "dependencies": [
+            "configurator"
+        ],
+        "codeowners": []
+    },
+    "gpsd": {
+        "domain": "gpsd",
+        "name": "GPSD",
+        "documentation": "https://www.home-assistant.io/integrations/gpsd",
+        "requirements": [
+            "gps3==0.33.3"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "gpslogger": {
+        "domain": "gpslogger",
+        "name": "GPSLogger",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/gpslogger",
+        "dependencies": [
+            "webhook"
+        ],
+        "codeowners": []
+    },
+    "graphite": {
+        "domain": "graphite",
+        "name": "Graphite",
+        "documentation": "https://www.home-assistant.io/integrations/graphite",
+        "codeowners": []
+    },
+    "gree": {
+        "domain": "gree",
+        "name": "Gree Climate",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/gree",
+        "requirements": [
+            "greeclimate==0.10.3"
+        ],
+        "codeowners": [
+            "@cmroche"
+        ]
+    },
+    "greeneye_monitor": {
+        "domain": "greeneye_monitor",
+        "name": "GreenEye Monitor (GEM)",
+        "documentation": "https://www.home-assistant.io/integrations/greeneye_monitor",
+        "requirements": [
+            "greeneye_monitor==2.1"
+        ],
+        "codeowners": [
+            "@jkeljo"
+        ]
+    },
+    "greenwave": {
+        "domain": "greenwave",
+        "name": "Greenwave Reality",
+        "documentation": "https://www.home-assistant.io/integrations/greenwave",
+        "requirements": [
+            "greenwavereality==0.5.1"
+        ],
+        "codeowners": []
+    },
+    "griddy": {
+        "domain": "griddy",
+        "name": "Griddy Power",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/griddy",
+        "requirements": [
+            "griddypower==0.1.0"
+        ],
+        "codeowners": [
+            "@bdraco"
+        ]
+    },
+    "group": {
+        "domain": "group",
+        "name": "Group",
+        "documentation": "https://www.home-assistant.io/integrations/group",
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "growatt_server": {
+        "domain": "growatt_server",
+        "name": "Growatt",
+        "documentation": "https://www.home-assistant.io/integrations/growatt_server/",
+        "requirements": [
+            "growattServer==0.1.1"
+        ],
+        "codeowners": [
+            "@indykoning"
+        ]
+    },
+    "gstreamer": {
+        "domain": "gstreamer",
+        "name": "GStreamer",
+        "documentation": "https://www.home-assistant.io/integrations/gstreamer",
+        "requirements": [
+            "gstreamer-player==1.1.2"
+        ],
+        "codeowners": []
+    },
+    "gtfs": {
+        "domain": "gtfs",
+        "name": "General Transit Feed Specification (GTFS)",
+        "documentation": "https://www.home-assistant.io/integrations/gtfs",
+        "requirements": [
+            "pygtfs==0.1.5"
+        ],
+        "codeowners": []
+    },
+    "guardian": {
+        "domain": "guardian",
+        "name": "Elexa Guardian",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/guardian",
+        "requirements": [
+            "aioguardian==1.0.4"
+        ],
+        "zeroconf": [
+            "_api._udp.local."
+        ],
+        "homekit": {},
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "habitica": {
+        "domain": "habitica",
+        "name": "Habitica",
+        "documentation": "https://www.home-assistant.io/integrations/habitica",
+        "requirements": [
+            "habitipy==0.2.0"
+        ],
+        "codeowners": []
+    },
+    "hangouts": {
+        "domain": "hangouts",
+        "name": "Google Hangouts",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/hangouts",
+        "requirements": [
+            "hangups==0.4.11"
+        ],
+        "codeowners": []
+    },
+    "harman_kardon_avr": {
+        "domain": "harman_kardon_avr",
+        "name": "Harman Kardon AVR",
+        "documentation": "https://www.home-assistant.io/integrations/harman_kardon_avr",
+        "requirements": [
+            "hkavr==0.0.5"
+        ],
+        "codeowners": []
+    },
+    "harmony": {
+        "domain": "harmony",
+        "name": "Logitech Harmony Hub",
+        "documentation": "https://www.home-assistant.io/integrations/harmony",
+        "requirements": [
+            "aioharmony==0.2.6"
+        ],
+        "codeowners": [
+            "@ehendrix23",
+            "@bramkragten",
+            "@bdraco",
+            "@mkeesey"
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "Logitech",
+                "deviceType": "urn:myharmony-com:device:harmony:1"
+            }
+        ],
+        "dependencies": [
+            "remote",
+            "switch"
+        ],
+        "config_flow": True
+    },
+    "hassio": {
+        "domain": "hassio",
+        "name": "Home Assistant Supervisor",
+        "documentation": "https://www.home-assistant.io/hassio",
+        "dependencies": [
+            "http"
+        ],
+        "after_dependencies": [
+            "panel_custom"
+        ],
+        "codeowners": [
+            "@home-assistant/supervisor"
+        ]
+    },
+    "haveibeenpwned": {
+        "domain": "haveibeenpwned",
+        "name": "HaveIBeenPwned",
+        "documentation": "https://www.home-assistant.io/integrations/haveibeenpwned",
+        "codeowners": []
+    },
+    "hddtemp": {
+        "domain": "hddtemp",
+        "name": "hddtemp",
+        "documentation": "https://www.home-assistant.io/integrations/hddtemp",
+        "codeowners": []
+    },
+    "hdmi_cec": {
+        "domain": "hdmi_cec",
+        "name": "HDMI-CEC",
+        "documentation": "https://www.home-assistant.io/integrations/hdmi_cec",
+        "requirements": [
+            "pyCEC==0.4.14"
+        ],
+        "codeowners": [
+            "@newAM"
+        ]
+    },
+    "heatmiser": {
+        "domain": "heatmiser",
+        "name": "Heatmiser",
+        "documentation": "https://www.home-assistant.io/integrations/heatmiser",
+        "requirements": [
+            "heatmiserV3==1.1.18"
+        ],
+        "codeowners": [
+            "@andylockran"
+        ]
+    },
+    "heos": {
+        "domain": "heos",
+        "name": "Denon HEOS",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/heos",
+        "requirements": [
+            "pyheos==0.7.2"
+        ],
+        "ssdp": [
+            {
+                "st": "urn:schemas-denon-com:device:ACT-Denon:1"
+            }
+        ],
+        "codeowners": [
+            "@andrewsayre"
+        ]
+    },
+    "here_travel_time": {
+        "domain": "here_travel_time",
+        "name": "HERE Travel Time",
+        "documentation": "https://www.home-assistant.io/integrations/here_travel_time",
+        "requirements": [
+            "herepy==2.0.0"
+        ],
+        "codeowners": [
+            "@eifinger"
+        ]
+    },
+    "hikvision": {
+        "domain": "hikvision",
+        "name": "Hikvision",
+        "documentation": "https://www.home-assistant.io/integrations/hikvision",
+        "requirements": [
+            "pyhik==0.2.8"
+        ],
+        "codeowners": [
+            "@mezz64"
+        ]
+    },
+    "hikvisioncam": {
+        "domain": "hikvisioncam",
+        "name": "Hikvision",
+        "documentation": "https://www.home-assistant.io/integrations/hikvisioncam",
+        "requirements": [
+            "hikvision==0.4"
+        ],
+        "codeowners": [
+            "@fbradyirl"
+        ]
+    },
+    "hisense_aehw4a1": {
+        "domain": "hisense_aehw4a1",
+        "name": "Hisense AEH-W4A1",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/hisense_aehw4a1",
+        "requirements": [
+            "pyaehw4a1==0.3.9"
+        ],
+        "codeowners": [
+            "@bannhead"
+        ]
+    },
+    "history": {
+        "domain": "history",
+        "name": "History",
+        "documentation": "https://www.home-assistant.io/integrations/history",
+        "dependencies": [
+            "http",
+            "recorder"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "history_stats": {
+        "domain": "history_stats",
+        "name": "History Stats",
+        "documentation": "https://www.home-assistant.io/integrations/history_stats",
+        "dependencies": [
+            "history"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "hitron_coda": {
+        "domain": "hitron_coda",
+        "name": "Rogers Hitron CODA",
+        "documentation": "https://www.home-assistant.io/integrations/hitron_coda",
+        "codeowners": []
+    },
+    "hive": {
+        "domain": "hive",
+        "name": "Hive",
+        "documentation": "https://www.home-assistant.io/integrations/hive",
+        "requirements": [
+            "pyhiveapi==0.2.20.2"
+        ],
+        "codeowners": [
+            "@Rendili",
+            "@KJonline"
+        ]
+    },
+    "hlk_sw16": {
+        "domain": "hlk_sw16",
+        "name": "Hi-Link HLK-SW16",
+        "documentation": "https://www.home-assistant.io/integrations/hlk_sw16",
+        "requirements": [
+            "hlk-sw16==0.0.9"
+        ],
+        "codeowners": [
+            "@jameshilliard"
+        ],
+        "config_flow": True
+    },
+    "home_connect": {
+        "domain": "home_connect",
+        "name": "Home Connect",
+        "documentation": "https://www.home-assistant.io/integrations/home_connect",
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@DavidMStraub"
+        ],
+        "requirements": [
+            "homeconnect==0.6.3"
+        ],
+        "config_flow": True
+    },
+    "homeassistant": {
+        "domain": "homeassistant",
+        "name": "Home Assistant Core Integration",
+        "documentation": "https://www.home-assistant.io/integrations/homeassistant",
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "homekit": {
+        "domain": "homekit",
+        "name": "HomeKit",
+        "documentation": "https://www.home-assistant.io/integrations/homekit",
+        "requirements": [
+            "HAP-python==3.1.0",
+            "fnvhash==0.1.0",
+            "PyQRCode==1.2.1",
+            "base36==0.1.1",
+            "PyTurboJPEG==1.4.0"
+        ],
+        "dependencies": [
+            "http",
+            "camera",
+            "ffmpeg"
+        ],
+        "after_dependencies": [
+            "zeroconf"
+        ],
+        "codeowners": [
+            "@bdraco"
+        ],
+        "zeroconf": [
+            "_homekit._tcp.local."
+        ],
+        "config_flow": True
+    },
+    "homekit_controller": {
+        "domain": "homekit_controller",
+        "name": "HomeKit Controller",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/homekit_controller",
+        "requirements": [
+            "aiohomekit==0.2.60"
+        ],
+        "zeroconf": [
+            "_hap._tcp.local."
+        ],
+        "after_dependencies": [
+            "zeroconf"
+        ],
+        "codeowners": [
+            "@Jc2k"
+        ]
+    },
+    "homematic": {
+        "domain": "homematic",
+        "name": "Homematic",
+        "documentation": "https://www.home-assistant.io/integrations/homematic",
+        "requirements": [
+            "pyhomematic==0.1.71"
+        ],
+        "codeowners": [
+            "@pvizeli",
+            "@danielperna84"
+        ]
+    },
+    "homematicip_cloud": {
+        "domain": "homematicip_cloud",
+        "name": "HomematicIP Cloud",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/homematicip_cloud",
+        "requirements": [
+            "homematicip==0.13.0"
+        ],
+        "codeowners": [
+            "@SukramJ"
+        ],
+        "quality_scale": "platinum"
+    },
+    "homeworks": {
+        "domain": "homeworks",
+        "name": "Lutron Homeworks",
+        "documentation": "https://www.home-assistant.io/integrations/homeworks",
+        "requirements": [
+            "pyhomeworks==0.0.6"
+        ],
+        "codeowners": []
+    },
+    "honeywell": {
+        "domain": "honeywell",
+        "name": "Honeywell Total Connect Comfort (US)",
+        "documentation": "https://www.home-assistant.io/integrations/honeywell",
+        "requirements": [
+            "somecomfort==0.5.2"
+        ],
+        "codeowners": []
+    },
+    "horizon": {
+        "domain": "horizon",
+        "name": "Unitymedia Horizon HD Recorder",
+        "documentation": "https://www.home-assistant.io/integrations/horizon",
+        "requirements": [
+            "horimote==0.4.1"
+        ],
+        "codeowners": []
+    },
+    "hp_ilo": {
+        "domain": "hp_ilo",
+        "name": "HP Integrated Lights-Out (ILO)",
+        "documentation": "https://www.home-assistant.io/integrations/hp_ilo",
+        "requirements": [
+            "python-hpilo==4.3"
+        ],
+        "codeowners": []
+    },
+    "html5": {
+        "domain": "html5",
+        "name": "HTML5 Push Notifications",
+        "documentation": "https://www.home-assistant.io/integrations/html5",
+        "requirements": [
+            "pywebpush==1.9.2"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": []
+    },
+    "http": {
+        "domain": "http",
+        "name": "HTTP",
+        "documentation": "https://www.home-assistant.io/integrations/http",
+        "requirements": [
+            "aiohttp_cors==0.7.0"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "htu21d": {
+        "domain": "htu21d",
+        "name": "HTU21D(F) Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/htu21d",
+        "requirements": [
+            "i2csense==0.0.4",
+            "smbus-cffi==0.5.1"
+        ],
+        "codeowners": []
+    },
+    "huawei_lte": {
+        "domain": "huawei_lte",
+        "name": "Huawei LTE",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/huawei_lte",
+        "requirements": [
+            "getmac==0.8.2",
+            "huawei-lte-api==1.4.17",
+            "stringcase==1.2.0",
+            "url-normalize==1.4.1"
+        ],
+        "ssdp": [
+            {
+                "deviceType": "urn:schemas-upnp-org:device:InternetGatewayDevice:1",
+                "manufacturer": "Huawei"
+            }
+        ],
+        "codeowners": [
+            "@scop",
+            "@fphammerle"
+        ]
+    },
+    "huawei_router": {
+        "domain": "huawei_router",
+        "name": "Huawei Router",
+        "documentation": "https://www.home-assistant.io/integrations/huawei_router",
+        "codeowners": [
+            "@abmantis"
+        ]
+    },
+    "hue": {
+        "domain": "hue",
+        "name": "Philips Hue",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/hue",
+        "requirements": [
+            "aiohue==2.1.0"
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "Royal Philips Electronics",
+                "modelName": "Philips hue bridge 2012"
+            },
+            {
+                "manufacturer": "Royal Philips Electronics",
+                "modelName": "Philips hue bridge 2015"
+            },
+            {
+                "manufacturer": "Signify",
+                "modelName": "Philips hue bridge 2015"
+            }
+        ],
+        "homekit": {
+            "models": [
+                "BSB002"
+            ]
+        },
+        "codeowners": [
+            "@balloob",
+            "@frenck"
+        ],
+        "quality_scale": "platinum"
+    },
+    "humidifier": {
+        "domain": "humidifier",
+        "name": "Humidifier",
+        "documentation": "https://www.home-assistant.io/integrations/humidifier",
+        "codeowners": [
+            "@home-assistant/core",
+            "@Shulyaka"
+        ],
+        "quality_scale": "internal"
+    },
+    "hunterdouglas_powerview": {
+        "domain": "hunterdouglas_powerview",
+        "name": "Hunter Douglas PowerView",
+        "documentation": "https://www.home-assistant.io/integrations/hunterdouglas_powerview",
+        "requirements": [
+            "aiopvapi==1.6.14"
+        ],
+        "codeowners": [
+            "@bdraco"
+        ],
+        "config_flow": True,
+        "homekit": {
+            "models": [
+                "PowerView"
+            ]
+        }
+    },
+    "hvv_departures": {
+        "domain": "hvv_departures",
+        "name": "HVV Departures",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/hvv_departures",
+        "requirements": [
+            "pygti==0.9.2"
+        ],
+        "codeowners": [
+            "@vigonotion"
+        ]
+    },
+    "hydrawise": {
+        "domain": "hydrawise",
+        "name": "Hunter Hydrawise",
+        "documentation": "https://www.home-assistant.io/integrations/hydrawise",
+        "requirements": [
+            "hydrawiser==0.2"
+        ],
+        "codeowners": [
+            "@ptcryan"
+        ]
+    },
+    "hyperion": {
+        "codeowners": [
+            "@dermotduffy"
+        ],
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/hyperion",
+        "domain": "hyperion",
+        "name": "Hyperion",
+        "quality_scale": "platinum",
+        "requirements": [
+            "hyperion-py==0.7.0"
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "Hyperion Open Source Ambient Lighting",
+                "st": "urn:hyperion-project.org:device:basic:1"
+            }
+        ]
+    },
+    "iammeter": {
+        "domain": "iammeter",
+        "name": "IamMeter",
+        "documentation": "https://www.home-assistant.io/integrations/iammeter",
+        "codeowners": [
+            "@lewei50"
+        ],
+        "requirements": [
+            "iammeter==0.1.7"
+        ]
+    },
+    "iaqualink": {
+        "domain": "iaqualink",
+        "name": "Jandy iAqualink",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/iaqualink/",
+        "codeowners": [
+            "@flz"
+        ],
+        "requirements": [
+            "iaqualink==0.3.4"
+        ]
+    },
+    "icloud": {
+        "domain": "icloud",
+        "name": "Apple iCloud",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/icloud",
+        "requirements": [
+            "pyicloud==0.9.7"
+        ],
+        "codeowners": [
+            "@Quentame"
+        ]
+    },
+    "idteck_prox": {
+        "domain": "idteck_prox",
+        "name": "IDTECK Proximity Reader",
+        "documentation": "https://www.home-assistant.io/integrations/idteck_prox",
+        "requirements": [
+            "rfk101py==0.0.1"
+        ],
+        "codeowners": []
+    },
+    "ifttt": {
+        "domain": "ifttt",
+        "name": "IFTTT",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ifttt",
+        "requirements": [
+            "pyfttt==0.3"
+        ],
+        "dependencies": [
+            "webhook"
+        ],
+        "codeowners": []
+    },
+    "iglo": {
+        "domain": "iglo",
+        "name": "iGlo",
+        "documentation": "https://www.home-assistant.io/integrations/iglo",
+        "requirements": [
+            "iglo==1.2.7"
+        ],
+        "codeowners": []
+    },
+    "ign_sismologia": {
+        "domain": "ign_sismologia",
+        "name": "IGN Sismolog\u00eda",
+        "documentation": "https://www.home-assistant.io/integrations/ign_sismologia",
+        "requirements": [
+            "georss_ign_sismologia_client==0.2"
+        ],
+        "codeowners": [
+            "@exxamalte"
+        ]
+    },
+    "ihc": {
+        "domain": "ihc",
+        "name": "IHC Controller",
+        "documentation": "https://www.home-assistant.io/integrations/ihc",
+        "requirements": [
+            "defusedxml==0.6.0",
+            "ihcsdk==2.7.0"
+        ],
+        "codeowners": []
+    },
+    "image": {
+        "domain": "image",
+        "name": "Image",
+        "config_flow": False,
+        "documentation": "https://www.home-assistant.io/integrations/image",
+        "requirements": [
+            "pillow==7.2.0"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "image_processing": {
+        "domain": "image_processing",
+        "name": "Image Processing",
+        "documentation": "https://www.home-assistant.io/integrations/image_processing",
+        "dependencies": [
+            "camera"
+        ],
+        "codeowners": []
+    },
+    "imap": {
+        "domain": "imap",
+        "name": "IMAP",
+        "documentation": "https://www.home-assistant.io/integrations/imap",
+        "requirements": [
+            "aioimaplib==0.7.15"
+        ],
+        "codeowners": []
+    },
+    "imap_email_content": {
+        "domain": "imap_email_content",
+        "name": "IMAP Email Content",
+        "documentation": "https://www.home-assistant.io/integrations/imap_email_content",
+        "codeowners": []
+    },
+    "incomfort": {
+        "domain": "incomfort",
+        "name": "Intergas InComfort/Intouch Lan2RF gateway",
+        "documentation": "https://www.home-assistant.io/integrations/incomfort",
+        "requirements": [
+            "incomfort-client==0.4.0"
+        ],
+        "codeowners": [
+            "@zxdavb"
+        ]
+    },
+    "influxdb": {
+        "domain": "influxdb",
+        "name": "InfluxDB",
+        "documentation": "https://www.home-assistant.io/integrations/influxdb",
+        "requirements": [
+            "influxdb==5.2.3",
+            "influxdb-client==1.8.0"
+        ],
+        "codeowners": [
+            "@fabaff",
+            "@mdegat01"
+        ]
+    },
+    "input_boolean": {
+        "domain": "input_boolean",
+        "name": "Input Boolean",
+        "documentation": "https://www.home-assistant.io/integrations/input_boolean",
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "input_datetime": {
+        "domain": "input_datetime",
+        "name": "Input Datetime",
+        "documentation": "https://www.home-assistant.io/integrations/input_datetime",
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "input_number": {
+        "domain": "input_number",
+        "name": "Input Number",
+        "documentation": "https://www.home-assistant.io/integrations/input_number",
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "input_select": {
+        "domain": "input_select",
+        "name": "Input Select",
+        "documentation": "https://www.home-assistant.io/integrations/input_select",
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "input_text": {
+        "domain": "input_text",
+        "name": "Input Text",
+        "documentation": "https://www.home-assistant.io/integrations/input_text",
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "insteon": {
+        "domain": "insteon",
+        "name": "Insteon",
+        "documentation": "https://www.home-assistant.io/integrations/insteon",
+        "requirements": [
+            "pyinsteon==1.0.8"
+        ],
+        "codeowners": [
+            "@teharris1"
+        ],
+        "config_flow": True
+    },
+    "integration": {
+        "domain": "integration",
+        "name": "Integration - Riemann sum integral",
+        "documentation": "https://www.home-assistant.io/integrations/integration",
+        "codeowners": [
+            "@dgomes"
+        ],
+        "quality_scale": "internal"
+    },
+    "intent": {
+        "domain": "intent",
+        "name": "Intent",
+        "config_flow": False,
+        "documentation": "https://www.home-assistant.io/integrations/intent",
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ]
+    },
+    "intent_script": {
+        "domain": "intent_script",
+        "name": "Intent Script",
+        "documentation": "https://www.home-assistant.io/integrations/intent_script",
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "intesishome": {
+        "domain": "intesishome",
+        "name": "IntesisHome",
+        "documentation": "https://www.home-assistant.io/integrations/intesishome",
+        "codeowners": [
+            "@jnimmo"
+        ],
+        "requirements": [
+            "pyintesishome==1.7.5"
+        ]
+    },
+    "ios": {
+        "domain": "ios",
+        "name": "Home Assistant iOS",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ios",
+        "dependencies": [
+            "device_tracker",
+            "http",
+            "zeroconf"
+        ],
+        "codeowners": [
+            "@robbiet480"
+        ]
+    },
+    "iota": {
+        "domain": "iota",
+        "name": "IOTA",
+        "documentation": "https://www.home-assistant.io/integrations/iota",
+        "requirements": [
+            "pyota==2.0.5"
+        ],
+        "codeowners": []
+    },
+    "iperf3": {
+        "domain": "iperf3",
+        "name": "Iperf3",
+        "documentation": "https://www.home-assistant.io/integrations/iperf3",
+        "requirements": [
+            "iperf3==0.1.11"
+        ],
+        "codeowners": [
+            "@rohankapoorcom"
+        ]
+    },
+    "ipma": {
+        "domain": "ipma",
+        "name": "Instituto Portugu\u00eas do Mar e Atmosfera (IPMA)",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ipma",
+        "requirements": [
+            "pyipma==2.0.5"
+        ],
+        "codeowners": [
+            "@dgomes",
+            "@abmantis"
+        ]
+    },
+    "ipp": {
+        "domain": "ipp",
+        "name": "Internet Printing Protocol (IPP)",
+        "documentation": "https://www.home-assistant.io/integrations/ipp",
+        "requirements": [
+            "pyipp==0.11.0"
+        ],
+        "codeowners": [
+            "@ctalkington"
+        ],
+        "config_flow": True,
+        "quality_scale": "platinum",
+        "zeroconf": [
+            "_ipps._tcp.local.",
+            "_ipp._tcp.local."
+        ]
+    },
+    "iqvia": {
+        "domain": "iqvia",
+        "name": "IQVIA",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/iqvia",
+        "requirements": [
+            "numpy==1.19.2",
+            "pyiqvia==0.3.1"
+        ],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "irish_rail_transport": {
+        "domain": "irish_rail_transport",
+        "name": "Irish Rail Transport",
+        "documentation": "https://www.home-assistant.io/integrations/irish_rail_transport",
+        "requirements": [
+            "pyirishrail==0.0.2"
+        ],
+        "codeowners": [
+            "@ttroy50"
+        ]
+    },
+    "islamic_prayer_times": {
+        "domain": "islamic_prayer_times",
+        "name": "Islamic Prayer Times",
+        "documentation": "https://www.home-assistant.io/integrations/islamic_prayer_times",
+        "requirements": [
+            "prayer_times_calculator==0.0.3"
+        ],
+        "codeowners": [
+            "@engrbm87"
+        ],
+        "config_flow": True
+    },
+    "iss": {
+        "domain": "iss",
+        "name": "International Space Station (ISS)",
+        "documentation": "https://www.home-assistant.io/integrations/iss",
+        "requirements": [
+            "pyiss==1.0.1"
+        ],
+        "codeowners": []
+    },
+    "isy994": {
+        "domain": "isy994",
+        "name": "Universal Devices ISY994",
+        "documentation": "https://www.home-assistant.io/integrations/isy994",
+        "requirements": [
+            "pyisy==2.1.0"
+        ],
+        "codeowners": [
+            "@bdraco",
+            "@shbatm"
+        ],
+        "config_flow": True,
+        "ssdp": [
+            {
+                "manufacturer": "Universal Devices Inc.",
+                "deviceType": "urn:udi-com:device:X_Insteon_Lighting_Device:1"
+            }
+        ]
+    },
+    "itach": {
+        "domain": "itach",
+        "name": "Global Cach\u00e9 iTach TCP/IP to IR",
+        "documentation": "https://www.home-assistant.io/integrations/itach",
+        "requirements": [
+            "pyitachip2ir==0.0.7"
+        ],
+        "codeowners": []
+    },
+    "itunes": {
+        "domain": "itunes",
+        "name": "Apple iTunes",
+        "documentation": "https://www.home-assistant.io/integrations/itunes",
+        "codeowners": []
+    },
+    "izone": {
+        "domain": "izone",
+        "name": "iZone",
+        "documentation": "https://www.home-assistant.io/integrations/izone",
+        "requirements": [
+            "python-izone==1.1.3"
+        ],
+        "codeowners": [
+            "@Swamp-Ig"
+        ],
+        "config_flow": True,
+        "homekit": {
+            "models": [
+                "iZone"
+            ]
+        }
+    },
+    "jewish_calendar": {
+        "domain": "jewish_calendar",
+        "name": "Jewish Calendar",
+        "documentation": "https://www.home-assistant.io/integrations/jewish_calendar",
+        "requirements": [
+            "hdate==0.9.12"
+        ],
+        "codeowners": [
+            "@tsvi"
+        ]
+    },
+    "joaoapps_join": {
+        "domain": "joaoapps_join",
+        "name": "Joaoapps Join",
+        "documentation": "https://www.home-assistant.io/integrations/joaoapps_join",
+        "requirements": [
+            "python-join-api==0.0.6"
+        ],
+        "codeowners": []
+    },
+    "juicenet": {
+        "domain": "juicenet",
+        "name": "JuiceNet",
+        "documentation": "https://www.home-assistant.io/integrations/juicenet",
+        "requirements": [
+            "python-juicenet==1.0.1"
+        ],
+        "codeowners": [
+            "@jesserockz"
+        ],
+        "config_flow": True
+    },
+    "kaiterra": {
+        "domain": "kaiterra",
+        "name": "Kaiterra",
+        "documentation": "https://www.home-assistant.io/integrations/kaiterra",
+        "requirements": [
+            "kaiterra-async-client==0.0.2"
+        ],
+        "codeowners": [
+            "@Michsior14"
+        ]
+    },
+    "kankun": {
+        "domain": "kankun",
+        "name": "Kankun",
+        "documentation": "https://www.home-assistant.io/integrations/kankun",
+        "codeowners": []
+    },
+    "keba": {
+        "domain": "keba",
+        "name": "Keba Charging Station",
+        "documentation": "https://www.home-assistant.io/integrations/keba",
+        "requirements": [
+            "keba-kecontact==1.1.0"
+        ],
+        "codeowners": [
+            "@dannerph"
+        ]
+    },
+    "keenetic_ndms2": {
+        "domain": "keenetic_ndms2",
+        "name": "Keenetic NDMS2 Routers",
+        "documentation": "https://www.home-assistant.io/integrations/keenetic_ndms2",
+        "requirements": [
+            "ndms2_client==0.0.11"
+        ],
+        "codeowners": [
+            "@foxel"
+        ]
+    },
+    "kef": {
+        "domain": "kef",
+        "name": "KEF",
+        "documentation": "https://www.home-assistant.io/integrations/kef",
+        "codeowners": [
+            "@basnijholt"
+        ],
+        "requirements": [
+            "aiokef==0.2.16",
+            "getmac==0.8.2"
+        ]
+    },
+    "keyboard": {
+        "domain": "keyboard",
+        "name": "Keyboard",
+        "documentation": "https://www.home-assistant.io/integrations/keyboard",
+        "requirements": [
+            "pyuserinput==0.1.11"
+        ],
+        "codeowners": []
+    },
+    "keyboard_remote": {
+        "domain": "keyboard_remote",
+        "name": "Keyboard Remote",
+        "documentation": "https://www.home-assistant.io/integrations/keyboard_remote",
+        "requirements": [
+            "evdev==1.1.2",
+            "aionotify==0.2.0"
+        ],
+        "codeowners": [
+            "@bendavid"
+        ]
+    },
+    "kira": {
+        "domain": "kira",
+        "name": "Kira",
+        "documentation": "https://www.home-assistant.io/integrations/kira",
+        "requirements": [
+            "pykira==0.1.1"
+        ],
+        "codeowners": []
+    },
+    "kiwi": {
+        "domain": "kiwi",
+        "name": "KIWI",
+        "documentation": "https://www.home-assistant.io/integrations/kiwi",
+        "requirements": [
+            "kiwiki-client==0.1.1"
+        ],
+        "codeowners": []
+    },
+    "knx": {
+        "domain": "knx",
+        "name": "KNX",
+        "documentation": "https://www.home-assistant.io/integrations/knx",
+        "requirements": [
+            "xknx==0.16.1"
+        ],
+        "codeowners": [
+            "@Julius2342",
+            "@farmio",
+            "@marvin-w"
+        ],
+        "quality_scale": "silver"
+    },
+    "kodi": {
+        "domain": "kodi",
+        "name": "Kodi",
+        "documentation": "https://www.home-assistant.io/integrations/kodi",
+        "requirements": [
+            "pykodi==0.2.1"
+        ],
+        "codeowners": [
+            "@OnFreund",
+            "@cgtobi"
+        ],
+        "zeroconf": [
+            "_xbmc-jsonrpc-h._tcp.local."
+        ],
+        "config_flow": True
+    },
+    "konnected": {
+        "domain": "konnected",
+        "name": "Konnected.io",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/konnected",
+        "requirements": [
+            "konnected==1.2.0"
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "konnected.io"
+            }
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@heythisisnate",
+            "@kit-klein"
+        ]
+    },
+    "kulersky": {
+        "domain": "kulersky",
+        "name": "Kuler Sky",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/kulersky",
+        "requirements": [
+            "pykulersky==0.4.0"
+        ],
+        "codeowners": [
+            "@emlove"
+        ]
+    },
+    "kwb": {
+        "domain": "kwb",
+        "name": "KWB Easyfire",
+        "documentation": "https://www.home-assistant.io/integrations/kwb",
+        "requirements": [
+            "pykwb==0.0.8"
+        ],
+        "codeowners": []
+    },
+    "lacrosse": {
+        "domain": "lacrosse",
+        "name": "LaCrosse",
+        "documentation": "https://www.home-assistant.io/integrations/lacrosse",
+        "requirements": [
+            "pylacrosse==0.4"
+        ],
+        "codeowners": []
+    },
+    "lametric": {
+        "domain": "lametric",
+        "name": "LaMetric",
+        "documentation": "https://www.home-assistant.io/integrations/lametric",
+        "requirements": [
+            "lmnotify==0.0.4"
+        ],
+        "codeowners": [
+            "@robbiet480"
+        ]
+    },
+    "lannouncer": {
+        "domain": "lannouncer",
+        "name": "LANnouncer",
+        "documentation": "https://www.home-assistant.io/integrations/lannouncer",
+        "codeowners": []
+    },
+    "lastfm": {
+        "domain": "lastfm",
+        "name": "Last.fm",
+        "documentation": "https://www.home-assistant.io/integrations/lastfm",
+        "requirements": [
+            "pylast==4.1.0"
+        ],
+        "codeowners": []
+    },
+    "launch_library": {
+        "domain": "launch_library",
+        "name": "Launch Library",
+        "documentation": "https://www.home-assistant.io/integrations/launch_library",
+        "requirements": [
+            "pylaunches==1.0.0"
+        ],
+        "codeowners": [
+            "@ludeeus"
+        ]
+    },
+    "lcn": {
+        "domain": "lcn",
+        "name": "LCN",
+        "documentation": "https://www.home-assistant.io/integrations/lcn",
+        "requirements": [
+            "pypck==0.7.9"
+        ],
+        "codeowners": [
+            "@alengwenus"
+        ]
+    },
+    "lg_netcast": {
+        "domain": "lg_netcast",
+        "name": "LG Netcast",
+        "documentation": "https://www.home-assistant.io/integrations/lg_netcast",
+        "requirements": [
+            "pylgnetcast-homeassistant==0.2.0.dev0"
+        ],
+        "codeowners": []
+    },
+    "lg_soundbar": {
+        "domain": "lg_soundbar",
+        "name": "LG Soundbars",
+        "documentation": "https://www.home-assistant.io/integrations/lg_soundbar",
+        "requirements": [
+            "temescal==0.3"
+        ],
+        "codeowners": []
+    },
+    "life360": {
+        "domain": "life360",
+        "name": "Life360",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/life360",
+        "codeowners": [
+            "@pnbruckner"
+        ],
+        "requirements": [
+            "life360==4.1.1"
+        ]
+    },
+    "lifx": {
+        "domain": "lifx",
+        "name": "LIFX",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/lifx",
+        "requirements": [
+            "aiolifx==0.6.9",
+            "aiolifx_effects==0.2.2"
+        ],
+        "homekit": {
+            "models": [
+                "LIFX"
+            ]
+        },
+        "codeowners": []
+    },
+    "lifx_cloud": {
+        "domain": "lifx_cloud",
+        "name": "LIFX Cloud",
+        "documentation": "https://www.home-assistant.io/integrations/lifx_cloud",
+        "codeowners": []
+    },
+    "lifx_legacy": {
+        "domain": "lifx_legacy",
+        "name": "LIFX Legacy",
+        "documentation": "https://www.home-assistant.io/integrations/lifx_legacy",
+        "requirements": [
+            "liffylights==0.9.4"
+        ],
+        "codeowners": []
+    },
+    "light": {
+        "domain": "light",
+        "name": "Light",
+        "documentation": "https://www.home-assistant.io/integrations/light",
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "lightwave": {
+        "domain": "lightwave",
+        "name": "Lightwave",
+        "documentation": "https://www.home-assistant.io/integrations/lightwave",
+        "requirements": [
+            "lightwave==0.19"
+        ],
+        "codeowners": []
+    },
+    "limitlessled": {
+        "domain": "limitlessled",
+        "name": "LimitlessLED",
+        "documentation": "https://www.home-assistant.io/integrations/limitlessled",
+        "requirements": [
+            "limitlessled==1.1.3"
+        ],
+        "codeowners": []
+    },
+    "linksys_smart": {
+        "domain": "linksys_smart",
+        "name": "Linksys Smart Wi-Fi",
+        "documentation": "https://www.home-assistant.io/integrations/linksys_smart",
+        "codeowners": []
+    },
+    "linode": {
+        "domain": "linode",
+        "name": "Linode",
+        "documentation": "https://www.home-assistant.io/integrations/linode",
+        "requirements": [
+            "linode-api==4.1.9b1"
+        ],
+        "codeowners": []
+    },
+    "linux_battery": {
+        "domain": "linux_battery",
+        "name": "Linux Battery",
+        "documentation": "https://www.home-assistant.io/integrations/linux_battery",
+        "requirements": [
+            "batinfo==0.4.2"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "lirc": {
+        "domain": "lirc",
+        "name": "LIRC",
+        "documentation": "https://www.home-assistant.io/integrations/lirc",
+        "requirements": [
+            "python-lirc==1.2.3"
+        ],
+        "codeowners": []
+    },
+    "litejet": {
+        "domain": "litejet",
+        "name": "LiteJet",
+        "documentation": "https://www.home-assistant.io/integrations/litejet",
+        "requirements": [
+            "pylitejet==0.1"
+        ],
+        "codeowners": []
+    },
+    "llamalab_automate": {
+        "domain": "llamalab_automate",
+        "name": "LlamaLab Automate",
+        "documentation": "https://www.home-assistant.io/integrations/llamalab_automate",
+        "codeowners": []
+    },
+    "local_file": {
+        "domain": "local_file",
+        "name": "Local File",
+        "documentation": "https://www.home-assistant.io/integrations/local_file",
+        "codeowners": []
+    },
+    "local_ip": {
+        "domain": "local_ip",
+        "name": "Local IP Address",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/local_ip",
+        "codeowners": [
+            "@issacg"
+        ]
+    },
+    "locative": {
+        "domain": "locative",
+        "name": "Locative",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/locative",
+        "dependencies": [
+            "webhook"
+        ],
+        "codeowners": []
+    },
+    "lock": {
+        "domain": "lock",
+        "name": "Lock",
+        "documentation": "https://www.home-assistant.io/integrations/lock",
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "logbook": {
+        "domain": "logbook",
+        "name": "Logbook",
+        "documentation": "https://www.home-assistant.io/integrations/logbook",
+        "dependencies": [
+            "frontend",
+            "http",
+            "recorder"
+        ],
+        "codeowners": []
+    },
+    "logentries": {
+        "domain": "logentries",
+        "name": "Logentries",
+        "documentation": "https://www.home-assistant.io/integrations/logentries",
+        "codeowners": []
+    },
+    "logger": {
+        "domain": "logger",
+        "name": "Logger",
+        "documentation": "https://www.home-assistant.io/integrations/logger",
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "logi_circle": {
+        "domain": "logi_circle",
+        "name": "Logi Circle",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/logi_circle",
+        "requirements": [
+            "logi_circle==0.2.2"
+        ],
+        "dependencies": [
+            "ffmpeg",
+            "http"
+        ],
+        "codeowners": [
+            "@evanjd"
+        ]
+    },
+    "london_air": {
+        "domain": "london_air",
+        "name": "London Air",
+        "documentation": "https://www.home-assistant.io/integrations/london_air",
+        "codeowners": []
+    },
+    "london_underground": {
+        "domain": "london_underground",
+        "name": "London Underground",
+        "documentation": "https://www.home-assistant.io/integrations/london_underground",
+        "requirements": [
+            "london-tube-status==0.2"
+        ],
+        "codeowners": []
+    },
+    "loopenergy": {
+        "domain": "loopenergy",
+        "name": "Loop Energy",
+        "documentation": "https://www.home-assistant.io/integrations/loopenergy",
+        "requirements": [
+            "pyloopenergy==0.2.1"
+        ],
+        "codeowners": [
+            "@pavoni"
+        ]
+    },
+    "lovelace": {
+        "domain": "lovelace",
+        "name": "Lovelace",
+        "documentation": "https://www.home-assistant.io/integrations/lovelace",
+        "codeowners": [
+            "@home-assistant/frontend"
+        ]
+    },
+    "luci": {
+        "domain": "luci",
+        "name": "OpenWRT (luci)",
+        "documentation": "https://www.home-assistant.io/integrations/luci",
+        "requirements": [
+            "openwrt-luci-rpc==1.1.6"
+        ],
+        "codeowners": [
+            "@mzdrale"
+        ]
+    },
+    "luftdaten": {
+        "domain": "luftdaten",
+        "name": "Luftdaten",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/luftdaten",
+        "requirements": [
+            "luftdaten==0.6.4"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ],
+        "quality_scale": "gold"
+    },
+    "lupusec": {
+        "domain": "lupusec",
+        "name": "Lupus Electronics LUPUSEC",
+        "documentation": "https://www.home-assistant.io/integrations/lupusec",
+        "requirements": [
+            "lupupy==0.0.18"
+        ],
+        "codeowners": [
+            "@majuss"
+        ]
+    },
+    "lutron": {
+        "domain": "lutron",
+        "name": "Lutron",
+        "documentation": "https://www.home-assistant.io/integrations/lutron",
+        "requirements": [
+            "pylutron==0.2.5"
+        ],
+        "codeowners": [
+            "@JonGilmore"
+        ]
+    },
+    "lutron_caseta": {
+        "domain": "lutron_caseta",
+        "name": "Lutron Cas\u00e9ta",
+        "documentation": "https://www.home-assistant.io/integrations/lutron_caseta",
+        "requirements": [
+            "pylutron-caseta==0.8.0"
+        ],
+        "config_flow": True,
+        "zeroconf": [
+            "_leap._tcp.local."
+        ],
+        "homekit": {
+            "models": [
+                "Smart Bridge"
+            ]
+        },
+        "codeowners": [
+            "@swails",
+            "@bdraco"
+        ]
+    },
+    "lw12wifi": {
+        "domain": "lw12wifi",
+        "name": "LAGUTE LW-12",
+        "documentation": "https://www.home-assistant.io/integrations/lw12wifi",
+        "requirements": [
+            "lw12==0.9.2"
+        ],
+        "codeowners": []
+    },
+    "lyft": {
+        "domain": "lyft",
+        "name": "Lyft",
+        "documentation": "https://www.home-assistant.io/integrations/lyft",
+        "requirements": [
+            "lyft_rides==0.2"
+        ],
+        "codeowners": []
+    },
+    "magicseaweed": {
+        "domain": "magicseaweed",
+        "name": "Magicseaweed",
+        "documentation": "https://www.home-assistant.io/integrations/magicseaweed",
+        "requirements": [
+            "magicseaweed==1.0.3"
+        ],
+        "codeowners": []
+    },
+    "mailbox": {
+        "domain": "mailbox",
+        "name": "Mailbox",
+        "documentation": "https://www.home-assistant.io/integrations/mailbox",
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": []
+    },
+    "mailgun": {
+        "domain": "mailgun",
+        "name": "Mailgun",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/mailgun",
+        "requirements": [
+            "pymailgunner==1.4"
+        ],
+        "dependencies": [
+            "webhook"
+        ],
+        "codeowners": []
+    },
+    "manual": {
+        "domain": "manual",
+        "name": "Manual",
+        "documentation": "https://www.home-assistant.io/integrations/manual",
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "manual_mqtt": {
+        "domain": "manual_mqtt",
+        "name": "Manual MQTT",
+        "documentation": "https://www.home-assistant.io/integrations/manual_mqtt",
+        "dependencies": [
+            "mqtt"
+        ],
+        "codeowners": []
+    },
+    "map": {
+        "domain": "map",
+        "name": "Map",
+        "documentation": "https://www.home-assistant.io/integrations/map",
+        "dependencies": [
+            "frontend"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "marytts": {
+        "domain": "marytts",
+        "name": "MaryTTS",
+        "documentation": "https://www.home-assistant.io/integrations/marytts",
+        "requirements": [
+            "speak2mary==1.4.0"
+        ],
+        "codeowners": []
+    },
+    "mastodon": {
+        "domain": "mastodon",
+        "name": "Mastodon",
+        "documentation": "https://www.home-assistant.io/integrations/mastodon",
+        "requirements": [
+            "Mastodon.py==1.5.1"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "matrix": {
+        "domain": "matrix",
+        "name": "Matrix",
+        "documentation": "https://www.home-assistant.io/integrations/matrix",
+        "requirements": [
+            "matrix-client==0.3.2"
+        ],
+        "codeowners": [
+            "@tinloaf"
+        ]
+    },
+    "maxcube": {
+        "domain": "maxcube",
+        "name": "eQ-3 MAX!",
+        "documentation": "https://www.home-assistant.io/integrations/maxcube",
+        "requirements": [
+            "maxcube-api==0.3.0"
+        ],
+        "codeowners": []
+    },
+    "mcp23017": {
+        "domain": "mcp23017",
+        "name": "MCP23017 I/O Expander",
+        "documentation": "https://www.home-assistant.io/integrations/mcp23017",
+        "requirements": [
+            "RPi.GPIO==0.7.0",
+            "adafruit-circuitpython-mcp230xx==2.2.2"
+        ],
+        "codeowners": [
+            "@jardiamj"
+        ]
+    },
+    "media_extractor": {
+        "domain": "media_extractor",
+        "name": "Media Extractor",
+        "documentation": "https://www.home-assistant.io/integrations/media_extractor",
+        "requirements": [
+            "youtube_dl==2021.01.03"
+        ],
+        "dependencies": [
+            "media_player"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "media_player": {
+        "domain": "media_player",
+        "name": "Media Player",
+        "documentation": "https://www.home-assistant.io/integrations/media_player",
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "media_source": {
+        "domain": "media_source",
+        "name": "Media Source",
+        "documentation": "https://www.home-assistant.io/integrations/media_source",
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@hunterjm"
+        ]
+    },
+    "mediaroom": {
+        "domain": "mediaroom",
+        "name": "Mediaroom",
+        "documentation": "https://www.home-assistant.io/integrations/mediaroom",
+        "requirements": [
+            "pymediaroom==0.6.4.1"
+        ],
+        "codeowners": [
+            "@dgomes"
+        ]
+    },
+    "melcloud": {
+        "domain": "melcloud",
+        "name": "MELCloud",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/melcloud",
+        "requirements": [
+            "pymelcloud==2.5.2"
+        ],
+        "codeowners": [
+            "@vilppuvuorinen"
+        ]
+    },
+    "melissa": {
+        "domain": "melissa",
+        "name": "Melissa",
+        "documentation": "https://www.home-assistant.io/integrations/melissa",
+        "requirements": [
+            "py-melissa-climate==2.1.4"
+        ],
+        "codeowners": [
+            "@kennedyshead"
+        ]
+    },
+    "meraki": {
+        "domain": "meraki",
+        "name": "Meraki",
+        "documentation": "https://www.home-assistant.io/integrations/meraki",
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": []
+    },
+    "message_bird": {
+        "domain": "message_bird",
+        "name": "MessageBird",
+        "documentation": "https://www.home-assistant.io/integrations/message_bird",
+        "requirements": [
+            "messagebird==1.2.0"
+        ],
+        "codeowners": []
+    },
+    "met": {
+        "domain": "met",
+        "name": "Meteorologisk institutt (Met.no)",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/met",
+        "requirements": [
+            "pyMetno==0.8.1"
+        ],
+        "codeowners": [
+            "@danielhiversen",
+            "@thimic"
+        ]
+    },
+    "meteo_france": {
+        "domain": "meteo_france",
+        "name": "M\u00e9t\u00e9o-France",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/meteo_france",
+        "requirements": [
+            "meteofrance-api==1.0.1"
+        ],
+        "codeowners": [
+            "@hacf-fr",
+            "@oncleben31",
+            "@Quentame"
+        ]
+    },
+    "meteoalarm": {
+        "domain": "meteoalarm",
+        "name": "MeteoAlarm",
+        "documentation": "https://www.home-assistant.io/integrations/meteoalarm",
+        "requirements": [
+            "meteoalertapi==0.1.6"
+        ],
+        "codeowners": [
+            "@rolfberkenbosch"
+        ]
+    },
+    "metoffice": {
+        "domain": "metoffice",
+        "name": "Met Office",
+        "documentation": "https://www.home-assistant.io/integrations/metoffice",
+        "requirements": [
+            "datapoint==0.9.5"
+        ],
+        "codeowners": [
+            "@MrHarcombe"
+        ],
+        "config_flow": True
+    },
+    "mfi": {
+        "domain": "mfi",
+        "name": "Ubiquiti mFi mPort",
+        "documentation": "https://www.home-assistant.io/integrations/mfi",
+        "requirements": [
+            "mficlient==0.3.0"
+        ],
+        "codeowners": []
+    },
+    "mhz19": {
+        "domain": "mhz19",
+        "name": "MH-Z19 CO2 Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/mhz19",
+        "requirements": [
+            "pmsensor==0.4"
+        ],
+        "codeowners": []
+    },
+    "microsoft": {
+        "domain": "microsoft",
+        "name": "Microsoft Text-to-Speech (TTS)",
+        "documentation": "https://www.home-assistant.io/integrations/microsoft",
+        "requirements": [
+            "pycsspeechtts==1.0.4"
+        ],
+        "codeowners": []
+    },
+    "microsoft_face": {
+        "domain": "microsoft_face",
+        "name": "Microsoft Face",
+        "documentation": "https://www.home-assistant.io/integrations/microsoft_face",
+        "dependencies": [
+            "camera"
+        ],
+        "codeowners": []
+    },
+    "microsoft_face_detect": {
+        "domain": "microsoft_face_detect",
+        "name": "Microsoft Face Detect",
+        "documentation": "https://www.home-assistant.io/integrations/microsoft_face_detect",
+        "dependencies": [
+            "microsoft_face"
+        ],
+        "codeowners": []
+    },
+    "microsoft_face_identify": {
+        "domain": "microsoft_face_identify",
+        "name": "Microsoft Face Identify",
+        "documentation": "https://www.home-assistant.io/integrations/microsoft_face_identify",
+        "dependencies": [
+            "microsoft_face"
+        ],
+        "codeowners": []
+    },
+    "miflora": {
+        "domain": "miflora",
+        "name": "Mi Flora",
+        "documentation": "https://www.home-assistant.io/integrations/miflora",
+        "requirements": [
+            "bluepy==1.3.0",
+            "miflora==0.7.0"
+        ],
+        "codeowners": [
+            "@danielhiversen",
+            "@basnijholt"
+        ]
+    },
+    "mikrotik": {
+        "domain": "mikrotik",
+        "name": "Mikrotik",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/mikrotik",
+        "requirements": [
+            "librouteros==3.0.0"
+        ],
+        "codeowners": [
+            "@engrbm87"
+        ]
+    },
+    "mill": {
+        "domain": "mill",
+        "name": "Mill",
+        "documentation": "https://www.home-assistant.io/integrations/mill",
+        "requirements": [
+            "millheater==0.4.0"
+        ],
+        "codeowners": [
+            "@danielhiversen"
+        ],
+        "config_flow": True
+    },
+    "min_max": {
+        "domain": "min_max",
+        "name": "Min/Max",
+        "documentation": "https://www.home-assistant.io/integrations/min_max",
+        "codeowners": [
+            "@fabaff"
+        ],
+        "quality_scale": "internal"
+    },
+    "minecraft_server": {
+        "domain": "minecraft_server",
+        "name": "Minecraft Server",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/minecraft_server",
+        "requirements": [
+            "aiodns==2.0.0",
+            "getmac==0.8.2",
+            "mcstatus==2.3.0"
+        ],
+        "codeowners": [
+            "@elmurato"
+        ],
+        "quality_scale": "silver"
+    },
+    "minio": {
+        "domain": "minio",
+        "name": "Minio",
+        "documentation": "https://www.home-assistant.io/integrations/minio",
+        "requirements": [
+            "minio==4.0.9"
+        ],
+        "codeowners": [
+            "@tkislan"
+        ]
+    },
+    "mitemp_bt": {
+        "domain": "mitemp_bt",
+        "name": "Xiaomi Mijia BLE Temperature and Humidity Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/mitemp_bt",
+        "requirements": [
+            "mitemp_bt==0.0.3"
+        ],
+        "codeowners": []
+    },
+    "mjpeg": {
+        "domain": "mjpeg",
+        "name": "MJPEG IP Camera",
+        "documentation": "https://www.home-assistant.io/integrations/mjpeg",
+        "codeowners": []
+    },
+    "mobile_app": {
+        "domain": "mobile_app",
+        "name": "Mobile App",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/mobile_app",
+        "requirements": [
+            "PyNaCl==1.3.0",
+            "emoji==0.5.4"
+        ],
+        "dependencies": [
+            "http",
+            "webhook",
+            "person",
+            "tag"
+        ],
+        "after_dependencies": [
+            "cloud",
+            "camera",
+            "notify"
+        ],
+        "codeowners": [
+            "@robbiet480"
+        ],
+        "quality_scale": "internal"
+    },
+    "mochad": {
+        "domain": "mochad",
+        "name": "Mochad",
+        "documentation": "https://www.home-assistant.io/integrations/mochad",
+        "requirements": [
+            "pymochad==0.2.0"
+        ],
+        "codeowners": []
+    },
+    "modbus": {
+        "domain": "modbus",
+        "name": "Modbus",
+        "documentation": "https://www.home-assistant.io/integrations/modbus",
+        "requirements": [
+            "pymodbus==2.3.0"
+        ],
+        "codeowners": [
+            "@adamchengtkc",
+            "@janiversen",
+            "@vzahradnik"
+        ]
+    },
+    "modem_callerid": {
+        "domain": "modem_callerid",
+        "name": "Modem Caller ID",
+        "documentation": "https://www.home-assistant.io/integrations/modem_callerid",
+        "requirements": [
+            "basicmodem==0.7"
+        ],
+        "codeowners": []
+    },
+    "mold_indicator": {
+        "domain": "mold_indicator",
+        "name": "Mold Indicator",
+        "documentation": "https://www.home-assistant.io/integrations/mold_indicator",
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "monoprice": {
+        "domain": "monoprice",
+        "name": "Monoprice 6-Zone Amplifier",
+        "documentation": "https://www.home-assistant.io/integrations/monoprice",
+        "requirements": [
+            "pymonoprice==0.3"
+        ],
+        "codeowners": [
+            "@etsinko",
+            "@OnFreund"
+        ],
+        "config_flow": True
+    },
+    "moon": {
+        "domain": "moon",
+        "name": "Moon",
+        "documentation": "https://www.home-assistant.io/integrations/moon",
+        "codeowners": [
+            "@fabaff"
+        ],
+        "quality_scale": "internal"
+    },
+    "motion_blinds": {
+        "domain": "motion_blinds",
+        "name": "Motion Blinds",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/motion_blinds",
+        "requirements": [
+            "motionblinds==0.4.7"
+        ],
+        "codeowners": [
+            "@starkillerOG"
+        ]
+    },
+    "mpchc": {
+        "domain": "mpchc",
+        "name": "Media Player Classic Home Cinema (MPC-HC)",
+        "documentation": "https://www.home-assistant.io/integrations/mpchc",
+        "codeowners": []
+    },
+    "mpd": {
+        "domain": "mpd",
+        "name": "Music Player Daemon (MPD)",
+        "documentation": "https://www.home-assistant.io/integrations/mpd",
+        "requirements": [
+            "python-mpd2==3.0.3"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "mqtt": {
+        "domain": "mqtt",
+        "name": "MQTT",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/mqtt",
+        "requirements": [
+            "paho-mqtt==1.5.1"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@home-assistant/core",
+            "@emontnemery"
+        ]
+    },
+    "mqtt_eventstream": {
+        "domain": "mqtt_eventstream",
+        "name": "MQTT Eventstream",
+        "documentation": "https://www.home-assistant.io/integrations/mqtt_eventstream",
+        "dependencies": [
+            "mqtt"
+        ],
+        "codeowners": []
+    },
+    "mqtt_json": {
+        "domain": "mqtt_json",
+        "name": "MQTT JSON",
+        "documentation": "https://www.home-assistant.io/integrations/mqtt_json",
+        "dependencies": [
+            "mqtt"
+        ],
+        "codeowners": []
+    },
+    "mqtt_room": {
+        "domain": "mqtt_room",
+        "name": "MQTT Room Presence",
+        "documentation": "https://www.home-assistant.io/integrations/mqtt_room",
+        "dependencies": [
+            "mqtt"
+        ],
+        "codeowners": []
+    },
+    "mqtt_statestream": {
+        "domain": "mqtt_statestream",
+        "name": "MQTT Statestream",
+        "documentation": "https://www.home-assistant.io/integrations/mqtt_statestream",
+        "dependencies": [
+            "mqtt"
+        ],
+        "codeowners": []
+    },
+    "msteams": {
+        "domain": "msteams",
+        "name": "Microsoft Teams",
+        "documentation": "https://www.home-assistant.io/integrations/msteams",
+        "requirements": [
+            "pymsteams==0.1.12"
+        ],
+        "codeowners": [
+            "@peroyvind"
+        ]
+    },
+    "mvglive": {
+        "domain": "mvglive",
+        "name": "MVG",
+        "documentation": "https://www.home-assistant.io/integrations/mvglive",
+        "requirements": [
+            "PyMVGLive==1.1.4"
+        ],
+        "codeowners": []
+    },
+    "mychevy": {
+        "domain": "mychevy",
+        "name": "myChevrolet",
+        "documentation": "https://www.home-assistant.io/integrations/mychevy",
+        "requirements": [
+            "mychevy==2.1.1"
+        ],
+        "codeowners": []
+    },
+    "mycroft": {
+        "domain": "mycroft",
+        "name": "Mycroft",
+        "documentation": "https://www.home-assistant.io/integrations/mycroft",
+        "requirements": [
+            "mycroftapi==2.0"
+        ],
+        "codeowners": []
+    },
+    "myq": {
+        "domain": "myq",
+        "name": "MyQ",
+        "documentation": "https://www.home-assistant.io/integrations/myq",
+        "requirements": [
+            "pymyq==2.0.14"
+        ],
+        "codeowners": [
+            "@bdraco"
+        ],
+        "config_flow": True,
+        "homekit": {
+            "models": [
+                "819LMB"
+            ]
+        }
+    },
+    "mysensors": {
+        "domain": "mysensors",
+        "name": "MySensors",
+        "documentation": "https://www.home-assistant.io/integrations/mysensors",
+        "requirements": [
+            "pymysensors==0.18.0"
+        ],
+        "after_dependencies": [
+            "mqtt"
+        ],
+        "codeowners": [
+            "@MartinHjelmare"
+        ]
+    },
+    "mystrom": {
+        "domain": "mystrom",
+        "name": "myStrom",
+        "documentation": "https://www.home-assistant.io/integrations/mystrom",
+        "requirements": [
+            "python-mystrom==1.1.2"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "mythicbeastsdns": {
+        "domain": "mythicbeastsdns",
+        "name": "Mythic Beasts DNS",
+        "documentation": "https://www.home-assistant.io/integrations/mythicbeastsdns",
+        "requirements": [
+            "mbddns==0.1.2"
+        ],
+        "codeowners": []
+    },
+    "n26": {
+        "domain": "n26",
+        "name": "N26",
+        "documentation": "https://www.home-assistant.io/integrations/n26",
+        "requirements": [
+            "n26==0.2.7"
+        ],
+        "codeowners": []
+    },
+    "nad": {
+        "domain": "nad",
+        "name": "NAD",
+        "documentation": "https://www.home-assistant.io/integrations/nad",
+        "requirements": [
+            "nad_receiver==0.0.12"
+        ],
+        "codeowners": []
+    },
+    "namecheapdns": {
+        "domain": "namecheapdns",
+        "name": "Namecheap FreeDNS",
+        "documentation": "https://www.home-assistant.io/integrations/namecheapdns",
+        "requirements": [
+            "defusedxml==0.6.0"
+        ],
+        "codeowners": []
+    },
+    "nanoleaf": {
+        "domain": "nanoleaf",
+        "name": "Nanoleaf",
+        "documentation": "https://www.home-assistant.io/integrations/nanoleaf",
+        "requirements": [
+            "pynanoleaf==0.0.5"
+        ],
+        "codeowners": []
+    },
+    "neato": {
+        "domain": "neato",
+        "name": "Neato Botvac",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/neato",
+        "requirements": [
+            "pybotvac==0.0.20"
+        ],
+        "codeowners": [
+            "@dshokouhi",
+            "@Santobert"
+        ],
+        "dependencies": [
+            "http"
+        ]
+    },
+    "nederlandse_spoorwegen": {
+        "domain": "nederlandse_spoorwegen",
+        "name": "Nederlandse Spoorwegen (NS)",
+        "documentation": "https://www.home-assistant.io/integrations/nederlandse_spoorwegen",
+        "requirements": [
+            "nsapi==3.0.4"
+        ],
+        "codeowners": [
+            "@YarmoM"
+        ]
+    },
+    "nello": {
+        "domain": "nello",
+        "name": "Nello",
+        "documentation": "https://www.home-assistant.io/integrations/nello",
+        "requirements": [
+            "pynello==2.0.3"
+        ],
+        "codeowners": [
+            "@pschmitt"
+        ]
+    },
+    "ness_alarm": {
+        "domain": "ness_alarm",
+        "name": "Ness Alarm",
+        "documentation": "https://www.home-assistant.io/integrations/ness_alarm",
+        "requirements": [
+            "nessclient==0.9.15"
+        ],
+        "codeowners": [
+            "@nickw444"
+        ]
+    },
+    "nest": {
+        "domain": "nest",
+        "name": "Nest",
+        "config_flow": True,
+        "dependencies": [
+            "ffmpeg",
+            "http"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/nest",
+        "requirements": [
+            "python-nest==4.1.0",
+            "google-nest-sdm==0.2.9"
+        ],
+        "codeowners": [
+            "@allenporter"
+        ],
+        "quality_scale": "platinum",
+        "dhcp": [
+            {
+                "macaddress": "18B430*"
+            }
+        ]
+    },
+    "netatmo": {
+        "domain": "netatmo",
+        "name": "Netatmo",
+        "documentation": "https://www.home-assistant.io/integrations/netatmo",
+        "requirements": [
+            "pyatmo==4.2.2"
+        ],
+        "after_dependencies": [
+            "cloud",
+            "media_source"
+        ],
+        "dependencies": [
+            "webhook"
+        ],
+        "codeowners": [
+            "@cgtobi"
+        ],
+        "config_flow": True,
+        "homekit": {
+            "models": [
+                "Healty Home Coach",
+                "Netatmo Relay",
+                "Presence",
+                "Welcome"
+            ]
+        }
+    },
+    "netdata": {
+        "domain": "netdata",
+        "name": "Netdata",
+        "documentation": "https://www.home-assistant.io/integrations/netdata",
+        "requirements": [
+            "netdata==0.2.0"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "netgear": {
+        "domain": "netgear",
+        "name": "NETGEAR",
+        "documentation": "https://www.home-assistant.io/integrations/netgear",
+        "requirements": [
+            "pynetgear==0.6.1"
+        ],
+        "codeowners": []
+    },
+    "netgear_lte": {
+        "domain": "netgear_lte",
+        "name": "NETGEAR LTE",
+        "documentation": "https://www.home-assistant.io/integrations/netgear_lte",
+        "requirements": [
+            "eternalegypt==0.0.12"
+        ],
+        "codeowners": []
+    },
+    "netio": {
+        "domain": "netio",
+        "name": "Netio",
+        "documentation": "https://www.home-assistant.io/integrations/netio",
+        "requirements": [
+            "pynetio==0.1.9.1"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": []
+    },
+    "neurio_energy": {
+        "domain": "neurio_energy",
+        "name": "Neurio energy",
+        "documentation": "https://www.home-assistant.io/integrations/neurio_energy",
+        "requirements": [
+            "neurio==0.3.1"
+        ],
+        "codeowners": []
+    },
+    "nexia": {
+        "domain": "nexia",
+        "name": "Nexia",
+        "requirements": [
+            "nexia==0.9.5"
+        ],
+        "codeowners": [
+            "@bdraco"
+        ],
+        "documentation": "https://www.home-assistant.io/integrations/nexia",
+        "config_flow": True,
+        "dhcp": [
+            {
+                "hostname": "xl857-*",
+                "macaddress": "000231*"
+            }
+        ]
+    },
+    "nextbus": {
+        "domain": "nextbus",
+        "name": "NextBus",
+        "documentation": "https://www.home-assistant.io/integrations/nextbus",
+        "codeowners": [
+            "@vividboarder"
+        ],
+        "requirements": [
+            "py_nextbusnext==0.1.4"
+        ]
+    },
+    "nextcloud": {
+        "domain": "nextcloud",
+        "name": "Nextcloud",
+        "documentation": "https://www.home-assistant.io/integrations/nextcloud",
+        "requirements": [
+            "nextcloudmonitor==1.1.0"
+        ],
+        "codeowners": [
+            "@meichthys"
+        ]
+    },
+    "nfandroidtv": {
+        "domain": "nfandroidtv",
+        "name": "Notifications for Android TV / FireTV",
+        "documentation": "https://www.home-assistant.io/integrations/nfandroidtv",
+        "codeowners": []
+    },
+    "nightscout": {
+        "domain": "nightscout",
+        "name": "Nightscout",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/nightscout",
+        "requirements": [
+            "py-nightscout==1.2.2"
+        ],
+        "codeowners": [
+            "@marciogranzotto"
+        ],
+        "quality_scale": "platinum"
+    },
+    "niko_home_control": {
+        "domain": "niko_home_control",
+        "name": "Niko Home Control",
+        "documentation": "https://www.home-assistant.io/integrations/niko_home_control",
+        "requirements": [
+            "niko-home-control==0.2.1"
+        ],
+        "codeowners": []
+    },
+    "nilu": {
+        "domain": "nilu",
+        "name": "Norwegian Institute for Air Research (NILU)",
+        "documentation": "https://www.home-assistant.io/integrations/nilu",
+        "requirements": [
+            "niluclient==0.1.2"
+        ],
+        "codeowners": [
+            "@hfurubotten"
+        ]
+    },
+    "nissan_leaf": {
+        "domain": "nissan_leaf",
+        "name": "Nissan Leaf",
+        "documentation": "https://www.home-assistant.io/integrations/nissan_leaf",
+        "requirements": [
+            "pycarwings2==2.10"
+        ],
+        "codeowners": [
+            "@filcole"
+        ]
+    },
+    "nmap_tracker": {
+        "domain": "nmap_tracker",
+        "name": "Nmap Tracker",
+        "documentation": "https://www.home-assistant.io/integrations/nmap_tracker",
+        "requirements": [
+            "python-nmap==0.6.1",
+            "getmac==0.8.2"
+        ],
+        "codeowners": []
+    },
+    "nmbs": {
+        "domain": "nmbs",
+        "name": "NMBS",
+        "documentation": "https://www.home-assistant.io/integrations/nmbs",
+        "requirements": [
+            "pyrail==0.0.3"
+        ],
+        "codeowners": [
+            "@thibmaek"
+        ]
+    },
+    "no_ip": {
+        "domain": "no_ip",
+        "name": "No-IP.com",
+        "documentation": "https://www.home-assistant.io/integrations/no_ip",
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "noaa_tides": {
+        "domain": "noaa_tides",
+        "name": "NOAA Tides",
+        "documentation": "https://www.home-assistant.io/integrations/noaa_tides",
+        "requirements": [
+            "noaa-coops==0.1.8"
+        ],
+        "codeowners": [
+            "@jdelaney72"
+        ]
+    },
+    "norway_air": {
+        "domain": "norway_air",
+        "name": "Om Luftkvalitet i Norge (Norway Air)",
+        "documentation": "https://www.home-assistant.io/integrations/norway_air",
+        "requirements": [
+            "pyMetno==0.8.1"
+        ],
+        "codeowners": []
+    },
+    "notify": {
+        "domain": "notify",
+        "name": "Notifications",
+        "documentation": "https://www.home-assistant.io/integrations/notify",
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "notify_events": {
+        "domain": "notify_events",
+        "name": "Notify.Events",
+        "documentation": "https://www.home-assistant.io/integrations/notify_events",
+        "codeowners": [
+            "@matrozov",
+            "@papajojo"
+        ],
+        "requirements": [
+            "notify-events==1.0.4"
+        ]
+    },
+    "notion": {
+        "domain": "notion",
+        "name": "Notion",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/notion",
+        "requirements": [
+            "aionotion==1.1.0"
+        ],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "nsw_fuel_station": {
+        "domain": "nsw_fuel_station",
+        "name": "NSW Fuel Station Price",
+        "documentation": "https://www.home-assistant.io/integrations/nsw_fuel_station",
+        "requirements": [
+            "nsw-fuel-api-client==1.0.10"
+        ],
+        "codeowners": [
+            "@nickw444"
+        ]
+    },
+    "nsw_rural_fire_service_feed": {
+        "domain": "nsw_rural_fire_service_feed",
+        "name": "NSW Rural Fire Service Incidents",
+        "documentation": "https://www.home-assistant.io/integrations/nsw_rural_fire_service_feed",
+        "requirements": [
+            "aio_geojson_nsw_rfs_incidents==0.3"
+        ],
+        "codeowners": [
+            "@exxamalte"
+        ]
+    },
+    "nuheat": {
+        "domain": "nuheat",
+        "name": "NuHeat",
+        "documentation": "https://www.home-assistant.io/integrations/nuheat",
+        "requirements": [
+            "nuheat==0.3.0"
+        ],
+        "codeowners": [
+            "@bdraco"
+        ],
+        "config_flow": True,
+        "dhcp": [
+            {
+                "hostname": "nuheat",
+                "macaddress": "002338*"
+            }
+        ]
+    },
+    "nuimo_controller": {
+        "domain": "nuimo_controller",
+        "name": "Nuimo controller",
+        "documentation": "https://www.home-assistant.io/integrations/nuimo_controller",
+        "requirements": [
+            "--only-binary=all nuimo==0.1.0"
+        ],
+        "codeowners": []
+    },
+    "nuki": {
+        "domain": "nuki",
+        "name": "Nuki",
+        "documentation": "https://www.home-assistant.io/integrations/nuki",
+        "requirements": [
+            "pynuki==1.3.8"
+        ],
+        "codeowners": [
+            "@pschmitt",
+            "@pvizeli"
+        ]
+    },
+    "numato": {
+        "domain": "numato",
+        "name": "Numato USB GPIO Expander",
+        "documentation": "https://www.home-assistant.io/integrations/numato",
+        "requirements": [
+            "numato-gpio==0.8.0"
+        ],
+        "codeowners": [
+            "@clssn"
+        ]
+    },
+    "number": {
+        "domain": "number",
+        "name": "Number",
+        "documentation": "https://www.home-assistant.io/integrations/number",
+        "codeowners": [
+            "@home-assistant/core",
+            "@Shulyaka"
+        ],
+        "quality_scale": "internal"
+    },
+    "nut": {
+        "domain": "nut",
+        "name": "Network UPS Tools (NUT)",
+        "documentation": "https://www.home-assistant.io/integrations/nut",
+        "requirements": [
+            "pynut2==2.1.2"
+        ],
+        "codeowners": [
+            "@bdraco"
+        ],
+        "config_flow": True,
+        "zeroconf": [
+            "_nut._tcp.local."
+        ]
+    },
+    "nws": {
+        "domain": "nws",
+        "name": "National Weather Service (NWS)",
+        "documentation": "https://www.home-assistant.io/integrations/nws",
+        "codeowners": [
+            "@MatthewFlamm"
+        ],
+        "requirements": [
+            "pynws==1.3.0"
+        ],
+        "quality_scale": "platinum",
+        "config_flow": True
+    },
+    "nx584": {
+        "domain": "nx584",
+        "name": "NX584",
+        "documentation": "https://www.home-assistant.io/integrations/nx584",
+        "requirements": [
+            "pynx584==0.5"
+        ],
+        "codeowners": []
+    },
+    "nzbget": {
+        "domain": "nzbget",
+        "name": "NZBGet",
+        "documentation": "https://www.home-assistant.io/integrations/nzbget",
+        "requirements": [
+            "pynzbgetapi==0.2.0"
+        ],
+        "codeowners": [
+            "@chriscla"
+        ],
+        "config_flow": True
+    },
+    "oasa_telematics": {
+        "domain": "oasa_telematics",
+        "name": "OASA Telematics",
+        "documentation": "https://www.home-assistant.io/integrations/oasa_telematics/",
+        "requirements": [
+            "oasatelematics==0.3"
+        ],
+        "codeowners": []
+    },
+    "obihai": {
+        "domain": "obihai",
+        "name": "Obihai",
+        "documentation": "https://www.home-assistant.io/integrations/obihai",
+        "requirements": [
+            "pyobihai==1.3.1"
+        ],
+        "codeowners": [
+            "@dshokouhi"
+        ]
+    },
+    "octoprint": {
+        "domain": "octoprint",
+        "name": "OctoPrint",
+        "documentation": "https://www.home-assistant.io/integrations/octoprint",
+        "after_dependencies": [
+            "discovery"
+        ],
+        "codeowners": []
+    },
+    "oem": {
+        "domain": "oem",
+        "name": "OpenEnergyMonitor WiFi Thermostat",
+        "documentation": "https://www.home-assistant.io/integrations/oem",
+        "requirements": [
+            "oemthermostat==1.1.1"
+        ],
+        "codeowners": []
+    },
+    "ohmconnect": {
+        "domain": "ohmconnect",
+        "name": "OhmConnect",
+        "documentation": "https://www.home-assistant.io/integrations/ohmconnect",
+        "requirements": [
+            "defusedxml==0.6.0"
+        ],
+        "codeowners": [
+            "@robbiet480"
+        ]
+    },
+    "ombi": {
+        "domain": "ombi",
+        "name": "Ombi",
+        "documentation": "https://www.home-assistant.io/integrations/ombi/",
+        "codeowners": [
+            "@larssont"
+        ],
+        "requirements": [
+            "pyombi==0.1.10"
+        ]
+    },
+    "omnilogic": {
+        "domain": "omnilogic",
+        "name": "Hayward Omnilogic",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/omnilogic",
+        "requirements": [
+            "omnilogic==0.4.2"
+        ],
+        "codeowners": [
+            "@oliver84",
+            "@djtimca",
+            "@gentoosu"
+        ]
+    },
+    "onboarding": {
+        "domain": "onboarding",
+        "name": "Home Assistant Onboarding",
+        "documentation": "https://www.home-assistant.io/integrations/onboarding",
+        "after_dependencies": [
+            "hassio"
+        ],
+        "dependencies": [
+            "auth",
+            "http",
+            "person"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "ondilo_ico": {
+        "domain": "ondilo_ico",
+        "name": "Ondilo ICO",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ondilo_ico",
+        "requirements": [
+            "ondilo==0.2.0"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@JeromeHXP"
+        ]
+    },
+    "onewire": {
+        "domain": "onewire",
+        "name": "1-Wire",
+        "documentation": "https://www.home-assistant.io/integrations/onewire",
+        "config_flow": True,
+        "requirements": [
+            "pyownet==0.10.0.post1",
+            "pi1wire==0.1.0"
+        ],
+        "codeowners": [
+            "@garbled1",
+            "@epenet"
+        ]
+    },
+    "onkyo": {
+        "domain": "onkyo",
+        "name": "Onkyo",
+        "documentation": "https://www.home-assistant.io/integrations/onkyo",
+        "requirements": [
+            "onkyo-eiscp==1.2.7"
+        ],
+        "codeowners": []
+    },
+    "onvif": {
+        "domain": "onvif",
+        "name": "ONVIF",
+        "documentation": "https://www.home-assistant.io/integrations/onvif",
+        "requirements": [
+            "onvif-zeep-async==1.0.0",
+            "WSDiscovery==2.0.0",
+            "zeep[async]==4.0.0"
+        ],
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "codeowners": [
+            "@hunterjm"
+        ],
+        "config_flow": True
+    },
+    "openalpr_cloud": {
+        "domain": "openalpr_cloud",
+        "name": "OpenALPR Cloud",
+        "documentation": "https://www.home-assistant.io/integrations/openalpr_cloud",
+        "codeowners": []
+    },
+    "openalpr_local": {
+        "domain": "openalpr_local",
+        "name": "OpenALPR Local",
+        "documentation": "https://www.home-assistant.io/integrations/openalpr_local",
+        "codeowners": []
+    },
+    "opencv": {
+        "domain": "opencv",
+        "name": "OpenCV",
+        "documentation": "https://www.home-assistant.io/integrations/opencv",
+        "requirements": [
+            "numpy==1.19.2",
+            "opencv-python-headless==4.3.0.36"
+        ],
+        "codeowners": []
+    },
+    "openerz": {
+        "domain": "openerz",
+        "name": "Open ERZ",
+        "documentation": "https://www.home-assistant.io/integrations/openerz",
+        "codeowners": [
+            "@misialq"
+        ],
+        "requirements": [
+            "openerz-api==0.1.0"
+        ]
+    },
+    "openevse": {
+        "domain": "openevse",
+        "name": "OpenEVSE",
+        "documentation": "https://www.home-assistant.io/integrations/openevse",
+        "requirements": [
+            "openevsewifi==1.1.0"
+        ],
+        "codeowners": []
+    },
+    "openexchangerates": {
+        "domain": "openexchangerates",
+        "name": "Open Exchange Rates",
+        "documentation": "https://www.home-assistant.io/integrations/openexchangerates",
+        "codeowners": []
+    },
+    "opengarage": {
+        "domain": "opengarage",
+        "name": "OpenGarage",
+        "documentation": "https://www.home-assistant.io/integrations/opengarage",
+        "codeowners": [
+            "@danielhiversen"
+        ],
+        "requirements": [
+            "open-garage==0.1.4"
+        ]
+    },
+    "openhardwaremonitor": {
+        "domain": "openhardwaremonitor",
+        "name": "Open Hardware Monitor",
+        "documentation": "https://www.home-assistant.io/integrations/openhardwaremonitor",
+        "codeowners": []
+    },
+    "openhome": {
+        "domain": "openhome",
+        "name": "Linn / OpenHome",
+        "documentation": "https://www.home-assistant.io/integrations/openhome",
+        "requirements": [
+            "openhomedevice==0.7.2"
+        ],
+        "codeowners": [
+            "@bazwilliams"
+        ]
+    },
+    "opensensemap": {
+        "domain": "opensensemap",
+        "name": "openSenseMap",
+        "documentation": "https://www.home-assistant.io/integrations/opensensemap",
+        "requirements": [
+            "opensensemap-api==0.1.5"
+        ],
+        "codeowners": []
+    },
+    "opensky": {
+        "domain": "opensky",
+        "name": "OpenSky Network",
+        "documentation": "https://www.home-assistant.io/integrations/opensky",
+        "codeowners": []
+    },
+    "opentherm_gw": {
+        "domain": "opentherm_gw",
+        "name": "OpenTherm Gateway",
+        "documentation": "https://www.home-assistant.io/integrations/opentherm_gw",
+        "requirements": [
+            "pyotgw==1.0b1"
+        ],
+        "codeowners": [
+            "@mvn23"
+        ],
+        "config_flow": True
+    },
+    "openuv": {
+        "domain": "openuv",
+        "name": "OpenUV",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/openuv",
+        "requirements": [
+            "pyopenuv==1.0.9"
+        ],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "openweathermap": {
+        "domain": "openweathermap",
+        "name": "OpenWeatherMap",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/openweathermap",
+        "requirements": [
+            "pyowm==3.1.1"
+        ],
+        "codeowners": [
+            "@fabaff",
+            "@freekode",
+            "@nzapponi"
+        ]
+    },
+    "opnsense": {
+        "domain": "opnsense",
+        "name": "OPNSense",
+        "documentation": "https://www.home-assistant.io/integrations/opnsense",
+        "requirements": [
+            "pyopnsense==0.2.0"
+        ],
+        "codeowners": [
+            "@mtreinish"
+        ]
+    },
+    "opple": {
+        "domain": "opple",
+        "name": "Opple",
+        "documentation": "https://www.home-assistant.io/integrations/opple",
+        "requirements": [
+            "pyoppleio==1.0.5"
+        ],
+        "codeowners": []
+    },
+    "orangepi_gpio": {
+        "domain": "orangepi_gpio",
+        "name": "Orange Pi GPIO",
+        "documentation": "https://www.home-assistant.io/integrations/orangepi_gpio",
+        "requirements": [
+            "OPi.GPIO==0.4.0"
+        ],
+        "codeowners": [
+            "@pascallj"
+        ]
+    },
+    "oru": {
+        "domain": "oru",
+        "name": "Orange and Rockland Utility (ORU)",
+        "documentation": "https://www.home-assistant.io/integrations/oru",
+        "codeowners": [
+            "@bvlaicu"
+        ],
+        "requirements": [
+            "oru==0.1.11"
+        ]
+    },
+    "orvibo": {
+        "domain": "orvibo",
+        "name": "Orvibo",
+        "documentation": "https://www.home-assistant.io/integrations/orvibo",
+        "requirements": [
+            "orvibo==1.1.1"
+        ],
+        "codeowners": []
+    },
+    "osramlightify": {
+        "domain": "osramlightify",
+        "name": "Osramlightify",
+        "documentation": "https://www.home-assistant.io/integrations/osramlightify",
+        "requirements": [
+            "lightify==1.0.7.2"
+        ],
+        "codeowners": []
+    },
+    "otp": {
+        "domain": "otp",
+        "name": "One-Time Password (OTP)",
+        "documentation": "https://www.home-assistant.io/integrations/otp",
+        "requirements": [
+            "pyotp==2.3.0"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "ovo_energy": {
+        "domain": "ovo_energy",
+        "name": "OVO Energy",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ovo_energy",
+        "requirements": [
+            "ovoenergy==1.1.11"
+        ],
+        "codeowners": [
+            "@timmo001"
+        ]
+    },
+    "owntracks": {
+        "domain": "owntracks",
+        "name": "OwnTracks",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/owntracks",
+        "requirements": [
+            "PyNaCl==1.3.0"
+        ],
+        "dependencies": [
+            "webhook"
+        ],
+        "after_dependencies": [
+            "mqtt",
+            "cloud"
+        ],
+        "codeowners": []
+    },
+    "ozw": {
+        "domain": "ozw",
+        "name": "OpenZWave (beta)",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ozw",
+        "requirements": [
+            "python-openzwave-mqtt[mqtt-client]==1.4.0"
+        ],
+        "after_dependencies": [
+            "mqtt",
+            "zwave"
+        ],
+        "codeowners": [
+            "@cgarwood",
+            "@marcelveldt",
+            "@MartinHjelmare"
+        ]
+    },
+    "panasonic_bluray": {
+        "domain": "panasonic_bluray",
+        "name": "Panasonic Blu-Ray Player",
+        "documentation": "https://www.home-assistant.io/integrations/panasonic_bluray",
+        "requirements": [
+            "panacotta==0.1"
+        ],
+        "codeowners": []
+    },
+    "panasonic_viera": {
+        "domain": "panasonic_viera",
+        "name": "Panasonic Viera",
+        "documentation": "https://www.home-assistant.io/integrations/panasonic_viera",
+        "requirements": [
+            "panasonic_viera==0.3.6"
+        ],
+        "codeowners": [],
+        "config_flow": True
+    },
+    "pandora": {
+        "domain": "pandora",
+        "name": "Pandora",
+        "documentation": "https://www.home-assistant.io/integrations/pandora",
+        "requirements": [
+            "pexpect==4.6.0"
+        ],
+        "codeowners": []
+    },
+    "panel_custom": {
+        "domain": "panel_custom",
+        "name": "Custom Panel",
+        "documentation": "https://www.home-assistant.io/integrations/panel_custom",
+        "dependencies": [
+            "frontend"
+        ],
+        "codeowners": [
+            "@home-assistant/frontend"
+        ],
+        "quality_scale": "internal"
+    },
+    "panel_iframe": {
+        "domain": "panel_iframe",
+        "name": "iframe Panel",
+        "documentation": "https://www.home-assistant.io/integrations/panel_iframe",
+        "dependencies": [
+            "frontend"
+        ],
+        "codeowners": [
+            "@home-assistant/frontend"
+        ],
+        "quality_scale": "internal"
+    },
+    "pcal9535a": {
+        "domain": "pcal9535a",
+        "name": "PCAL9535A I/O Expander",
+        "documentation": "https://www.home-assistant.io/integrations/pcal9535a",
+        "requirements": [
+            "pcal9535a==0.7"
+        ],
+        "codeowners": [
+            "@Shulyaka"
+        ]
+    },
+    "pencom": {
+        "domain": "pencom",
+        "name": "Pencom",
+        "documentation": "https://www.home-assistant.io/integrations/pencom",
+        "requirements": [
+            "pencompy==0.0.3"
+        ],
+        "codeowners": []
+    },
+    "persistent_notification": {
+        "domain": "persistent_notification",
+        "name": "Persistent Notification",
+        "documentation": "https://www.home-assistant.io/integrations/persistent_notification",
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "person": {
+        "domain": "person",
+        "name": "Person",
+        "documentation": "https://www.home-assistant.io/integrations/person",
+        "dependencies": [
+            "image"
+        ],
+        "after_dependencies": [
+            "device_tracker"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "philips_js": {
+        "domain": "philips_js",
+        "name": "Philips TV",
+        "documentation": "https://www.home-assistant.io/integrations/philips_js",
+        "requirements": [
+            "ha-philipsjs==0.0.8"
+        ],
+        "codeowners": [
+            "@elupus"
+        ]
+    },
+    "pi4ioe5v9xxxx": {
+        "domain": "pi4ioe5v9xxxx",
+        "name": "pi4ioe5v9xxxx IO Expander",
+        "documentation": "https://www.home-assistant.io/integrations/pi4ioe5v9xxxx",
+        "requirements": [
+            "pi4ioe5v9xxxx==0.0.2"
+        ],
+        "codeowners": [
+            "@antonverburg"
+        ]
+    },
+    "pi_hole": {
+        "domain": "pi_hole",
+        "name": "Pi-hole",
+        "documentation": "https://www.home-assistant.io/integrations/pi_hole",
+        "requirements": [
+            "hole==0.5.1"
+        ],
+        "codeowners": [
+            "@fabaff",
+            "@johnluetke",
+            "@shenxn"
+        ],
+        "config_flow": True
+    },
+    "picotts": {
+        "domain": "picotts",
+        "name": "Pico TTS",
+        "documentation": "https://www.home-assistant.io/integrations/picotts",
+        "codeowners": []
+    },
+    "piglow": {
+        "domain": "piglow",
+        "name": "Piglow",
+        "documentation": "https://www.home-assistant.io/integrations/piglow",
+        "requirements": [
+            "piglow==1.2.4"
+        ],
+        "codeowners": []
+    },
+    "pilight": {
+        "domain": "pilight",
+        "name": "Pilight",
+        "documentation": "https://www.home-assistant.io/integrations/pilight",
+        "requirements": [
+            "pilight==0.1.1"
+        ],
+        "codeowners": [
+            "@trekky12"
+        ]
+    },
+    "ping": {
+        "domain": "ping",
+        "name": "Ping (ICMP)",
+        "documentation": "https://www.home-assistant.io/integrations/ping",
+        "codeowners": [],
+        "requirements": [
+            "icmplib==2.0"
+        ],
+        "quality_scale": "internal"
+    },
+    "pioneer": {
+        "domain": "pioneer",
+        "name": "Pioneer",
+        "documentation": "https://www.home-assistant.io/integrations/pioneer",
+        "codeowners": []
+    },
+    "pjlink": {
+        "domain": "pjlink",
+        "name": "PJLink",
+        "documentation": "https://www.home-assistant.io/integrations/pjlink",
+        "requirements": [
+            "pypjlink2==1.2.1"
+        ],
+        "codeowners": []
+    },
+    "plaato": {
+        "domain": "plaato",
+        "name": "Plaato Airlock",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/plaato",
+        "dependencies": [
+            "webhook"
+        ],
+        "codeowners": [
+            "@JohNan"
+        ]
+    },
+    "plant": {
+        "domain": "plant",
+        "name": "Plant Monitor",
+        "documentation": "https://www.home-assistant.io/integrations/plant",
+        "after_dependencies": [
+            "recorder"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "plex": {
+        "domain": "plex",
+        "name": "Plex Media Server",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/plex",
+        "requirements": [
+            "plexapi==4.2.0",
+            "plexauth==0.0.6",
+            "plexwebsocket==0.0.12"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@jjlawren"
+        ]
+    },
+    "plugwise": {
+        "domain": "plugwise",
+        "name": "Plugwise",
+        "documentation": "https://www.home-assistant.io/integrations/plugwise",
+        "requirements": [
+            "plugwise==0.8.5"
+        ],
+        "codeowners": [
+            "@CoMPaTech",
+            "@bouwew",
+            "@brefra"
+        ],
+        "zeroconf": [
+            "_plugwise._tcp.local."
+        ],
+        "config_flow": True
+    },
+    "plum_lightpad": {
+        "domain": "plum_lightpad",
+        "name": "Plum Lightpad",
+        "documentation": "https://www.home-assistant.io/integrations/plum_lightpad",
+        "requirements": [
+            "plumlightpad==0.0.11"
+        ],
+        "codeowners": [
+            "@ColinHarrington",
+            "@prystupa"
+        ],
+        "config_flow": True
+    },
+    "pocketcasts": {
+        "domain": "pocketcasts",
+        "name": "Pocket Casts",
+        "documentation": "https://www.home-assistant.io/integrations/pocketcasts",
+        "requirements": [
+            "pycketcasts==1.0.0"
+        ],
+        "codeowners": []
+    },
+    "point": {
+        "domain": "point",
+        "name": "Minut Point",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/point",
+        "requirements": [
+            "pypoint==2.0.0"
+        ],
+        "dependencies": [
+            "webhook",
+            "http"
+        ],
+        "codeowners": [
+            "@fredrike"
+        ],
+        "quality_scale": "gold"
+    },
+    "poolsense": {
+        "domain": "poolsense",
+        "name": "PoolSense",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/poolsense",
+        "requirements": [
+            "poolsense==0.0.8"
+        ],
+        "codeowners": [
+            "@haemishkyd"
+        ]
+    },
+    "powerwall": {
+        "domain": "powerwall",
+        "name": "Tesla Powerwall",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/powerwall",
+        "requirements": [
+            "tesla-powerwall==0.3.3"
+        ],
+        "codeowners": [
+            "@bdraco",
+            "@jrester"
+        ],
+        "dhcp": [
+            {
+                "hostname": "1118431-*",
+                "macaddress": "88DA1A*"
+            },
+            {
+                "hostname": "1118431-*",
+                "macaddress": "000145*"
+            }
+        ]
+    },
+    "profiler": {
+        "domain": "profiler",
+        "name": "Profiler",
+        "documentation": "https://www.home-assistant.io/integrations/profiler",
+        "requirements": [
+            "pyprof2calltree==1.4.5",
+            "guppy3==3.1.0",
+            "objgraph==3.4.1"
+        ],
+        "codeowners": [
+            "@bdraco"
+        ],
+        "quality_scale": "internal",
+        "config_flow": True
+    },
+    "progettihwsw": {
+        "domain": "progettihwsw",
+        "name": "ProgettiHWSW Automation",
+        "documentation": "https://www.home-assistant.io/integrations/progettihwsw",
+        "codeowners": [
+            "@ardaseremet"
+        ],
+        "requirements": [
+            "progettihwsw==0.1.1"
+        ],
+        "config_flow": True
+    },
+    "proliphix": {
+        "domain": "proliphix",
+        "name": "Proliphix",
+        "documentation": "https://www.home-assistant.io/integrations/proliphix",
+        "requirements": [
+            "proliphix==0.4.1"
+        ],
+        "codeowners": []
+    },
+    "prometheus": {
+        "domain": "prometheus",
+        "name": "Prometheus",
+        "documentation": "https://www.home-assistant.io/integrations/prometheus",
+        "requirements": [
+            "prometheus_client==0.7.1"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@knyar"
+        ]
+    },
+    "prowl": {
+        "domain": "prowl",
+        "name": "Prowl",
+        "documentation": "https://www.home-assistant.io/integrations/prowl",
+        "codeowners": []
+    },
+    "proximity": {
+        "domain": "proximity",
+        "name": "Proximity",
+        "documentation": "https://www.home-assistant.io/integrations/proximity",
+        "dependencies": [
+            "device_tracker",
+            "zone"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "proxmoxve": {
+        "domain": "proxmoxve",
+        "name": "Proxmox VE",
+        "documentation": "https://www.home-assistant.io/integrations/proxmoxve",
+        "codeowners": [
+            "@k4ds3",
+            "@jhollowe"
+        ],
+        "requirements": [
+            "proxmoxer==1.1.1"
+        ]
+    },
+    "proxy": {
+        "domain": "proxy",
+        "name": "Camera Proxy",
+        "documentation": "https://www.home-assistant.io/integrations/proxy",
+        "requirements": [
+            "pillow==7.2.0"
+        ],
+        "codeowners": []
+    },
+    "ps4": {
+        "domain": "ps4",
+        "name": "Sony PlayStation 4",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ps4",
+        "requirements": [
+            "pyps4-2ndscreen==1.2.0"
+        ],
+        "codeowners": [
+            "@ktnrg45"
+        ]
+    },
+    "pulseaudio_loopback": {
+        "domain": "pulseaudio_loopback",
+        "name": "PulseAudio Loopback",
+        "documentation": "https://www.home-assistant.io/integrations/pulseaudio_loopback",
+        "requirements": [
+            "pulsectl==20.2.4"
+        ],
+        "codeowners": []
+    },
+    "push": {
+        "domain": "push",
+        "name": "Push",
+        "documentation": "https://www.home-assistant.io/integrations/push",
+        "dependencies": [
+            "webhook"
+        ],
+        "codeowners": [
+            "@dgomes"
+        ]
+    },
+    "pushbullet": {
+        "domain": "pushbullet",
+        "name": "Pushbullet",
+        "documentation": "https://www.home-assistant.io/integrations/pushbullet",
+        "requirements": [
+            "pushbullet.py==0.11.0"
+        ],
+        "codeowners": []
+    },
+    "pushover": {
+        "domain": "pushover",
+        "name": "Pushover",
+        "documentation": "https://www.home-assistant.io/integrations/pushover",
+        "requirements": [
+            "pushover_complete==1.1.1"
+        ],
+        "codeowners": []
+    },
+    "pushsafer": {
+        "domain": "pushsafer",
+        "name": "Pushsafer",
+        "documentation": "https://www.home-assistant.io/integrations/pushsafer",
+        "codeowners": []
+    },
+    "pvoutput": {
+        "domain": "pvoutput",
+        "name": "PVOutput",
+        "documentation": "https://www.home-assistant.io/integrations/pvoutput",
+        "after_dependencies": [
+            "rest"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "pvpc_hourly_pricing": {
+        "domain": "pvpc_hourly_pricing",
+        "name": "Spain electricity hourly pricing (PVPC)",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/pvpc_hourly_pricing",
+        "requirements": [
+            "aiopvpc==2.0.2"
+        ],
+        "codeowners": [
+            "@azogue"
+        ],
+        "quality_scale": "platinum"
+    },
+    "pyload": {
+        "domain": "pyload",
+        "name": "pyLoad",
+        "documentation": "https://www.home-assistant.io/integrations/pyload",
+        "codeowners": []
+    },
+    "python_script": {
+        "domain": "python_script",
+        "name": "Python Scripts",
+        "documentation": "https://www.home-assistant.io/integrations/python_script",
+        "requirements": [
+            "restrictedpython==5.1"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "qbittorrent": {
+        "domain": "qbittorrent",
+        "name": "qBittorrent",
+        "documentation": "https://www.home-assistant.io/integrations/qbittorrent",
+        "requirements": [
+            "python-qbittorrent==0.4.2"
+        ],
+        "codeowners": [
+            "@geoffreylagaisse"
+        ]
+    },
+    "qld_bushfire": {
+        "domain": "qld_bushfire",
+        "name": "Queensland Bushfire Alert",
+        "documentation": "https://www.home-assistant.io/integrations/qld_bushfire",
+        "requirements": [
+            "georss_qld_bushfire_alert_client==0.3"
+        ],
+        "codeowners": [
+            "@exxamalte"
+        ]
+    },
+    "qnap": {
+        "domain": "qnap",
+        "name": "QNAP",
+        "documentation": "https://www.home-assistant.io/integrations/qnap",
+        "requirements": [
+            "qnapstats==0.3.0"
+        ],
+        "codeowners": [
+            "@colinodell"
+        ]
+    },
+    "qrcode": {
+        "domain": "qrcode",
+        "name": "QR Code",
+        "documentation": "https://www.home-assistant.io/integrations/qrcode",
+        "requirements": [
+            "pillow==7.2.0",
+            "pyzbar==0.1.7"
+        ],
+        "codeowners": []
+    },
+    "quantum_gateway": {
+        "domain": "quantum_gateway",
+        "name": "Quantum Gateway",
+        "documentation": "https://www.home-assistant.io/integrations/quantum_gateway",
+        "requirements": [
+            "quantum-gateway==0.0.5"
+        ],
+        "codeowners": [
+            "@cisasteelersfan"
+        ]
+    },
+    "qvr_pro": {
+        "domain": "qvr_pro",
+        "name": "QVR Pro",
+        "documentation": "https://www.home-assistant.io/integrations/qvr_pro",
+        "requirements": [
+            "pyqvrpro==0.52"
+        ],
+        "codeowners": [
+            "@oblogic7"
+        ]
+    },
+    "qwikswitch": {
+        "domain": "qwikswitch",
+        "name": "QwikSwitch QSUSB",
+        "documentation": "https://www.home-assistant.io/integrations/qwikswitch",
+        "requirements": [
+            "pyqwikswitch==0.93"
+        ],
+        "codeowners": [
+            "@kellerza"
+        ]
+    },
+    "rachio": {
+        "domain": "rachio",
+        "name": "Rachio",
+        "documentation": "https://www.home-assistant.io/integrations/rachio",
+        "requirements": [
+            "rachiopy==1.0.3"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "after_dependencies": [
+            "cloud"
+        ],
+        "codeowners": [
+            "@bdraco"
+        ],
+        "config_flow": True,
+        "dhcp": [
+            {
+                "hostname": "rachio-*",
+                "macaddress": "009D6B*"
+            },
+            {
+                "hostname": "rachio-*",
+                "macaddress": "F0038C*"
+            },
+            {
+                "hostname": "rachio-*",
+                "macaddress": "74C63B*"
+            }
+        ],
+        "homekit": {
+            "models": [
+                "Rachio"
+            ]
+        }
+    },
+    "radarr": {
+        "domain": "radarr",
+        "name": "Radarr",
+        "documentation": "https://www.home-assistant.io/integrations/radarr",
+        "codeowners": []
+    },
+    "radiotherm": {
+        "domain": "radiotherm",
+        "name": "Radio Thermostat",
+        "documentation": "https://www.home-assistant.io/integrations/radiotherm",
+        "requirements": [
+            "radiotherm==2.0.0"
+        ],
+        "codeowners": []
+    },
+    "rainbird": {
+        "domain": "rainbird",
+        "name": "Rain Bird",
+        "documentation": "https://www.home-assistant.io/integrations/rainbird",
+        "requirements": [
+            "pyrainbird==0.4.2"
+        ],
+        "codeowners": [
+            "@konikvranik"
+        ]
+    },
+    "raincloud": {
+        "domain": "raincloud",
+        "name": "Melnor RainCloud",
+        "documentation": "https://www.home-assistant.io/integrations/raincloud",
+        "requirements": [
+            "raincloudy==0.0.7"
+        ],
+        "codeowners": [
+            "@vanstinator"
+        ]
+    },
+    "rainforest_eagle": {
+        "domain": "rainforest_eagle",
+        "name": "Rainforest Eagle-200",
+        "documentation": "https://www.home-assistant.io/integrations/rainforest_eagle",
+        "requirements": [
+            "eagle200_reader==0.2.4",
+            "uEagle==0.0.2"
+        ],
+        "codeowners": [
+            "@gtdiehl",
+            "@jcalbert"
+        ]
+    },
+    "rainmachine": {
+        "domain": "rainmachine",
+        "name": "RainMachine",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/rainmachine",
+        "requirements": [
+            "regenmaschine==3.0.0"
+        ],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "random": {
+        "domain": "random",
+        "name": "Random",
+        "documentation": "https://www.home-assistant.io/integrations/random",
+        "codeowners": [
+            "@fabaff"
+        ],
+        "quality_scale": "internal"
+    },
+    "raspihats": {
+        "domain": "raspihats",
+        "name": "Raspihats",
+        "documentation": "https://www.home-assistant.io/integrations/raspihats",
+        "requirements": [
+            "raspihats==2.2.3",
+            "smbus-cffi==0.5.1"
+        ],
+        "codeowners": []
+    },
+    "raspyrfm": {
+        "domain": "raspyrfm",
+        "name": "RaspyRFM",
+        "documentation": "https://www.home-assistant.io/integrations/raspyrfm",
+        "requirements": [
+            "raspyrfm-client==1.2.8"
+        ],
+        "codeowners": []
+    },
+    "recollect_waste": {
+        "domain": "recollect_waste",
+        "name": "ReCollect Waste",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/recollect_waste",
+        "requirements": [
+            "aiorecollect==1.0.1"
+        ],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "recorder": {
+        "domain": "recorder",
+        "name": "Recorder",
+        "documentation": "https://www.home-assistant.io/integrations/recorder",
+        "requirements": [
+            "sqlalchemy==1.3.22"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "recswitch": {
+        "domain": "recswitch",
+        "name": "Ankuoo REC Switch",
+        "documentation": "https://www.home-assistant.io/integrations/recswitch",
+        "requirements": [
+            "pyrecswitch==1.0.2"
+        ],
+        "codeowners": []
+    },
+    "reddit": {
+        "domain": "reddit",
+        "name": "Reddit",
+        "documentation": "https://www.home-assistant.io/integrations/reddit",
+        "requirements": [
+            "praw==7.1.0"
+        ],
+        "codeowners": []
+    },
+    "rejseplanen": {
+        "domain": "rejseplanen",
+        "name": "Rejseplanen",
+        "documentation": "https://www.home-assistant.io/integrations/rejseplanen",
+        "requirements": [
+            "rjpl==0.3.6"
+        ],
+        "codeowners": [
+            "@DarkFox"
+        ]
+    },
+    "remember_the_milk": {
+        "domain": "remember_the_milk",
+        "name": "Remember The Milk",
+        "documentation": "https://www.home-assistant.io/integrations/remember_the_milk",
+        "requirements": [
+            "RtmAPI==0.7.2",
+            "httplib2==0.10.3"
+        ],
+        "dependencies": [
+            "configurator"
+        ],
+        "codeowners": []
+    },
+    "remote": {
+        "domain": "remote",
+        "name": "Remote",
+        "documentation": "https://www.home-assistant.io/integrations/remote",
+        "codeowners": []
+    },
+    "remote_rpi_gpio": {
+        "domain": "remote_rpi_gpio",
+        "name": "remote_rpi_gpio",
+        "documentation": "https://www.home-assistant.io/integrations/remote_rpi_gpio",
+        "requirements": [
+            "gpiozero==1.5.1"
+        ],
+        "codeowners": []
+    },
+    "repetier": {
+        "domain": "repetier",
+        "name": "Repetier-Server",
+        "documentation": "https://www.home-assistant.io/integrations/repetier",
+        "requirements": [
+            "pyrepetier==3.0.5"
+        ],
+        "codeowners": [
+            "@MTrab"
+        ]
+    },
+    "rest": {
+        "domain": "rest",
+        "name": "RESTful",
+        "documentation": "https://www.home-assistant.io/integrations/rest",
+        "requirements": [
+            "jsonpath==0.82",
+            "xmltodict==0.12.0"
+        ],
+        "codeowners": []
+    },
+    "rest_command": {
+        "domain": "rest_command",
+        "name": "RESTful Command",
+        "documentation": "https://www.home-assistant.io/integrations/rest_command",
+        "codeowners": []
+    },
+    "rflink": {
+        "domain": "rflink",
+        "name": "RFLink",
+        "documentation": "https://www.home-assistant.io/integrations/rflink",
+        "requirements": [
+            "rflink==0.0.55"
+        ],
+        "codeowners": []
+    },
+    "rfxtrx": {
+        "domain": "rfxtrx",
+        "name": "RFXCOM RFXtrx",
+        "documentation": "https://www.home-assistant.io/integrations/rfxtrx",
+        "requirements": [
+            "pyRFXtrx==0.26.1"
+        ],
+        "codeowners": [
+            "@danielhiversen",
+            "@elupus",
+            "@RobBie1221"
+        ],
+        "config_flow": True
+    },
+    "ring": {
+        "domain": "ring",
+        "name": "Ring",
+        "documentation": "https://www.home-assistant.io/integrations/ring",
+        "requirements": [
+            "ring_doorbell==0.6.2"
+        ],
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "codeowners": [
+            "@balloob"
+        ],
+        "config_flow": True,
+        "dhcp": [
+            {
+                "hostname": "ring*",
+                "macaddress": "0CAE7D*"
+            }
+        ]
+    },
+    "ripple": {
+        "domain": "ripple",
+        "name": "Ripple",
+        "documentation": "https://www.home-assistant.io/integrations/ripple",
+        "requirements": [
+            "python-ripple-api==0.0.3"
+        ],
+        "codeowners": []
+    },
+    "risco": {
+        "domain": "risco",
+        "name": "Risco",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/risco",
+        "requirements": [
+            "pyrisco==0.3.1"
+        ],
+        "codeowners": [
+            "@OnFreund"
+        ],
+        "quality_scale": "platinum"
+    },
+    "rmvtransport": {
+        "domain": "rmvtransport",
+        "name": "RMV",
+        "documentation": "https://www.home-assistant.io/integrations/rmvtransport",
+        "requirements": [
+            "PyRMVtransport==0.2.9"
+        ],
+        "codeowners": [
+            "@cgtobi"
+        ]
+    },
+    "rocketchat": {
+        "domain": "rocketchat",
+        "name": "Rocket.Chat",
+        "documentation": "https://www.home-assistant.io/integrations/rocketchat",
+        "requirements": [
+            "rocketchat-API==0.6.1"
+        ],
+        "codeowners": []
+    },
+    "roku": {
+        "domain": "roku",
+        "name": "Roku",
+        "documentation": "https://www.home-assistant.io/integrations/roku",
+        "requirements": [
+            "rokuecp==0.6.0"
+        ],
+        "homekit": {
+            "models": [
+                "3810X",
+                "4660X",
+                "7820X",
+                "C105X",
+                "C135X"
+            ]
+        },
+        "ssdp": [
+            {
+                "st": "roku:ecp",
+                "manufacturer": "Roku",
+                "deviceType": "urn:roku-com:device:player:1-0"
+            }
+        ],
+        "codeowners": [
+            "@ctalkington"
+        ],
+        "quality_scale": "silver",
+        "config_flow": True
+    },
+    "roomba": {
+        "domain": "roomba",
+        "name": "iRobot Roomba and Braava",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/roomba",
+        "requirements": [
+            "roombapy==1.6.2"
+        ],
+        "codeowners": [
+            "@pschmitt",
+            "@cyr-ius",
+            "@shenxn"
+        ],
+        "dhcp": [
+            {
+                "hostname": "irobot-*",
+                "macaddress": "501479*"
+            }
+        ]
+    },
+    "roon": {
+        "domain": "roon",
+        "name": "RoonLabs music player",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/roon",
+        "requirements": [
+            "roonapi==0.0.31"
+        ],
+        "codeowners": [
+            "@pavoni"
+        ]
+    },
+    "route53": {
+        "domain": "route53",
+        "name": "AWS Route53",
+        "documentation": "https://www.home-assistant.io/integrations/route53",
+        "requirements": [
+            "boto3==1.9.252"
+        ],
+        "codeowners": []
+    },
+    "rova": {
+        "domain": "rova",
+        "name": "ROVA",
+        "documentation": "https://www.home-assistant.io/integrations/rova",
+        "requirements": [
+            "rova==0.1.0"
+        ],
+        "codeowners": []
+    },
+    "rpi_camera": {
+        "domain": "rpi_camera",
+        "name": "Raspberry Pi Camera",
+        "documentation": "https://www.home-assistant.io/integrations/rpi_camera",
+        "codeowners": []
+    },
+    "rpi_gpio": {
+        "domain": "rpi_gpio",
+        "name": "Raspberry Pi GPIO",
+        "documentation": "https://www.home-assistant.io/integrations/rpi_gpio",
+        "requirements": [
+            "RPi.GPIO==0.7.0"
+        ],
+        "codeowners": []
+    },
+    "rpi_gpio_pwm": {
+        "domain": "rpi_gpio_pwm",
+        "name": "pigpio Daemon PWM LED",
+        "documentation": "https://www.home-assistant.io/integrations/rpi_gpio_pwm",
+        "requirements": [
+            "pwmled==1.6.7"
+        ],
+        "codeowners": [
+            "@soldag"
+        ]
+    },
+    "rpi_pfio": {
+        "domain": "rpi_pfio",
+        "name": "PiFace Digital I/O (PFIO)",
+        "documentation": "https://www.home-assistant.io/integrations/rpi_pfio",
+        "requirements": [
+            "pifacecommon==4.2.2",
+            "pifacedigitalio==3.0.5"
+        ],
+        "codeowners": []
+    },
+    "rpi_power": {
+        "domain": "rpi_power",
+        "name": "Raspberry Pi Power Supply Checker",
+        "documentation": "https://www.home-assistant.io/integrations/rpi_power",
+        "codeowners": [
+            "@shenxn",
+            "@swetoast"
+        ],
+        "requirements": [
+            "rpi-bad-power==0.1.0"
+        ],
+        "config_flow": True
+    },
+    "rpi_rf": {
+        "domain": "rpi_rf",
+        "name": "Raspberry Pi RF",
+        "documentation": "https://www.home-assistant.io/integrations/rpi_rf",
+        "requirements": [
+            "rpi-rf==0.9.7"
+        ],
+        "codeowners": []
+    },
+    "rss_feed_template": {
+        "domain": "rss_feed_template",
+        "name": "RSS Feed Template",
+        "documentation": "https://www.home-assistant.io/integrations/rss_feed_template",
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "rtorrent": {
+        "domain": "rtorrent",
+        "name": "rTorrent",
+        "documentation": "https://www.home-assistant.io/integrations/rtorrent",
+        "codeowners": []
+    },
+    "ruckus_unleashed": {
+        "domain": "ruckus_unleashed",
+        "name": "Ruckus Unleashed",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/ruckus_unleashed",
+        "requirements": [
+            "pyruckus==0.12"
+        ],
+        "codeowners": [
+            "@gabe565"
+        ]
+    },
+    "russound_rio": {
+        "domain": "russound_rio",
+        "name": "Russound RIO",
+        "documentation": "https://www.home-assistant.io/integrations/russound_rio",
+        "requirements": [
+            "russound_rio==0.1.7"
+        ],
+        "codeowners": []
+    },
+    "russound_rnet": {
+        "domain": "russound_rnet",
+        "name": "Russound RNET",
+        "documentation": "https://www.home-assistant.io/integrations/russound_rnet",
+        "requirements": [
+            "russound==0.1.9"
+        ],
+        "codeowners": []
+    },
+    "sabnzbd": {
+        "domain": "sabnzbd",
+        "name": "SABnzbd",
+        "documentation": "https://www.home-assistant.io/integrations/sabnzbd",
+        "requirements": [
+            "pysabnzbd==1.1.0"
+        ],
+        "dependencies": [
+            "configurator"
+        ],
+        "after_dependencies": [
+            "discovery"
+        ],
+        "codeowners": []
+    },
+    "safe_mode": {
+        "domain": "safe_mode",
+        "name": "Safe Mode",
+        "config_flow": False,
+        "documentation": "https://www.home-assistant.io/integrations/safe_mode",
+        "dependencies": [
+            "frontend",
+            "persistent_notification",
+            "cloud"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ]
+    },
+    "saj": {
+        "domain": "saj",
+        "name": "SAJ Solar Inverter",
+        "documentation": "https://www.home-assistant.io/integrations/saj",
+        "requirements": [
+            "pysaj==0.0.16"
+        ],
+        "codeowners": [
+            "@fredericvl"
+        ]
+    },
+    "samsungtv": {
+        "domain": "samsungtv",
+        "name": "Samsung Smart TV",
+        "documentation": "https://www.home-assistant.io/integrations/samsungtv",
+        "requirements": [
+            "samsungctl[websocket]==0.7.1",
+            "samsungtvws==1.4.0"
+        ],
+        "ssdp": [
+            {
+                "st": "urn:samsung.com:device:RemoteControlReceiver:1"
+            }
+        ],
+        "codeowners": [
+            "@escoand"
+        ],
+        "config_flow": True
+    },
+    "satel_integra": {
+        "domain": "satel_integra",
+        "name": "Satel Integra",
+        "documentation": "https://www.home-assistant.io/integrations/satel_integra",
+        "requirements": [
+            "satel_integra==0.3.4"
+        ],
+        "codeowners": []
+    },
+    "scene": {
+        "domain": "scene",
+        "name": "Scenes",
+        "documentation": "https://www.home-assistant.io/integrations/scene",
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "schluter": {
+        "domain": "schluter",
+        "name": "Schluter",
+        "documentation": "https://www.home-assistant.io/integrations/schluter",
+        "requirements": [
+            "py-schluter==0.1.7"
+        ],
+        "codeowners": [
+            "@prairieapps"
+        ]
+    },
+    "scrape": {
+        "domain": "scrape",
+        "name": "Scrape",
+        "documentation": "https://www.home-assistant.io/integrations/scrape",
+        "requirements": [
+            "beautifulsoup4==4.9.1"
+        ],
+        "after_dependencies": [
+            "rest"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "script": {
+        "domain": "script",
+        "name": "Scripts",
+        "documentation": "https://www.home-assistant.io/integrations/script",
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "scsgate": {
+        "domain": "scsgate",
+        "name": "SCSGate",
+        "documentation": "https://www.home-assistant.io/integrations/scsgate",
+        "requirements": [
+            "scsgate==0.1.0"
+        ],
+        "codeowners": []
+    },
+    "search": {
+        "domain": "search",
+        "name": "Search",
+        "documentation": "https://www.home-assistant.io/integrations/search",
+        "dependencies": [
+            "websocket_api"
+        ],
+        "after_dependencies": [
+            "scene",
+            "group",
+            "automation",
+            "script"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ]
+    },
+    "season": {
+        "domain": "season",
+        "name": "Season",
+        "documentation": "https://www.home-assistant.io/integrations/season",
+        "requirements": [
+            "ephem==3.7.7.0"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "sendgrid": {
+        "domain": "sendgrid",
+        "name": "SendGrid",
+        "documentation": "https://www.home-assistant.io/integrations/sendgrid",
+        "requirements": [
+            "sendgrid==6.5.0"
+        ],
+        "codeowners": []
+    },
+    "sense": {
+        "domain": "sense",
+        "name": "Sense",
+        "documentation": "https://www.home-assistant.io/integrations/sense",
+        "requirements": [
+            "sense_energy==0.8.1"
+        ],
+        "codeowners": [
+            "@kbickar"
+        ],
+        "config_flow": True,
+        "dhcp": [
+            {
+                "hostname": "sense-*",
+                "macaddress": "009D6B*"
+            },
+            {
+                "hostname": "sense-*",
+                "macaddress": "DCEFCA*"
+            }
+        ]
+    },
+    "sensehat": {
+        "domain": "sensehat",
+        "name": "Sense HAT",
+        "documentation": "https://www.home-assistant.io/integrations/sensehat",
+        "requirements": [
+            "sense-hat==2.2.0"
+        ],
+        "codeowners": []
+    },
+    "sensibo": {
+        "domain": "sensibo",
+        "name": "Sensibo",
+        "documentation": "https://www.home-assistant.io/integrations/sensibo",
+        "requirements": [
+            "pysensibo==1.0.3"
+        ],
+        "codeowners": [
+            "@andrey-git"
+        ]
+    },
+    "sensor": {
+        "domain": "sensor",
+        "name": "Sensor",
+        "documentation": "https://www.home-assistant.io/integrations/sensor",
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "sentry": {
+        "domain": "sentry",
+        "name": "Sentry",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/sentry",
+        "requirements": [
+            "sentry-sdk==0.19.5"
+        ],
+        "codeowners": [
+            "@dcramer",
+            "@frenck"
+        ]
+    },
+    "serial": {
+        "domain": "serial",
+        "name": "Serial",
+        "documentation": "https://www.home-assistant.io/integrations/serial",
+        "requirements": [
+            "pyserial-asyncio==0.5"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "serial_pm": {
+        "domain": "serial_pm",
+        "name": "Serial Particulate Matter",
+        "documentation": "https://www.home-assistant.io/integrations/serial_pm",
+        "requirements": [
+            "pmsensor==0.4"
+        ],
+        "codeowners": []
+    },
+    "sesame": {
+        "domain": "sesame",
+        "name": "Sesame Smart Lock",
+        "documentation": "https://www.home-assistant.io/integrations/sesame",
+        "requirements": [
+            "pysesame2==1.0.1"
+        ],
+        "codeowners": []
+    },
+    "seven_segments": {
+        "domain": "seven_segments",
+        "name": "Seven Segments OCR",
+        "documentation": "https://www.home-assistant.io/integrations/seven_segments",
+        "requirements": [
+            "pillow==7.2.0"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "seventeentrack": {
+        "domain": "seventeentrack",
+        "name": "17TRACK",
+        "documentation": "https://www.home-assistant.io/integrations/seventeentrack",
+        "requirements": [
+            "py17track==2.2.2"
+        ],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "sharkiq": {
+        "domain": "sharkiq",
+        "name": "Shark IQ",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/sharkiq",
+        "requirements": [
+            "sharkiqpy==0.1.8"
+        ],
+        "codeowners": [
+            "@ajmarks"
+        ]
+    },
+    "shell_command": {
+        "domain": "shell_command",
+        "name": "Shell Command",
+        "documentation": "https://www.home-assistant.io/integrations/shell_command",
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "shelly": {
+        "domain": "shelly",
+        "name": "Shelly",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/shelly",
+        "requirements": [
+            "aioshelly==0.5.3"
+        ],
+        "zeroconf": [
+            {
+                "type": "_http._tcp.local.",
+                "name": "shelly*"
+            }
+        ],
+        "codeowners": [
+            "@balloob",
+            "@bieniu",
+            "@thecode",
+            "@chemelli74"
+        ]
+    },
+    "shiftr": {
+        "domain": "shiftr",
+        "name": "shiftr.io",
+        "documentation": "https://www.home-assistant.io/integrations/shiftr",
+        "requirements": [
+            "paho-mqtt==1.5.1"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "shodan": {
+        "domain": "shodan",
+        "name": "Shodan",
+        "documentation": "https://www.home-assistant.io/integrations/shodan",
+        "requirements": [
+            "shodan==1.24.0"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "shopping_list": {
+        "domain": "shopping_list",
+        "name": "Shopping List",
+        "documentation": "https://www.home-assistant.io/integrations/shopping_list",
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [],
+        "config_flow": True,
+        "quality_scale": "internal"
+    },
+    "sht31": {
+        "domain": "sht31",
+        "name": "Sensirion SHT31",
+        "documentation": "https://www.home-assistant.io/integrations/sht31",
+        "requirements": [
+            "Adafruit-GPIO==1.0.3",
+            "Adafruit-SHT31==1.0.2"
+        ],
+        "codeowners": []
+    },
+    "sigfox": {
+        "domain": "sigfox",
+        "name": "Sigfox",
+        "documentation": "https://www.home-assistant.io/integrations/sigfox",
+        "codeowners": []
+    },
+    "sighthound": {
+        "domain": "sighthound",
+        "name": "Sighthound",
+        "documentation": "https://www.home-assistant.io/integrations/sighthound",
+        "requirements": [
+            "pillow==7.2.0",
+            "simplehound==0.3"
+        ],
+        "codeowners": [
+            "@robmarkcole"
+        ]
+    },
+    "signal_messenger": {
+        "domain": "signal_messenger",
+        "name": "Signal Messenger",
+        "documentation": "https://www.home-assistant.io/integrations/signal_messenger",
+        "codeowners": [
+            "@bbernhard"
+        ],
+        "requirements": [
+            "pysignalclirestapi==0.3.4"
+        ]
+    },
+    "simplepush": {
+        "domain": "simplepush",
+        "name": "Simplepush",
+        "documentation": "https://www.home-assistant.io/integrations/simplepush",
+        "requirements": [
+            "simplepush==1.1.4"
+        ],
+        "codeowners": []
+    },
+    "simplisafe": {
+        "domain": "simplisafe",
+        "name": "SimpliSafe",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/simplisafe",
+        "requirements": [
+            "simplisafe-python==9.6.2"
+        ],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "simulated": {
+        "domain": "simulated",
+        "name": "Simulated",
+        "documentation": "https://www.home-assistant.io/integrations/simulated",
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "sinch": {
+        "domain": "sinch",
+        "name": "Sinch SMS",
+        "documentation": "https://www.home-assistant.io/integrations/sinch",
+        "codeowners": [
+            "@bendikrb"
+        ],
+        "requirements": [
+            "clx-sdk-xms==1.0.0"
+        ]
+    },
+    "sisyphus": {
+        "domain": "sisyphus",
+        "name": "Sisyphus",
+        "documentation": "https://www.home-assistant.io/integrations/sisyphus",
+        "requirements": [
+            "sisyphus-control==3.0"
+        ],
+        "codeowners": [
+            "@jkeljo"
+        ]
+    },
+    "sky_hub": {
+        "domain": "sky_hub",
+        "name": "Sky Hub",
+        "documentation": "https://www.home-assistant.io/integrations/sky_hub",
+        "requirements": [
+            "pyskyqhub==0.1.3"
+        ],
+        "codeowners": [
+            "@rogerselwyn"
+        ]
+    },
+    "skybeacon": {
+        "domain": "skybeacon",
+        "name": "Skybeacon",
+        "documentation": "https://www.home-assistant.io/integrations/skybeacon",
+        "requirements": [
+            "pygatt[GATTTOOL]==4.0.5"
+        ],
+        "codeowners": []
+    },
+    "skybell": {
+        "domain": "skybell",
+        "name": "SkyBell",
+        "documentation": "https://www.home-assistant.io/integrations/skybell",
+        "requirements": [
+            "skybellpy==0.6.3"
+        ],
+        "codeowners": []
+    },
+    "slack": {
+        "domain": "slack",
+        "name": "Slack",
+        "documentation": "https://www.home-assistant.io/integrations/slack",
+        "requirements": [
+            "slackclient==2.5.0"
+        ],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "sleepiq": {
+        "domain": "sleepiq",
+        "name": "SleepIQ",
+        "documentation": "https://www.home-assistant.io/integrations/sleepiq",
+        "requirements": [
+            "sleepyq==0.8.1"
+        ],
+        "codeowners": []
+    },
+    "slide": {
+        "domain": "slide",
+        "name": "Slide",
+        "documentation": "https://www.home-assistant.io/integrations/slide",
+        "requirements": [
+            "goslide-api==0.5.1"
+        ],
+        "codeowners": [
+            "@ualex73"
+        ]
+    },
+    "sma": {
+        "domain": "sma",
+        "name": "SMA Solar",
+        "documentation": "https://www.home-assistant.io/integrations/sma",
+        "requirements": [
+            "pysma==0.3.5"
+        ],
+        "codeowners": [
+            "@kellerza"
+        ]
+    },
+    "smappee": {
+        "domain": "smappee",
+        "name": "Smappee",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/smappee",
+        "dependencies": [
+            "http"
+        ],
+        "requirements": [
+            "pysmappee==0.2.13"
+        ],
+        "codeowners": [
+            "@bsmappee"
+        ],
+        "zeroconf": [
+            {
+                "type": "_ssh._tcp.local.",
+                "name": "smappee1*"
+            },
+            {
+                "type": "_ssh._tcp.local.",
+                "name": "smappee2*"
+            }
+        ]
+    },
+    "smart_meter_texas": {
+        "domain": "smart_meter_texas",
+        "name": "Smart Meter Texas",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/smart_meter_texas",
+        "requirements": [
+            "smart-meter-texas==0.4.0"
+        ],
+        "codeowners": [
+            "@grahamwetzler"
+        ]
+    },
+    "smarthab": {
+        "domain": "smarthab",
+        "name": "SmartHab",
+        "documentation": "https://www.home-assistant.io/integrations/smarthab",
+        "config_flow": True,
+        "requirements": [
+            "smarthab==0.21"
+        ],
+        "codeowners": [
+            "@outadoc"
+        ]
+    },
+    "smartthings": {
+        "domain": "smartthings",
+        "name": "SmartThings",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/smartthings",
+        "requirements": [
+            "pysmartapp==0.3.3",
+            "pysmartthings==0.7.6"
+        ],
+        "dependencies": [
+            "webhook"
+        ],
+        "after_dependencies": [
+            "cloud"
+        ],
+        "codeowners": [
+            "@andrewsayre"
+        ]
+    },
+    "smarty": {
+        "domain": "smarty",
+        "name": "Salda Smarty",
+        "documentation": "https://www.home-assistant.io/integrations/smarty",
+        "requirements": [
+            "pysmarty==0.8"
+        ],
+        "codeowners": [
+            "@z0mbieprocess"
+        ]
+    },
+    "smhi": {
+        "domain": "smhi",
+        "name": "SMHI",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/smhi",
+        "requirements": [
+            "smhi-pkg==1.0.13"
+        ],
+        "codeowners": []
+    },
+    "sms": {
+        "domain": "sms",
+        "name": "SMS notifications via GSM-modem",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/sms",
+        "requirements": [
+            "python-gammu==3.1"
+        ],
+        "codeowners": [
+            "@ocalvo"
+        ]
+    },
+    "smtp": {
+        "domain": "smtp",
+        "name": "SMTP",
+        "documentation": "https://www.home-assistant.io/integrations/smtp",
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "snapcast": {
+        "domain": "snapcast",
+        "name": "Snapcast",
+        "documentation": "https://www.home-assistant.io/integrations/snapcast",
+        "requirements": [
+            "snapcast==2.1.1"
+        ],
+        "codeowners": []
+    },
+    "snips": {
+        "domain": "snips",
+        "name": "Snips",
+        "documentation": "https://www.home-assistant.io/integrations/snips",
+        "dependencies": [
+            "mqtt"
+        ],
+        "codeowners": []
+    },
+    "snmp": {
+        "domain": "snmp",
+        "name": "SNMP",
+        "documentation": "https://www.home-assistant.io/integrations/snmp",
+        "requirements": [
+            "pysnmp==4.4.12"
+        ],
+        "codeowners": []
+    },
+    "sochain": {
+        "domain": "sochain",
+        "name": "SoChain",
+        "documentation": "https://www.home-assistant.io/integrations/sochain",
+        "requirements": [
+            "python-sochain-api==0.0.2"
+        ],
+        "codeowners": []
+    },
+    "socialblade": {
+        "domain": "socialblade",
+        "name": "Social Blade",
+        "documentation": "https://www.home-assistant.io/integrations/socialblade",
+        "requirements": [
+            "socialbladeclient==0.5"
+        ],
+        "codeowners": []
+    },
+    "solaredge": {
+        "domain": "solaredge",
+        "name": "SolarEdge",
+        "documentation": "https://www.home-assistant.io/integrations/solaredge",
+        "requirements": [
+            "solaredge==0.0.2",
+            "stringcase==1.2.0"
+        ],
+        "config_flow": True,
+        "codeowners": [],
+        "dhcp": [
+            {
+                "hostname": "target",
+                "macaddress": "002702*"
+            }
+        ]
+    },
+    "solaredge_local": {
+        "domain": "solaredge_local",
+        "name": "SolarEdge Local",
+        "documentation": "https://www.home-assistant.io/integrations/solaredge_local",
+        "requirements": [
+            "solaredge-local==0.2.0"
+        ],
+        "codeowners": [
+            "@drobtravels",
+            "@scheric"
+        ]
+    },
+    "solarlog": {
+        "domain": "solarlog",
+        "name": "Solar-Log",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/solarlog",
+        "codeowners": [
+            "@Ernst79"
+        ],
+        "requirements": [
+            "sunwatcher==0.2.1"
+        ]
+    },
+    "solax": {
+        "domain": "solax",
+        "name": "SolaX Power",
+        "documentation": "https://www.home-assistant.io/integrations/solax",
+        "requirements": [
+            "solax==0.2.5"
+        ],
+        "codeowners": [
+            "@squishykid"
+        ]
+    },
+    "soma": {
+        "domain": "soma",
+        "name": "Soma Connect",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/soma",
+        "codeowners": [
+            "@ratsept"
+        ],
+        "requirements": [
+            "pysoma==0.0.10"
+        ]
+    },
+    "somfy": {
+        "domain": "somfy",
+        "name": "Somfy",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/somfy",
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@tetienne"
+        ],
+        "requirements": [
+            "pymfy==0.9.3"
+        ],
+        "zeroconf": [
+            {
+                "type": "_kizbox._tcp.local.",
+                "name": "gateway*"
+            }
+        ]
+    },
+    "somfy_mylink": {
+        "domain": "somfy_mylink",
+        "name": "Somfy MyLink",
+        "documentation": "https://www.home-assistant.io/integrations/somfy_mylink",
+        "requirements": [
+            "somfy-mylink-synergy==1.0.6"
+        ],
+        "codeowners": [
+            "@bdraco"
+        ],
+        "config_flow": True,
+        "dhcp": [
+            {
+                "hostname": "somfy_*",
+                "macaddress": "B8B7F1*"
+            }
+        ]
+    },
+    "sonarr": {
+        "domain": "sonarr",
+        "name": "Sonarr",
+        "documentation": "https://www.home-assistant.io/integrations/sonarr",
+        "codeowners": [
+            "@ctalkington"
+        ],
+        "requirements": [
+            "sonarr==0.3.0"
+        ],
+        "config_flow": True,
+        "quality_scale": "silver"
+    },
+    "songpal": {
+        "domain": "songpal",
+        "name": "Sony Songpal",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/songpal",
+        "requirements": [
+            "python-songpal==0.12"
+        ],
+        "codeowners": [
+            "@rytilahti",
+            "@shenxn"
+        ],
+        "ssdp": [
+            {
+                "st": "urn:schemas-sony-com:service:ScalarWebAPI:1",
+                "manufacturer": "Sony Corporation"
+            }
+        ],
+        "quality_scale": "gold"
+    },
+    "sonos": {
+        "domain": "sonos",
+        "name": "Sonos",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/sonos",
+        "requirements": [
+            "pysonos==0.0.37"
+        ],
+        "after_dependencies": [
+            "plex"
+        ],
+        "ssdp": [
+            {
+                "st": "urn:schemas-upnp-org:device:ZonePlayer:1"
+            }
+        ],
+        "codeowners": [
+            "@cgtobi"
+        ]
+    },
+    "sony_projector": {
+        "domain": "sony_projector",
+        "name": "Sony Projector",
+        "documentation": "https://www.home-assistant.io/integrations/sony_projector",
+        "requirements": [
+            "pysdcp==1"
+        ],
+        "codeowners": []
+    },
+    "soundtouch": {
+        "domain": "soundtouch",
+        "name": "Bose Soundtouch",
+        "documentation": "https://www.home-assistant.io/integrations/soundtouch",
+        "requirements": [
+            "libsoundtouch==0.8"
+        ],
+        "after_dependencies": [
+            "zeroconf"
+        ],
+        "codeowners": []
+    },
+    "spaceapi": {
+        "domain": "spaceapi",
+        "name": "Space API",
+        "documentation": "https://www.home-assistant.io/integrations/spaceapi",
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "spc": {
+        "domain": "spc",
+        "name": "Vanderbilt SPC",
+        "documentation": "https://www.home-assistant.io/integrations/spc",
+        "requirements": [
+            "pyspcwebgw==0.4.0"
+        ],
+        "codeowners": []
+    },
+    "speedtestdotnet": {
+        "domain": "speedtestdotnet",
+        "name": "Speedtest.net",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/speedtestdotnet",
+        "requirements": [
+            "speedtest-cli==2.1.2"
+        ],
+        "codeowners": [
+            "@rohankapoorcom",
+            "@engrbm87"
+        ]
+    },
+    "spider": {
+        "domain": "spider",
+        "name": "Itho Daalderop Spider",
+        "documentation": "https://www.home-assistant.io/integrations/spider",
+        "requirements": [
+            "spiderpy==1.4.2"
+        ],
+        "codeowners": [
+            "@peternijssen"
+        ],
+        "config_flow": True
+    },
+    "splunk": {
+        "domain": "splunk",
+        "name": "Splunk",
+        "documentation": "https://www.home-assistant.io/integrations/splunk",
+        "requirements": [
+            "hass_splunk==0.1.1"
+        ],
+        "codeowners": [
+            "@Bre77"
+        ]
+    },
+    "spotcrime": {
+        "domain": "spotcrime",
+        "name": "Spot Crime",
+        "documentation": "https://www.home-assistant.io/integrations/spotcrime",
+        "requirements": [
+            "spotcrime==1.0.4"
+        ],
+        "codeowners": []
+    },
+    "spotify": {
+        "domain": "spotify",
+        "name": "Spotify",
+        "documentation": "https://www.home-assistant.io/integrations/spotify",
+        "requirements": [
+            "spotipy==2.16.1"
+        ],
+        "zeroconf": [
+            "_spotify-connect._tcp.local."
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@frenck"
+        ],
+        "config_flow": True,
+        "quality_scale": "silver"
+    },
+    "sql": {
+        "domain": "sql",
+        "name": "SQL",
+        "documentation": "https://www.home-assistant.io/integrations/sql",
+        "requirements": [
+            "sqlalchemy==1.3.22"
+        ],
+        "codeowners": [
+            "@dgomes"
+        ]
+    },
+    "squeezebox": {
+        "domain": "squeezebox",
+        "name": "Logitech Squeezebox",
+        "documentation": "https://www.home-assistant.io/integrations/squeezebox",
+        "codeowners": [
+            "@rajlaud"
+        ],
+        "requirements": [
+            "pysqueezebox==0.5.5"
+        ],
+        "config_flow": True,
+        "dhcp": [
+            {
+                "hostname": "squeezebox*",
+                "macaddress": "000420*"
+            }
+        ]
+    },
+    "srp_energy": {
+        "domain": "srp_energy",
+        "name": "SRP Energy",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/srp_energy",
+        "requirements": [
+            "srpenergy==1.3.2"
+        ],
+        "ssdp": [],
+        "zeroconf": [],
+        "homekit": {},
+        "dependencies": [],
+        "codeowners": [
+            "@briglx"
+        ]
+    },
+    "ssdp": {
+        "domain": "ssdp",
+        "name": "Simple Service Discovery Protocol (SSDP)",
+        "documentation": "https://www.home-assistant.io/integrations/ssdp",
+        "requirements": [
+            "defusedxml==0.6.0",
+            "netdisco==2.8.2"
+        ],
+        "after_dependencies": [
+            "zeroconf"
+        ],
+        "codeowners": []
+    },
+    "starline": {
+        "domain": "starline",
+        "name": "StarLine",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/starline",
+        "requirements": [
+            "starline==0.1.5"
+        ],
+        "codeowners": [
+            "@anonym-tsk"
+        ]
+    },
+    "starlingbank": {
+        "domain": "starlingbank",
+        "name": "Starling Bank",
+        "documentation": "https://www.home-assistant.io/integrations/starlingbank",
+        "requirements": [
+            "starlingbank==3.2"
+        ],
+        "codeowners": []
+    },
+    "startca": {
+        "domain": "startca",
+        "name": "Start.ca",
+        "documentation": "https://www.home-assistant.io/integrations/startca",
+        "requirements": [
+            "xmltodict==0.12.0"
+        ],
+        "codeowners": []
+    },
+    "statistics": {
+        "domain": "statistics",
+        "name": "Statistics",
+        "documentation": "https://www.home-assistant.io/integrations/statistics",
+        "after_dependencies": [
+            "recorder"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ],
+        "quality_scale": "internal"
+    },
+    "statsd": {
+        "domain": "statsd",
+        "name": "StatsD",
+        "documentation": "https://www.home-assistant.io/integrations/statsd",
+        "requirements": [
+            "statsd==3.2.1"
+        ],
+        "codeowners": []
+    },
+    "steam_online": {
+        "domain": "steam_online",
+        "name": "Steam",
+        "documentation": "https://www.home-assistant.io/integrations/steam_online",
+        "requirements": [
+            "steamodd==4.21"
+        ],
+        "codeowners": []
+    },
+    "stiebel_eltron": {
+        "domain": "stiebel_eltron",
+        "name": "STIEBEL ELTRON",
+        "documentation": "https://www.home-assistant.io/integrations/stiebel_eltron",
+        "requirements": [
+            "pystiebeleltron==0.0.1.dev2"
+        ],
+        "dependencies": [
+            "modbus"
+        ],
+        "codeowners": [
+            "@fucm"
+        ]
+    },
+    "stookalert": {
+        "domain": "stookalert",
+        "name": "RIVM Stookalert",
+        "documentation": "https://www.home-assistant.io/integrations/stookalert",
+        "codeowners": [
+            "@fwestenberg"
+        ],
+        "requirements": [
+            "stookalert==0.1.4"
+        ]
+    },
+    "stream": {
+        "domain": "stream",
+        "name": "Stream",
+        "documentation": "https://www.home-assistant.io/integrations/stream",
+        "requirements": [
+            "av==8.0.2"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@hunterjm",
+            "@uvjustin"
+        ],
+        "quality_scale": "internal"
+    },
+    "streamlabswater": {
+        "domain": "streamlabswater",
+        "name": "StreamLabs",
+        "documentation": "https://www.home-assistant.io/integrations/streamlabswater",
+        "requirements": [
+            "streamlabswater==1.0.1"
+        ],
+        "codeowners": []
+    },
+    "stt": {
+        "domain": "stt",
+        "name": "Speech-to-Text (STT)",
+        "documentation": "https://www.home-assistant.io/integrations/stt",
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@pvizeli"
+        ]
+    },
+    "suez_water": {
+        "domain": "suez_water",
+        "name": "Suez Water",
+        "documentation": "https://www.home-assistant.io/integrations/suez_water",
+        "codeowners": [
+            "@ooii"
+        ],
+        "requirements": [
+            "pysuez==0.1.19"
+        ]
+    },
+    "sun": {
+        "domain": "sun",
+        "name": "Sun",
+        "documentation": "https://www.home-assistant.io/integrations/sun",
+        "codeowners": [
+            "@Swamp-Ig"
+        ],
+        "quality_scale": "internal"
+    },
+    "supervisord": {
+        "domain": "supervisord",
+        "name": "Supervisord",
+        "documentation": "https://www.home-assistant.io/integrations/supervisord",
+        "codeowners": []
+    },
+    "supla": {
+        "domain": "supla",
+        "name": "Supla",
+        "documentation": "https://www.home-assistant.io/integrations/supla",
+        "requirements": [
+            "asyncpysupla==0.0.5"
+        ],
+        "codeowners": [
+            "@mwegrzynek"
+        ]
+    },
+    "surepetcare": {
+        "domain": "surepetcare",
+        "name": "Sure Petcare",
+        "documentation": "https://www.home-assistant.io/integrations/surepetcare",
+        "codeowners": [
+            "@benleb"
+        ],
+        "requirements": [
+            "surepy==0.4.0"
+        ]
+    },
+    "swiss_hydrological_data": {
+        "domain": "swiss_hydrological_data",
+        "name": "Swiss Hydrological Data",
+        "documentation": "https://www.home-assistant.io/integrations/swiss_hydrological_data",
+        "requirements": [
+            "swisshydrodata==0.0.3"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "swiss_public_transport": {
+        "domain": "swiss_public_transport",
+        "name": "Swiss public transport",
+        "documentation": "https://www.home-assistant.io/integrations/swiss_public_transport",
+        "requirements": [
+            "python_opendata_transport==0.2.1"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "swisscom": {
+        "domain": "swisscom",
+        "name": "Swisscom Internet-Box",
+        "documentation": "https://www.home-assistant.io/integrations/swisscom",
+        "codeowners": []
+    },
+    "switch": {
+        "domain": "switch",
+        "name": "Switch",
+        "documentation": "https://www.home-assistant.io/integrations/switch",
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "switchbot": {
+        "domain": "switchbot",
+        "name": "SwitchBot",
+        "documentation": "https://www.home-assistant.io/integrations/switchbot",
+        "requirements": [
+            "PySwitchbot==0.8.0"
+        ],
+        "codeowners": [
+            "@danielhiversen"
+        ]
+    },
+    "switcher_kis": {
+        "domain": "switcher_kis",
+        "name": "Switcher",
+        "documentation": "https://www.home-assistant.io/integrations/switcher_kis/",
+        "codeowners": [
+            "@tomerfi"
+        ],
+        "requirements": [
+            "aioswitcher==1.2.1"
+        ]
+    },
+    "switchmate": {
+        "domain": "switchmate",
+        "name": "Switchmate SimplySmart Home",
+        "documentation": "https://www.home-assistant.io/integrations/switchmate",
+        "requirements": [
+            "pySwitchmate==0.4.6"
+        ],
+        "codeowners": [
+            "@danielhiversen"
+        ]
+    },
+    "syncthru": {
+        "domain": "syncthru",
+        "name": "Samsung SyncThru Printer",
+        "documentation": "https://www.home-assistant.io/integrations/syncthru",
+        "config_flow": True,
+        "requirements": [
+            "pysyncthru==0.7.0",
+            "url-normalize==1.4.1"
+        ],
+        "ssdp": [
+            {
+                "deviceType": "urn:schemas-upnp-org:device:Printer:1",
+                "manufacturer": "Samsung Electronics"
+            }
+        ],
+        "codeowners": [
+            "@nielstron"
+        ]
+    },
+    "synology": {
+        "domain": "synology",
+        "name": "Synology",
+        "documentation": "https://www.home-assistant.io/integrations/synology",
+        "requirements": [
+            "py-synology==0.2.0"
+        ],
+        "codeowners": []
+    },
+    "synology_chat": {
+        "domain": "synology_chat",
+        "name": "Synology Chat",
+        "documentation": "https://www.home-assistant.io/integrations/synology_chat",
+        "codeowners": []
+    },
+    "synology_dsm": {
+        "domain": "synology_dsm",
+        "name": "Synology DSM",
+        "documentation": "https://www.home-assistant.io/integrations/synology_dsm",
+        "requirements": [
+            "synologydsm-api==1.0.1"
+        ],
+        "codeowners": [
+            "@hacf-fr",
+            "@Quentame",
+            "@mib1185"
+        ],
+        "config_flow": True,
+        "ssdp": [
+            {
+                "manufacturer": "Synology",
+                "deviceType": "urn:schemas-upnp-org:device:Basic:1"
+            }
+        ]
+    },
+    "synology_srm": {
+        "domain": "synology_srm",
+        "name": "Synology SRM",
+        "documentation": "https://www.home-assistant.io/integrations/synology_srm",
+        "requirements": [
+            "synology-srm==0.2.0"
+        ],
+        "codeowners": [
+            "@aerialls"
+        ]
+    },
+    "syslog": {
+        "domain": "syslog",
+        "name": "Syslog",
+        "documentation": "https://www.home-assistant.io/integrations/syslog",
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "system_health": {
+        "domain": "system_health",
+        "name": "System Health",
+        "documentation": "https://www.home-assistant.io/integrations/system_health",
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "system_log": {
+        "domain": "system_log",
+        "name": "System Log",
+        "documentation": "https://www.home-assistant.io/integrations/system_log",
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "systemmonitor": {
+        "domain": "systemmonitor",
+        "name": "System Monitor",
+        "documentation": "https://www.home-assistant.io/integrations/systemmonitor",
+        "requirements": [
+            "psutil==5.8.0"
+        ],
+        "codeowners": []
+    },
+    "tado": {
+        "domain": "tado",
+        "name": "Tado",
+        "documentation": "https://www.home-assistant.io/integrations/tado",
+        "requirements": [
+            "python-tado==0.10.0"
+        ],
+        "codeowners": [
+            "@michaelarnauts",
+            "@bdraco"
+        ],
+        "config_flow": True,
+        "homekit": {
+            "models": [
+                "tado",
+                "AC02"
+            ]
+        }
+    },
+    "tag": {
+        "domain": "tag",
+        "name": "Tags",
+        "documentation": "https://www.home-assistant.io/integrations/tag",
+        "codeowners": [
+            "@balloob",
+            "@dmulcahey"
+        ],
+        "quality_scale": "internal"
+    },
+    "tahoma": {
+        "domain": "tahoma",
+        "name": "Tahoma",
+        "documentation": "https://www.home-assistant.io/integrations/tahoma",
+        "requirements": [
+            "tahoma-api==0.0.16"
+        ],
+        "codeowners": [
+            "@philklei"
+        ]
+    },
+    "tank_utility": {
+        "domain": "tank_utility",
+        "name": "Tank Utility",
+        "documentation": "https://www.home-assistant.io/integrations/tank_utility",
+        "requirements": [
+            "tank_utility==1.4.0"
+        ],
+        "codeowners": []
+    },
+    "tankerkoenig": {
+        "domain": "tankerkoenig",
+        "name": "Tankerkoenig",
+        "documentation": "https://www.home-assistant.io/integrations/tankerkoenig",
+        "requirements": [
+            "pytankerkoenig==0.0.6"
+        ],
+        "codeowners": [
+            "@guillempages"
+        ]
+    },
+    "tapsaff": {
+        "domain": "tapsaff",
+        "name": "Taps Aff",
+        "documentation": "https://www.home-assistant.io/integrations/tapsaff",
+        "requirements": [
+            "tapsaff==0.2.1"
+        ],
+        "codeowners": [
+            "@bazwilliams"
+        ]
+    },
+    "tasmota": {
+        "domain": "tasmota",
+        "name": "Tasmota",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/tasmota",
+        "requirements": [
+            "hatasmota==0.2.6"
+        ],
+        "dependencies": [
+            "mqtt"
+        ],
+        "mqtt": [
+            "tasmota/discovery/#"
+        ],
+        "codeowners": [
+            "@emontnemery"
+        ]
+    },
+    "tautulli": {
+        "domain": "tautulli",
+        "name": "Tautulli",
+        "documentation": "https://www.home-assistant.io/integrations/tautulli",
+        "requirements": [
+            "pytautulli==0.5.0"
+        ],
+        "codeowners": [
+            "@ludeeus"
+        ]
+    },
+    "tcp": {
+        "domain": "tcp",
+        "name": "TCP",
+        "documentation": "https://www.home-assistant.io/integrations/tcp",
+        "codeowners": []
+    },
+    "ted5000": {
+        "domain": "ted5000",
+        "name": "The Energy Detective TED5000",
+        "documentation": "https://www.home-assistant.io/integrations/ted5000",
+        "requirements": [
+            "xmltodict==0.12.0"
+        ],
+        "codeowners": []
+    },
+    "telegram": {
+        "domain": "telegram",
+        "name": "Telegram",
+        "documentation": "https://www.home-assistant.io/integrations/telegram",
+        "dependencies": [
+            "telegram_bot"
+        ],
+        "codeowners": []
+    },
+    "telegram_bot": {
+        "domain": "telegram_bot",
+        "name": "Telegram bot",
+        "documentation": "https://www.home-assistant.io/integrations/telegram_bot",
+        "requirements": [
+            "python-telegram-bot==13.1",
+            "PySocks==1.7.1"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": []
+    },
+    "tellduslive": {
+        "domain": "tellduslive",
+        "name": "Telldus Live",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/tellduslive",
+        "requirements": [
+            "tellduslive==0.10.11"
+        ],
+        "codeowners": [
+            "@fredrike"
+        ],
+        "quality_scale": "gold"
+    },
+    "tellstick": {
+        "domain": "tellstick",
+        "name": "TellStick",
+        "documentation": "https://www.home-assistant.io/integrations/tellstick",
+        "requirements": [
+            "tellcore-net==0.4",
+            "tellcore-py==1.1.2"
+        ],
+        "codeowners": []
+    },
+    "telnet": {
+        "domain": "telnet",
+        "name": "Telnet",
+        "documentation": "https://www.home-assistant.io/integrations/telnet",
+        "codeowners": []
+    },
+    "temper": {
+        "domain": "temper",
+        "name": "TEMPer",
+        "documentation": "https://www.home-assistant.io/integrations/temper",
+        "requirements": [
+            "temperusb==1.5.3"
+        ],
+        "codeowners": []
+    },
+    "template": {
+        "domain": "template",
+        "name": "Template",
+        "documentation": "https://www.home-assistant.io/integrations/template",
+        "codeowners": [
+            "@PhracturedBlue",
+            "@tetienne"
+        ],
+        "quality_scale": "internal",
+        "after_dependencies": [
+            "group"
+        ]
+    },
+    "tensorflow": {
+        "domain": "tensorflow",
+        "name": "TensorFlow",
+        "documentation": "https://www.home-assistant.io/integrations/tensorflow",
+        "requirements": [
+            "tensorflow==2.3.0",
+            "tf-models-official==2.3.0",
+            "pycocotools==2.0.1",
+            "numpy==1.19.2",
+            "pillow==7.2.0"
+        ],
+        "codeowners": []
+    },
+    "tesla": {
+        "domain": "tesla",
+        "name": "Tesla",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/tesla",
+        "requirements": [
+            "teslajsonpy==0.10.4"
+        ],
+        "codeowners": [
+            "@zabuldon",
+            "@alandtse"
+        ],
+        "dhcp": [
+            {
+                "hostname": "tesla_*",
+                "macaddress": "4CFCAA*"
+            },
+            {
+                "hostname": "tesla_*",
+                "macaddress": "044EAF*"
+            },
+            {
+                "hostname": "tesla_*",
+                "macaddress": "98ED5C*"
+            }
+        ]
+    },
+    "tfiac": {
+        "domain": "tfiac",
+        "name": "Tfiac",
+        "documentation": "https://www.home-assistant.io/integrations/tfiac",
+        "requirements": [
+            "pytfiac==0.4"
+        ],
+        "codeowners": [
+            "@fredrike",
+            "@mellado"
+        ]
+    },
+    "thermoworks_smoke": {
+        "domain": "thermoworks_smoke",
+        "name": "ThermoWorks Smoke",
+        "documentation": "https://www.home-assistant.io/integrations/thermoworks_smoke",
+        "requirements": [
+            "stringcase==1.2.0",
+            "thermoworks_smoke==0.1.8"
+        ],
+        "codeowners": []
+    },
+    "thethingsnetwork": {
+        "domain": "thethingsnetwork",
+        "name": "The Things Network",
+        "documentation": "https://www.home-assistant.io/integrations/thethingsnetwork",
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "thingspeak": {
+        "domain": "thingspeak",
+        "name": "ThingSpeak",
+        "documentation": "https://www.home-assistant.io/integrations/thingspeak",
+        "requirements": [
+            "thingspeak==1.0.0"
+        ],
+        "codeowners": []
+    },
+    "thinkingcleaner": {
+        "domain": "thinkingcleaner",
+        "name": "Thinking Cleaner",
+        "documentation": "https://www.home-assistant.io/integrations/thinkingcleaner",
+        "requirements": [
+            "pythinkingcleaner==0.0.3"
+        ],
+        "codeowners": []
+    },
+    "thomson": {
+        "domain": "thomson",
+        "name": "Thomson",
+        "documentation": "https://www.home-assistant.io/integrations/thomson",
+        "codeowners": []
+    },
+    "threshold": {
+        "domain": "threshold",
+        "name": "Threshold",
+        "documentation": "https://www.home-assistant.io/integrations/threshold",
+        "codeowners": [
+            "@fabaff"
+        ],
+        "quality_scale": "internal"
+    },
+    "tibber": {
+        "domain": "tibber",
+        "name": "Tibber",
+        "documentation": "https://www.home-assistant.io/integrations/tibber",
+        "requirements": [
+            "pyTibber==0.16.1"
+        ],
+        "codeowners": [
+            "@danielhiversen"
+        ],
+        "quality_scale": "silver",
+        "config_flow": True
+    },
+    "tikteck": {
+        "domain": "tikteck",
+        "name": "Tikteck",
+        "documentation": "https://www.home-assistant.io/integrations/tikteck",
+        "requirements": [
+            "tikteck==0.4"
+        ],
+        "codeowners": []
+    },
+    "tile": {
+        "domain": "tile",
+        "name": "Tile",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/tile",
+        "requirements": [
+            "pytile==4.0.0"
+        ],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "time_date": {
+        "domain": "time_date",
+        "name": "Time & Date",
+        "documentation": "https://www.home-assistant.io/integrations/time_date",
+        "codeowners": [
+            "@fabaff"
+        ],
+        "quality_scale": "internal"
+    },
+    "timer": {
+        "domain": "timer",
+        "name": "Timer",
+        "documentation": "https://www.home-assistant.io/integrations/timer",
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "tmb": {
+        "domain": "tmb",
+        "name": "Transports Metropolitans de Barcelona",
+        "documentation": "https://www.home-assistant.io/integrations/tmb",
+        "requirements": [
+            "tmb==0.0.4"
+        ],
+        "codeowners": [
+            "@alemuro"
+        ]
+    },
+    "tod": {
+        "domain": "tod",
+        "name": "Times of the Day",
+        "documentation": "https://www.home-assistant.io/integrations/tod",
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "todoist": {
+        "domain": "todoist",
+        "name": "Todoist",
+        "documentation": "https://www.home-assistant.io/integrations/todoist",
+        "requirements": [
+            "todoist-python==8.0.0"
+        ],
+        "codeowners": [
+            "@boralyl"
+        ]
+    },
+    "tof": {
+        "domain": "tof",
+        "name": "Time of Flight",
+        "documentation": "https://www.home-assistant.io/integrations/tof",
+        "requirements": [
+            "VL53L1X2==0.1.5"
+        ],
+        "dependencies": [
+            "rpi_gpio"
+        ],
+        "codeowners": []
+    },
+    "tomato": {
+        "domain": "tomato",
+        "name": "Tomato",
+        "documentation": "https://www.home-assistant.io/integrations/tomato",
+        "codeowners": []
+    },
+    "toon": {
+        "domain": "toon",
+        "name": "Toon",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/toon",
+        "requirements": [
+            "toonapi==0.2.0"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "after_dependencies": [
+            "cloud"
+        ],
+        "codeowners": [
+            "@frenck"
+        ],
+        "dhcp": [
+            {
+                "hostname": "eneco-*",
+                "macaddress": "74C63B*"
+            }
+        ]
+    },
+    "torque": {
+        "domain": "torque",
+        "name": "Torque",
+        "documentation": "https://www.home-assistant.io/integrations/torque",
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": []
+    },
+    "totalconnect": {
+        "domain": "totalconnect",
+        "name": "Honeywell Total Connect Alarm",
+        "documentation": "https://www.home-assistant.io/integrations/totalconnect",
+        "requirements": [
+            "total_connect_client==0.55"
+        ],
+        "codeowners": [
+            "@austinmroczek"
+        ],
+        "config_flow": True
+    },
+    "touchline": {
+        "domain": "touchline",
+        "name": "Roth Touchline",
+        "documentation": "https://www.home-assistant.io/integrations/touchline",
+        "requirements": [
+            "pytouchline==0.7"
+        ],
+        "codeowners": []
+    },
+    "tplink": {
+        "domain": "tplink",
+        "name": "TP-Link Kasa Smart",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/tplink",
+        "requirements": [
+            "pyHS100==0.3.5.2"
+        ],
+        "codeowners": [
+            "@rytilahti",
+            "@thegardenmonkey"
+        ]
+    },
+    "tplink_lte": {
+        "domain": "tplink_lte",
+        "name": "TP-Link LTE",
+        "documentation": "https://www.home-assistant.io/integrations/tplink_lte",
+        "requirements": [
+            "tp-connected==0.0.4"
+        ],
+        "codeowners": []
+    },
+    "traccar": {
+        "domain": "traccar",
+        "name": "Traccar",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/traccar",
+        "requirements": [
+            "pytraccar==0.9.0",
+            "stringcase==1.2.0"
+        ],
+        "dependencies": [
+            "webhook"
+        ],
+        "codeowners": [
+            "@ludeeus"
+        ]
+    },
+    "trackr": {
+        "domain": "trackr",
+        "name": "TrackR",
+        "documentation": "https://www.home-assistant.io/integrations/trackr",
+        "requirements": [
+            "pytrackr==0.0.5"
+        ],
+        "codeowners": []
+    },
+    "tradfri": {
+        "domain": "tradfri",
+        "name": "IKEA TR\u00c5DFRI",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/tradfri",
+        "requirements": [
+            "pytradfri[async]==7.0.6"
+        ],
+        "homekit": {
+            "models": [
+                "TRADFRI"
+            ]
+        },
+        "codeowners": [
+            "@ggravlingen"
+        ]
+    },
+    "trafikverket_train": {
+        "domain": "trafikverket_train",
+        "name": "Trafikverket Train",
+        "documentation": "https://www.home-assistant.io/integrations/trafikverket_train",
+        "requirements": [
+            "pytrafikverket==0.1.6.2"
+        ],
+        "codeowners": [
+            "@endor-force"
+        ]
+    },
+    "trafikverket_weatherstation": {
+        "domain": "trafikverket_weatherstation",
+        "name": "Trafikverket Weather Station",
+        "documentation": "https://www.home-assistant.io/integrations/trafikverket_weatherstation",
+        "requirements": [
+            "pytrafikverket==0.1.6.2"
+        ],
+        "codeowners": [
+            "@endor-force"
+        ]
+    },
+    "transmission": {
+        "domain": "transmission",
+        "name": "Transmission",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/transmission",
+        "requirements": [
+            "transmissionrpc==0.11"
+        ],
+        "codeowners": [
+            "@engrbm87",
+            "@JPHutchins"
+        ]
+    },
+    "transport_nsw": {
+        "domain": "transport_nsw",
+        "name": "Transport NSW",
+        "documentation": "https://www.home-assistant.io/integrations/transport_nsw",
+        "requirements": [
+            "PyTransportNSW==0.1.1"
+        ],
+        "codeowners": []
+    },
+    "travisci": {
+        "domain": "travisci",
+        "name": "Travis-CI",
+        "documentation": "https://www.home-assistant.io/integrations/travisci",
+        "requirements": [
+            "TravisPy==0.3.5"
+        ],
+        "codeowners": []
+    },
+    "trend": {
+        "domain": "trend",
+        "name": "Trend",
+        "documentation": "https://www.home-assistant.io/integrations/trend",
+        "requirements": [
+            "numpy==1.19.2"
+        ],
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "tts": {
+        "domain": "tts",
+        "name": "Text-to-Speech (TTS)",
+        "documentation": "https://www.home-assistant.io/integrations/tts",
+        "requirements": [
+            "mutagen==1.45.1"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "after_dependencies": [
+            "media_player"
+        ],
+        "codeowners": [
+            "@pvizeli"
+        ]
+    },
+    "tuya": {
+        "domain": "tuya",
+        "name": "Tuya",
+        "documentation": "https://www.home-assistant.io/integrations/tuya",
+        "requirements": [
+            "tuyaha==0.0.9"
+        ],
+        "codeowners": [
+            "@ollo69"
+        ],
+        "config_flow": True
+    },
+    "twentemilieu": {
+        "domain": "twentemilieu",
+        "name": "Twente Milieu",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/twentemilieu",
+        "requirements": [
+            "twentemilieu==0.3.0"
+        ],
+        "codeowners": [
+            "@frenck"
+        ]
+    },
+    "twilio": {
+        "domain": "twilio",
+        "name": "Twilio",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/twilio",
+        "requirements": [
+            "twilio==6.32.0"
+        ],
+        "dependencies": [
+            "webhook"
+        ],
+        "codeowners": []
+    },
+    "twilio_call": {
+        "domain": "twilio_call",
+        "name": "Twilio Call",
+        "documentation": "https://www.home-assistant.io/integrations/twilio_call",
+        "dependencies": [
+            "twilio"
+        ],
+        "codeowners": []
+    },
+    "twilio_sms": {
+        "domain": "twilio_sms",
+        "name": "Twilio SMS",
+        "documentation": "https://www.home-assistant.io/integrations/twilio_sms",
+        "dependencies": [
+            "twilio"
+        ],
+        "codeowners": []
+    },
+    "twinkly": {
+        "domain": "twinkly",
+        "name": "Twinkly",
+        "documentation": "https://www.home-assistant.io/integrations/twinkly",
+        "requirements": [
+            "twinkly-client==0.0.2"
+        ],
+        "dependencies": [],
+        "codeowners": [
+            "@dr1rrb"
+        ],
+        "config_flow": True
+    },
+    "twitch": {
+        "domain": "twitch",
+        "name": "Twitch",
+        "documentation": "https://www.home-assistant.io/integrations/twitch",
+        "requirements": [
+            "python-twitch-client==0.6.0"
+        ],
+        "codeowners": []
+    },
+    "twitter": {
+        "domain": "twitter",
+        "name": "Twitter",
+        "documentation": "https://www.home-assistant.io/integrations/twitter",
+        "requirements": [
+            "TwitterAPI==2.6.3"
+        ],
+        "codeowners": []
+    },
+    "ubus": {
+        "domain": "ubus",
+        "name": "OpenWrt (ubus)",
+        "documentation": "https://www.home-assistant.io/integrations/ubus",
+        "codeowners": []
+    },
+    "ue_smart_radio": {
+        "domain": "ue_smart_radio",
+        "name": "Logitech UE Smart Radio",
+        "documentation": "https://www.home-assistant.io/integrations/ue_smart_radio",
+        "codeowners": []
+    },
+    "uk_transport": {
+        "domain": "uk_transport",
+        "name": "UK Transport",
+        "documentation": "https://www.home-assistant.io/integrations/uk_transport",
+        "codeowners": []
+    },
+    "unifi": {
+        "domain": "unifi",
+        "name": "Ubiquiti UniFi",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/unifi",
+        "requirements": [
+            "aiounifi==26"
+        ],
+        "codeowners": [
+            "@Kane610"
+        ],
+        "quality_scale": "platinum",
+        "ssdp": [
+            {
+                "manufacturer": "Ubiquiti Networks",
+                "deviceType": "urn:schemas-upnp-org:device:InternetGatewayDevice:1",
+                "modelDescription": "UniFi Dream Machine"
+            },
+            {
+                "manufacturer": "Ubiquiti Networks",
+                "deviceType": "urn:schemas-upnp-org:device:InternetGatewayDevice:1",
+                "modelDescription": "UniFi Dream Machine Pro"
+            }
+        ]
+    },
+    "unifi_direct": {
+        "domain": "unifi_direct",
+        "name": "Ubiquiti UniFi AP",
+        "documentation": "https://www.home-assistant.io/integrations/unifi_direct",
+        "requirements": [
+            "pexpect==4.6.0"
+        ],
+        "codeowners": []
+    },
+    "unifiled": {
+        "domain": "unifiled",
+        "name": "Ubiquiti UniFi LED",
+        "documentation": "https://www.home-assistant.io/integrations/unifiled",
+        "codeowners": [
+            "@florisvdk"
+        ],
+        "requirements": [
+            "unifiled==0.11"
+        ]
+    },
+    "universal": {
+        "domain": "universal",
+        "name": "Universal Media Player",
+        "documentation": "https://www.home-assistant.io/integrations/universal",
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "upb": {
+        "domain": "upb",
+        "name": "Universal Powerline Bus (UPB)",
+        "documentation": "https://www.home-assistant.io/integrations/upb",
+        "requirements": [
+            "upb_lib==0.4.12"
+        ],
+        "codeowners": [
+            "@gwww"
+        ],
+        "config_flow": True
+    },
+    "upc_connect": {
+        "domain": "upc_connect",
+        "name": "UPC Connect Box",
+        "documentation": "https://www.home-assistant.io/integrations/upc_connect",
+        "requirements": [
+            "connect-box==0.2.8"
+        ],
+        "codeowners": [
+            "@pvizeli",
+            "@fabaff"
+        ]
+    },
+    "upcloud": {
+        "domain": "upcloud",
+        "name": "UpCloud",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/upcloud",
+        "requirements": [
+            "upcloud-api==0.4.5"
+        ],
+        "codeowners": [
+            "@scop"
+        ]
+    },
+    "updater": {
+        "domain": "updater",
+        "name": "Updater",
+        "documentation": "https://www.home-assistant.io/integrations/updater",
+        "requirements": [
+            "distro==1.5.0"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "upnp": {
+        "domain": "upnp",
+        "name": "UPnP",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/upnp",
+        "requirements": [
+            "async-upnp-client==0.14.13"
+        ],
+        "codeowners": [
+            "@StevenLooman"
+        ],
+        "ssdp": [
+            {
+                "st": "urn:schemas-upnp-org:device:InternetGatewayDevice:1"
+            },
+            {
+                "st": "urn:schemas-upnp-org:device:InternetGatewayDevice:2"
+            }
+        ]
+    },
+    "uptime": {
+        "domain": "uptime",
+        "name": "Uptime",
+        "documentation": "https://www.home-assistant.io/integrations/uptime",
+        "codeowners": [],
+        "quality_scale": "internal"
+    },
+    "uptimerobot": {
+        "domain": "uptimerobot",
+        "name": "Uptime Robot",
+        "documentation": "https://www.home-assistant.io/integrations/uptimerobot",
+        "requirements": [
+            "pyuptimerobot==0.0.5"
+        ],
+        "codeowners": [
+            "@ludeeus"
+        ]
+    },
+    "uscis": {
+        "domain": "uscis",
+        "name": "U.S. Citizenship and Immigration Services (USCIS)",
+        "documentation": "https://www.home-assistant.io/integrations/uscis",
+        "requirements": [
+            "uscisstatus==0.1.1"
+        ],
+        "codeowners": []
+    },
+    "usgs_earthquakes_feed": {
+        "domain": "usgs_earthquakes_feed",
+        "name": "U.S. Geological Survey Earthquake Hazards (USGS)",
+        "documentation": "https://www.home-assistant.io/integrations/usgs_earthquakes_feed",
+        "requirements": [
+            "geojson_client==0.4"
+        ],
+        "codeowners": [
+            "@exxamalte"
+        ]
+    },
+    "utility_meter": {
+        "domain": "utility_meter",
+        "name": "Utility Meter",
+        "documentation": "https://www.home-assistant.io/integrations/utility_meter",
+        "codeowners": [
+            "@dgomes"
+        ],
+        "quality_scale": "internal"
+    },
+    "uvc": {
+        "domain": "uvc",
+        "name": "Ubiquiti UniFi Video",
+        "documentation": "https://www.home-assistant.io/integrations/uvc",
+        "requirements": [
+            "uvcclient==0.11.0"
+        ],
+        "codeowners": []
+    },
+    "vacuum": {
+        "domain": "vacuum",
+        "name": "Vacuum",
+        "documentation": "https://www.home-assistant.io/integrations/vacuum",
+        "codeowners": []
+    },
+    "vallox": {
+        "domain": "vallox",
+        "name": "Vallox",
+        "documentation": "https://www.home-assistant.io/integrations/vallox",
+        "requirements": [
+            "vallox-websocket-api==2.4.0"
+        ],
+        "codeowners": []
+    },
+    "vasttrafik": {
+        "domain": "vasttrafik",
+        "name": "V\u00e4sttrafik",
+        "documentation": "https://www.home-assistant.io/integrations/vasttrafik",
+        "requirements": [
+            "vtjp==0.1.14"
+        ],
+        "codeowners": []
+    },
+    "velbus": {
+        "domain": "velbus",
+        "name": "Velbus",
+        "documentation": "https://www.home-assistant.io/integrations/velbus",
+        "requirements": [
+            "python-velbus==2.1.1"
+        ],
+        "config_flow": True,
+        "codeowners": [
+            "@Cereal2nd",
+            "@brefra"
+        ]
+    },
+    "velux": {
+        "domain": "velux",
+        "name": "Velux",
+        "documentation": "https://www.home-assistant.io/integrations/velux",
+        "requirements": [
+            "pyvlx==0.2.18"
+        ],
+        "codeowners": [
+            "@Julius2342"
+        ]
+    },
+    "venstar": {
+        "domain": "venstar",
+        "name": "Venstar",
+        "documentation": "https://www.home-assistant.io/integrations/venstar",
+        "requirements": [
+            "venstarcolortouch==0.13"
+        ],
+        "codeowners": []
+    },
+    "vera": {
+        "domain": "vera",
+        "name": "Vera",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/vera",
+        "requirements": [
+            "pyvera==0.3.11"
+        ],
+        "codeowners": [
+            "@vangorra"
+        ]
+    },
+    "verisure": {
+        "domain": "verisure",
+        "name": "Verisure",
+        "documentation": "https://www.home-assistant.io/integrations/verisure",
+        "requirements": [
+            "jsonpath==0.82",
+            "vsure==1.6.1"
+        ],
+        "codeowners": [
+            "@frenck"
+        ]
+    },
+    "versasense": {
+        "domain": "versasense",
+        "name": "VersaSense",
+        "documentation": "https://www.home-assistant.io/integrations/versasense",
+        "codeowners": [
+            "@flamm3blemuff1n"
+        ],
+        "requirements": [
+            "pyversasense==0.0.6"
+        ]
+    },
+    "version": {
+        "domain": "version",
+        "name": "Version",
+        "documentation": "https://www.home-assistant.io/integrations/version",
+        "requirements": [
+            "pyhaversion==3.4.2"
+        ],
+        "codeowners": [
+            "@fabaff",
+            "@ludeeus"
+        ],
+        "quality_scale": "internal"
+    },
+    "vesync": {
+        "domain": "vesync",
+        "name": "VeSync",
+        "documentation": "https://www.home-assistant.io/integrations/vesync",
+        "codeowners": [
+            "@markperdue",
+            "@webdjoe",
+            "@thegardenmonkey"
+        ],
+        "requirements": [
+            "pyvesync==1.2.0"
+        ],
+        "config_flow": True
+    },
+    "viaggiatreno": {
+        "domain": "viaggiatreno",
+        "name": "Trenitalia ViaggiaTreno",
+        "documentation": "https://www.home-assistant.io/integrations/viaggiatreno",
+        "codeowners": []
+    },
+    "vicare": {
+        "domain": "vicare",
+        "name": "Viessmann ViCare",
+        "documentation": "https://www.home-assistant.io/integrations/vicare",
+        "codeowners": [
+            "@oischinger"
+        ],
+        "requirements": [
+            "PyViCare==0.2.5"
+        ]
+    },
+    "vilfo": {
+        "domain": "vilfo",
+        "name": "Vilfo Router",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/vilfo",
+        "requirements": [
+            "vilfo-api-client==0.3.2"
+        ],
+        "codeowners": [
+            "@ManneW"
+        ]
+    },
+    "vivotek": {
+        "domain": "vivotek",
+        "name": "VIVOTEK",
+        "documentation": "https://www.home-assistant.io/integrations/vivotek",
+        "requirements": [
+            "libpyvivotek==0.4.0"
+        ],
+        "codeowners": [
+            "@HarlemSquirrel"
+        ]
+    },
+    "vizio": {
+        "domain": "vizio",
+        "name": "VIZIO SmartCast",
+        "documentation": "https://www.home-assistant.io/integrations/vizio",
+        "requirements": [
+            "pyvizio==0.1.57"
+        ],
+        "codeowners": [
+            "@raman325"
+        ],
+        "config_flow": True,
+        "zeroconf": [
+            "_viziocast._tcp.local."
+        ],
+        "quality_scale": "platinum"
+    },
+    "vlc": {
+        "domain": "vlc",
+        "name": "VLC media player",
+        "documentation": "https://www.home-assistant.io/integrations/vlc",
+        "requirements": [
+            "python-vlc==1.1.2"
+        ],
+        "codeowners": []
+    },
+    "vlc_telnet": {
+        "domain": "vlc_telnet",
+        "name": "VLC media player Telnet",
+        "documentation": "https://www.home-assistant.io/integrations/vlc-telnet",
+        "requirements": [
+            "python-telnet-vlc==1.0.4"
+        ],
+        "codeowners": [
+            "@rodripf"
+        ]
+    },
+    "voicerss": {
+        "domain": "voicerss",
+        "name": "VoiceRSS",
+        "documentation": "https://www.home-assistant.io/integrations/voicerss",
+        "codeowners": []
+    },
+    "volkszaehler": {
+        "domain": "volkszaehler",
+        "name": "Volkszaehler",
+        "documentation": "https://www.home-assistant.io/integrations/volkszaehler",
+        "requirements": [
+            "volkszaehler==0.2.1"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ]
+    },
+    "volumio": {
+        "domain": "volumio",
+        "name": "Volumio",
+        "documentation": "https://www.home-assistant.io/integrations/volumio",
+        "codeowners": [
+            "@OnFreund"
+        ],
+        "config_flow": True,
+        "zeroconf": [
+            "_Volumio._tcp.local."
+        ],
+        "requirements": [
+            "pyvolumio==0.1.3"
+        ]
+    },
+    "volvooncall": {
+        "domain": "volvooncall",
+        "name": "Volvo On Call",
+        "documentation": "https://www.home-assistant.io/integrations/volvooncall",
+        "requirements": [
+            "volvooncall==0.8.12"
+        ],
+        "codeowners": []
+    },
+    "vultr": {
+        "domain": "vultr",
+        "name": "Vultr",
+        "documentation": "https://www.home-assistant.io/integrations/vultr",
+        "requirements": [
+            "vultr==0.1.2"
+        ],
+        "codeowners": []
+    },
+    "w800rf32": {
+        "domain": "w800rf32",
+        "name": "WGL Designs W800RF32",
+        "documentation": "https://www.home-assistant.io/integrations/w800rf32",
+        "requirements": [
+            "pyW800rf32==0.1"
+        ],
+        "codeowners": []
+    },
+    "wake_on_lan": {
+        "domain": "wake_on_lan",
+        "name": "Wake on LAN",
+        "documentation": "https://www.home-assistant.io/integrations/wake_on_lan",
+        "requirements": [
+            "wakeonlan==1.1.6"
+        ],
+        "codeowners": []
+    },
+    "waqi": {
+        "domain": "waqi",
+        "name": "World Air Quality Index (WAQI)",
+        "documentation": "https://www.home-assistant.io/integrations/waqi",
+        "requirements": [
+            "waqiasync==1.0.0"
+        ],
+        "codeowners": [
+            "@andrey-git"
+        ]
+    },
+    "water_heater": {
+        "domain": "water_heater",
+        "name": "Water Heater",
+        "documentation": "https://www.home-assistant.io/integrations/water_heater",
+        "codeowners": []
+    },
+    "waterfurnace": {
+        "domain": "waterfurnace",
+        "name": "WaterFurnace",
+        "documentation": "https://www.home-assistant.io/integrations/waterfurnace",
+        "requirements": [
+            "waterfurnace==1.1.0"
+        ],
+        "codeowners": []
+    },
+    "watson_iot": {
+        "domain": "watson_iot",
+        "name": "IBM Watson IoT Platform",
+        "documentation": "https://www.home-assistant.io/integrations/watson_iot",
+        "requirements": [
+            "ibmiotf==0.3.4"
+        ],
+        "codeowners": []
+    },
+    "watson_tts": {
+        "domain": "watson_tts",
+        "name": "IBM Watson TTS",
+        "documentation": "https://www.home-assistant.io/integrations/watson_tts",
+        "requirements": [
+            "ibm-watson==4.0.1"
+        ],
+        "codeowners": [
+            "@rutkai"
+        ]
+    },
+    "waze_travel_time": {
+        "domain": "waze_travel_time",
+        "name": "Waze Travel Time",
+        "documentation": "https://www.home-assistant.io/integrations/waze_travel_time",
+        "requirements": [
+            "WazeRouteCalculator==0.12"
+        ],
+        "codeowners": []
+    },
+    "weather": {
+        "domain": "weather",
+        "name": "Weather",
+        "documentation": "https://www.home-assistant.io/integrations/weather",
+        "codeowners": [
+            "@fabaff"
+        ],
+        "quality_scale": "internal"
+    },
+    "webhook": {
+        "domain": "webhook",
+        "name": "Webhook",
+        "documentation": "https://www.home-assistant.io/integrations/webhook",
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": []
+    },
+    "webostv": {
+        "domain": "webostv",
+        "name": "LG webOS Smart TV",
+        "documentation": "https://www.home-assistant.io/integrations/webostv",
+        "requirements": [
+            "aiopylgtv==0.3.3"
+        ],
+        "dependencies": [
+            "configurator"
+        ],
+        "codeowners": [
+            "@bendavid"
+        ]
+    },
+    "websocket_api": {
+        "domain": "websocket_api",
+        "name": "Home Assistant WebSocket API",
+        "documentation": "https://www.home-assistant.io/integrations/websocket_api",
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "wemo": {
+        "domain": "wemo",
+        "name": "Belkin WeMo",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/wemo",
+        "requirements": [
+            "pywemo==0.5.6"
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "Belkin International Inc."
+            }
+        ],
+        "homekit": {
+            "models": [
+                "Socket",
+                "Wemo"
+            ]
+        },
+        "codeowners": []
+    },
+    "whois": {
+        "domain": "whois",
+        "name": "Whois",
+        "documentation": "https://www.home-assistant.io/integrations/whois",
+        "requirements": [
+            "python-whois==0.7.3"
+        ],
+        "codeowners": []
+    },
+    "wiffi": {
+        "domain": "wiffi",
+        "name": "Wiffi",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/wiffi",
+        "requirements": [
+            "wiffi==1.0.1"
+        ],
+        "codeowners": [
+            "@mampfes"
+        ]
+    },
+    "wilight": {
+        "domain": "wilight",
+        "name": "WiLight",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/wilight",
+        "requirements": [
+            "pywilight==0.0.65"
+        ],
+        "ssdp": [
+            {
+                "manufacturer": "All Automacao Ltda"
+            }
+        ],
+        "codeowners": [
+            "@leofig-rj"
+        ],
+        "quality_scale": "silver"
+    },
+    "wink": {
+        "domain": "wink",
+        "name": "Wink",
+        "documentation": "https://www.home-assistant.io/integrations/wink",
+        "requirements": [
+            "pubnubsub-handler==1.0.9",
+            "python-wink==1.10.5"
+        ],
+        "dependencies": [
+            "configurator",
+            "http"
+        ],
+        "codeowners": []
+    },
+    "wirelesstag": {
+        "domain": "wirelesstag",
+        "name": "Wireless Sensor Tags",
+        "documentation": "https://www.home-assistant.io/integrations/wirelesstag",
+        "requirements": [
+            "wirelesstagpy==0.4.1"
+        ],
+        "codeowners": []
+    },
+    "withings": {
+        "domain": "withings",
+        "name": "Withings",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/withings",
+        "requirements": [
+            "withings-api==2.1.6"
+        ],
+        "dependencies": [
+            "http",
+            "webhook"
+        ],
+        "codeowners": [
+            "@vangorra"
+        ]
+    },
+    "wled": {
+        "domain": "wled",
+        "name": "WLED",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/wled",
+        "requirements": [
+            "wled==0.4.4"
+        ],
+        "zeroconf": [
+            "_wled._tcp.local."
+        ],
+        "codeowners": [
+            "@frenck"
+        ],
+        "quality_scale": "platinum"
+    },
+    "wolflink": {
+        "domain": "wolflink",
+        "name": "Wolf SmartSet Service",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/wolflink",
+        "requirements": [
+            "wolf_smartset==0.1.8"
+        ],
+        "codeowners": [
+            "@adamkrol93"
+        ]
+    },
+    "workday": {
+        "domain": "workday",
+        "name": "Workday",
+        "documentation": "https://www.home-assistant.io/integrations/workday",
+        "requirements": [
+            "holidays==0.10.4"
+        ],
+        "codeowners": [
+            "@fabaff"
+        ],
+        "quality_scale": "internal"
+    },
+    "worldclock": {
+        "domain": "worldclock",
+        "name": "Worldclock",
+        "documentation": "https://www.home-assistant.io/integrations/worldclock",
+        "codeowners": [
+            "@fabaff"
+        ],
+        "quality_scale": "internal"
+    },
+    "worldtidesinfo": {
+        "domain": "worldtidesinfo",
+        "name": "World Tides",
+        "documentation": "https://www.home-assistant.io/integrations/worldtidesinfo",
+        "codeowners": []
+    },
+    "worxlandroid": {
+        "domain": "worxlandroid",
+        "name": "Worx Landroid",
+        "documentation": "https://www.home-assistant.io/integrations/worxlandroid",
+        "codeowners": []
+    },
+    "wsdot": {
+        "domain": "wsdot",
+        "name": "Washington State Department of Transportation (WSDOT)",
+        "documentation": "https://www.home-assistant.io/integrations/wsdot",
+        "codeowners": []
+    },
+    "wunderground": {
+        "domain": "wunderground",
+        "name": "Weather Underground (WUnderground)",
+        "documentation": "https://www.home-assistant.io/integrations/wunderground",
+        "codeowners": []
+    },
+    "x10": {
+        "domain": "x10",
+        "name": "Heyu X10",
+        "documentation": "https://www.home-assistant.io/integrations/x10",
+        "codeowners": []
+    },
+    "xbee": {
+        "domain": "xbee",
+        "name": "XBee",
+        "documentation": "https://www.home-assistant.io/integrations/xbee",
+        "requirements": [
+            "xbee-helper==0.0.7"
+        ],
+        "codeowners": []
+    },
+    "xbox": {
+        "domain": "xbox",
+        "name": "Xbox",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/xbox",
+        "requirements": [
+            "xbox-webapi==2.0.8"
+        ],
+        "dependencies": [
+            "http"
+        ],
+        "codeowners": [
+            "@hunterjm"
+        ]
+    },
+    "xbox_live": {
+        "domain": "xbox_live",
+        "name": "Xbox Live",
+        "documentation": "https://www.home-assistant.io/integrations/xbox_live",
+        "requirements": [
+            "xboxapi==2.0.1"
+        ],
+        "codeowners": [
+            "@MartinHjelmare"
+        ]
+    },
+    "xeoma": {
+        "domain": "xeoma",
+        "name": "Xeoma",
+        "documentation": "https://www.home-assistant.io/integrations/xeoma",
+        "requirements": [
+            "pyxeoma==1.4.1"
+        ],
+        "codeowners": []
+    },
+    "xfinity": {
+        "domain": "xfinity",
+        "name": "Xfinity Gateway",
+        "documentation": "https://www.home-assistant.io/integrations/xfinity",
+        "requirements": [
+            "xfinity-gateway==0.0.4"
+        ],
+        "codeowners": [
+            "@cisasteelersfan"
+        ]
+    },
+    "xiaomi": {
+        "domain": "xiaomi",
+        "name": "Xiaomi",
+        "documentation": "https://www.home-assistant.io/integrations/xiaomi",
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "codeowners": []
+    },
+    "xiaomi_aqara": {
+        "domain": "xiaomi_aqara",
+        "name": "Xiaomi Gateway (Aqara)",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/xiaomi_aqara",
+        "requirements": [
+            "PyXiaomiGateway==0.13.4"
+        ],
+        "after_dependencies": [
+            "discovery"
+        ],
+        "codeowners": [
+            "@danielhiversen",
+            "@syssi"
+        ],
+        "zeroconf": [
+            "_miio._udp.local."
+        ]
+    },
+    "xiaomi_miio": {
+        "domain": "xiaomi_miio",
+        "name": "Xiaomi Miio",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/xiaomi_miio",
+        "requirements": [
+            "construct==2.10.56",
+            "python-miio==0.5.4"
+        ],
+        "codeowners": [
+            "@rytilahti",
+            "@syssi",
+            "@starkillerOG"
+        ],
+        "zeroconf": [
+            "_miio._udp.local."
+        ]
+    },
+    "xiaomi_tv": {
+        "domain": "xiaomi_tv",
+        "name": "Xiaomi TV",
+        "documentation": "https://www.home-assistant.io/integrations/xiaomi_tv",
+        "requirements": [
+            "pymitv==1.4.3"
+        ],
+        "codeowners": [
+            "@simse"
+        ]
+    },
+    "xmpp": {
+        "domain": "xmpp",
+        "name": "Jabber (XMPP)",
+        "documentation": "https://www.home-assistant.io/integrations/xmpp",
+        "requirements": [
+            "slixmpp==1.6.0"
+        ],
+        "codeowners": [
+            "@fabaff",
+            "@flowolf"
+        ]
+    },
+    "xs1": {
+        "domain": "xs1",
+        "name": "EZcontrol XS1",
+        "documentation": "https://www.home-assistant.io/integrations/xs1",
+        "requirements": [
+            "xs1-api-client==3.0.0"
+        ],
+        "codeowners": []
+    },
+    "yale_smart_alarm": {
+        "domain": "yale_smart_alarm",
+        "name": "Yale Smart Living",
+        "documentation": "https://www.home-assistant.io/integrations/yale_smart_alarm",
+        "requirements": [
+            "yalesmartalarmclient==0.1.6"
+        ],
+        "codeowners": []
+    },
+    "yamaha": {
+        "domain": "yamaha",
+        "name": "Yamaha Network Receivers",
+        "documentation": "https://www.home-assistant.io/integrations/yamaha",
+        "requirements": [
+            "rxv==0.6.0"
+        ],
+        "codeowners": []
+    },
+    "yamaha_musiccast": {
+        "domain": "yamaha_musiccast",
+        "name": "Yamaha MusicCast",
+        "documentation": "https://www.home-assistant.io/integrations/yamaha_musiccast",
+        "requirements": [
+            "pymusiccast==0.1.6"
+        ],
+        "codeowners": [
+            "@jalmeroth"
+        ]
+    },
+    "yandex_transport": {
+        "domain": "yandex_transport",
+        "name": "Yandex Transport",
+        "documentation": "https://www.home-assistant.io/integrations/yandex_transport",
+        "requirements": [
+            "aioymaps==1.1.0"
+        ],
+        "codeowners": [
+            "@rishatik92",
+            "@devbis"
+        ]
+    },
+    "yandextts": {
+        "domain": "yandextts",
+        "name": "Yandex TTS",
+        "documentation": "https://www.home-assistant.io/integrations/yandextts",
+        "codeowners": []
+    },
+    "yeelight": {
+        "domain": "yeelight",
+        "name": "Yeelight",
+        "documentation": "https://www.home-assistant.io/integrations/yeelight",
+        "requirements": [
+            "yeelight==0.5.4"
+        ],
+        "codeowners": [
+            "@rytilahti",
+            "@zewelor",
+            "@shenxn"
+        ],
+        "config_flow": True
+    },
+    "yeelightsunflower": {
+        "domain": "yeelightsunflower",
+        "name": "Yeelight Sunflower",
+        "documentation": "https://www.home-assistant.io/integrations/yeelightsunflower",
+        "requirements": [
+            "yeelightsunflower==0.0.10"
+        ],
+        "codeowners": [
+            "@lindsaymarkward"
+        ]
+    },
+    "yi": {
+        "domain": "yi",
+        "name": "Yi Home Cameras",
+        "documentation": "https://www.home-assistant.io/integrations/yi",
+        "requirements": [
+            "aioftp==0.12.0"
+        ],
+        "dependencies": [
+            "ffmpeg"
+        ],
+        "codeowners": [
+            "@bachya"
+        ]
+    },
+    "zabbix": {
+        "domain": "zabbix",
+        "name": "Zabbix",
+        "documentation": "https://www.home-assistant.io/integrations/zabbix",
+        "requirements": [
+            "py-zabbix==1.1.7"
+        ],
+        "codeowners": []
+    },
+    "zamg": {
+        "domain": "zamg",
+        "name": "Zentralanstalt f\u00fcr Meteorologie und Geodynamik (ZAMG)",
+        "documentation": "https://www.home-assistant.io/integrations/zamg",
+        "codeowners": []
+    },
+    "zengge": {
+        "domain": "zengge",
+        "name": "Zengge",
+        "documentation": "https://www.home-assistant.io/integrations/zengge",
+        "requirements": [
+            "zengge==0.2"
+        ],
+        "codeowners": []
+    },
+    "zeroconf": {
+        "domain": "zeroconf",
+        "name": "Zero-configuration networking (zeroconf)",
+        "documentation": "https://www.home-assistant.io/integrations/zeroconf",
+        "requirements": [
+            "zeroconf==0.28.8"
+        ],
+        "dependencies": [
+            "api"
+        ],
+        "codeowners": [
+            "@bdraco"
+        ],
+        "quality_scale": "internal"
+    },
+    "zerproc": {
+        "domain": "zerproc",
+        "name": "Zerproc",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/zerproc",
+        "requirements": [
+            "pyzerproc==0.4.7"
+        ],
+        "codeowners": [
+            "@emlove"
+        ]
+    },
+    "zestimate": {
+        "domain": "zestimate",
+        "name": "Zestimate",
+        "documentation": "https://www.home-assistant.io/integrations/zestimate",
+        "requirements": [
+            "xmltodict==0.12.0"
+        ],
+        "codeowners": []
+    },
+    "zha": {
+        "domain": "zha",
+        "name": "Zigbee Home Automation",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/zha",
+        "requirements": [
+            "bellows==0.21.0",
+            "pyserial==3.5",
+            "pyserial-asyncio==0.5",
+            "zha-quirks==0.0.52",
+            "zigpy-cc==0.5.2",
+            "zigpy-deconz==0.11.1",
+            "zigpy==0.30.1",
+            "zigpy-xbee==0.13.0",
+            "zigpy-zigate==0.7.3",
+            "zigpy-znp==0.3.0"
+        ],
+        "codeowners": [
+            "@dmulcahey",
+            "@adminiuga"
+        ]
+    },
+    "zhong_hong": {
+        "domain": "zhong_hong",
+        "name": "ZhongHong",
+        "documentation": "https://www.home-assistant.io/integrations/zhong_hong",
+        "requirements": [
+            "zhong_hong_hvac==1.0.9"
+        ],
+        "codeowners": []
+    },
+    "ziggo_mediabox_xl": {
+        "domain": "ziggo_mediabox_xl",
+        "name": "Ziggo Mediabox XL",
+        "documentation": "https://www.home-assistant.io/integrations/ziggo_mediabox_xl",
+        "requirements": [
+            "ziggo-mediabox-xl==1.1.0"
+        ],
+        "codeowners": []
+    },
+    "zodiac": {
+        "domain": "zodiac",
+        "name": "Zodiac",
+        "documentation": "https://www.home-assistant.io/integrations/zodiac",
+        "codeowners": [
+            "@JulienTant"
+        ],
+        "quality_scale": "silver"
+    },
+    "zone": {
+        "domain": "zone",
+        "name": "Zone",
+        "config_flow": False,
+        "documentation": "https://www.home-assistant.io/integrations/zone",
+        "codeowners": [
+            "@home-assistant/core"
+        ],
+        "quality_scale": "internal"
+    },
+    "zoneminder": {
+        "domain": "zoneminder",
+        "name": "ZoneMinder",
+        "documentation": "https://www.home-assistant.io/integrations/zoneminder",
+        "requirements": [
+            "zm-py==0.5.2"
+        ],
+        "codeowners": [
+            "@rohankapoorcom"
+        ]
+    },
+    "zwave": {
+        "domain": "zwave",
+        "name": "Z-Wave",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/zwave",
+        "requirements": [
+            "homeassistant-pyozw==0.1.10",
+            "pydispatcher==2.0.5"
+        ],
+        "after_dependencies": [
+            "ozw"
+        ],
+        "codeowners": [
+            "@home-assistant/z-wave"
+        ]
+    },
+    "zwave_js": {
+        "domain": "zwave_js",
+        "name": "Z-Wave JS",
+        "config_flow": True,
+        "documentation": "https://www.home-assistant.io/integrations/zwave_js",
+        "requirements": [
+            "zwave-js-server-python==0.12.0"
+        ],
+        "codeowners": [
+            "@home-assistant/z-wave"
+        ]
+    }
+}
+
+ALL_DEPENDENCIES = {
+    "alexa": [
+        "http"
+    ],
+    "almond": [
+        "conversation",
+        "http"
+    ],
+    "ambiclimate": [
+        "http"
+    ],
+    "amcrest": [
+        "ffmpeg"
+    ],
+    "api": [
+        "http"
+    ],
+    "arlo": [
+        "ffmpeg"
+    ],
+    "arwn": [
+        "http",
+        "mqtt"
+    ],
+    "asterisk_cdr": [
+        "asterisk_mbox"
+    ],
+    "august": [
+        "configurator"
+    ],
+    "auth": [
+        "http"
+    ],
+    "automation": [
+        "blueprint"
+    ],
+    "calendar": [
+        "http"
+    ],
+    "camera": [
+        "http"
+    ],
+    "canary": [
+        "ffmpeg"
+    ],
+    "cloud": [
+        "alexa",
+        "http",
+        "webhook"
+    ],
+    "config": [
+        "http"
+    ],
+    "conversation": [
+        "http"
+    ],
+    "default_config": [
+        "alexa",
+        "api",
+        "auth",
+        "automation",
+        "blueprint",
+        "cloud",
+        "config",
+        "counter",
+        "device_automation",
+        "dhcp",
+        "frontend",
+        "history",
+        "http",
+        "image",
+        "input_boolean",
+        "input_datetime",
+        "input_number",
+        "input_select",
+        "input_text",
+        "logbook",
+        "lovelace",
+        "map",
+        "media_source",
+        "mobile_app",
+        "onboarding",
+        "person",
+        "recorder",
+        "scene",
+        "script",
+        "search",
+        "ssdp",
+        "sun",
+        "system_health",
+        "system_log",
+        "tag",
+        "timer",
+        "updater",
+        "webhook",
+        "websocket_api",
+        "zeroconf",
+        "zone"
+    ],
+    "demo": [
+        "conversation",
+        "group",
+        "http",
+        "zone"
+    ],
+    "device_tracker": [
+        "zone"
+    ],
+    "dialogflow": [
+        "http",
+        "webhook"
+    ],
+    "dominos": [
+        "http"
+    ],
+    "doorbird": [
+        "http"
+    ],
+    "dsmr_reader": [
+        "http",
+        "mqtt"
+    ],
+    "ffmpeg_motion": [
+        "ffmpeg"
+    ],
+    "ffmpeg_noise": [
+        "ffmpeg"
+    ],
+    "filter": [
+        "history",
+        "http",
+        "recorder"
+    ],
+    "fitbit": [
+        "configurator",
+        "http"
+    ],
+    "flexit": [
+        "modbus"
+    ],
+    "foursquare": [
+        "http"
+    ],
+    "frontend": [
+        "api",
+        "auth",
+        "config",
+        "device_automation",
+        "http",
+        "image",
+        "lovelace",
+        "onboarding",
+        "person",
+        "search",
+        "system_log",
+        "websocket_api"
+    ],
+    "generic_thermostat": [
+        "sensor",
+        "switch"
+    ],
+    "geofency": [
+        "http",
+        "webhook"
+    ],
+    "google_assistant": [
+        "http"
+    ],
+    "gpmdp": [
+        "configurator"
+    ],
+    "gpslogger": [
+        "http",
+        "webhook"
+    ],
+    "harmony": [
+        "remote",
+        "switch"
+    ],
+    "hassio": [
+        "http"
+    ],
+    "history": [
+        "http",
+        "recorder"
+    ],
+    "history_stats": [
+        "history",
+        "http",
+        "recorder"
+    ],
+    "home_connect": [
+        "http"
+    ],
+    "homekit": [
+        "camera",
+        "ffmpeg",
+        "http"
+    ],
+    "html5": [
+        "http"
+    ],
+    "ifttt": [
+        "http",
+        "webhook"
+    ],
+    "image": [
+        "http"
+    ],
+    "image_processing": [
+        "camera",
+        "http"
+    ],
+    "intent": [
+        "http"
+    ],
+    "ios": [
+        "api",
+        "device_tracker",
+        "http",
+        "zeroconf",
+        "zone"
+    ],
+    "konnected": [
+        "http"
+    ],
+    "locative": [
+        "http",
+        "webhook"
+    ],
+    "logbook": [
+        "api",
+        "auth",
+        "config",
+        "device_automation",
+        "frontend",
+        "http",
+        "image",
+        "lovelace",
+        "onboarding",
+        "person",
+        "recorder",
+        "search",
+        "system_log",
+        "websocket_api"
+    ],
+    "logi_circle": [
+        "ffmpeg",
+        "http"
+    ],
+    "mailbox": [
+        "http"
+    ],
+    "mailgun": [
+        "http",
+        "webhook"
+    ],
+    "manual_mqtt": [
+        "http",
+        "mqtt"
+    ],
+    "map": [
+        "api",
+        "auth",
+        "config",
+        "device_automation",
+        "frontend",
+        "http",
+        "image",
+        "lovelace",
+        "onboarding",
+        "person",
+        "search",
+        "system_log",
+        "websocket_api"
+    ],
+    "media_extractor": [
+        "http",
+        "media_player"
+    ],
+    "media_player": [
+        "http"
+    ],
+    "media_source": [
+        "http"
+    ],
+    "meraki": [
+        "http"
+    ],
+    "microsoft_face": [
+        "camera",
+        "http"
+    ],
+    "microsoft_face_detect": [
+        "camera",
+        "http",
+        "microsoft_face"
+    ],
+    "microsoft_face_identify": [
+        "camera",
+        "http",
+        "microsoft_face"
+    ],
+    "mobile_app": [
+        "http",
+        "image",
+        "person",
+        "tag",
+        "webhook"
+    ],
+    "mqtt": [
+        "http"
+    ],
+    "mqtt_eventstream": [
+        "http",
+        "mqtt"
+    ],
+    "mqtt_json": [
+        "http",
+        "mqtt"
+    ],
+    "mqtt_room": [
+        "http",
+        "mqtt"
+    ],
+    "mqtt_statestream": [
+        "http",
+        "mqtt"
+    ],
+    "mystrom": [
+        "http"
+    ],
+    "neato": [
+        "http"
+    ],
+    "nest": [
+        "ffmpeg",
+        "http"
+    ],
+    "netatmo": [
+        "http",
+        "webhook"
+    ],
+    "netio": [
+        "http"
+    ],
+    "onboarding": [
+        "auth",
+        "http",
+        "image",
+        "person"
+    ],
+    "ondilo_ico": [
+        "http"
+    ],
+    "onvif": [
+        "ffmpeg"
+    ],
+    "owntracks": [
+        "http",
+        "webhook"
+    ],
+    "panel_custom": [
+        "api",
+        "auth",
+        "config",
+        "device_automation",
+        "frontend",
+        "http",
+        "image",
+        "lovelace",
+        "onboarding",
+        "person",
+        "search",
+        "system_log",
+        "websocket_api"
+    ],
+    "panel_iframe": [
+        "api",
+        "auth",
+        "config",
+        "device_automation",
+        "frontend",
+        "http",
+        "image",
+        "lovelace",
+        "onboarding",
+        "person",
+        "search",
+        "system_log",
+        "websocket_api"
+    ],
+    "person": [
+        "http",
+        "image"
+    ],
+    "plaato": [
+        "http",
+        "webhook"
+    ],
+    "plex": [
+        "http"
+    ],
+    "point": [
+        "http",
+        "webhook"
+    ],
+    "prometheus": [
+        "http"
+    ],
+    "proximity": [
+        "device_tracker",
+        "zone"
+    ],
+    "push": [
+        "http",
+        "webhook"
+    ],
+    "rachio": [
+        "http"
+    ],
+    "remember_the_milk": [
+        "configurator"
+    ],
+    "ring": [
+        "ffmpeg"
+    ],
+    "rss_feed_template": [
+        "http"
+    ],
+    "sabnzbd": [
+        "configurator"
+    ],
+    "safe_mode": [
+        "alexa",
+        "api",
+        "auth",
+        "cloud",
+        "config",
+        "device_automation",
+        "frontend",
+        "http",
+        "image",
+        "lovelace",
+        "onboarding",
+        "persistent_notification",
+        "person",
+        "search",
+        "system_log",
+        "webhook",
+        "websocket_api"
+    ],
+    "search": [
+        "http",
+        "websocket_api"
+    ],
+    "shopping_list": [
+        "http"
+    ],
+    "smappee": [
+        "http"
+    ],
+    "smartthings": [
+        "http",
+        "webhook"
+    ],
+    "snips": [
+        "http",
+        "mqtt"
+    ],
+    "somfy": [
+        "http"
+    ],
+    "spaceapi": [
+        "http"
+    ],
+    "spotify": [
+        "http"
+    ],
+    "stiebel_eltron": [
+        "modbus"
+    ],
+    "stream": [
+        "http"
+    ],
+    "stt": [
+        "http"
+    ],
+    "system_health": [
+        "http"
+    ],
+    "system_log": [
+        "http"
+    ],
+    "tasmota": [
+        "http",
+        "mqtt"
+    ],
+    "telegram": [
+        "http",
+        "telegram_bot"
+    ],
+    "telegram_bot": [
+        "http"
+    ],
+    "tof": [
+        "rpi_gpio"
+    ],
+    "toon": [
+        "http"
+    ],
+    "torque": [
+        "http"
+    ],
+    "traccar": [
+        "http",
+        "webhook"
+    ],
+    "tts": [
+        "http"
+    ],
+    "twilio": [
+        "http",
+        "webhook"
+    ],
+    "twilio_call": [
+        "http",
+        "twilio",
+        "webhook"
+    ],
+    "twilio_sms": [
+        "http",
+        "twilio",
+        "webhook"
+    ],
+    "webhook": [
+        "http"
+    ],
+    "webostv": [
+        "configurator"
+    ],
+    "websocket_api": [
+        "http"
+    ],
+    "wink": [
+        "configurator",
+        "http"
+    ],
+    "withings": [
+        "http",
+        "webhook"
+    ],
+    "xbox": [
+        "http"
+    ],
+    "xiaomi": [
+        "ffmpeg"
+    ],
+    "yi": [
+        "ffmpeg"
+    ],
+    "zeroconf": [
+        "api",
+        "http"
+    ]
+}
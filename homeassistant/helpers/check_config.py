@@ -2,7 +2,7 @@
 from collections import OrderedDict
 import logging
 import os
-from typing import List, NamedTuple, Optional
+from typing import Any, Callable, List, NamedTuple, Optional
 
 import voluptuous as vol
 
@@ -13,6 +13,7 @@ from homeassistant.config import (
     CORE_CONFIG_SCHEMA,
     YAML_CONFIG_FILE,
     _format_config_error,
+    async_validate_config_schema,
     config_per_platform,
     extract_domain_configs,
     load_yaml_config_file,
@@ -20,6 +21,7 @@ from homeassistant.config import (
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.config_cache import ConfigCache, async_get_config_cache
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.requirements import (
     RequirementsNotFound,
@@ -60,12 +62,32 @@ class HomeAssistantConfig(OrderedDict):
         return "\n".join([err.message for err in self.errors])
 
 
-async def async_check_ha_config_file(hass: HomeAssistant) -> HomeAssistantConfig:
+async def _async_validate(
+    cache: Optional[ConfigCache],
+    integrations: List[loader.Integration],
+    name: str,
+    validator: Callable[[Any], Any],
+    config: Any,
+) -> Any:
+    """Validate a configuration, through the configuration cache if given."""
+    if cache is None:
+        return validator(config)
+    return await cache.async_validate(integrations, name, validator, config)
+
+
+async def async_check_ha_config_file(
+    hass: HomeAssistant, use_cache: bool = True
+) -> HomeAssistantConfig:
     """Load and check if Home Assistant configuration file is valid.
 
+    Unless use_cache is False, files and validations that didn't change
+    since they were last loaded or checked are taken from the configuration
+    cache.
+
     This method is a coroutine.
     """
     result = HomeAssistantConfig()
+    cache = await async_get_config_cache(hass) if use_cache else None
 
     def _pack_error(
         package: str, component: str, config: ConfigType, message: str
@@ -85,7 +107,9 @@ async def async_check_ha_config_file(hass: HomeAssistant) -> HomeAssistantConfig
     try:
         if not await hass.async_add_executor_job(os.path.isfile, config_path):
             return result.add_error("File configuration.yaml not found.")
-        config = await hass.async_add_executor_job(load_yaml_config_file, config_path)
+        config = await hass.async_add_executor_job(
+            load_yaml_config_file, config_path, None if cache is None else cache.yaml
+        )
     except FileNotFoundError:
         return result.add_error(f"File not found: {config_path}")
     except HomeAssistantError as err:
@@ -164,17 +188,23 @@ async def async_check_ha_config_file(hass: HomeAssistant) -> HomeAssistantConfig
         config_schema = getattr(component, "CONFIG_SCHEMA", None)
         if config_schema is not None:
             try:
-                config = config_schema(config)
+                if cache is None:
+                    config = config_schema(config)
+                else:
+                    config = await async_validate_config_schema(
+                        hass, integration, config_schema, config
+                    )
                 result[domain] = config[domain]
             except vol.Invalid as ex:
                 _comp_error(ex, domain, config)
                 continue
 
-        component_platform_schema = getattr(
-            component,
-            "PLATFORM_SCHEMA_BASE",
-            getattr(component, "PLATFORM_SCHEMA", None),
+        schema_name = (
+            "PLATFORM_SCHEMA_BASE"
+            if hasattr(component, "PLATFORM_SCHEMA_BASE")
+            else "PLATFORM_SCHEMA"
         )
+        component_platform_schema = getattr(component, schema_name, None)
 
         if component_platform_schema is None:
             continue
@@ -183,7 +213,13 @@ async def async_check_ha_config_file(hass: HomeAssistant) -> HomeAssistantConfig
         for p_name, p_config in config_per_platform(config, domain):
             # Validate component specific platform schema
             try:
-                p_validated = component_platform_schema(p_config)
+                p_validated = await _async_validate(
+                    cache,
+                    [integration],
+                    f"{domain}.{schema_name}",
+                    component_platform_schema,
+                    p_config,
+                )
             except vol.Invalid as ex:
                 _comp_error(ex, domain, config)
                 continue
@@ -212,7 +248,13 @@ async def async_check_ha_config_file(hass: HomeAssistant) -> HomeAssistantConfig
             platform_schema = getattr(platform, "PLATFORM_SCHEMA", None)
             if platform_schema is not None:
                 try:
-                    p_validated = platform_schema(p_validated)
+                    p_validated = await _async_validate(
+                        cache,
+                        [integration, p_integration],
+                        f"{p_name}.{domain}.PLATFORM_SCHEMA",
+                        platform_schema,
+                        p_validated,
+                    )
                 except vol.Invalid as ex:
                     _comp_error(ex, f"{domain}.{p_name}", p_validated)
                     continue
@@ -6,7 +6,22 @@ import functools as ft
 import logging
 import re
 import sys
-from typing import Any, Callable, Container, List, Optional, Set, Union, cast
+from timeit import default_timer as timer
+from typing import (
+    Any,
+    Callable,
+    Container,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+import weakref
+
+import attr
 
 from homeassistant.components import zone as zone_cmp
 from homeassistant.components.device_automation import (
@@ -55,6 +70,129 @@ INPUT_ENTITY_ID = re.compile(
 
 ConditionCheckerType = Callable[[HomeAssistant, TemplateVarsType], bool]
 
+DATA_CONDITION_TIMINGS = "condition_timings"
+
+# Relative cost of evaluating a condition. Cheap checks are evaluated first
+# when conditions are combined, templates last.
+COST_CHEAP = 0
+COST_DEVICE = 1
+COST_TEMPLATE = 2
+
+
+@attr.s(slots=True, eq=False)
+class ConditionTimings:
+    """Evaluation statistics of a compiled condition."""
+
+    description: str = attr.ib()
+    count: int = attr.ib(default=0)
+    total_time: float = attr.ib(default=0.0)
+    max_time: float = attr.ib(default=0.0)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a dictionary representation of the timings."""
+        return {
+            "condition": self.description,
+            "count": self.count,
+            "total_time": self.total_time,
+            "max_time": self.max_time,
+            "average_time": self.total_time / self.count if self.count else 0.0,
+        }
+
+
+@callback
+def async_get_condition_timings(hass: HomeAssistant) -> List[Dict[str, Any]]:
+    """Return evaluation timings of all active conditions, slowest first."""
+    timings: "weakref.WeakSet[ConditionTimings]" = hass.data.get(
+        DATA_CONDITION_TIMINGS, ()
+    )
+    return [
+        timing.as_dict()
+        for timing in sorted(
+            timings, key=lambda timing: timing.total_time, reverse=True
+        )
+    ]
+
+
+@callback
+def async_condition_cost(config: Union[ConfigType, Template]) -> int:
+    """Return the relative cost of evaluating a condition."""
+    if isinstance(config, Template):
+        return COST_TEMPLATE
+
+    condition = config[CONF_CONDITION]
+
+    if condition in ("and", "not", "or"):
+        return max(
+            (async_condition_cost(sub_cond) for sub_cond in config["conditions"]),
+            default=COST_CHEAP,
+        )
+
+    if condition == "template" or (
+        condition == "numeric_state" and config.get(CONF_VALUE_TEMPLATE) is not None
+    ):
+        return COST_TEMPLATE
+
+    if condition == "device":
+        return COST_DEVICE
+
+    return COST_CHEAP
+
+
+@callback
+def _async_describe_condition(config: ConfigType) -> str:
+    """Return a short description of a condition for timing reports."""
+    condition = config[CONF_CONDITION]
+
+    if condition == "template":
+        value_template = config[CONF_VALUE_TEMPLATE]
+        return f"template {getattr(value_template, 'template', value_template)}"
+
+    if condition == "device":
+        return f"device {config[CONF_DEVICE_ID]} {config.get('type', '')}".rstrip()
+
+    entity_ids = config.get(CONF_ENTITY_ID)
+    if entity_ids:
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        return f"{condition} {', '.join(entity_ids)}"
+
+    return str(condition)
+
+
+@callback
+def _async_timed_checker(
+    hass: HomeAssistant, config: ConfigType, checker: ConditionCheckerType
+) -> ConditionCheckerType:
+    """Wrap a checker to record how long its evaluations take."""
+    timings = ConditionTimings(_async_describe_condition(config))
+    hass.data.setdefault(DATA_CONDITION_TIMINGS, weakref.WeakSet()).add(timings)
+
+    def timed_checker(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
+        """Evaluate the condition and record its duration."""
+        start = timer()
+        try:
+            return checker(hass, variables)
+        finally:
+            duration = timer() - start
+            timings.count += 1
+            timings.total_time += duration
+            if duration > timings.max_time:
+                timings.max_time = duration
+
+    # Keep the timings alive as long as the checker is referenced
+    timed_checker.timings = timings  # type: ignore
+    return timed_checker
+
+
+async def _async_ordered_checks(
+    hass: HomeAssistant, configs: List[Union[ConfigType, Template]]
+) -> List[ConditionCheckerType]:
+    """Build checkers for conditions, cheapest to evaluate first."""
+    return [
+        await async_from_config(hass, entry, False)
+        for entry in sorted(configs, key=async_condition_cost)
+    ]
+
 
 async def async_from_config(
     hass: HomeAssistant,
@@ -88,10 +226,13 @@ async def async_from_config(
         check_factory = check_factory.func
 
     if asyncio.iscoroutinefunction(check_factory):
-        return cast(
+        checker = cast(
             ConditionCheckerType, await factory(hass, config, config_validation)
         )
-    return cast(ConditionCheckerType, factory(config, config_validation))
+    else:
+        checker = cast(ConditionCheckerType, factory(config, config_validation))
+
+    return _async_timed_checker(hass, config, checker)
 
 
 async def async_and_from_config(
@@ -100,9 +241,7 @@ async def async_and_from_config(
     """Create multi condition matcher using 'AND'."""
     if config_validation:
         config = cv.AND_CONDITION_SCHEMA(config)
-    checks = [
-        await async_from_config(hass, entry, False) for entry in config["conditions"]
-    ]
+    checks = await _async_ordered_checks(hass, config["conditions"])
 
     def if_and_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
@@ -127,9 +266,7 @@ async def async_or_from_config(
     """Create multi condition matcher using 'OR'."""
     if config_validation:
         config = cv.OR_CONDITION_SCHEMA(config)
-    checks = [
-        await async_from_config(hass, entry, False) for entry in config["conditions"]
-    ]
+    checks = await _async_ordered_checks(hass, config["conditions"])
 
     def if_or_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
@@ -153,9 +290,7 @@ async def async_not_from_config(
     """Create multi condition matcher using 'NOT'."""
     if config_validation:
         config = cv.NOT_CONDITION_SCHEMA(config)
-    checks = [
-        await async_from_config(hass, entry, False) for entry in config["conditions"]
-    ]
+    checks = await _async_ordered_checks(hass, config["conditions"])
 
     def if_not_condition(
         hass: HomeAssistant, variables: TemplateVarsType = None
@@ -204,6 +339,53 @@ def async_numeric_state(
     attribute: Optional[str] = None,
 ) -> bool:
     """Test a numeric state condition."""
+    return _async_numeric_state(
+        hass, entity, below, above, value_template, variables, attribute, None
+    )
+
+
+def _async_numeric_threshold(
+    hass: HomeAssistant,
+    entity_id: str,
+    thresholds: Optional[Dict[str, Tuple[State, float]]],
+) -> Optional[float]:
+    """Return the value of a threshold entity.
+
+    Parsed values are cached per state object, so a threshold is only parsed
+    again after its entity changed state.
+    """
+    threshold_entity = hass.states.get(entity_id)
+
+    if threshold_entity is None:
+        return None
+
+    if thresholds is not None:
+        cached = thresholds.get(entity_id)
+        if cached is not None and cached[0] is threshold_entity:
+            return cached[1]
+
+    if threshold_entity.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        return None
+
+    value = float(threshold_entity.state)
+
+    if thresholds is not None:
+        thresholds[entity_id] = (threshold_entity, value)
+
+    return value
+
+
+def _async_numeric_state(
+    hass: HomeAssistant,
+    entity: Union[None, str, State],
+    below: Optional[Union[float, str]],
+    above: Optional[Union[float, str]],
+    value_template: Optional[Template],
+    variables: TemplateVarsType,
+    attribute: Optional[str],
+    thresholds: Optional[Dict[str, Tuple[State, float]]],
+) -> bool:
+    """Test a numeric state condition, caching parsed thresholds."""
     if isinstance(entity, str):
         entity = hass.states.get(entity)
 
@@ -240,24 +422,16 @@ def async_numeric_state(
 
     if below is not None:
         if isinstance(below, str):
-            below_entity = hass.states.get(below)
-            if (
-                not below_entity
-                or below_entity.state in (STATE_UNAVAILABLE, STATE_UNKNOWN)
-                or fvalue >= float(below_entity.state)
-            ):
+            below_value = _async_numeric_threshold(hass, below, thresholds)
+            if below_value is None or fvalue >= below_value:
                 return False
         elif fvalue >= below:
             return False
 
     if above is not None:
         if isinstance(above, str):
-            above_entity = hass.states.get(above)
-            if (
-                not above_entity
-                or above_entity.state in (STATE_UNAVAILABLE, STATE_UNKNOWN)
-                or fvalue <= float(above_entity.state)
-            ):
+            above_value = _async_numeric_threshold(hass, above, thresholds)
+            if above_value is None or fvalue <= above_value:
                 return False
         elif fvalue <= above:
             return False
@@ -276,6 +450,7 @@ def async_numeric_state_from_config(
     below = config.get(CONF_BELOW)
     above = config.get(CONF_ABOVE)
     value_template = config.get(CONF_VALUE_TEMPLATE)
+    thresholds: Dict[str, Tuple[State, float]] = {}
 
     def if_numeric_state(
         hass: HomeAssistant, variables: TemplateVarsType = None
@@ -285,8 +460,15 @@ def async_numeric_state_from_config(
             value_template.hass = hass
 
         return all(
-            async_numeric_state(
-                hass, entity_id, below, above, value_template, variables, attribute
+            _async_numeric_state(
+                hass,
+                entity_id,
+                below,
+                above,
+                value_template,
+                variables,
+                attribute,
+                thresholds,
             )
             for entity_id in entity_ids
         )
@@ -305,6 +487,38 @@ def state(
 
     Async friendly.
     """
+    if not isinstance(req_state, list):
+        req_state = [req_state]
+
+    return _state(hass, entity, *_split_req_states(req_state), for_period, attribute)
+
+
+def _split_req_states(req_states: List[Any]) -> Tuple[List[Any], List[str]]:
+    """Split required states into literal values and input entity IDs."""
+    values = []
+    input_entity_ids = []
+
+    for req_state_value in req_states:
+        if (
+            isinstance(req_state_value, str)
+            and INPUT_ENTITY_ID.match(req_state_value) is not None
+        ):
+            input_entity_ids.append(req_state_value)
+        else:
+            values.append(req_state_value)
+
+    return values, input_entity_ids
+
+
+def _state(
+    hass: HomeAssistant,
+    entity: Union[None, str, State],
+    req_values: List[Any],
+    req_input_entity_ids: List[str],
+    for_period: Optional[timedelta],
+    attribute: Optional[str],
+) -> bool:
+    """Test if state matches pre-split requirements."""
     if isinstance(entity, str):
         entity = hass.states.get(entity)
 
@@ -318,23 +532,14 @@ def state(
     else:
         value = entity.attributes.get(attribute)
 
-    if not isinstance(req_state, list):
-        req_state = [req_state]
+    is_state = value in req_values
 
-    is_state = False
-    for req_state_value in req_state:
-        state_value = req_state_value
-        if (
-            isinstance(req_state_value, str)
-            and INPUT_ENTITY_ID.match(req_state_value) is not None
-        ):
-            state_entity = hass.states.get(req_state_value)
-            if not state_entity:
-                continue
-            state_value = state_entity.state
-        is_state = value == state_value
-        if is_state:
-            break
+    if not is_state:
+        for req_entity_id in req_input_entity_ids:
+            state_entity = hass.states.get(req_entity_id)
+            if state_entity and value == state_entity.state:
+                is_state = True
+                break
 
     if for_period is None or not is_state:
         return is_state
@@ -356,10 +561,19 @@ def state_from_config(
     if not isinstance(req_states, list):
         req_states = [req_states]
 
+    req_values, req_input_entity_ids = _split_req_states(req_states)
+
     def if_state(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Test if condition."""
         return all(
-            state(hass, entity_id, req_states, for_period, attribute)
+            _state(
+                hass,
+                entity_id,
+                req_values,
+                req_input_entity_ids,
+                for_period,
+                attribute,
+            )
             for entity_id in entity_ids
         )
 
@@ -0,0 +1,216 @@
+"""Cache of the loaded and validated YAML configuration.
+
+The cache is kept in the .storage folder, so it is used at startup and by a
+configuration check, not only by reloads. It holds the configuration with
+the secrets filled in, like the config entries stored next to it.
+"""
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Set,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+from homeassistant.const import __version__
+from homeassistant.core import CoreState, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.loader import Integration, bind_hass
+from homeassistant.util.yaml import YamlCache, serialize
+
+from .singleton import singleton
+from .storage import Store
+from .template import Template
+from .typing import HomeAssistantType
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_CONFIG_CACHE = "config_cache"
+
+STORAGE_KEY = "core.config_cache"
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 30
+
+T = TypeVar("T")  # pylint: disable=invalid-name
+
+
+def _encode(obj: Any) -> Tuple[str, Any]:
+    """Return the tag and value to store a validated object."""
+    # Templates made by the config validation are not bound to hass yet.
+    if isinstance(obj, Template) and obj.hass is None:
+        return "template", obj.template
+    raise TypeError(f"Object of type {type(obj).__name__} can't be stored")
+
+
+def _decode(tag: str, value: Any) -> Any:
+    """Restore a validated object stored by _encode."""
+    if tag == "template":
+        return Template(value)  # type: ignore[no-untyped-call]
+    raise TypeError(f"Unknown tag {tag}")
+
+
+def _integration_version(integration: Integration) -> List[Any]:
+    """Return what the schemas of an integration change with.
+
+    Custom integrations are often changed without a new version, so the
+    modification time of their code is included.
+    """
+    if integration.is_built_in:
+        return [__version__]
+
+    mtime = 0
+    with contextlib.suppress(OSError):
+        for entry in os.scandir(integration.file_path):
+            if entry.name.endswith(".py"):
+                mtime = max(mtime, entry.stat().st_mtime_ns)
+    return [cast(Dict[str, Any], integration.manifest).get("version"), mtime]
+
+
+class _WarningCollector(logging.Handler):
+    """Collect the warnings logged by the current thread."""
+
+    def __init__(self) -> None:
+        """Initialize the collector."""
+        super().__init__(logging.WARNING)
+        self.thread = threading.get_ident()
+        self.records: List[List[Any]] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Collect a record."""
+        if record.thread == self.thread:
+            self.records.append([record.name, record.levelno, record.getMessage()])
+
+
+@contextlib.contextmanager
+def _collect_warnings() -> Iterator[List[List[Any]]]:
+    """Collect the warnings logged by the current thread in the block."""
+    collector = _WarningCollector()
+    logging.root.addHandler(collector)
+    try:
+        yield collector.records
+    finally:
+        logging.root.removeHandler(collector)
+
+
+class ConfigCache:
+    """Cache of loaded YAML files and of validated configuration.
+
+    A YAML file is only parsed again if its content, or the content of a file
+    it includes or takes secrets from, changed. A schema only validates a
+    configuration again if the configuration or the integration changed.
+    Warnings logged while validating, like for deprecated options, are
+    logged again when the result is reused.
+
+    Once Home Assistant is running, only the validations used since the
+    start are saved.
+    """
+
+    def __init__(
+        self, hass: HomeAssistantType, store: Store, data: Dict[str, Any]
+    ) -> None:
+        """Initialize the cache from the stored data."""
+        self.hass = hass
+        self.yaml = YamlCache(data.get("yaml"))
+        self._store = store
+        self._validated: Dict[str, Dict[str, Any]] = data.get("validated", {})
+        self._used: Set[str] = set()
+        self._versions: Dict[str, List[Any]] = {}
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule saving the cache."""
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return the data to store, dropping the unused validations."""
+        self.yaml.changed = False
+        if self.hass.state == CoreState.running:
+            self._validated = {
+                key: entry
+                for key, entry in self._validated.items()
+                if key in self._used
+            }
+        return {"yaml": self.yaml.as_dict(), "validated": self._validated}
+
+    async def _async_integration_version(self, integration: Integration) -> List[Any]:
+        """Return what the schemas of an integration change with."""
+        version = self._versions.get(integration.domain)
+        if version is None:
+            version = self._versions[
+                integration.domain
+            ] = await self.hass.async_add_executor_job(
+                _integration_version, integration
+            )
+        return version
+
+    async def async_validate(
+        self,
+        integrations: Iterable[Integration],
+        name: str,
+        validator: Callable[[Any], T],
+        config: Any,
+    ) -> T:
+        """Validate a configuration, reusing the result of an earlier validation.
+
+        The validator is identified by its name and the integrations it comes
+        from. Failed validations and results that can't be stored are not
+        cached.
+        """
+        versions = [
+            [integration.domain, await self._async_integration_version(integration)]
+            for integration in integrations
+        ]
+        try:
+            key = hashlib.sha1(
+                json.dumps([versions, name, serialize.dumps(config, _encode)]).encode()
+            ).hexdigest()
+        except TypeError:
+            return validator(config)
+
+        entry = self._validated.get(key)
+
+        if entry is not None:
+            self._used.add(key)
+            for logger, level, message in entry["warnings"]:
+                logging.getLogger(logger).log(level, "%s", message)
+            return serialize.loads(entry["config"], _decode)  # type: ignore
+
+        with _collect_warnings() as warnings:
+            validated = validator(config)
+
+        try:
+            self._validated[key] = {
+                "config": serialize.dumps(validated, _encode),
+                "warnings": warnings,
+            }
+        except TypeError:
+            return validated
+
+        self._used.add(key)
+        self.async_schedule_save()
+        return validated
+
+
+@singleton(DATA_CONFIG_CACHE)
+@bind_hass
+async def async_get_config_cache(hass: HomeAssistantType) -> ConfigCache:
+    """Return the configuration cache, loading it from storage."""
+    store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+    try:
+        data = await store.async_load()
+    except HomeAssistantError as err:
+        _LOGGER.warning("Unable to load the configuration cache: %s", err)
+        data = None
+    return ConfigCache(hass, store, data or {})  # type: ignore
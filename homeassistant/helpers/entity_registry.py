@@ -124,7 +124,9 @@ class EntityRegistry:
         self.hass = hass
         self.entities: Dict[str, RegistryEntry]
         self._index: Dict[Tuple[str, str, str], str] = {}
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self._store = hass.helpers.storage.Store(
+            STORAGE_VERSION, STORAGE_KEY, journal=True
+        )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
         )
@@ -617,7 +619,10 @@ def async_setup_entity_restore(
     def _write_unavailable_states(_: Event) -> None:
         """Make sure state machine contains entry for each registered entity."""
         states = hass.states
-        existing = set(states.async_entity_ids())
+        # States restored from before a restart are replaced by the placeholder
+        existing = set(states.async_entity_ids()) - set(
+            states.async_restored_entity_ids()
+        )
 
         for entry in registry.entities.values():
             if entry.entity_id in existing or entry.disabled:
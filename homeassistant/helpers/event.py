@@ -4,6 +4,8 @@ import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import functools as ft
+import heapq
+import itertools
 import logging
 import time
 from typing import (
@@ -62,6 +64,8 @@ TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
 TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
 TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
 
+TRACK_TIME_PATTERN_SCHEDULER = "track_time_pattern_scheduler"
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -1316,6 +1320,148 @@ track_sunset = threaded_listener_factory(async_track_sunset)
 time_tracker_utcnow = dt_util.utcnow
 
 
+class _TimePatternGroup:
+    """Listeners that share the same time pattern."""
+
+    __slots__ = ("seconds", "minutes", "hours", "local", "jobs", "next_fire")
+
+    def __init__(
+        self, seconds: List[int], minutes: List[int], hours: List[int], local: bool
+    ) -> None:
+        """Initialize the group."""
+        self.seconds = seconds
+        self.minutes = minutes
+        self.hours = hours
+        self.local = local
+        self.jobs: List[HassJob] = []
+        self.next_fire: Optional[datetime] = None
+
+    def calculate_next(self, now: datetime) -> datetime:
+        """Calculate the next time the pattern matches."""
+        localized_now = dt_util.as_local(now) if self.local else now
+        return dt_util.find_next_time_expression_time(
+            localized_now, self.seconds, self.minutes, self.hours
+        )
+
+
+class _TimePatternScheduler:
+    """Drive all time pattern listeners from a single timer.
+
+    Listeners with identical patterns are merged into one group. Groups are
+    kept in a heap ordered by their next fire time, so each wakeup only
+    touches the groups that are due.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._groups: Dict[Tuple[Any, ...], _TimePatternGroup] = {}
+        self._schedule: List[Tuple[datetime, int, _TimePatternGroup]] = []
+        self._sequence = itertools.count()
+        self._job = HassJob(self._async_fire)
+        self._unsub_timer: Optional[CALLBACK_TYPE] = None
+        self._timer_fire: Optional[datetime] = None
+
+    @callback
+    def async_add(
+        self,
+        job: HassJob,
+        seconds: List[int],
+        minutes: List[int],
+        hours: List[int],
+        local: bool,
+    ) -> CALLBACK_TYPE:
+        """Add a listener for a time pattern."""
+        key = (tuple(seconds), tuple(minutes), tuple(hours), local)
+        group = self._groups.get(key)
+
+        if group is None:
+            group = self._groups[key] = _TimePatternGroup(
+                seconds, minutes, hours, local
+            )
+            self._async_schedule_group(group, group.calculate_next(dt_util.utcnow()))
+            self._async_update_timer()
+
+        group.jobs.append(job)
+
+        @callback
+        def unsub_pattern_time_change_listener() -> None:
+            """Remove the listener from its group."""
+            group.jobs.remove(job)
+            if group.jobs:
+                return
+            # The group stays in the heap and is skipped when it comes due.
+            del self._groups[key]
+            group.next_fire = None
+            if not self._groups:
+                self._schedule.clear()
+            elif len(self._schedule) > 2 * len(self._groups):
+                self._schedule = [
+                    entry for entry in self._schedule if entry[2].next_fire is entry[0]
+                ]
+                heapq.heapify(self._schedule)
+            self._async_update_timer()
+
+        return unsub_pattern_time_change_listener
+
+    @callback
+    def _async_schedule_group(self, group: _TimePatternGroup, when: datetime) -> None:
+        """Put a group in the schedule."""
+        group.next_fire = when
+        heapq.heappush(self._schedule, (when, next(self._sequence), group))
+
+    @callback
+    def _async_update_timer(self) -> None:
+        """Arm the timer for the earliest scheduled group."""
+        schedule = self._schedule
+        while schedule and schedule[0][2].next_fire is not schedule[0][0]:
+            heapq.heappop(schedule)
+
+        when = schedule[0][0] if schedule else None
+
+        if when == self._timer_fire:
+            return
+
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+        self._timer_fire = when
+
+        if when is not None:
+            self._unsub_timer = async_track_point_in_utc_time(
+                self.hass, self._job, when
+            )
+
+    @callback
+    def _async_fire(self, _: datetime) -> None:
+        """Run all listeners that are due and reschedule them."""
+        self._unsub_timer = None
+        self._timer_fire = None
+
+        now = time_tracker_utcnow()
+        after = now + timedelta(seconds=1)
+        schedule = self._schedule
+        due = []
+
+        while schedule and schedule[0][0] <= now:
+            when, _, group = heapq.heappop(schedule)
+            if group.next_fire is when:
+                due.append(group)
+
+        for group in due:
+            self._async_schedule_group(group, group.calculate_next(after))
+
+        local_now = dt_util.as_local(now)
+        for group in due:
+            for job in list(group.jobs):
+                # An earlier listener may have removed this one
+                if job in group.jobs:
+                    self.hass.async_run_hass_job(job, local_now if group.local else now)
+
+        self._async_update_timer()
+
+
 @callback
 @bind_hass
 def async_track_utc_time_change(
@@ -1344,41 +1490,16 @@ def async_track_utc_time_change(
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
 
-    def calculate_next(now: datetime) -> datetime:
-        """Calculate and set the next time the trigger should fire."""
-        localized_now = dt_util.as_local(now) if local else now
-        return dt_util.find_next_time_expression_time(
-            localized_now, matching_seconds, matching_minutes, matching_hours
+    scheduler = hass.data.get(TRACK_TIME_PATTERN_SCHEDULER)
+    if scheduler is None:
+        scheduler = hass.data[TRACK_TIME_PATTERN_SCHEDULER] = _TimePatternScheduler(
+            hass
         )
 
-    time_listener: Optional[CALLBACK_TYPE] = None
-
-    @callback
-    def pattern_time_change_listener(_: datetime) -> None:
-        """Listen for matching time_changed events."""
-        nonlocal time_listener
-
-        now = time_tracker_utcnow()
-        hass.async_run_hass_job(job, dt_util.as_local(now) if local else now)
-
-        time_listener = async_track_point_in_utc_time(
-            hass,
-            pattern_time_change_listener,
-            calculate_next(now + timedelta(seconds=1)),
-        )
-
-    time_listener = async_track_point_in_utc_time(
-        hass, pattern_time_change_listener, calculate_next(dt_util.utcnow())
+    return scheduler.async_add(
+        job, matching_seconds, matching_minutes, matching_hours, local
     )
 
-    @callback
-    def unsub_pattern_time_change_listener() -> None:
-        """Cancel the time listener."""
-        assert time_listener is not None
-        time_listener()
-
-    return unsub_pattern_time_change_listener
-
 
 track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
 
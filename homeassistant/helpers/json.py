@@ -1,8 +1,16 @@
 """Helpers to help with encoding Home Assistant objects in JSON."""
 from datetime import datetime
 import json
+import math
 from typing import Any
 
+from homeassistant.core import State
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class JSONEncoder(json.JSONEncoder):
     """JSONEncoder that supports Home Assistant objects."""
@@ -20,3 +28,82 @@ class JSONEncoder(json.JSONEncoder):
             return o.as_dict()
 
         return json.JSONEncoder.default(self, o)
+
+
+def json_encoder_default(obj: Any) -> Any:
+    """Convert Home Assistant objects for the fast JSON encoder.
+
+    Same conversions as JSONEncoder.default.
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, set):
+        return list(obj)
+    if hasattr(obj, "as_dict"):
+        return obj.as_dict()
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _has_non_finite_float(obj: Any) -> bool:
+    """Test if an object contains NaN or infinite floats.
+
+    States cache the result for their attributes, the rest of a state has no
+    floats.
+    """
+    if isinstance(obj, State):
+        return obj.has_non_finite_float()
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite_float(value) for value in obj.values())
+    if isinstance(obj, (list, tuple, set)):
+        return any(_has_non_finite_float(item) for item in obj)
+    if hasattr(obj, "as_dict"):
+        return _has_non_finite_float(obj.as_dict())
+    return False
+
+
+def _stdlib_dumps(obj: Any, allow_nan: bool = False) -> str:
+    """Dump an object to a JSON string with the standard library."""
+    return json.dumps(obj, cls=JSONEncoder, allow_nan=allow_nan)
+
+
+if orjson is not None:
+    # Datetimes go through json_encoder_default to keep isoformat output
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def json_bytes(obj: Any, allow_nan: bool = False) -> bytes:
+        """Dump an object to JSON bytes.
+
+        Like the standard library, NaN and infinite floats raise ValueError
+        unless allow_nan is passed. orjson writes them as null, so those
+        payloads and the objects orjson can't serialize, like named tuples
+        and integers over 64 bits, are handed to the standard library.
+        """
+        if allow_nan:
+            return _stdlib_dumps(obj, allow_nan).encode("utf-8")
+
+        try:
+            result: bytes = orjson.dumps(
+                obj, option=_ORJSON_OPTIONS, default=json_encoder_default
+            )
+        except TypeError:
+            return _stdlib_dumps(obj).encode("utf-8")
+
+        if b"null" in result and _has_non_finite_float(obj):
+            return _stdlib_dumps(obj).encode("utf-8")
+
+        return result
+
+    def json_dumps(obj: Any, allow_nan: bool = False) -> str:
+        """Dump an object to a JSON string."""
+        return json_bytes(obj, allow_nan).decode("utf-8")
+
+
+else:
+    json_dumps = _stdlib_dumps
+
+    def json_bytes(obj: Any, allow_nan: bool = False) -> bytes:
+        """Dump an object to JSON bytes."""
+        return _stdlib_dumps(obj, allow_nan).encode("utf-8")
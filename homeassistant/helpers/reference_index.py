@@ -0,0 +1,78 @@
+"""Reverse index of the entities and devices referenced by entities."""
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from homeassistant.core import callback
+from homeassistant.helpers.typing import HomeAssistantType
+
+ReferencesType = Callable[[], Iterable[Tuple[str, Iterable[str]]]]
+
+
+class ReferenceIndex:
+    """Map IDs to the entities that reference them and the other way around.
+
+    The index is built on first use from the referencing entities and dropped
+    when one of them is added, removed or changes what it references.
+    """
+
+    def __init__(self, async_get_references: ReferencesType) -> None:
+        """Initialize the index.
+
+        async_get_references returns pairs of an entity ID and the IDs
+        that entity references.
+        """
+        self._async_get_references = async_get_references
+        self._referenced: Optional[Dict[str, List[str]]] = None
+        self._referencing: Optional[Dict[str, List[str]]] = None
+
+    @callback
+    def async_invalidate(self) -> None:
+        """Drop the index, it is rebuilt on next use."""
+        self._referenced = None
+        self._referencing = None
+
+    @callback
+    def _async_build(self) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+        """Build the index."""
+        referenced: Dict[str, List[str]] = {}
+        referencing: Dict[str, List[str]] = defaultdict(list)
+
+        for entity_id, references in self._async_get_references():
+            referenced[entity_id] = list(references)
+            for reference in referenced[entity_id]:
+                referencing[reference].append(entity_id)
+
+        self._referenced = referenced
+        self._referencing = dict(referencing)
+        return self._referenced, self._referencing
+
+    @callback
+    def async_referencing(self, reference: str) -> List[str]:
+        """Return the entities that reference an ID."""
+        referencing = self._referencing
+        if referencing is None:
+            _, referencing = self._async_build()
+
+        return list(referencing.get(reference, ()))
+
+    @callback
+    def async_referenced(self, entity_id: str) -> List[str]:
+        """Return the IDs referenced by an entity."""
+        referenced = self._referenced
+        if referenced is None:
+            referenced, _ = self._async_build()
+
+        return list(referenced.get(entity_id, ()))
+
+
+@callback
+def async_get_reference_index(
+    hass: HomeAssistantType, key: str, async_get_references: ReferencesType
+) -> ReferenceIndex:
+    """Return the reference index stored under key, creating it if needed."""
+    index: Optional[ReferenceIndex] = hass.data.get(key)
+
+    if index is None:
+        index = hass.data[key] = ReferenceIndex(async_get_references)
+
+    return index
@@ -1,8 +1,12 @@
 """Support for restoring entity states on startup."""
 import asyncio
 from datetime import datetime, timedelta
+import json
 import logging
-from typing import Any, Dict, List, Optional, Set, cast
+import os
+import struct
+import tempfile
+from typing import Any, Dict, List, Optional, Set, Tuple, cast
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import (
@@ -18,7 +22,7 @@ from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.singleton import singleton
-from homeassistant.helpers.storage import Store
+from homeassistant.helpers.storage import STORAGE_DIR, Store
 import homeassistant.util.dt as dt_util
 
 DATA_RESTORE_STATE_TASK = "restore_state_task"
@@ -27,6 +31,7 @@ _LOGGER = logging.getLogger(__name__)
 
 STORAGE_KEY = "core.restore_state"
 STORAGE_VERSION = 1
+SNAPSHOT_KEY = "core.restore_state.snapshot"
 
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
@@ -58,6 +63,278 @@ class StoredState:
         return cls(State.from_dict(json_dict["state"]), last_seen)
 
 
+class SnapshotStoredState(StoredState):
+    """Stored state from the snapshot, decoded when it is first used."""
+
+    def __init__(self, entity_id: str, payload: bytes, last_seen: datetime) -> None:
+        """Initialize a stored state from its encoded state."""
+        # pylint: disable=super-init-not-called
+        self.entity_id = entity_id
+        self.payload = payload
+        self.last_seen = last_seen
+        self._state: Optional[State] = None
+
+    @property  # type: ignore
+    def state(self) -> State:  # type: ignore
+        """Return the state, decoding it when needed."""
+        if self._state is None:
+            self._state = State.from_dict(json.loads(self.payload))
+        return self._state
+
+
+# A stored state as written to the snapshot: alive, last seen and encoded state
+SnapshotRecord = Tuple[bool, float, bytes]
+
+
+class StateSnapshot:
+    """Binary file with the encoded stored states.
+
+    The file starts with a header holding the time of the last dump, followed
+    by records with an entity ID and its JSON encoded state. Loading reads
+    the whole file and keeps the encoded states, a state is only decoded
+    when it is restored.
+
+    A dump appends records for the states that changed since the previous
+    dump and an empty record for states no longer stored. Entities that were
+    alive at a dump are marked as such instead of writing their last seen
+    time, so the records of unchanged entities don't need to be written
+    again. The file is rewritten when most of it is outdated records.
+    """
+
+    MAGIC = b"HARS"
+    FORMAT_VERSION = 1
+    # Magic, format version, time of the last dump
+    HEADER = struct.Struct("<4sHd")
+    # Entity ID length, payload length, flags, last seen
+    RECORD = struct.Struct("<HIBd")
+    FLAG_ALIVE = 1
+    FLAG_REMOVED = 2
+
+    def __init__(self, path: str) -> None:
+        """Initialize the snapshot."""
+        self.path = path
+        self.dump_time = 0.0
+        self.records: Dict[str, SnapshotRecord] = {}
+        self._file_size = 0
+        # Rewrite the file on the next write, it is missing or damaged
+        self._rewrite = True
+        # Payloads of the states of the last write
+        self._payloads: Dict[str, Tuple[State, bytes]] = {}
+
+    def load(self) -> bool:
+        """Load the records, return False if there is no snapshot."""
+        buffer = self._read()
+        if buffer is None:
+            return False
+
+        view = memoryview(buffer)
+        try:
+            return self._load(view)
+        finally:
+            view.release()
+
+    def _load(self, view: memoryview) -> bool:
+        """Load the records from the content of the snapshot file."""
+        header = self.HEADER
+        record_header = self.RECORD
+
+        if len(view) < header.size:
+            _LOGGER.warning("Ignoring invalid restore state snapshot")
+            return False
+
+        magic, version, self.dump_time = header.unpack_from(view)
+        if magic != self.MAGIC or version != self.FORMAT_VERSION:
+            _LOGGER.warning("Ignoring invalid restore state snapshot")
+            return False
+
+        offset = header.size
+        end = len(view)
+        while offset + record_header.size <= end:
+            id_length, payload_length, flags, last_seen = record_header.unpack_from(
+                view, offset
+            )
+            id_start = offset + record_header.size
+            payload_start = id_start + id_length
+            next_offset = payload_start + payload_length
+            if next_offset > end:
+                break
+            entity_id = bytes(view[id_start:payload_start]).decode()
+
+            if flags & self.FLAG_REMOVED:
+                self.records.pop(entity_id, None)
+            else:
+                self.records[entity_id] = (
+                    bool(flags & self.FLAG_ALIVE),
+                    last_seen,
+                    bytes(view[payload_start:next_offset]),
+                )
+            offset = next_offset
+
+        if offset != end:
+            # Last dump was interrupted, don't append to a partial record
+            _LOGGER.warning("Ignoring incomplete records of restore state snapshot")
+        else:
+            self._rewrite = False
+
+        self._file_size = end
+        return True
+
+    def write(self, stored_states: List[StoredState], now: datetime) -> None:
+        """Write the stored states, the ones seen now are alive.
+
+        Only the states that changed since the previous write are written.
+        """
+        records: Dict[str, SnapshotRecord] = {}
+        payloads: Dict[str, Tuple[State, bytes]] = {}
+
+        for stored_state in stored_states:
+            if isinstance(stored_state, SnapshotStoredState):
+                entity_id = stored_state.entity_id
+            else:
+                entity_id = stored_state.state.entity_id
+            try:
+                payload = self._payload(entity_id, stored_state, payloads)
+            except (TypeError, ValueError) as err:
+                _LOGGER.error("Unable to store state of %s: %s", entity_id, err)
+                continue
+            alive = stored_state.last_seen == now
+            records[entity_id] = (
+                alive,
+                0.0 if alive else stored_state.last_seen.timestamp(),
+                payload,
+            )
+
+        changed = b"".join(
+            self._encode_record(entity_id, record)
+            for entity_id, record in records.items()
+            if not self._same_record(self.records.get(entity_id), record)
+        ) + b"".join(
+            self._encode_record(entity_id, None)
+            for entity_id in self.records
+            if entity_id not in records
+        )
+
+        dump_time = now.timestamp()
+        header = self.HEADER.pack(self.MAGIC, self.FORMAT_VERSION, dump_time)
+        live_size = self.HEADER.size + sum(
+            self.RECORD.size + len(entity_id.encode()) + len(record[2])
+            for entity_id, record in records.items()
+        )
+
+        if self._rewrite or self._file_size + len(changed) > 2 * live_size:
+            content = header + b"".join(
+                self._encode_record(entity_id, record)
+                for entity_id, record in records.items()
+            )
+            self._write_file(content)
+            self._file_size = len(content)
+        else:
+            try:
+                self._append(header, changed)
+            except OSError:
+                # Records may be partially written
+                self._rewrite = True
+                raise
+            self._file_size += len(changed)
+
+        self._rewrite = False
+        self.dump_time = dump_time
+        self.records = records
+        self._payloads = payloads
+
+    def _payload(
+        self,
+        entity_id: str,
+        stored_state: StoredState,
+        payloads: Dict[str, Tuple[State, bytes]],
+    ) -> bytes:
+        """Return the encoded state, only encoding states that changed."""
+        if isinstance(stored_state, SnapshotStoredState):
+            return stored_state.payload
+
+        state = stored_state.state
+        cached = self._payloads.get(entity_id)
+        if cached is not None and cached[0] is state:
+            payloads[entity_id] = cached
+            return cached[1]
+
+        payload = json.dumps(
+            state.as_dict(), cls=JSONEncoder, separators=(",", ":")
+        ).encode()
+        payloads[entity_id] = (state, payload)
+        return payload
+
+    @staticmethod
+    def _same_record(old: Optional[SnapshotRecord], new: SnapshotRecord) -> bool:
+        """Test if a record doesn't need to be written again."""
+        if old is None or old[0] != new[0] or old[1] != new[1]:
+            return False
+        return old[2] is new[2] or old[2] == new[2]
+
+    def _encode_record(self, entity_id: str, record: Optional[SnapshotRecord]) -> bytes:
+        """Encode a record, None for a removed state."""
+        encoded_id = entity_id.encode()
+        if record is None:
+            return (
+                self.RECORD.pack(len(encoded_id), 0, self.FLAG_REMOVED, 0.0)
+                + encoded_id
+            )
+
+        alive, last_seen, payload = record
+        return (
+            self.RECORD.pack(
+                len(encoded_id),
+                len(payload),
+                self.FLAG_ALIVE if alive else 0,
+                last_seen,
+            )
+            + encoded_id
+            + payload
+        )
+
+    def _read(self) -> Optional[bytes]:
+        """Read the snapshot file, None if it doesn't exist."""
+        try:
+            with open(self.path, "rb") as fp:
+                return fp.read()
+        except FileNotFoundError:
+            return None
+
+    def _write_file(self, content: bytes) -> None:
+        """Replace the snapshot file."""
+        directory = os.path.dirname(self.path)
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=directory, delete=False) as fp:
+            tmp_path = fp.name
+            try:
+                fp.write(content)
+            except OSError:
+                os.remove(tmp_path)
+                raise
+        try:
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            os.remove(tmp_path)
+            raise
+
+    def _append(self, header: bytes, records: bytes) -> None:
+        """Append records to the snapshot file and update the header."""
+        with open(self.path, "r+b") as fp:
+            fp.seek(0, os.SEEK_END)
+            fp.write(records)
+            fp.flush()
+            fp.seek(0)
+            fp.write(header)
+
+    def remove(self) -> None:
+        """Remove the snapshot file."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
 class RestoreStateData:
     """Helper class for managing the helper saved data."""
 
@@ -70,6 +347,29 @@ class RestoreStateData:
             """Get the singleton instance of this data helper."""
             data = cls(hass)
 
+            try:
+                has_snapshot = await hass.async_add_executor_job(data.snapshot.load)
+            except OSError as exc:
+                _LOGGER.error("Error loading last states", exc_info=exc)
+                has_snapshot = False
+
+            if has_snapshot:
+                dump_time = dt_util.utc_from_timestamp(data.snapshot.dump_time)
+                for entity_id, record in data.snapshot.records.items():
+                    if not valid_entity_id(entity_id):
+                        continue
+                    alive, last_seen, payload = record
+                    data.last_states[entity_id] = SnapshotStoredState(
+                        entity_id,
+                        payload,
+                        dump_time if alive else dt_util.utc_from_timestamp(last_seen),
+                    )
+                _LOGGER.debug("Created cache with %s", list(data.last_states))
+                return data._async_loaded()
+
+            # Migrate the states stored as JSON by earlier versions. The JSON
+            # store is removed once the snapshot is written, earlier versions
+            # don't restore states after a downgrade.
             try:
                 stored_states = await data.store.async_load()
             except HomeAssistantError as exc:
@@ -85,27 +385,42 @@ class RestoreStateData:
                     for item in stored_states
                     if valid_entity_id(item["state"]["entity_id"])
                 }
-                _LOGGER.debug("Created cache with %s", list(data.last_states))
-
-            if hass.state == CoreState.running:
-                data.async_setup_dump()
-            else:
-                hass.bus.async_listen_once(
-                    EVENT_HOMEASSISTANT_START, data.async_setup_dump
+                data.remove_store = True
+                _LOGGER.info(
+                    "Moving the restore states to %s, a downgrade will not "
+                    "restore them",
+                    SNAPSHOT_KEY,
                 )
+                _LOGGER.debug("Created cache with %s", list(data.last_states))
 
-            return data
+            return data._async_loaded()
 
         return cast(RestoreStateData, await load_instance(hass))
 
+    @callback
+    def _async_loaded(self) -> "RestoreStateData":
+        """Set up dumping once the states are loaded."""
+        hass = self.hass
+
+        if hass.state == CoreState.running:
+            self.async_setup_dump()
+        else:
+            hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, self.async_setup_dump)
+
+        return self
+
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store: Store = Store(
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
+        self.snapshot = StateSnapshot(hass.config.path(STORAGE_DIR, SNAPSHOT_KEY))
+        # Remove the JSON store after writing the snapshot
+        self.remove_store = False
         self.last_states: Dict[str, StoredState] = {}
         self.entity_ids: Set[str] = set()
+        self._dump_lock: Optional[asyncio.Lock] = None
 
     @callback
     def async_get_stored_states(self) -> List[StoredState]:
@@ -115,7 +430,11 @@ class RestoreStateData:
         stored states from the previous run, which have not been created as
         entities on this run, and have not expired.
         """
-        now = dt_util.utcnow()
+        return self._async_get_stored_states(dt_util.utcnow())
+
+    @callback
+    def _async_get_stored_states(self, now: datetime) -> List[StoredState]:
+        """Get the states to store, states of current entities are seen now."""
         all_states = self.hass.states.async_all()
         # Entities currently backed by an entity object
         current_entity_ids = {
@@ -152,15 +471,22 @@ class RestoreStateData:
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
-        try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
-        except HomeAssistantError as exc:
-            _LOGGER.error("Error saving current states", exc_info=exc)
+        if self._dump_lock is None:
+            self._dump_lock = asyncio.Lock()
+
+        async with self._dump_lock:
+            now = dt_util.utcnow()
+            try:
+                await self.hass.async_add_executor_job(
+                    self.snapshot.write, self._async_get_stored_states(now), now
+                )
+            except OSError as exc:
+                _LOGGER.error("Error saving current states", exc_info=exc)
+                return
+
+            if self.remove_store:
+                self.remove_store = False
+                await self.store.async_remove()
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
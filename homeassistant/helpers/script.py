@@ -7,6 +7,7 @@ import logging
 from types import MappingProxyType
 from typing import (
     Any,
+    Awaitable,
     Callable,
     Dict,
     List,
@@ -223,10 +224,6 @@ class _ScriptRun:
         if not self._stop.is_set():
             self._script._changed()  # pylint: disable=protected-access
 
-    async def _async_get_condition(self, config):
-        # pylint: disable=protected-access
-        return await self._script._async_get_condition(config)
-
     def _log(
         self, msg: str, *args: Any, level: int = logging.INFO, **kwargs: Any
     ) -> None:
@@ -240,20 +237,20 @@ class _ScriptRun:
             if self._stop.is_set():
                 return
             self._log("Running %s", self._script.running_description)
+            # pylint: disable=protected-access
+            handlers = self._script._get_step_handlers()
             for self._step, self._action in enumerate(self._script.sequence):
                 if self._stop.is_set():
                     break
-                await self._async_step(log_exceptions=False)
+                await self._async_step(handlers[self._step], log_exceptions=False)
         except _StopScript:
             pass
         finally:
             self._finish()
 
-    async def _async_step(self, log_exceptions):
+    async def _async_step(self, handler, log_exceptions):
         try:
-            await getattr(
-                self, f"_async_{cv.determine_script_action(self._action)}_step"
-            )()
+            await handler(self)
         except Exception as ex:
             if not isinstance(ex, (_StopScript, asyncio.CancelledError)) and (
                 self._log_exceptions or log_exceptions
@@ -515,7 +512,10 @@ class _ScriptRun:
         self._script.last_action = self._action.get(
             CONF_ALIAS, self._action[CONF_CONDITION]
         )
-        cond = await self._async_get_condition(self._action)
+        # pylint: disable=protected-access
+        (cond,) = await self._script._async_get_step_conditions(
+            self._step, [self._action]
+        )
         check = cond(self._hass, self._variables)
         self._log("Test condition %s: %s", self._script.last_action, check)
         if not check:
@@ -562,9 +562,9 @@ class _ScriptRun:
                     break
 
         elif CONF_WHILE in repeat:
-            conditions = [
-                await self._async_get_condition(config) for config in repeat[CONF_WHILE]
-            ]
+            conditions = await self._script._async_get_step_conditions(
+                self._step, repeat[CONF_WHILE]
+            )
             for iteration in itertools.count(1):
                 set_repeat_var(iteration)
                 if self._stop.is_set() or not all(
@@ -574,9 +574,9 @@ class _ScriptRun:
                 await async_run_sequence(iteration)
 
         elif CONF_UNTIL in repeat:
-            conditions = [
-                await self._async_get_condition(config) for config in repeat[CONF_UNTIL]
-            ]
+            conditions = await self._script._async_get_step_conditions(
+                self._step, repeat[CONF_UNTIL]
+            )
             for iteration in itertools.count(1):
                 set_repeat_var(iteration)
                 await async_run_sequence(iteration)
@@ -678,6 +678,12 @@ class _ScriptRun:
         )
 
 
+_STEP_HANDLERS: Dict[str, Callable[[_ScriptRun], Awaitable[None]]] = {
+    action: getattr(_ScriptRun, f"_async_{action}_step")
+    for action in cv.ACTION_TYPE_SCHEMAS
+}
+
+
 class _QueuedScriptRun(_ScriptRun):
     """Manage queued Script sequence run."""
 
@@ -831,6 +837,10 @@ class Script:
         if script_mode == SCRIPT_MODE_QUEUED:
             self._queue_lck = asyncio.Lock()
         self._config_cache: Dict[Set[Tuple], Callable[..., bool]] = {}
+        self._step_handlers: Optional[
+            List[Callable[[_ScriptRun], Awaitable[None]]]
+        ] = None
+        self._step_conditions: Dict[int, List[Callable[..., bool]]] = {}
         self._repeat_script: Dict[int, Script] = {}
         self._choose_data: Dict[int, Dict[str, Any]] = {}
         self._referenced_entities: Optional[Set[str]] = None
@@ -876,6 +886,7 @@ class Script:
         if self._change_listener_job:
             self._hass.async_run_hass_job(self._change_listener_job)
 
+    @callback
     def _chain_change_listener(self, sub_script):
         if sub_script.is_running:
             self.last_action = sub_script.last_action
@@ -1056,6 +1067,25 @@ class Script:
             self._config_cache[config_cache_key] = cond
         return cond
 
+    def _get_step_handlers(self) -> List[Callable[[_ScriptRun], Awaitable[None]]]:
+        """Return the handler of each step, resolved once per script."""
+        if self._step_handlers is None:
+            self._step_handlers = [
+                _STEP_HANDLERS[cv.determine_script_action(action)]
+                for action in self.sequence
+            ]
+        return self._step_handlers
+
+    async def _async_get_step_conditions(
+        self, step: int, configs: Sequence[Dict[str, Any]]
+    ) -> List[Callable[..., bool]]:
+        """Return the conditions of a step, built once per script."""
+        conditions = self._step_conditions.get(step)
+        if conditions is None:
+            conditions = [await self._async_get_condition(config) for config in configs]
+            self._step_conditions[step] = conditions
+        return conditions
+
     def _prep_repeat_script(self, step):
         action = self.sequence[step]
         step_name = action.get(CONF_ALIAS, f"Repeat at step {step+1}")
@@ -1135,6 +1165,9 @@ class Script:
     def _log(
         self, msg: str, *args: Any, level: int = logging.INFO, **kwargs: Any
     ) -> None:
+        if not self._logger.isEnabledFor(min(level, logging.ERROR)):
+            return
+
         msg = f"%s: {msg}"
         args = (self.name, *args)
 
@@ -3,6 +3,7 @@ import asyncio
 import dataclasses
 from functools import partial, wraps
 import logging
+import pathlib
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -53,6 +54,7 @@ from homeassistant.loader import (
     bind_hass,
 )
 from homeassistant.util.async_ import gather_with_concurrency
+from homeassistant.util.json import load_json
 from homeassistant.util.yaml import load_yaml
 from homeassistant.util.yaml.loader import JSON_TYPE
 
@@ -68,6 +70,13 @@ CONF_SERVICE_DATA_TEMPLATE = "data_template"
 _LOGGER = logging.getLogger(__name__)
 
 SERVICE_DESCRIPTION_CACHE = "service_description_cache"
+SERVICE_DESCRIPTION_INDEX = "service_description_index"
+ALL_SERVICE_DESCRIPTIONS_CACHE = "all_service_descriptions_cache"
+
+# Descriptions of the services of built-in integrations, generated by hassfest
+SERVICE_DESCRIPTION_INDEX_PATH = str(
+    pathlib.Path(__file__).parent.parent / "generated" / "services.json"
+)
 
 
 @dataclasses.dataclass
@@ -378,14 +387,37 @@ def _load_services_files(
     return [_load_services_file(hass, integration) for integration in integrations]
 
 
+async def _async_get_description_index(
+    hass: HomeAssistantType,
+) -> Dict[str, JSON_TYPE]:
+    """Return the service descriptions of built-in integrations."""
+    index = hass.data.get(SERVICE_DESCRIPTION_INDEX)
+    if index is None:
+        index = hass.data[
+            SERVICE_DESCRIPTION_INDEX
+        ] = await hass.async_add_executor_job(load_json, SERVICE_DESCRIPTION_INDEX_PATH)
+    return cast(Dict[str, JSON_TYPE], index)
+
+
 @bind_hass
 async def async_get_all_descriptions(
     hass: HomeAssistantType,
 ) -> Dict[str, Dict[str, Any]]:
-    """Return descriptions (i.e. user documentation) for all service calls."""
+    """Return descriptions (i.e. user documentation) for all service calls.
+
+    The result is shared until services are added or removed and should not
+    be modified.
+    """
+    services = hass.services.async_services()
+
+    # Services are compared by identity, so a service registered again
+    # with the same name is noticed as well.
+    all_descriptions = hass.data.get(ALL_SERVICE_DESCRIPTIONS_CACHE)
+    if all_descriptions is not None and all_descriptions[0] == services:
+        return cast(Dict[str, Dict[str, Any]], all_descriptions[1])
+
     descriptions_cache = hass.data.setdefault(SERVICE_DESCRIPTION_CACHE, {})
     format_cache_key = "{}.{}".format
-    services = hass.services.async_services()
 
     # See if there are new services not seen before.
     # Any service that we saw before already has an entry in description_cache.
@@ -405,12 +437,26 @@ async def async_get_all_descriptions(
             *(async_get_integration(hass, domain) for domain in missing),
         )
 
-        contents = await hass.async_add_executor_job(
-            _load_services_files, hass, integrations
-        )
+        # Built-in integrations are described by the generated index,
+        # the others by their services.yaml.
+        index: Dict[str, JSON_TYPE] = {}
+        if any(integration.is_built_in for integration in integrations):
+            index = await _async_get_description_index(hass)
+
+        to_load = []
+        for integration in integrations:
+            if integration.is_built_in and integration.domain in index:
+                loaded[integration.domain] = index[integration.domain]
+            else:
+                to_load.append(integration)
+
+        if to_load:
+            contents = await hass.async_add_executor_job(
+                _load_services_files, hass, to_load
+            )
 
-        for domain, content in zip(missing, contents):
-            loaded[domain] = content
+            for integration, content in zip(to_load, contents):
+                loaded[integration.domain] = content
 
     # Build response
     descriptions: Dict[str, Dict[str, Any]] = {}
@@ -436,6 +482,7 @@ async def async_get_all_descriptions(
 
             descriptions[domain][service] = description
 
+    hass.data[ALL_SERVICE_DESCRIPTIONS_CACHE] = (services, descriptions)
     return descriptions
 
 
@@ -453,6 +500,7 @@ def async_set_service_schema(
     }
 
     hass.data[SERVICE_DESCRIPTION_CACHE][f"{domain}.{service}"] = description
+    hass.data.pop(ALL_SERVICE_DESCRIPTIONS_CACHE, None)
 
 
 @bind_hass
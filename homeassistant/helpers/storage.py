@@ -1,9 +1,13 @@
 """Helper to help store data."""
 import asyncio
+import json
 from json import JSONEncoder
 import logging
 import os
-from typing import Any, Callable, Dict, List, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
+import uuid
+
+import attr
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
@@ -15,9 +19,113 @@ from homeassistant.util import json as json_util
 # mypy: no-check-untyped-defs
 
 STORAGE_DIR = ".storage"
+JOURNAL_SUFFIX = ".journal"
+# A journal is compacted into the data file when it gets bigger than the
+# data file, but not before it reaches this size.
+JOURNAL_MIN_COMPACT_SIZE = 64 * 1024
 _LOGGER = logging.getLogger(__name__)
 
 
+def _json_equal(old: Any, new: Any) -> bool:
+    """Test if JSON data is equal, including the types of values.
+
+    Python equality would consider 1, 1.0 and True equal, while they
+    serialize differently.
+    """
+    if old is new:
+        return True
+    if type(old) is not type(new):
+        return False
+    if isinstance(old, dict):
+        return len(old) == len(new) and all(
+            key in new and _json_equal(value, new[key]) for key, value in old.items()
+        )
+    if isinstance(old, list):
+        return len(old) == len(new) and all(map(_json_equal, old, new))
+    return bool(old == new)
+
+
+def _json_diff(old: Any, new: Any, path: List, ops: List[List]) -> None:
+    """Add the operations that turn old JSON data into new to ops.
+
+    Lists are diffed by their common start and end, so changing, adding or
+    removing an item results in a single operation.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                ops.append(["del", path + [key]])
+        for key, value in new.items():
+            if key not in old:
+                ops.append(["set", path + [key], value])
+            elif not _json_equal(old[key], value):
+                _json_diff(old[key], value, path + [key], ops)
+        return
+
+    if isinstance(old, list) and isinstance(new, list):
+        start = 0
+        limit = min(len(old), len(new))
+        while start < limit and _json_equal(old[start], new[start]):
+            start += 1
+
+        old_end, new_end = len(old), len(new)
+        while (
+            old_end > start
+            and new_end > start
+            and _json_equal(old[old_end - 1], new[new_end - 1])
+        ):
+            old_end -= 1
+            new_end -= 1
+
+        if old_end - start == 1 and new_end - start == 1:
+            _json_diff(old[start], new[start], path + [start], ops)
+        else:
+            ops.append(["splice", path, start, old_end, new[start:new_end]])
+        return
+
+    ops.append(["set", path, new])
+
+
+def _json_apply(data: Any, ops: List[List]) -> Any:
+    """Apply operations created by _json_diff and return the result."""
+    for operation in ops:
+        kind, path = operation[0], operation[1]
+
+        if kind == "splice":
+            target = data
+            for key in path:
+                target = target[key]
+            target[operation[2] : operation[3]] = operation[4]
+            continue
+
+        if not path:
+            data = operation[2]
+            continue
+
+        parent = data
+        for key in path[:-1]:
+            parent = parent[key]
+
+        if kind == "set":
+            parent[path[-1]] = operation[2]
+        else:
+            del parent[path[-1]]
+
+    return data
+
+
+@attr.s(slots=True)
+class _JournalState:
+    """What a journaled store has on disk."""
+
+    version: int = attr.ib()
+    # Only records with the identifier of the data file are replayed
+    journal_id: str = attr.ib()
+    data: Any = attr.ib()
+    data_size: int = attr.ib()
+    journal_size: int = attr.ib(default=0)
+
+
 @bind_hass
 async def async_migrator(
     hass,
@@ -72,8 +180,15 @@ class Store:
         private: bool = False,
         *,
         encoder: Optional[Type[JSONEncoder]] = None,
+        journal: bool = False,
     ):
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        A journaled store appends the changes of a save to a journal next to
+        the data file, instead of writing all data. The journal is merged into
+        the data file when it grows bigger than the data file and on the final
+        write.
+        """
         self.version = version
         self.key = key
         self.hass = hass
@@ -84,12 +199,20 @@ class Store:
         self._write_lock = asyncio.Lock()
         self._load_task: Optional[asyncio.Future] = None
         self._encoder = encoder
+        self._journal = journal
+        self._journal_state: Optional[_JournalState] = None
+        self._journal_compact = False
 
     @property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @property
+    def journal_path(self):
+        """Return the path of the journal."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     async def async_load(self) -> Union[Dict, List, None]:
         """Load data.
 
@@ -121,9 +244,7 @@ class Store:
             if "data_func" in data:
                 data["data"] = data.pop("data_func")()
         else:
-            data = await self.hass.async_add_executor_job(
-                json_util.load_json, self.path
-            )
+            data = await self.hass.async_add_executor_job(self._load_data)
 
             if data == {}:
                 return None
@@ -140,6 +261,67 @@ class Store:
 
         return stored
 
+    def _load_data(self) -> Dict:
+        """Load the data file and replay its journal."""
+        data = json_util.load_json(self.path)
+        journal_id = data.get("journal")
+        complete = False
+
+        if journal_id is not None:
+            data["data"], complete = self._replay_journal(journal_id, data["data"])
+
+        # Records appended after an incomplete one would be ignored, so the
+        # first write after that starts a new journal.
+        if self._journal and complete and self._journal_state is None:
+            # Keep an unshared copy to diff the next save against
+            self._journal_state = _JournalState(
+                data["version"],
+                journal_id,
+                json.loads(json.dumps(data["data"])),
+                os.path.getsize(self.path),
+                self._journal_size(),
+            )
+
+        return data
+
+    def _journal_size(self) -> int:
+        """Return the size of the journal."""
+        try:
+            return os.path.getsize(self.journal_path)
+        except OSError:
+            return 0
+
+    def _replay_journal(self, journal_id: str, data: Any) -> Tuple[Any, bool]:
+        """Apply the records of the journal that belong to the data file.
+
+        Returns the data and if all records were valid.
+        """
+        try:
+            with open(self.journal_path, encoding="utf-8") as journal:
+                for line in journal:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # Write was interrupted, later records are not valid
+                        _LOGGER.warning("Ignoring incomplete journal of %s", self.key)
+                        return data, False
+
+                    if record["id"] != journal_id:
+                        continue
+
+                    try:
+                        data = _json_apply(data, record["ops"])
+                    except (KeyError, IndexError, TypeError):
+                        _LOGGER.error("Invalid journal record for %s", self.key)
+                        return data, False
+        except FileNotFoundError:
+            pass
+        except OSError as err:
+            _LOGGER.error("Unable to read journal of %s: %s", self.key, err)
+            return data, False
+
+        return data, True
+
     async def async_save(self, data: Union[Dict, List]) -> None:
         """Save data."""
         self._data = {"version": self.version, "key": self.key, "data": data}
@@ -198,6 +380,8 @@ class Store:
     async def _async_callback_final_write(self, _event):
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
+        # Leave a complete data file behind
+        self._journal_compact = True
         await self._async_handle_write_data()
 
     async def _async_handle_write_data(self, *_args):
@@ -230,9 +414,83 @@ class Store:
         if not os.path.isdir(os.path.dirname(path)):
             os.makedirs(os.path.dirname(path))
 
+        if self._journal:
+            self._write_journaled_data(path, data)
+            return
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_util.save_json(path, data, self._private, encoder=self._encoder)
 
+    def _write_journaled_data(self, path: str, data: Dict) -> None:
+        """Append the changes to the journal, or compact it into the data file."""
+        state = self._journal_state
+        compact = self._journal_compact or state is None
+        self._journal_compact = False
+
+        try:
+            new_data = json.loads(json.dumps(data["data"], cls=self._encoder))
+        except TypeError:
+            # Let the data file write report what can't be serialized
+            new_data = None
+            compact = True
+
+        if not compact:
+            assert state is not None
+            ops: List[List] = []
+            _json_diff(state.data, new_data, [], ops)
+
+            if not ops and state.version == data["version"]:
+                return
+
+            record = json.dumps({"id": state.journal_id, "ops": ops}) + "\n"
+
+            if state.version != data["version"] or (
+                state.journal_size + len(record)
+                > max(state.data_size, JOURNAL_MIN_COMPACT_SIZE)
+            ):
+                compact = True
+
+        if not compact:
+            assert state is not None
+            _LOGGER.debug("Appending changes for %s to %s", self.key, path)
+            try:
+                fd = os.open(
+                    self.journal_path,
+                    os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                    0o600 if self._private else 0o644,
+                )
+                with os.fdopen(fd, "w", encoding="utf-8") as journal:
+                    journal.write(record)
+            except OSError as err:
+                # The journal may end with part of the record, start over
+                self._journal_state = None
+                _LOGGER.exception("Appending to journal failed: %s", self.journal_path)
+                raise json_util.WriteError(err) from err
+
+            state.data = new_data
+            state.journal_size += len(record)
+            return
+
+        journal_id = uuid.uuid4().hex
+        self._journal_state = None
+        _LOGGER.debug("Writing data for %s to %s", self.key, path)
+        json_util.save_json(
+            path, {**data, "journal": journal_id}, self._private, encoder=self._encoder
+        )
+
+        try:
+            os.unlink(self.journal_path)
+        except FileNotFoundError:
+            pass
+        except OSError as err:
+            # Records of the journal have another identifier, so they are
+            # ignored when loading
+            _LOGGER.error("Unable to remove journal of %s: %s", self.key, err)
+
+        self._journal_state = _JournalState(
+            data["version"], journal_id, new_data, os.path.getsize(path)
+        )
+
     async def _async_migrate_func(self, old_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -242,7 +500,10 @@ class Store:
         self._async_cleanup_delay_listener()
         self._async_cleanup_final_write_listener()
 
-        try:
-            await self.hass.async_add_executor_job(os.unlink, self.path)
-        except FileNotFoundError:
-            pass
+        self._journal_state = None
+
+        for path in (self.path, self.journal_path):
+            try:
+                await self.hass.async_add_executor_job(os.unlink, path)
+            except FileNotFoundError:
+                pass
@@ -2,8 +2,10 @@
 import asyncio
 from collections import ChainMap
 import logging
-from typing import Any, Dict, List, Optional, Set
+import os
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+from homeassistant.const import __version__
 from homeassistant.core import callback
 from homeassistant.loader import (
     MAX_LOAD_CONCURRENTLY,
@@ -15,14 +17,20 @@ from homeassistant.loader import (
 from homeassistant.util.async_ import gather_with_concurrency
 from homeassistant.util.json import load_json
 
+from .storage import Store
 from .typing import HomeAssistantType
 
 _LOGGER = logging.getLogger(__name__)
 
 TRANSLATION_LOAD_LOCK = "translation_load_lock"
 TRANSLATION_FLATTEN_CACHE = "translation_flatten_cache"
+TRANSLATION_STORE = "translation_store"
 LOCALE_EN = "en"
 
+STORAGE_KEY = "core.translations"
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 30
+
 
 def recursive_flatten(prefix: Any, data: Dict) -> Dict[str, Any]:
     """Return a flattened representation of dict data."""
@@ -89,6 +97,116 @@ def load_translations_files(
     return loaded
 
 
+def _file_mtime(path: str) -> Optional[int]:
+    """Return the modification time of a file, None if it doesn't exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def load_translations_files_cached(
+    translation_files: Dict[str, str],
+    versions: Dict[str, Optional[str]],
+    cached: Dict[str, Dict[str, Any]],
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """Load translation files that changed since they were stored.
+
+    Returns the translations and the new store entries of the files that
+    had to be loaded.
+    """
+    loaded = {}
+    mtimes = {}
+    files_to_load = {}
+
+    for component, translation_file in translation_files.items():
+        mtime = _file_mtime(translation_file)
+        entry = cached.get(component)
+
+        if (
+            entry is not None
+            and entry["mtime"] == mtime
+            and entry["version"] == versions[component]
+        ):
+            loaded[component] = entry["strings"]
+        else:
+            files_to_load[component] = translation_file
+            mtimes[component] = mtime
+
+    updated = {}
+
+    if files_to_load:
+        for component, strings in load_translations_files(files_to_load).items():
+            loaded[component] = strings
+            updated[component] = {
+                "version": versions[component],
+                "mtime": mtimes[component],
+                "strings": strings,
+            }
+
+    return loaded, updated
+
+
+class _TranslationStore:
+    """Store of the translation files loaded per language.
+
+    Translations are kept across restarts, a file is only loaded again when
+    it was modified or its integration changed version. Only the translations
+    requested since the start are saved, so languages and integrations that
+    are no longer used are dropped.
+    """
+
+    def __init__(self, hass: HomeAssistantType) -> None:
+        """Initialize the store."""
+        self.hass = hass
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._data: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None
+        # Language -> components requested since the start
+        self._used: Dict[str, Set[str]] = {}
+
+    async def async_load_files(
+        self,
+        language: str,
+        translation_files: Dict[str, str],
+        versions: Dict[str, Optional[str]],
+    ) -> Dict[str, Dict[str, Any]]:
+        """Load translation files, using the stored translations if unchanged."""
+        if self._data is None:
+            data = await self._store.async_load()
+            if self._data is None:
+                self._data = data or {}  # type: ignore
+
+        assert self._data is not None
+        self._used.setdefault(language, set()).update(translation_files)
+        language_data = self._data.setdefault(language, {})
+        loaded, updated = await self.hass.async_add_executor_job(
+            load_translations_files_cached,
+            translation_files,
+            versions,
+            dict(language_data),
+        )
+
+        if updated:
+            language_data.update(updated)
+            self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+        return loaded
+
+    @callback
+    def _data_to_save(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Return the data to store, dropping the unused translations."""
+        assert self._data is not None
+        self._data = {
+            language: {
+                component: entry
+                for component, entry in self._data.get(language, {}).items()
+                if component in components
+            }
+            for language, components in self._used.items()
+        }
+        return self._data
+
+
 def _merge_resources(
     translation_strings: Dict[str, Dict[str, Any]],
     components: Set[str],
@@ -180,11 +298,22 @@ async def async_get_component_strings(
         return translations
 
     # Load files
-    load_translations_job = hass.async_add_executor_job(
-        load_translations_files, files_to_load
+    store = hass.data.get(TRANSLATION_STORE)
+    if store is None:
+        store = hass.data[TRANSLATION_STORE] = _TranslationStore(hass)
+
+    versions = {}
+    for loaded in files_to_load:
+        integration = integrations[loaded.split(".")[-1]]
+        versions[loaded] = (
+            __version__
+            if integration.is_built_in
+            else integration.manifest.get("version")
+        )
+
+    loaded_translations = await store.async_load_files(
+        language, files_to_load, versions
     )
-    assert load_translations_job is not None
-    loaded_translations = await load_translations_job
 
     # Translations that miss "title" will get integration put in.
     for loaded, loaded_translation in loaded_translations.items():
@@ -192,7 +321,10 @@ async def async_get_component_strings(
             continue
 
         if "title" not in loaded_translation:
-            loaded_translation["title"] = integrations[loaded].name
+            loaded_translations[loaded] = {
+                **loaded_translation,
+                "title": integrations[loaded].name,
+            }
 
     translations.update(loaded_translations)
 
@@ -0,0 +1,110 @@
+"""Keep the states of the state machine across a restart.
+
+When Home Assistant restarts, the states are written to a snapshot while it
+stops. On the next start they are put back in the state machine before the
+integrations are set up, so the last known states are available right away
+instead of the entities being unavailable until they are set up again.
+"""
+from datetime import datetime, timedelta
+import json
+import logging
+from typing import List
+
+from homeassistant.const import (
+    ATTR_RESTORED,
+    EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STOP,
+    RESTART_EXIT_CODE,
+)
+from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.helpers.restore_state import StateSnapshot, StoredState
+from homeassistant.helpers.storage import STORAGE_DIR
+import homeassistant.util.dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+SNAPSHOT_KEY = "core.warm_restart.snapshot"
+
+# States in an older snapshot are too outdated to show
+MAX_SNAPSHOT_AGE = timedelta(minutes=10)
+
+
+def _load_states(snapshot: StateSnapshot) -> List[State]:
+    """Load the states of the snapshot and remove it."""
+    if not snapshot.load():
+        return []
+
+    # The snapshot is only valid for the start right after the restart
+    snapshot.remove()
+
+    age = dt_util.utcnow().timestamp() - snapshot.dump_time
+    if age > MAX_SNAPSHOT_AGE.total_seconds():
+        _LOGGER.debug("Ignoring states from a restart %.0f seconds ago", age)
+        return []
+
+    states = []
+    for entity_id, (_, _, payload) in snapshot.records.items():
+        try:
+            state = State.from_dict(json.loads(payload))
+        except (ValueError, KeyError) as err:
+            _LOGGER.warning("Unable to restore state of %s: %s", entity_id, err)
+            continue
+        if state is not None:
+            states.append(state)
+
+    return states
+
+
+async def async_load(hass: HomeAssistant) -> None:
+    """Restore the states from before a restart and save them when restarting."""
+    path = hass.config.path(STORAGE_DIR, SNAPSHOT_KEY)
+
+    try:
+        states = await hass.async_add_executor_job(_load_states, StateSnapshot(path))
+    except OSError as err:
+        _LOGGER.error("Error loading states from before the restart: %s", err)
+        states = []
+
+    if states:
+        hass.states.async_restore(states)
+        _LOGGER.info("Restored %s states from before the restart", len(states))
+
+    @callback
+    def async_remove_outdated_states(_: Event) -> None:
+        """Remove the restored states that were not replaced while starting."""
+        for entity_id in hass.states.async_restored_entity_ids():
+            hass.states.async_remove(entity_id)
+
+    @callback
+    def async_save_states(_: Event) -> None:
+        """Save the states before the integrations stop, when restarting."""
+        if hass.exit_code != RESTART_EXIT_CODE:
+            return
+
+        now = dt_util.utcnow()
+        restored = set(hass.states.async_restored_entity_ids())
+        stored_states = [
+            StoredState(state, now)
+            for state in hass.states.async_all()
+            if state.entity_id not in restored
+            and not state.attributes.get(ATTR_RESTORED)
+        ]
+        hass.async_create_task(
+            _async_write(hass, StateSnapshot(path), stored_states, now)
+        )
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, async_remove_outdated_states)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, async_save_states)
+
+
+async def _async_write(
+    hass: HomeAssistant,
+    snapshot: StateSnapshot,
+    stored_states: List[StoredState],
+    now: datetime,
+) -> None:
+    """Write the states to the snapshot."""
+    try:
+        await hass.async_add_executor_job(snapshot.write, stored_states, now)
+    except OSError as err:
+        _LOGGER.error("Error saving states for the restart: %s", err)
@@ -17,6 +17,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
     Optional,
     Set,
@@ -109,26 +110,17 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
-    def get_sub_directories(paths: List[str]) -> List[pathlib.Path]:
-        """Return all sub directories in a set of paths."""
+    def resolve_sub_directories(paths: List[str]) -> List[Optional["Integration"]]:
+        """Resolve the integrations in all sub directories of a set of paths."""
         return [
-            entry
+            Integration.resolve_from_root(hass, custom_components, entry.name)
             for path in paths
             for entry in pathlib.Path(path).iterdir()
             if entry.is_dir()
         ]
 
-    dirs = await hass.async_add_executor_job(
-        get_sub_directories, custom_components.__path__
-    )
-
-    integrations = await asyncio.gather(
-        *(
-            hass.async_add_executor_job(
-                Integration.resolve_from_root, hass, custom_components, comp.name
-            )
-            for comp in dirs
-        )
+    integrations = await hass.async_add_executor_job(
+        resolve_sub_directories, custom_components.__path__
     )
 
     return {
@@ -294,6 +286,44 @@ class Integration:
 
         return None
 
+    @classmethod
+    def resolve_from_index(
+        cls,
+        hass: "HomeAssistant",
+        root_module: ModuleType,
+        domain: str,
+        custom_domains: Iterable[str],
+    ) -> "Optional[Integration]":
+        """Resolve a built-in integration from the generated manifest index.
+
+        Dependencies are taken from the index too, unless one of them is
+        overridden by a custom integration.
+        """
+        # pylint: disable=import-outside-toplevel
+        from homeassistant.generated.integrations import ALL_DEPENDENCIES, MANIFESTS
+
+        manifest = MANIFESTS.get(domain)
+
+        if manifest is None:
+            return None
+
+        integration = cls(
+            hass,
+            f"{root_module.__name__}.{domain}",
+            pathlib.Path(root_module.__path__[0]) / domain,  # type: ignore
+            cast(Manifest, dict(manifest)),
+        )
+
+        all_dependencies = ALL_DEPENDENCIES.get(domain)
+
+        if all_dependencies is not None and set(custom_domains).isdisjoint(
+            all_dependencies
+        ):
+            integration._all_dependencies = set(all_dependencies)
+            integration._all_dependencies_resolved = True
+
+        return integration
+
     @classmethod
     def resolve_legacy(
         cls, hass: "HomeAssistant", domain: str
@@ -335,6 +365,9 @@ class Integration:
             self._all_dependencies_resolved = True
             self._all_dependencies = set()
 
+        # Platform name, None for the component -> pending import
+        self._preimports: Dict[Optional[str], "asyncio.Future[None]"] = {}
+
         _LOGGER.info("Loaded %s from %s", self.domain, pkg_path)
 
     @property
@@ -460,6 +493,48 @@ class Integration:
 
         return self._all_dependencies_resolved
 
+    def async_preimport(self, platform_names: Iterable[str] = ()) -> None:
+        """Import the component and platforms in the executor ahead of setup.
+
+        Setup waits for these imports instead of doing them in the event loop.
+        """
+        for platform_name in (None, *platform_names):
+            if platform_name not in self._preimports:
+                self._preimports[platform_name] = self.hass.async_add_executor_job(
+                    self._preimport, platform_name
+                )
+
+    def _preimport(self, platform_name: Optional[str]) -> None:
+        """Import the component or a platform, setup reports any errors."""
+        # pylint: disable=import-outside-toplevel
+        import homeassistant.util.package as pkg_util
+
+        # Requirements are installed during setup, before importing
+        if not self.hass.config.skip_pip and not all(
+            pkg_util.is_installed(req) for req in self.requirements
+        ):
+            return
+
+        try:
+            if platform_name is None:
+                self.get_component()
+            else:
+                self.get_platform(platform_name)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.debug(
+                "Unable to preimport %s %s",
+                self.domain,
+                platform_name or "component",
+                exc_info=True,
+            )
+
+    async def async_wait_preimport(self, platform_name: Optional[str] = None) -> None:
+        """Wait for a preimport of the component or a platform to finish."""
+        preimport = self._preimports.get(platform_name)
+
+        if preimport is not None:
+            await preimport
+
     def get_component(self) -> ModuleType:
         """Return the component."""
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
@@ -511,7 +586,8 @@ async def async_get_integration(hass: "HomeAssistant", domain: str) -> Integrati
 
     # Instead of using resolve_from_root we use the cache of custom
     # components to find the integration.
-    integration = (await async_get_custom_components(hass)).get(domain)
+    custom = await async_get_custom_components(hass)
+    integration = custom.get(domain)
     if integration is not None:
         _LOGGER.warning(CUSTOM_WARNING, domain)
         cache[domain] = integration
@@ -520,9 +596,12 @@ async def async_get_integration(hass: "HomeAssistant", domain: str) -> Integrati
 
     from homeassistant import components  # pylint: disable=import-outside-toplevel
 
-    integration = await hass.async_add_executor_job(
-        Integration.resolve_from_root, hass, components, domain
-    )
+    integration = Integration.resolve_from_index(hass, components, domain, custom)
+
+    if integration is None:
+        integration = await hass.async_add_executor_job(
+            Integration.resolve_from_root, hass, components, domain
+        )
 
     if integration is not None:
         cache[domain] = integration
@@ -4,8 +4,11 @@ import asyncio
 import collections
 from contextlib import suppress
 from datetime import datetime
+from functools import partial
+import glob
 import json
 import logging
+import os
 from timeit import default_timer as timer
 from typing import Callable, Dict, TypeVar
 
@@ -13,8 +16,9 @@ from homeassistant import core
 from homeassistant.components.websocket_api.const import JSON_DUMP
 from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSONEncoder, json_bytes
 from homeassistant.util import dt as dt_util
+from homeassistant.util.yaml import loader as yaml_loader
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -310,16 +314,140 @@ async def valid_entity_id(hass):
     return timer() - start
 
 
+@benchmark
+async def script_long_sequence(hass):
+    """Run a script with a 10k step sequence 10 times."""
+    return await _script_steps(
+        hass, [{"event": "benchmark_event"}] * 10 ** 4, 10, 10 ** 4
+    )
+
+
+@benchmark
+async def script_repeat_loop(hass):
+    """Run a script repeating a two step sequence 10k times."""
+    sequence = {
+        "repeat": {
+            "count": 10 ** 4,
+            "sequence": [
+                {"event": "benchmark_event"},
+                {"condition": "template", "value_template": "{{ true }}"},
+            ],
+        }
+    }
+    return await _script_steps(hass, [sequence], 1, 2 * 10 ** 4)
+
+
+async def _script_steps(hass, sequence, runs, steps_per_run):
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers import config_validation as cv
+    from homeassistant.helpers.script import Script
+
+    script_obj = Script(hass, cv.SCRIPT_SCHEMA(sequence), "Benchmark", "benchmark")
+    context = core.Context()
+
+    start = timer()
+
+    for _ in range(runs):
+        await script_obj.async_run(context=context)
+
+    runtime = timer() - start
+    print(f"{runs * steps_per_run / runtime:.0f} steps/s")
+    return runtime
+
+
 @benchmark
 async def json_serialize_states(hass):
     """Serialize million states with websocket default encoder."""
+    return _json_serialize_states(JSON_DUMP)
+
+
+@benchmark
+async def json_bytes_states(hass):
+    """Serialize million states to bytes with the HTTP encoder."""
+    return _json_serialize_states(json_bytes)
+
+
+@benchmark
+async def json_serialize_states_stdlib(hass):
+    """Serialize million states with the standard library encoder."""
+    return _json_serialize_states(partial(json.dumps, cls=JSONEncoder))
+
+
+def _json_serialize_states(dump):
     states = [
         core.State("light.kitchen", "on", {"friendly_name": "Kitchen Lights"})
         for _ in range(10 ** 6)
     ]
 
     start = timer()
-    JSON_DUMP(states)
+    dump(states)
+    return timer() - start
+
+
+@benchmark
+async def json_bytes_get_states(hass):
+    """Serialize 4k states with attributes 10 times with the HTTP encoder."""
+    return _json_serialize_states_payload(json_bytes)
+
+
+@benchmark
+async def json_bytes_get_states_stdlib(hass):
+    """Serialize 4k states with attributes 10 times with the standard library."""
+    return _json_serialize_states_payload(
+        lambda obj: json.dumps(obj, cls=JSONEncoder, allow_nan=False).encode("utf-8")
+    )
+
+
+def _json_serialize_states_payload(dump):
+    states = [
+        core.State(
+            f"sensor.power_{i}",
+            str(i),
+            {
+                "friendly_name": f"Power {i}",
+                "unit_of_measurement": "W",
+                "device_class": "power",
+                "last_reset": None,
+                "average": i / 3,
+                "history": [i / 7, i / 11],
+            },
+        )
+        for i in range(4000)
+    ]
+
+    start = timer()
+    for _ in range(10):
+        dump(states)
+    return timer() - start
+
+
+@benchmark
+async def yaml_load_services(hass):
+    """Parse all service descriptions with the default YAML loader."""
+    return _yaml_load_services(yaml_loader.parse_yaml)
+
+
+@benchmark
+async def yaml_load_services_python(hass):
+    """Parse all service descriptions with the pure Python YAML loader."""
+    return _yaml_load_services(
+        lambda content: yaml_loader.yaml.load(
+            content, Loader=yaml_loader.SafeLineLoader
+        )
+    )
+
+
+def _yaml_load_services(parse):
+    components = os.path.join(os.path.dirname(core.__file__), "components")
+    contents = []
+    for fname in sorted(glob.glob(os.path.join(components, "*", "services.yaml"))):
+        with open(fname, encoding="utf-8") as fp:
+            contents.append(fp.read())
+
+    start = timer()
+    for _ in range(5):
+        for content in contents:
+            parse(content)
     return timer() - start
 
 
@@ -81,7 +81,8 @@ def run(script_args: List) -> int:
 
     print(color("bold", "Testing configuration at", config_dir))
 
-    res = check(config_dir, args.secrets)
+    # The used files and secrets are only seen when the files are loaded
+    res = check(config_dir, args.secrets, use_cache=not (args.files or args.secrets))
 
     domain_info: List[str] = []
     if args.info:
@@ -151,8 +152,12 @@ def run(script_args: List) -> int:
     return len(res["except"])
 
 
-def check(config_dir, secrets=False):
-    """Perform a check by mocking hass load functions."""
+def check(config_dir, secrets=False, use_cache=False):
+    """Perform a check by mocking hass load functions.
+
+    With use_cache, unchanged files and validations are taken from the
+    configuration cache of Home Assistant and aren't reported as used.
+    """
     logging.getLogger("homeassistant.loader").setLevel(logging.CRITICAL)
     res: Dict[str, Any] = {
         "yaml_files": OrderedDict(),  # yaml_files loaded
@@ -197,10 +202,10 @@ def check(config_dir, secrets=False):
 
     if secrets:
         # Ensure !secrets point to the patched function
-        yaml_loader.yaml.SafeLoader.add_constructor("!secret", yaml_loader.secret_yaml)
+        yaml_loader.add_constructor("!secret", yaml_loader.secret_yaml)
 
     try:
-        res["components"] = asyncio.run(async_check_config(config_dir))
+        res["components"] = asyncio.run(async_check_config(config_dir, use_cache))
         res["secret_cache"] = OrderedDict(yaml_loader.__SECRET_CACHE)
         for err in res["components"].errors:
             domain = err.domain or ERROR_STR
@@ -217,19 +222,17 @@ def check(config_dir, secrets=False):
             pat.stop()
         if secrets:
             # Ensure !secrets point to the original function
-            yaml_loader.yaml.SafeLoader.add_constructor(
-                "!secret", yaml_loader.secret_yaml
-            )
+            yaml_loader.add_constructor("!secret", yaml_loader.secret_yaml)
         bootstrap.clear_secret_cache()
 
     return res
 
 
-async def async_check_config(config_dir):
+async def async_check_config(config_dir, use_cache=False):
     """Check the HA config."""
     hass = core.HomeAssistant()
     hass.config.config_dir = config_dir
-    components = await async_check_ha_config_file(hass)
+    components = await async_check_ha_config_file(hass, use_cache)
     await hass.async_stop(force=True)
     return components
 
@@ -11,6 +11,7 @@ from homeassistant.const import EVENT_COMPONENT_LOADED, PLATFORM_FORMAT
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util
+from homeassistant.util.timeline import Timeline
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,6 +21,7 @@ DATA_SETUP_DONE = "setup_done"
 DATA_SETUP_STARTED = "setup_started"
 DATA_SETUP = "setup_tasks"
 DATA_DEPS_REQS = "deps_reqs_processed"
+DATA_SETUP_TIMELINE = "setup_timeline"
 
 SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 300
@@ -34,6 +36,36 @@ def async_set_domains_to_be_loaded(hass: core.HomeAssistant, domains: Set[str])
     hass.data[DATA_SETUP_DONE] = {domain: asyncio.Event() for domain in domains}
 
 
+@core.callback
+def async_get_setup_timeline(hass: core.HomeAssistant) -> Timeline:
+    """Return the timeline of setting up integrations during startup."""
+    timeline: Optional[Timeline] = hass.data.get(DATA_SETUP_TIMELINE)
+
+    if timeline is None:
+        timeline = hass.data[DATA_SETUP_TIMELINE] = Timeline()
+
+    return timeline
+
+
+@core.callback
+def async_record_setup_phase(
+    hass: core.HomeAssistant, domain: str, phase: str, start: float
+) -> None:
+    """Record a phase of setting up a domain that started at start.
+
+    Only phases that run before Home Assistant is running are recorded.
+    """
+    if hass.state not in (core.CoreState.not_running, core.CoreState.starting):
+        return
+
+    timeline: Optional[Timeline] = hass.data.get(DATA_SETUP_TIMELINE)
+
+    if timeline is None:
+        timeline = hass.data[DATA_SETUP_TIMELINE] = Timeline(start)
+
+    timeline.add_span(domain, phase, start, timer())
+
+
 def setup_component(hass: core.HomeAssistant, domain: str, config: ConfigType) -> bool:
     """Set up a component and all its dependencies."""
     return asyncio.run_coroutine_threadsafe(
@@ -92,6 +124,10 @@ async def _async_process_dependencies(
     if not dependencies_tasks and not after_dependencies_tasks:
         return True
 
+    async_get_setup_timeline(hass).add_wait(
+        integration.domain, [*dependencies_tasks, *after_dependencies_tasks]
+    )
+
     if dependencies_tasks:
         _LOGGER.debug(
             "Dependency %s will wait for dependencies %s",
@@ -105,10 +141,12 @@ async def _async_process_dependencies(
             list(after_dependencies_tasks),
         )
 
+    start = timer()
     async with hass.timeout.async_freeze(integration.domain):
         results = await asyncio.gather(
             *dependencies_tasks.values(), *after_dependencies_tasks.values()
         )
+    async_record_setup_phase(hass, integration.domain, "dependencies", start)
 
     failed = [
         domain for idx, domain in enumerate(dependencies_tasks) if not results[idx]
@@ -138,6 +176,7 @@ async def _async_setup_component(
         _LOGGER.error("Setup failed for %s: %s", domain, msg)
         async_notify_setup_error(hass, domain, link)
 
+    start = timer()
     try:
         integration = await loader.async_get_integration(hass, domain)
     except loader.IntegrationNotFound:
@@ -151,6 +190,7 @@ async def _async_setup_component(
     # Validate all dependencies exist and there are no circular dependencies
     if not await integration.resolve_dependencies():
         return False
+    async_record_setup_phase(hass, domain, "resolve", start)
 
     # Process requirements as soon as possible, so we can import the component
     # without requiring imports to be in functions.
@@ -162,6 +202,8 @@ async def _async_setup_component(
 
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
+    start = timer()
+    await integration.async_wait_preimport()
     try:
         component = integration.get_component()
     except ImportError as err:
@@ -170,10 +212,13 @@ async def _async_setup_component(
     except Exception:  # pylint: disable=broad-except
         _LOGGER.exception("Setup failed for %s: unknown error", domain)
         return False
+    async_record_setup_phase(hass, domain, "import", start)
 
+    start = timer()
     processed_config = await conf_util.async_process_component_config(
         hass, config, integration
     )
+    async_record_setup_phase(hass, domain, "config", start)
 
     if processed_config is None:
         log_error("Invalid config.", integration.documentation)
@@ -227,6 +272,7 @@ async def _async_setup_component(
         return False
     finally:
         end = timer()
+        async_record_setup_phase(hass, domain, "setup", start)
         if warn_task:
             warn_task.cancel()
     _LOGGER.info("Setup of domain %s took %.1f seconds", domain, end - start)
@@ -294,6 +340,7 @@ async def async_prepare_setup_platform(
         log_error(str(err))
         return None
 
+    await integration.async_wait_preimport(domain)
     try:
         platform = integration.get_platform(domain)
     except ImportError as exc:
@@ -339,10 +386,12 @@ async def async_process_deps_reqs(
         raise HomeAssistantError("Could not set up all dependencies.")
 
     if not hass.config.skip_pip and integration.requirements:
+        start = timer()
         async with hass.timeout.async_freeze(integration.domain):
             await requirements.async_get_integration_with_requirements(
                 hass, integration.domain
             )
+        async_record_setup_phase(hass, integration.domain, "requirements", start)
 
     processed.add(integration.domain)
 
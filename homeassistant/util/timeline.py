@@ -0,0 +1,123 @@
+"""Timeline of the phases of work done per domain.
+
+Used to find out where startup time goes and which chain of
+dependencies determines how long it takes.
+"""
+from timeit import default_timer as timer
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import attr
+
+
+@attr.s(slots=True, frozen=True)
+class Span:
+    """A phase of work for a domain."""
+
+    domain: str = attr.ib()
+    phase: str = attr.ib()
+    start: float = attr.ib()
+    end: float = attr.ib()
+
+
+class Timeline:
+    """Record spans of work and the domains they waited on."""
+
+    def __init__(self, origin: Optional[float] = None) -> None:
+        """Initialize the timeline, times are relative to origin."""
+        self.origin = timer() if origin is None else origin
+        self.spans: List[Span] = []
+        self.waits: Dict[str, Set[str]] = {}
+
+    def add_span(self, domain: str, phase: str, start: float, end: float) -> None:
+        """Add a span of work, start and end are timer() values."""
+        self.spans.append(Span(domain, phase, start - self.origin, end - self.origin))
+
+    def add_wait(self, domain: str, waited_on: Iterable[str]) -> None:
+        """Record the domains a domain had to wait for."""
+        self.waits.setdefault(domain, set()).update(waited_on)
+
+    def domain_bounds(self) -> Dict[str, Tuple[float, float]]:
+        """Return the first start and last end of the spans per domain."""
+        bounds: Dict[str, Tuple[float, float]] = {}
+        for span in self.spans:
+            if span.domain in bounds:
+                start, end = bounds[span.domain]
+                bounds[span.domain] = (min(start, span.start), max(end, span.end))
+            else:
+                bounds[span.domain] = (span.start, span.end)
+        return bounds
+
+    def critical_path(self) -> List[Dict[str, Any]]:
+        """Return the chain of domains that finished last.
+
+        Starting from the domain that finished last, each step goes to the
+        domain it waited on that finished last, which is the one that
+        held it up.
+        """
+        bounds = self.domain_bounds()
+        if not bounds:
+            return []
+
+        domain: Optional[str] = max(bounds, key=lambda dom: bounds[dom][1])
+        path: List[Dict[str, Any]] = []
+        seen: Set[str] = set()
+
+        while domain is not None and domain not in seen:
+            seen.add(domain)
+            start, end = bounds[domain]
+            path.append({"domain": domain, "start": start, "end": end})
+            waited_on = [dom for dom in self.waits.get(domain, ()) if dom in bounds]
+            domain = max(waited_on, key=lambda dom: bounds[dom][1], default=None)
+
+        path.reverse()
+        return path
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the spans and critical path."""
+        return {
+            "spans": [attr.asdict(span) for span in self.spans],
+            "waits": {domain: sorted(waits) for domain, waits in self.waits.items()},
+            "critical_path": self.critical_path(),
+        }
+
+    def as_chrome_trace(self) -> Dict[str, Any]:
+        """Return the spans in the Chrome trace event format.
+
+        Every domain is shown as its own thread, the file can be loaded in
+        chrome://tracing or Perfetto.
+        """
+        thread_ids: Dict[str, int] = {}
+        events: List[Dict[str, Any]] = []
+
+        for span in self.spans:
+            tid = thread_ids.get(span.domain)
+            if tid is None:
+                tid = thread_ids[span.domain] = len(thread_ids) + 1
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": 1,
+                        "tid": tid,
+                        "args": {"name": span.domain},
+                    }
+                )
+            events.append(
+                {
+                    "name": span.phase,
+                    "cat": span.domain,
+                    "ph": "X",
+                    "pid": 1,
+                    "tid": tid,
+                    "ts": round(span.start * 1_000_000),
+                    "dur": round((span.end - span.start) * 1_000_000),
+                }
+            )
+
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "critical_path": [step["domain"] for step in self.critical_path()]
+            },
+        }
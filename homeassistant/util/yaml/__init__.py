@@ -2,13 +2,14 @@
 from .const import _SECRET_NAMESPACE, SECRET_YAML
 from .dumper import dump, save_yaml
 from .input import UndefinedSubstitution, extract_inputs, substitute
-from .loader import clear_secret_cache, load_yaml, parse_yaml, secret_yaml
+from .loader import YamlCache, clear_secret_cache, load_yaml, parse_yaml, secret_yaml
 from .objects import Input
 
 __all__ = [
     "SECRET_YAML",
     "_SECRET_NAMESPACE",
     "Input",
+    "YamlCache",
     "dump",
     "save_yaml",
     "clear_secret_cache",
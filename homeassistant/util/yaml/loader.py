@@ -1,18 +1,43 @@
 """Custom loader."""
 from collections import OrderedDict
 import fnmatch
+import hashlib
 import logging
 import os
 import sys
-from typing import Dict, Iterator, List, TextIO, TypeVar, Union, overload
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
 
 import yaml
 
 from homeassistant.exceptions import HomeAssistantError
 
+from . import serialize
 from .const import _SECRET_NAMESPACE, SECRET_YAML
 from .objects import Input, NodeListClass, NodeStrClass
 
+try:
+    from yaml import CSafeLoader as FastestAvailableSafeLoader
+
+    HAS_C_LOADER = True
+except ImportError:
+    HAS_C_LOADER = False
+    from yaml import SafeLoader as FastestAvailableSafeLoader  # type: ignore
+
 try:
     import keyring
 except ImportError:
@@ -28,6 +53,14 @@ except ImportError:
 
 JSON_TYPE = Union[List, Dict, str]  # pylint: disable=invalid-name
 DICT_T = TypeVar("DICT_T", bound=Dict)  # pylint: disable=invalid-name
+# Something a loaded YAML file depends on, like ("file", path, hash)
+DEPENDENCY_T = Tuple  # pylint: disable=invalid-name
+
+DEPENDENCY_DIR = "dir"
+DEPENDENCY_ENV = "env"
+DEPENDENCY_FILE = "file"
+# Secrets from keyring or credstash, which can't be checked for changes
+DEPENDENCY_VOLATILE = "volatile"
 
 _LOGGER = logging.getLogger(__name__)
 __SECRET_CACHE: Dict[str, JSON_TYPE] = {}
@@ -44,7 +77,41 @@ def clear_secret_cache() -> None:
     __SECRET_CACHE.clear()
 
 
-class SafeLineLoader(yaml.SafeLoader):
+class _LoaderMixin:
+    """Keep track of the cache and dependencies of a loader."""
+
+    name: str
+
+    def __init__(
+        self, stream: Union[str, TextIO], cache: Optional["YamlCache"] = None
+    ) -> None:
+        """Initialize the loader, includes are loaded through cache if given."""
+        super().__init__(stream)  # type: ignore
+        self.yaml_cache = cache
+        self.dependencies: Set[DEPENDENCY_T] = set()
+
+
+class FastSafeLoader(_LoaderMixin, FastestAvailableSafeLoader):
+    """Loader class using the libyaml parser when available.
+
+    The C parser doesn't keep track of the current line, but the nodes it
+    composes carry their start mark, which is all the constructors need.
+    """
+
+    def __init__(
+        self, stream: Union[str, TextIO], cache: Optional["YamlCache"] = None
+    ) -> None:
+        """Initialize the loader."""
+        super().__init__(stream, cache)
+        # Set like the pure Python reader does, the C parser only puts the
+        # name in the marks.
+        self.stream = stream
+        self.name = getattr(
+            stream, "name", "<unicode string>" if isinstance(stream, str) else "<file>"
+        )
+
+
+class SafeLineLoader(_LoaderMixin, yaml.SafeLoader):
     """Loader class that keeps track of line numbers."""
 
     def compose_node(self, parent: yaml.nodes.Node, index: int) -> yaml.nodes.Node:
@@ -55,11 +122,141 @@ class SafeLineLoader(yaml.SafeLoader):
         return node
 
 
+def _file_hash(fname: str) -> Optional[str]:
+    """Return the hash of the content of a file, None if missing or unreadable."""
+    try:
+        with open(fname, encoding="utf-8") as fil:
+            return hashlib.sha1(fil.read().encode()).hexdigest()
+    except (FileNotFoundError, UnicodeDecodeError):
+        return None
+
+
+class YamlCache:
+    """Cache of loaded YAML files.
+
+    A file is only parsed again when it or something it depends on, like an
+    included file, a secrets file or an environment variable, has changed.
+    Files are compared by the hash of their content, so the entries can be
+    stored and passed to a new cache, for example at the next start.
+
+    Entries keep the loaded YAML as a JSON string, every load returns new
+    objects decoded from it.
+    """
+
+    def __init__(self, entries: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+        """Initialize the cache with entries returned by as_dict."""
+        self._entries: Dict[str, Tuple[FrozenSet[DEPENDENCY_T], str]] = {}
+        for fname, entry in (entries or {}).items():
+            self._entries[fname] = (
+                frozenset(
+                    tuple(
+                        tuple(part) if isinstance(part, list) else part for part in dep
+                    )
+                    for dep in entry["dependencies"]
+                ),
+                entry["data"],
+            )
+        self._hashes: Dict[str, Optional[str]] = {}
+        self._used: Set[str] = set()
+        self._lock = threading.Lock()
+        self.changed = False
+
+    def file_hash(self, fname: str) -> Optional[str]:
+        """Return the hash of a file, it is read once per load."""
+        if fname not in self._hashes:
+            self._hashes[fname] = _file_hash(fname)
+        return self._hashes[fname]
+
+    def _dependency_unchanged(self, dependency: DEPENDENCY_T) -> bool:
+        """Test if a dependency of a loaded YAML file is unchanged."""
+        kind = dependency[0]
+        if kind == DEPENDENCY_FILE:
+            return self.file_hash(dependency[1]) == dependency[2]
+        if kind == DEPENDENCY_DIR:
+            return tuple(_find_files(dependency[1], "*.yaml")) == dependency[2]
+        if kind == DEPENDENCY_ENV:
+            return os.environ.get(dependency[1]) == dependency[2]
+        return False
+
+    def load(self, fname: str) -> JSON_TYPE:
+        """Load a YAML file.
+
+        Entries of files that were not needed by it are dropped, which keeps
+        the cache to the files of the last loaded configuration.
+        """
+        with self._lock:
+            self._hashes = {}
+            self._used = set()
+            try:
+                return self.load_with_dependencies(fname)[0]
+            finally:
+                self._hashes = {}
+                if not self._entries.keys() <= self._used:
+                    self._entries = {
+                        key: value
+                        for key, value in self._entries.items()
+                        if key in self._used
+                    }
+                    self.changed = True
+
+    def load_with_dependencies(
+        self, fname: str
+    ) -> Tuple[JSON_TYPE, FrozenSet[DEPENDENCY_T]]:
+        """Load a YAML file and return what it depends on, including itself."""
+        self._used.add(fname)
+        digest = self.file_hash(fname)
+        entry = self._entries.get(fname)
+        if (
+            digest is not None
+            and entry is not None
+            and all(self._dependency_unchanged(dep) for dep in entry[0])
+        ):
+            # Keep the entries of the included files as well
+            self._used.update(dep[1] for dep in entry[0] if dep[0] == DEPENDENCY_FILE)
+            return serialize.loads(entry[1]), entry[0]
+
+        data, dependencies = _load_yaml(fname, self)
+        dependencies.add((DEPENDENCY_FILE, fname, digest))
+        frozen = frozenset(dependencies)
+        if digest is None or any(dep[0] == DEPENDENCY_VOLATILE for dep in frozen):
+            self._entries.pop(fname, None)
+            return data, frozen
+
+        try:
+            self._entries[fname] = (frozen, serialize.dumps(data))
+        except TypeError:
+            self._entries.pop(fname, None)
+        self.changed = True
+        return data, frozen
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Return the entries in a JSON compatible form.
+
+        Async friendly, a load running in another thread is not waited for.
+        """
+        return {
+            fname: {"dependencies": sorted(entry[0], key=str), "data": entry[1]}
+            for fname, entry in self._entries.copy().items()
+        }
+
+    def clear(self) -> None:
+        """Remove all cached files."""
+        self._entries.clear()
+        self.changed = True
+
+
 def load_yaml(fname: str) -> JSON_TYPE:
     """Load a YAML file."""
+    return _load_yaml(fname, None)[0]
+
+
+def _load_yaml(
+    fname: str, cache: Optional[YamlCache]
+) -> Tuple[JSON_TYPE, Set[DEPENDENCY_T]]:
+    """Load a YAML file and return the dependencies found while loading it."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file)
+            return _parse_yaml(conf_file, cache)
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
@@ -67,15 +264,77 @@ def load_yaml(fname: str) -> JSON_TYPE:
 
 def parse_yaml(content: Union[str, TextIO]) -> JSON_TYPE:
     """Load a YAML file."""
+    return _parse_yaml(content, None)[0]
+
+
+def _parse_yaml(
+    content: Union[str, TextIO], cache: Optional[YamlCache]
+) -> Tuple[JSON_TYPE, Set[DEPENDENCY_T]]:
+    """Parse YAML content and return the dependencies found while parsing it.
+
+    The C parser is used when available. When it rejects the content, it is
+    parsed again by the pure Python parser so errors are reported the same
+    way with or without libyaml.
+    """
+    if HAS_C_LOADER:
+        position = None if isinstance(content, str) else content.tell()
+        try:
+            return _load_single_document(FastSafeLoader(content, cache))
+        except yaml.YAMLError:
+            if position is not None:
+                content.seek(position)  # type: ignore
+
     try:
-        # If configuration file is empty YAML returns None
-        # We convert that to an empty dict
-        return yaml.load(content, Loader=SafeLineLoader) or OrderedDict()
+        return _load_single_document(SafeLineLoader(content, cache))
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc) from exc
 
 
+def _load_single_document(
+    loader: Union[FastSafeLoader, SafeLineLoader]
+) -> Tuple[JSON_TYPE, Set[DEPENDENCY_T]]:
+    """Construct the document of a loader."""
+    try:
+        # If configuration file is empty YAML returns None
+        # We convert that to an empty dict
+        return loader.get_single_data() or OrderedDict(), loader.dependencies
+    finally:
+        # The stubs of the C loader lack dispose, it has it at runtime
+        loader.dispose()  # type: ignore[union-attr]
+
+
+def _add_dependencies(loader: yaml.SafeLoader, *dependencies: DEPENDENCY_T) -> None:
+    """Record what the loaded file depends on, if the loader keeps track."""
+    if isinstance(loader, _LoaderMixin):
+        loader.dependencies.update(dependencies)
+
+
+def _add_file_dependency(loader: yaml.SafeLoader, fname: str) -> None:
+    """Record that the loaded file depends on the content of another file."""
+    cache = getattr(loader, "yaml_cache", None)
+    if cache is not None:
+        _add_dependencies(loader, (DEPENDENCY_FILE, fname, cache.file_hash(fname)))
+
+
+def _load_include(loader: SafeLineLoader, fname: str) -> JSON_TYPE:
+    """Load an included YAML file, through the cache of the loader if set."""
+    cache = getattr(loader, "yaml_cache", None)
+    if cache is None:
+        return load_yaml(fname)
+
+    data, dependencies = cache.load_with_dependencies(fname)
+    _add_dependencies(loader, *dependencies)
+    return data
+
+
+def _find_included_files(loader: SafeLineLoader, directory: str) -> List[str]:
+    """Return the YAML files included from a directory."""
+    files = list(_find_files(directory, "*.yaml"))
+    _add_dependencies(loader, (DEPENDENCY_DIR, directory, tuple(files)))
+    return files
+
+
 @overload
 def _add_reference(
     obj: Union[list, NodeListClass], loader: yaml.SafeLoader, node: yaml.nodes.Node
@@ -117,7 +376,7 @@ def _include_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     """
     fname = os.path.join(os.path.dirname(loader.name), node.value)
     try:
-        return _add_reference(load_yaml(fname), loader, node)
+        return _add_reference(_load_include(loader, fname), loader, node)
     except FileNotFoundError as exc:
         raise HomeAssistantError(
             f"{node.start_mark}: Unable to read file {fname}."
@@ -145,11 +404,11 @@ def _include_dir_named_yaml(
     """Load multiple files from directory as a dictionary."""
     mapping: OrderedDict = OrderedDict()
     loc = os.path.join(os.path.dirname(loader.name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_included_files(loader, loc):
         filename = os.path.splitext(os.path.basename(fname))[0]
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        mapping[filename] = load_yaml(fname)
+        mapping[filename] = _load_include(loader, fname)
     return _add_reference(mapping, loader, node)
 
 
@@ -159,10 +418,10 @@ def _include_dir_merge_named_yaml(
     """Load multiple files from directory as a merged dictionary."""
     mapping: OrderedDict = OrderedDict()
     loc = os.path.join(os.path.dirname(loader.name), node.value)
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_included_files(loader, loc):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname)
+        loaded_yaml = _load_include(loader, fname)
         if isinstance(loaded_yaml, dict):
             mapping.update(loaded_yaml)
     return _add_reference(mapping, loader, node)
@@ -174,8 +433,8 @@ def _include_dir_list_yaml(
     """Load multiple files from directory as a list."""
     loc = os.path.join(os.path.dirname(loader.name), node.value)
     return [
-        load_yaml(f)
-        for f in _find_files(loc, "*.yaml")
+        _load_include(loader, f)
+        for f in _find_included_files(loader, loc)
         if os.path.basename(f) != SECRET_YAML
     ]
 
@@ -186,10 +445,10 @@ def _include_dir_merge_list_yaml(
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.name), node.value)
     merged_list: List[JSON_TYPE] = []
-    for fname in _find_files(loc, "*.yaml"):
+    for fname in _find_included_files(loader, loc):
         if os.path.basename(fname) == SECRET_YAML:
             continue
-        loaded_yaml = load_yaml(fname)
+        loaded_yaml = _load_include(loader, fname)
         if isinstance(loaded_yaml, list):
             merged_list.extend(loaded_yaml)
     return _add_reference(merged_list, loader, node)
@@ -236,6 +495,7 @@ def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
 def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
+    _add_dependencies(loader, (DEPENDENCY_ENV, args[0], os.environ.get(args[0])))
 
     # Check for a default value
     if len(args) > 1:
@@ -277,6 +537,8 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load secrets and embed it into the configuration YAML."""
     secret_path = os.path.dirname(loader.name)
     while True:
+        secrets_file = os.path.join(secret_path, SECRET_YAML)
+        _add_file_dependency(loader, secrets_file)
         secrets = _load_secret_yaml(secret_path)
 
         if node.value in secrets:
@@ -307,6 +569,7 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
                 )
 
             _LOGGER.debug("Secret %s retrieved from keyring", node.value)
+            _add_dependencies(loader, (DEPENDENCY_VOLATILE,))
             return pwd
 
     global credstash  # pylint: disable=invalid-name, global-statement
@@ -324,6 +587,7 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
                         "Credstash is deprecated and will be removed in March 2021."
                     )
                 _LOGGER.debug("Secret %s retrieved from credstash", node.value)
+                _add_dependencies(loader, (DEPENDENCY_VOLATILE,))
                 return pwd
         except credstash.ItemNotFound:
             pass
@@ -334,19 +598,22 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     raise HomeAssistantError(f"Secret {node.value} not defined")
 
 
-yaml.SafeLoader.add_constructor("!include", _include_yaml)
-yaml.SafeLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
-)
-yaml.SafeLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq
-)
-yaml.SafeLoader.add_constructor("!env_var", _env_var_yaml)
-yaml.SafeLoader.add_constructor("!secret", secret_yaml)
-yaml.SafeLoader.add_constructor("!include_dir_list", _include_dir_list_yaml)
-yaml.SafeLoader.add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
-yaml.SafeLoader.add_constructor("!include_dir_named", _include_dir_named_yaml)
-yaml.SafeLoader.add_constructor(
-    "!include_dir_merge_named", _include_dir_merge_named_yaml
-)
-yaml.SafeLoader.add_constructor("!input", Input.from_node)
+def add_constructor(tag: str, constructor: Callable[..., Any]) -> None:
+    """Register a constructor with the YAML loaders.
+
+    Also registered with yaml.SafeLoader, so yaml.safe_load handles the tags.
+    """
+    yaml.SafeLoader.add_constructor(tag, constructor)
+    FastSafeLoader.add_constructor(tag, constructor)
+
+
+add_constructor("!include", _include_yaml)
+add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict)
+add_constructor(yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq)
+add_constructor("!env_var", _env_var_yaml)
+add_constructor("!secret", secret_yaml)
+add_constructor("!include_dir_list", _include_dir_list_yaml)
+add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
+add_constructor("!include_dir_named", _include_dir_named_yaml)
+add_constructor("!include_dir_merge_named", _include_dir_merge_named_yaml)
+add_constructor("!input", Input.from_node)
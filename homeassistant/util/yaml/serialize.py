@@ -0,0 +1,121 @@
+"""Store loaded YAML in a JSON string and back.
+
+Unlike dumping it back to YAML, the types the loader creates, like the file
+and line annotations used in error messages, are kept. Every object in the
+JSON string is a tagged value, so it can be decoded by a single object hook.
+"""
+from collections import OrderedDict
+from datetime import date, datetime, time, timedelta
+import json
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .objects import Input, NodeListClass, NodeStrClass
+
+# Return the tag and a JSON compatible value for a type not known here,
+# or raise TypeError.
+ENCODER_T = Callable[[Any], Tuple[str, Any]]  # pylint: disable=invalid-name
+# Return the object for a tag and value, or raise TypeError.
+DECODER_T = Callable[[str, Any], Any]  # pylint: disable=invalid-name
+
+_PLAIN_TYPES = (str, int, float, bool, type(None))
+
+
+def _encode_reference(obj: Any, tagged: Dict[str, Any]) -> Dict[str, Any]:
+    """Add the file reference of an object to its tagged value."""
+    if hasattr(obj, "__config_file__"):
+        tagged["f"] = obj.__config_file__
+    if hasattr(obj, "__line__"):
+        tagged["l"] = obj.__line__
+    return tagged
+
+
+def _encode(obj: Any, default: Optional[ENCODER_T]) -> Any:
+    """Return a JSON compatible value for a loaded object."""
+    # pylint: disable=unidiomatic-typecheck
+    obj_type = type(obj)
+    if obj_type in _PLAIN_TYPES:
+        return obj
+    if obj_type is list:
+        return [_encode(item, default) for item in obj]
+    if isinstance(obj, dict):
+        pairs = [[_encode(key, default), _encode(obj[key], default)] for key in obj]
+        if obj_type is OrderedDict:
+            return _encode_reference(obj, {"t": "odict", "v": pairs})
+        if obj_type is dict:
+            return {"t": "dict", "v": pairs}
+    elif obj_type is NodeListClass:
+        return _encode_reference(
+            obj, {"t": "nlist", "v": [_encode(item, default) for item in obj]}
+        )
+    elif obj_type is NodeStrClass:
+        return _encode_reference(obj, {"t": "nstr", "v": str(obj)})
+    elif obj_type is tuple:
+        return {"t": "tuple", "v": [_encode(item, default) for item in obj]}
+    elif obj_type is set:
+        return {"t": "set", "v": [_encode(item, default) for item in obj]}
+    elif obj_type is Input:
+        return {"t": "input", "v": obj.name}
+    elif obj_type is datetime:
+        return {"t": "datetime", "v": obj.isoformat()}
+    elif obj_type is date:
+        return {"t": "date", "v": obj.isoformat()}
+    elif obj_type is time:
+        return {"t": "time", "v": obj.isoformat()}
+    elif obj_type is timedelta:
+        return {"t": "timedelta", "v": [obj.days, obj.seconds, obj.microseconds]}
+
+    if default is None:
+        raise TypeError(f"Object of type {obj_type.__name__} can't be stored")
+    tag, value = default(obj)
+    return {"t": f"ext:{tag}", "v": _encode(value, default)}
+
+
+def _decode_reference(obj: Any, tagged: Dict[str, Any]) -> Any:
+    """Restore the file reference of a decoded object."""
+    if "f" in tagged:
+        setattr(obj, "__config_file__", tagged["f"])
+    if "l" in tagged:
+        setattr(obj, "__line__", tagged["l"])
+    return obj
+
+
+_DECODERS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "odict": lambda tagged: _decode_reference(OrderedDict(tagged["v"]), tagged),
+    "dict": lambda tagged: dict(tagged["v"]),
+    "nlist": lambda tagged: _decode_reference(NodeListClass(tagged["v"]), tagged),
+    "nstr": lambda tagged: _decode_reference(NodeStrClass(tagged["v"]), tagged),
+    "tuple": lambda tagged: tuple(tagged["v"]),
+    "set": lambda tagged: set(tagged["v"]),
+    "input": lambda tagged: Input(tagged["v"]),
+    "datetime": lambda tagged: datetime.fromisoformat(tagged["v"]),
+    "date": lambda tagged: date.fromisoformat(tagged["v"]),
+    "time": lambda tagged: time.fromisoformat(tagged["v"]),
+    "timedelta": lambda tagged: timedelta(*tagged["v"]),
+}
+
+
+def dumps(obj: Any, default: Optional[ENCODER_T] = None) -> str:
+    """Store a loaded object in a JSON string.
+
+    Raises TypeError if it contains an object of a type that can't be stored.
+    """
+    return json.dumps(_encode(obj, default), separators=(",", ":"))
+
+
+def loads(data: str, object_hook: Optional[DECODER_T] = None) -> Any:
+    """Restore an object stored by dumps.
+
+    Every call returns new objects, which the caller is free to change.
+    """
+
+    def decode(tagged: Dict[str, Any]) -> Any:
+        """Decode a tagged value."""
+        tag = tagged["t"]
+        decoder = _DECODERS.get(tag)
+        if decoder is not None:
+            return decoder(tagged)
+        if object_hook is None or not tag.startswith("ext:"):
+            raise TypeError(f"Unknown tag {tag}")
+        return object_hook(tag[4:], tagged["v"])
+
+    return json.loads(data, object_hook=decode)
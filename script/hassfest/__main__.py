@@ -10,6 +10,7 @@ from . import (
     coverage,
     dependencies,
     dhcp,
+    integrations,
     json,
     manifest,
     mqtt,
@@ -33,6 +34,7 @@ INTEGRATION_PLUGINS = [
     translations,
     zeroconf,
     dhcp,
+    integrations,
 ]
 HASS_PLUGINS = [
     coverage,
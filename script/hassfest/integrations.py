@@ -0,0 +1,129 @@
+"""Generate the integration manifest index."""
+import json
+from typing import Dict, List, Optional, Set
+
+from .model import Config, Integration
+
+BASE = """
+\"\"\"Automatically generated by hassfest.
+
+To update, run python3 -m script.hassfest
+\"\"\"
+
+# fmt: off
+
+MANIFESTS = {}
+
+ALL_DEPENDENCIES = {}
+""".strip()
+
+
+def to_python(value, indent: int = 0) -> str:
+    """Format a JSON value as a Python literal, indented like json.dumps."""
+    pad = " " * indent
+
+    if isinstance(value, dict) and value:
+        items = ",\n".join(
+            f"{pad}    {json.dumps(key)}: {to_python(item, indent + 4)}"
+            for key, item in value.items()
+        )
+        return f"{{\n{items}\n{pad}}}"
+
+    if isinstance(value, list) and value:
+        items = ",\n".join(f"{pad}    {to_python(item, indent + 4)}" for item in value)
+        return f"[\n{items}\n{pad}]"
+
+    if isinstance(value, bool) or value is None:
+        return repr(value)
+
+    return json.dumps(value)
+
+
+def _all_dependencies(
+    integrations: Dict[str, Integration], domain: str
+) -> Optional[Set[str]]:
+    """Return all dependencies of an integration, None if unresolvable.
+
+    This follows the rules of the loader, so a missing or circular
+    dependency leaves the integration to be resolved at runtime.
+    """
+    loaded: Set[str] = set()
+    loading: Set[str] = set()
+
+    def resolve(current: str) -> bool:
+        loading.add(current)
+
+        for dependency in integrations[current].dependencies:
+            if dependency in loaded:
+                continue
+            if dependency in loading or dependency not in integrations:
+                return False
+
+            loaded.add(dependency)
+            dep_integration = integrations[dependency]
+
+            if domain in dep_integration.manifest.get("after_dependencies", []):
+                return False
+
+            if dep_integration.dependencies and not resolve(dependency):
+                return False
+
+        loaded.add(current)
+        loading.remove(current)
+        return True
+
+    if not resolve(domain):
+        return None
+
+    loaded.discard(domain)
+    return loaded
+
+
+def generate_and_validate(integrations: Dict[str, Integration]):
+    """Validate and generate the manifest index."""
+    manifests = {}
+    all_dependencies: Dict[str, List[str]] = {}
+
+    for domain in sorted(integrations):
+        integration = integrations[domain]
+
+        if not integration.manifest:
+            continue
+
+        manifests[domain] = integration.manifest
+
+        if not integration.dependencies:
+            continue
+
+        dependencies = _all_dependencies(integrations, domain)
+
+        if dependencies is not None:
+            all_dependencies[domain] = sorted(dependencies)
+
+    return BASE.format(to_python(manifests), to_python(all_dependencies))
+
+
+def validate(integrations: Dict[str, Integration], config: Config):
+    """Validate the manifest index."""
+    index_path = config.root / "homeassistant/generated/integrations.py"
+    config.cache["integrations"] = content = generate_and_validate(integrations)
+
+    if config.specific_integrations:
+        return
+
+    with open(str(index_path)) as fp:
+        if fp.read().strip() != content:
+            config.add_error(
+                "integrations",
+                "File integrations.py is not up to date. "
+                "Run python3 -m script.hassfest",
+                fixable=True,
+            )
+        return
+
+
+def generate(integrations: Dict[str, Integration], config: Config):
+    """Generate the manifest index."""
+    index_path = config.root / "homeassistant/generated/integrations.py"
+    with open(str(index_path), "w") as fp:
+        fp.write(f"{config.cache['integrations']}\n")
@@ -1,7 +1,8 @@
-"""Validate dependencies."""
+"""Validate services and generate the service description index."""
+import json
 import pathlib
 import re
-from typing import Dict
+from typing import Any, Dict
 
 import voluptuous as vol
 from voluptuous.humanize import humanize_error
@@ -11,7 +12,9 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv, selector
 from homeassistant.util.yaml import load_yaml
 
-from .model import Integration
+from .model import Config, Integration
+
+DESCRIPTION_KEYS = ("description", "fields")
 
 
 def exists(value):
@@ -85,7 +88,41 @@ def validate_services(integration: Integration):
         )
 
 
-def validate(integrations: Dict[str, Integration], config):
+def generate_descriptions(integrations: Dict[str, Integration]) -> str:
+    """Generate the index of service descriptions of built-in integrations.
+
+    Only the keys used for the descriptions at runtime are kept.
+    """
+    index: Dict[str, Dict[str, Any]] = {}
+
+    for domain in sorted(integrations):
+        integration = integrations[domain]
+        services_file = integration.path / "services.yaml"
+
+        if not integration.manifest or not services_file.is_file():
+            continue
+
+        try:
+            data = load_yaml(str(services_file))
+        except HomeAssistantError:
+            continue
+
+        if not isinstance(data, dict):
+            continue
+
+        index[domain] = {
+            service: {
+                key: description[key] for key in DESCRIPTION_KEYS if key in description
+            }
+            if isinstance(description, dict)
+            else description
+            for service, description in data.items()
+        }
+
+    return json.dumps(index, indent=2)
+
+
+def validate(integrations: Dict[str, Integration], config: Config):
     """Handle dependencies for integrations."""
     # check services.yaml is cool
     for integration in integrations.values():
@@ -93,3 +130,25 @@ def validate(integrations: Dict[str, Integration], config):
             continue
 
         validate_services(integration)
+
+    index_path = config.root / "homeassistant/generated/services.json"
+    config.cache["services"] = content = generate_descriptions(integrations)
+
+    if config.specific_integrations:
+        return
+
+    with open(str(index_path)) as fp:
+        if fp.read().strip() != content:
+            config.add_error(
+                "services",
+                "File services.json is not up to date. "
+                "Run python3 -m script.hassfest",
+                fixable=True,
+            )
+
+
+def generate(integrations: Dict[str, Integration], config: Config):
+    """Generate the service description index."""
+    index_path = config.root / "homeassistant/generated/services.json"
+    with open(str(index_path), "w") as fp:
+        fp.write(f"{config.cache['services']}\n")
@@ -0,0 +1,67 @@
+"""Tests for the permissions classes."""
+import attr
+
+from homeassistant.auth import auth_store
+from homeassistant.auth.permissions import PolicyPermissions
+from homeassistant.auth.permissions.models import PermissionLookup
+from homeassistant.helpers.device_registry import (
+    EVENT_DEVICE_REGISTRY_UPDATED,
+    DeviceEntry,
+)
+from homeassistant.helpers.entity_registry import RegistryEntry
+
+from tests.common import mock_device_registry, mock_registry
+
+
+def test_entity_permissions_cached_per_policy(hass):
+    """Test entity permission results are shared by equal policies."""
+    entity_registry = mock_registry(
+        hass,
+        {
+            "light.kitchen": RegistryEntry(
+                entity_id="light.kitchen",
+                unique_id="1234",
+                platform="test_platform",
+                device_id="mock-dev-id",
+            )
+        },
+    )
+    device_registry = mock_device_registry(
+        hass, {"mock-dev-id": DeviceEntry(id="mock-dev-id", area_id="mock-area-id")}
+    )
+    perm_lookup = PermissionLookup(entity_registry, device_registry)
+    policy = {"entities": {"area_ids": {"mock-area-id": True}}}
+
+    perms = PolicyPermissions(policy, perm_lookup)
+    assert perms.check_entity("light.kitchen", "read") is True
+    assert perms.check_entity("light.other", "read") is False
+    assert len(perm_lookup.entity_caches) == 1
+
+    device_registry.devices["mock-dev-id"] = attr.evolve(
+        device_registry.devices["mock-dev-id"], area_id="other-area-id"
+    )
+
+    # A user with an equal policy gets the cached result
+    other_perms = PolicyPermissions({**policy}, perm_lookup)
+    assert other_perms.check_entity("light.kitchen", "read") is True
+    assert len(perm_lookup.entity_caches) == 1
+
+    perm_lookup.invalidate_entity_caches()
+    assert perms.check_entity("light.kitchen", "read") is False
+    assert other_perms.check_entity("light.kitchen", "read") is False
+
+
+async def test_registry_update_invalidates_entity_permissions(hass):
+    """Test registry updates drop the cached entity permissions."""
+    store = auth_store.AuthStore(hass)
+    await store.async_get_users()
+    perm_lookup = store._perm_lookup
+    cache = perm_lookup.entity_cache("policy")
+    cache[("light.kitchen", "read")] = True
+
+    hass.bus.async_fire(
+        EVENT_DEVICE_REGISTRY_UPDATED, {"action": "remove", "device_id": "mock"}
+    )
+    await hass.async_block_till_done()
+
+    assert cache == {}
@@ -241,3 +241,23 @@ async def test_loading_race_condition(hass):
         mock_dev_registry.assert_called_once_with(hass)
         mock_load.assert_called_once_with()
         assert results[0] == results[1]
+
+
+async def test_get_refresh_token_by_token(hass):
+    """Test looking up refresh tokens by token."""
+    store = auth_store.AuthStore(hass)
+    user = await store.async_create_user("Test User")
+    refresh_token = await store.async_create_refresh_token(user, "http://example.com")
+
+    assert await store.async_get_refresh_token_by_token(refresh_token.token) is (
+        refresh_token
+    )
+    assert await store.async_get_refresh_token_by_token("invalid") is None
+
+    other_token = await store.async_create_refresh_token(user, "http://other.com")
+    assert await store.async_get_refresh_token_by_token(other_token.token) is (
+        other_token
+    )
+
+    await store.async_remove_refresh_token(refresh_token)
+    assert await store.async_get_refresh_token_by_token(refresh_token.token) is None
@@ -344,6 +344,66 @@ async def test_cannot_retrieve_expired_access_token(hass):
     assert await manager.async_validate_access_token(access_token) is None
 
 
+async def test_access_token_validation_cached(hass):
+    """Test validated access tokens are cached until they are revoked."""
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    with patch("homeassistant.auth.jwt.decode") as mock_decode:
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+    assert len(mock_decode.mock_calls) == 0
+
+    user.is_active = False
+    assert await manager.async_validate_access_token(access_token) is None
+    user.is_active = True
+
+    await manager.async_remove_refresh_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is None
+
+
+async def test_access_token_cache_expires(hass):
+    """Test cached access tokens are validated again once expired."""
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    with patch(
+        "homeassistant.util.dt.utcnow",
+        return_value=dt_util.utcnow()
+        + auth_const.ACCESS_TOKEN_EXPIRATION
+        + timedelta(seconds=11),
+    ), patch("homeassistant.auth.jwt.decode", side_effect=jwt.ExpiredSignatureError):
+        assert await manager.async_validate_access_token(access_token) is None
+
+    assert manager._access_token_cache == {}
+
+
+async def test_access_token_cache_bounded(hass):
+    """Test the access token cache drops the least recently used tokens."""
+    manager = await auth.auth_manager_from_config(hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+
+    with patch("homeassistant.auth.ACCESS_TOKEN_CACHE_SIZE", 2):
+        tokens = []
+        for idx in range(3):
+            with patch(
+                "homeassistant.util.dt.utcnow",
+                return_value=dt_util.utcnow() + timedelta(seconds=idx),
+            ):
+                tokens.append(manager.async_create_access_token(refresh_token))
+            assert await manager.async_validate_access_token(tokens[-1])
+
+    assert list(manager._access_token_cache) == tokens[1:]
+
+
 async def test_generating_system_user(hass):
     """Test that we can add a system user."""
     events = []
@@ -46,6 +46,7 @@ from homeassistant.const import (
 from homeassistant.core import State
 from homeassistant.helpers import (
     area_registry,
+    config_cache,
     device_registry,
     entity,
     entity_platform,
@@ -111,6 +112,10 @@ def get_test_home_assistant():
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     hass = loop.run_until_complete(async_test_home_assistant(loop))
+    # Storage isn't mocked, keep the configuration cache out of the config dir
+    hass.data[config_cache.DATA_CONFIG_CACHE] = config_cache.ConfigCache(
+        hass, Mock(), {}
+    )
 
     loop_stop_event = threading.Event()
 
@@ -914,6 +919,7 @@ def mock_storage(data=None):
     Data is a dict {'key': {'version': version, 'data': data}}
 
     Written data will be converted to JSON to ensure JSON parsing works.
+    The restore state snapshot is kept as bytes under its file name.
     """
     if data is None:
         data = {}
@@ -950,6 +956,23 @@ def mock_storage(data=None):
         """Remove data."""
         data.pop(store.key, None)
 
+    def mock_snapshot_read(snapshot):
+        """Mock version of reading the restore state snapshot."""
+        return data.get(os.path.basename(snapshot.path))
+
+    def mock_snapshot_write_file(snapshot, content):
+        """Mock version of replacing the restore state snapshot."""
+        data[os.path.basename(snapshot.path)] = bytes(content)
+
+    def mock_snapshot_append(snapshot, header, records):
+        """Mock version of appending to the restore state snapshot."""
+        key = os.path.basename(snapshot.path)
+        data[key] = header + data[key][len(header) :] + records
+
+    def mock_snapshot_remove(snapshot):
+        """Mock version of removing the restore state snapshot."""
+        data.pop(os.path.basename(snapshot.path), None)
+
     with patch(
         "homeassistant.helpers.storage.Store._async_load",
         side_effect=mock_async_load,
@@ -962,6 +985,22 @@ def mock_storage(data=None):
         "homeassistant.helpers.storage.Store.async_remove",
         side_effect=mock_remove,
         autospec=True,
+    ), patch(
+        "homeassistant.helpers.restore_state.StateSnapshot._read",
+        side_effect=mock_snapshot_read,
+        autospec=True,
+    ), patch(
+        "homeassistant.helpers.restore_state.StateSnapshot._write_file",
+        side_effect=mock_snapshot_write_file,
+        autospec=True,
+    ), patch(
+        "homeassistant.helpers.restore_state.StateSnapshot._append",
+        side_effect=mock_snapshot_append,
+        autospec=True,
+    ), patch(
+        "homeassistant.helpers.restore_state.StateSnapshot.remove",
+        side_effect=mock_snapshot_remove,
+        autospec=True,
     ):
         yield data
 
@@ -9,8 +9,9 @@ import voluptuous as vol
 
 from homeassistant import const
 from homeassistant.bootstrap import DATA_LOGGING
+from homeassistant.components import api
 import homeassistant.core as ha
-from homeassistant.setup import async_setup_component
+from homeassistant.setup import async_get_setup_timeline, async_setup_component
 
 from tests.common import async_mock_service
 
@@ -408,6 +409,26 @@ async def test_api_error_log(hass, aiohttp_client, hass_access_token, hass_admin
     assert resp.status == 401
 
 
+async def test_api_startup_trace(hass, mock_api_client, hass_admin_user):
+    """Test downloading the startup timeline as a Chrome trace."""
+    timeline = async_get_setup_timeline(hass)
+    timeline.add_span("http", "setup", timeline.origin, timeline.origin + 1)
+
+    resp = await mock_api_client.get(const.URL_API_STARTUP_TRACE)
+    assert resp.status == 200
+    assert resp.headers["Content-Disposition"] == (
+        'attachment; filename="startup_trace.json"'
+    )
+    data = await resp.json()
+    assert data["traceEvents"][1]["name"] == "setup"
+    assert data["traceEvents"][1]["dur"] == 1_000_000
+    assert data["otherData"]["critical_path"] == ["http"]
+
+    hass_admin_user.groups = []
+    resp = await mock_api_client.get(const.URL_API_STARTUP_TRACE)
+    assert resp.status == 401
+
+
 async def test_api_fire_event_context(hass, mock_api_client, hass_access_token):
     """Test if the API sets right context if we fire an event."""
     test_value = []
@@ -551,3 +572,260 @@ async def test_api_call_service_bad_data(hass, mock_api_client):
         "/api/services/test_domain/test_service", json={"hello": 5}
     )
     assert resp.status == 400
+
+
+async def test_stream_with_entity_filter(hass, mock_api_client):
+    """Test the stream filtered by entity ID and domain."""
+    resp = await mock_api_client.get(
+        f"{const.URL_API_STREAM}?entity_id=light.kitchen&domain=switch"
+    )
+    assert resp.status == 200
+
+    hass.bus.async_fire("test_event")
+    hass.states.async_set("light.hallway", "on")
+    hass.states.async_set("light.kitchen", "on")
+    data = await _stream_next_event(resp.content)
+    assert data["data"]["entity_id"] == "light.kitchen"
+
+    hass.states.async_set("sensor.temperature", "20")
+    hass.states.async_set("switch.fan", "off")
+    data = await _stream_next_event(resp.content)
+    assert data["data"]["entity_id"] == "switch.fan"
+
+
+async def test_stream_drop_oldest(hass, mock_api_client, caplog):
+    """Test a full stream drops the oldest events."""
+    with patch("homeassistant.components.api.STREAM_MAX_PENDING", 2):
+        resp = await mock_api_client.get(f"{const.URL_API_STREAM}?restrict=test_event")
+        assert resp.status == 200
+
+        for idx in range(5):
+            hass.bus.async_fire("test_event", {"idx": idx})
+
+        data = await _stream_next_event(resp.content)
+        assert data["data"] == {"idx": 3}
+        data = await _stream_next_event(resp.content)
+        assert data["data"] == {"idx": 4}
+
+        # The stream is closed when Home Assistant stops
+        hass.bus.async_fire(const.EVENT_HOMEASSISTANT_STOP)
+        assert await resp.content.read() == b""
+
+    assert hass.data[api.DATA_STREAM_STATS][api.ATTR_DROPPED_EVENTS] == 3
+    assert "3 events dropped (3 events dropped since start)" in caplog.text
+
+
+async def test_stream_disconnect(hass, mock_api_client, caplog):
+    """Test a full stream is closed with the disconnect policy."""
+    listen_count = _listen_count(hass)
+
+    with patch("homeassistant.components.api.STREAM_MAX_PENDING", 2):
+        resp = await mock_api_client.get(
+            f"{const.URL_API_STREAM}?restrict=test_event&overflow=disconnect"
+        )
+        assert resp.status == 200
+
+        for idx in range(3):
+            hass.bus.async_fire("test_event", {"idx": idx})
+
+        assert b"test_event" not in await resp.content.read()
+
+    assert listen_count == _listen_count(hass)
+    stats = hass.data[api.DATA_STREAM_STATS]
+    assert stats[api.ATTR_DISCONNECTED_STREAMS] == 1
+    assert "(1 streams disconnected since start)" in caplog.text
+
+
+async def test_stream_invalid_overflow(hass, mock_api_client):
+    """Test an unknown overflow policy is rejected."""
+    resp = await mock_api_client.get(f"{const.URL_API_STREAM}?overflow=grow")
+    assert resp.status == 400
+
+
+async def test_api_batch_state_change(hass, mock_api_client):
+    """Test setting the states of several entities in one request."""
+    hass.states.async_set("test.existing", "off")
+
+    resp = await mock_api_client.post(
+        const.URL_API_STATES,
+        json=[
+            {"entity_id": "test.existing", "state": "on"},
+            {"entity_id": "test.new", "state": "hello", "attributes": {"a": 1}},
+            {"entity_id": "test.no_state"},
+            {"entity_id": "invalid", "state": "on"},
+        ],
+    )
+    assert resp.status == 200
+    results = await resp.json()
+
+    assert [result["success"] for result in results] == [True, True, False, False]
+    assert results[0]["created"] is False
+    assert results[1]["created"] is True
+    assert results[1]["state"]["attributes"] == {"a": 1}
+    assert results[2] == {
+        "success": False,
+        "error": "No state specified.",
+        "entity_id": "test.no_state",
+    }
+    assert hass.states.get("test.existing").state == "on"
+    assert hass.states.get("test.new").state == "hello"
+
+
+async def test_api_batch_state_change_requires_admin(
+    hass, mock_api_client, hass_admin_user
+):
+    """Test batch state changes need an admin."""
+    hass_admin_user.groups = []
+    resp = await mock_api_client.post(
+        const.URL_API_STATES, json=[{"entity_id": "test.new", "state": "on"}]
+    )
+    assert resp.status == 401
+
+
+async def test_api_batch_state_change_requires_list(hass, mock_api_client):
+    """Test batch state changes need a list."""
+    resp = await mock_api_client.post(
+        const.URL_API_STATES, json={"entity_id": "test.new", "state": "on"}
+    )
+    assert resp.status == 400
+
+
+async def test_api_batch_call_services(hass, mock_api_client):
+    """Test calling several services in one request."""
+    calls = async_mock_service(hass, "test_domain", "test_service")
+
+    resp = await mock_api_client.post(
+        const.URL_API_SERVICES,
+        json=[
+            {"domain": "test_domain", "service": "test_service"},
+            {
+                "domain": "test_domain",
+                "service": "test_service",
+                "service_data": {"hello": 5},
+            },
+            {"domain": "test_domain", "service": "missing"},
+            {"service": "test_service"},
+        ],
+    )
+    assert resp.status == 200
+    results = await resp.json()
+
+    assert [result["success"] for result in results] == [True, True, False, False]
+    assert results[3]["error"] == "No domain and service specified."
+    assert len(calls) == 2
+    assert calls[1].data == {"hello": 5}
+
+
+async def test_api_batch_state_change_malformed_items(hass, mock_api_client):
+    """Test malformed items fail on their own in a batch state change."""
+    resp = await mock_api_client.post(
+        const.URL_API_STATES,
+        json=[
+            "test.string",
+            {"entity_id": 5, "state": "on"},
+            {"entity_id": "test.list_attributes", "state": "on", "attributes": [1]},
+            {"entity_id": "test.dict_state", "state": {"on": True}},
+            {"entity_id": "test.valid", "state": 5},
+        ],
+    )
+    assert resp.status == 200
+    results = await resp.json()
+
+    assert results[:4] == [
+        {"success": False, "error": "Each item should be an object."},
+        {"success": False, "error": "entity_id should be a string."},
+        {
+            "success": False,
+            "error": "attributes should be an object.",
+            "entity_id": "test.list_attributes",
+        },
+        {
+            "success": False,
+            "error": "state should be a string or number.",
+            "entity_id": "test.dict_state",
+        },
+    ]
+    assert results[4]["success"] is True
+    assert hass.states.get("test.valid").state == "5"
+    assert hass.states.get("test.list_attributes") is None
+
+
+async def test_api_batch_call_services_malformed_items(hass, mock_api_client):
+    """Test malformed items and failing calls fail on their own in a batch."""
+    calls = async_mock_service(hass, "test_domain", "test_service")
+
+    async def failing_service(call):
+        """Raise an unexpected error."""
+        raise ZeroDivisionError
+
+    hass.services.async_register("test_domain", "failing", failing_service)
+
+    resp = await mock_api_client.post(
+        const.URL_API_SERVICES,
+        json=[
+            ["test_domain", "test_service"],
+            {"domain": 5, "service": "test_service"},
+            {
+                "domain": "test_domain",
+                "service": "test_service",
+                "service_data": [1],
+            },
+            {"domain": "test_domain", "service": "failing"},
+            {"domain": "test_domain", "service": "test_service"},
+        ],
+    )
+    assert resp.status == 200
+    results = await resp.json()
+
+    assert results == [
+        {"success": False, "error": "Each item should be an object."},
+        {"success": False, "error": "domain should be a string."},
+        {"success": False, "error": "service_data should be an object."},
+        {"success": False, "error": "Unknown error."},
+        {"success": True},
+    ]
+    assert len(calls) == 1
+
+
+async def test_api_get_services_etag(hass, mock_api_client):
+    """Test unchanged services are answered with 304."""
+    resp = await mock_api_client.get(const.URL_API_SERVICES)
+    assert resp.status == 200
+    etag = resp.headers["ETag"]
+
+    resp = await mock_api_client.get(
+        const.URL_API_SERVICES, headers={"If-None-Match": etag}
+    )
+    assert resp.status == 304
+    assert resp.headers["ETag"] == etag
+
+    hass.services.async_register("light", "test_service", lambda call: None)
+    await hass.async_block_till_done()
+
+    resp = await mock_api_client.get(
+        const.URL_API_SERVICES, headers={"If-None-Match": etag}
+    )
+    assert resp.status == 200
+    assert resp.headers["ETag"] != etag
+    assert "light" in [item["domain"] for item in await resp.json()]
+
+
+async def test_api_get_config_etag(hass, mock_api_client):
+    """Test unchanged config is answered with 304."""
+    resp = await mock_api_client.get(const.URL_API_CONFIG)
+    assert resp.status == 200
+    etag = resp.headers["ETag"]
+
+    resp = await mock_api_client.get(
+        const.URL_API_CONFIG, headers={"If-None-Match": etag}
+    )
+    assert resp.status == 304
+
+    await hass.config.async_update(location_name="Elsewhere")
+    await hass.async_block_till_done()
+
+    resp = await mock_api_client.get(
+        const.URL_API_CONFIG, headers={"If-None-Match": etag}
+    )
+    assert resp.status == 200
+    assert (await resp.json())["location_name"] == "Elsewhere"
@@ -664,6 +664,7 @@ async def test_automation_stops(hass, calls, service):
             blocking=True,
         )
     else:
+        config[automation.DOMAIN]["trigger"]["event_type"] = "test_event_2"
         with patch(
             "homeassistant.config.load_yaml_config_file",
             autospec=True,
@@ -679,6 +680,91 @@ async def test_automation_stops(hass, calls, service):
     assert len(calls) == (1 if service == "turn_off_no_stop" else 0)
 
 
+async def test_reload_unchanged_automation_keeps_running(hass, calls):
+    """Test reload only replaces automations that were changed or removed."""
+    test_entity = "test.entity"
+
+    config = {
+        automation.DOMAIN: [
+            {
+                "alias": "unchanged",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": [
+                    {"event": "running"},
+                    {"wait_template": "{{ is_state('test.entity', 'goodbye') }}"},
+                    {"service": "test.automation", "data": {"source": "unchanged"}},
+                ],
+            },
+            {
+                "alias": "changed",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": [
+                    {"wait_template": "{{ is_state('test.entity', 'goodbye') }}"},
+                    {"service": "test.automation", "data": {"source": "changed"}},
+                ],
+            },
+            {
+                "alias": "removed",
+                "trigger": {"platform": "event", "event_type": "test_event"},
+                "action": {"event": "removed"},
+            },
+        ]
+    }
+    assert await async_setup_component(hass, automation.DOMAIN, config)
+    unchanged_entity = hass.data[automation.DOMAIN].get_entity("automation.unchanged")
+
+    running = asyncio.Event()
+
+    @callback
+    def running_cb(event):
+        running.set()
+
+    hass.bus.async_listen_once("running", running_cb)
+    hass.states.async_set(test_entity, "hello")
+
+    hass.bus.async_fire("test_event")
+    await running.wait()
+
+    new_config = {
+        automation.DOMAIN: [
+            config[automation.DOMAIN][0],
+            {
+                **config[automation.DOMAIN][1],
+                "trigger": {"platform": "event", "event_type": "test_event_2"},
+            },
+            {
+                "alias": "added",
+                "trigger": {"platform": "event", "event_type": "test_event_2"},
+                "action": {"service": "test.automation"},
+            },
+        ]
+    }
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value=new_config,
+    ):
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    assert (
+        hass.data[automation.DOMAIN].get_entity("automation.unchanged")
+        is unchanged_entity
+    )
+    assert hass.states.get("automation.changed") is not None
+    assert hass.states.get("automation.removed") is None
+    assert hass.states.get("automation.added") is not None
+
+    listeners = hass.bus.async_listeners()
+    assert listeners.get("test_event") == 1
+    assert listeners.get("test_event_2") == 2
+
+    hass.states.async_set(test_entity, "goodbye")
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert calls[0].data["source"] == "unchanged"
+
+
 async def test_automation_restore_state(hass):
     """Ensure states are restored on startup."""
     time = dt_util.utcnow()
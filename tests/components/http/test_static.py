@@ -0,0 +1,135 @@
+"""Test static file handling."""
+import gzip
+import mimetypes
+
+from aiohttp import web
+import pytest
+
+from homeassistant.components.http import static
+from homeassistant.components.http.static import (
+    CACHE_HEADERS,
+    IMMUTABLE_CACHE_HEADERS,
+    CachingStaticResource,
+)
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    """Create a directory with static files."""
+    (tmp_path / "app.js").write_text("console.log('app')")
+    (tmp_path / "chunk.0a1b2c3d4e5f.js").write_text("console.log('chunk')")
+    (tmp_path / "chunk.0a1b2c3d4e5f.js.gz").write_bytes(
+        gzip.compress(b"console.log('chunk')")
+    )
+    (tmp_path / "chunk.0a1b2c3d4e5f.js.br").write_bytes(b"brotli")
+    return tmp_path
+
+
+@pytest.fixture
+async def static_client(aiohttp_client, static_dir):
+    """Return a client serving the static directory."""
+    app = web.Application()
+    app.router.register_resource(
+        CachingStaticResource("/static", str(static_dir), content_hashed=True)
+    )
+    app.router.register_resource(CachingStaticResource("/local", str(static_dir)))
+    return await aiohttp_client(app, auto_decompress=False)
+
+
+async def test_serve_file(static_client):
+    """Test a file without content hash gets the regular cache headers."""
+    resp = await static_client.get("/static/app.js", headers={"Accept-Encoding": ""})
+    assert resp.status == 200
+    assert await resp.read() == b"console.log('app')"
+    assert resp.headers["Cache-Control"] == CACHE_HEADERS["Cache-Control"]
+    assert resp.headers["Content-Type"] == mimetypes.guess_type("app.js")[0]
+    assert "Content-Encoding" not in resp.headers
+    assert "Vary" not in resp.headers
+
+    resp = await static_client.get("/static/missing.js")
+    assert resp.status == 404
+
+
+async def test_serve_precompressed(static_client):
+    """Test the precompressed variant is picked from Accept-Encoding."""
+    url = "/static/chunk.0a1b2c3d4e5f.js"
+
+    resp = await static_client.get(url, headers={"Accept-Encoding": "gzip, br"})
+    assert resp.status == 200
+    assert resp.headers["Content-Encoding"] == "br"
+    assert resp.headers["Content-Type"] == mimetypes.guess_type("app.js")[0]
+    assert resp.headers["Vary"] == "Accept-Encoding"
+    assert await resp.read() == b"brotli"
+
+    resp = await static_client.get(url, headers={"Accept-Encoding": "gzip, br;q=0"})
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(await resp.read()) == b"console.log('chunk')"
+
+    resp = await static_client.get(url, headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in resp.headers
+    assert await resp.read() == b"console.log('chunk')"
+
+
+async def test_immutable_files_kept_in_memory(static_client, static_dir):
+    """Test content-hashed files are cached forever and served from memory."""
+    url = "/static/chunk.0a1b2c3d4e5f.js"
+
+    resp = await static_client.get(url, headers={"Accept-Encoding": "identity"})
+    assert resp.status == 200
+    assert resp.headers["Cache-Control"] == IMMUTABLE_CACHE_HEADERS["Cache-Control"]
+    last_modified = resp.headers["Last-Modified"]
+
+    (static_dir / "chunk.0a1b2c3d4e5f.js").unlink()
+
+    resp = await static_client.get(url, headers={"Accept-Encoding": "identity"})
+    assert resp.status == 200
+    assert await resp.read() == b"console.log('chunk')"
+
+    resp = await static_client.get(
+        url,
+        headers={"Accept-Encoding": "identity", "If-Modified-Since": last_modified},
+    )
+    assert resp.status == 304
+
+
+async def test_not_content_hashed(static_client, static_dir):
+    """Test hash-like file names are not cached forever outside build output."""
+    (static_dir / "snapshot_20210115.jpg").write_bytes(b"first")
+    url = "/local/snapshot_20210115.jpg"
+
+    resp = await static_client.get(url)
+    assert resp.status == 200
+    assert resp.headers["Cache-Control"] == CACHE_HEADERS["Cache-Control"]
+    assert await resp.read() == b"first"
+
+    (static_dir / "snapshot_20210115.jpg").write_bytes(b"second")
+
+    resp = await static_client.get(url)
+    assert await resp.read() == b"second"
+
+    resp = await static_client.get("/local/chunk.0a1b2c3d4e5f.js")
+    assert resp.headers["Cache-Control"] == CACHE_HEADERS["Cache-Control"]
+
+    _, resource = static_client.app.router.resources()
+    assert not resource._immutable_files
+
+
+async def test_memory_cache_is_bounded(static_client, monkeypatch):
+    """Test large files are streamed from disk instead of kept in memory."""
+    monkeypatch.setattr(static, "MAX_MEMORY_FILE_SIZE", 8)
+
+    resp = await static_client.get(
+        "/static/chunk.0a1b2c3d4e5f.js", headers={"Accept-Encoding": "br"}
+    )
+    assert resp.status == 200
+    assert await resp.read() == b"brotli"
+
+    resource, _ = static_client.app.router.resources()
+    static_file = resource._immutable_files["chunk.0a1b2c3d4e5f.js"]
+    assert list(static_file.bodies) == ["br"]
+
+
+async def test_forbidden_paths(static_client):
+    """Test paths outside the static directory are not served."""
+    resp = await static_client.get("/static/../../etc/passwd")
+    assert resp.status == 404
@@ -1,4 +1,5 @@
 """Tests for Home Assistant View."""
+import json
 from unittest.mock import AsyncMock, Mock
 
 from aiohttp.web_exceptions import (
@@ -10,6 +11,7 @@ import pytest
 import voluptuous as vol
 
 from homeassistant.components.http.view import (
+    JSON_COMPRESS_MIN_SIZE,
     HomeAssistantView,
     request_handler_factory,
 )
@@ -38,6 +40,33 @@ async def test_invalid_json(caplog):
     assert str(float("NaN")) in caplog.text
 
 
+async def test_json_compression_threshold():
+    """Test only large JSON responses are compressed."""
+    view = HomeAssistantView()
+
+    assert view.json({"small": True})._compression is False
+    assert view.json({"large": "x" * JSON_COMPRESS_MIN_SIZE})._compression is True
+
+
+async def test_json_etag():
+    """Test JSON responses with an ETag."""
+    view = HomeAssistantView()
+
+    response = view.json_etag(Mock(headers={}), "v1", {"hello": "world"})
+    assert response.status == 200
+    assert response.headers["ETag"] == '"v1"'
+    assert json.loads(response.body) == {"hello": "world"}
+
+    request = Mock(headers={"If-None-Match": '"v0", "v1"'})
+    result = Mock(side_effect=AssertionError)
+    response = view.json_etag(request, "v1", result)
+    assert response.status == 304
+    assert response.headers["ETag"] == '"v1"'
+
+    request = Mock(headers={"If-None-Match": '"v0"'})
+    assert view.json_etag(request, "v1", {}).status == 200
+
+
 async def test_handling_unauthorized(mock_request):
     """Test handling unauth exceptions."""
     with pytest.raises(HTTPUnauthorized):
@@ -9,12 +9,14 @@ from homeassistant.components.profiler import (
     CONF_SECONDS,
     CONF_TYPE,
     SERVICE_DUMP_LOG_OBJECTS,
+    SERVICE_LOG_CONDITION_TIMINGS,
     SERVICE_MEMORY,
     SERVICE_START,
     SERVICE_START_LOG_OBJECTS,
     SERVICE_STOP_LOG_OBJECTS,
 )
 from homeassistant.components.profiler.const import DOMAIN
+from homeassistant.helpers import condition
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
@@ -147,3 +149,31 @@ async def test_dump_log_object(hass, caplog):
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_log_condition_timings(hass, caplog):
+    """Test we can log the timings of conditions."""
+
+    await setup.async_setup_component(hass, "persistent_notification", {})
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_LOG_CONDITION_TIMINGS)
+
+    test = await condition.async_from_config(
+        hass, {"condition": "state", "entity_id": "sensor.temperature", "state": "100"}
+    )
+    hass.states.async_set("sensor.temperature", 100)
+    assert test(hass)
+
+    await hass.services.async_call(DOMAIN, SERVICE_LOG_CONDITION_TIMINGS, {})
+    await hass.async_block_till_done()
+
+    assert "state sensor.temperature: 1 evaluations" in caplog.text
+    caplog.clear()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -1,5 +1,6 @@
 """The tests for the Recorder component."""
 from datetime import datetime
+import math
 
 import pytest
 import pytz
@@ -41,6 +42,22 @@ def test_from_event_to_db_state():
     assert state == States.from_event(event).to_native()
 
 
+def test_from_event_to_db_state_nan():
+    """Test states and events with NaN attributes are recorded."""
+    state = ha.State("sensor.temperature", "18", {"value": float("nan")})
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+    )
+
+    assert math.isnan(States.from_event(event).to_native().attributes["value"])
+    assert math.isnan(
+        Events.from_event(ha.Event("test", {"value": float("nan")}))
+        .to_native()
+        .data["value"]
+    )
+
+
 def test_from_event_to_delete_state():
     """Test converting deleting state event to db state."""
     event = ha.Event(
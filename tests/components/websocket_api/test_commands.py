@@ -1,4 +1,6 @@
 """Tests for WebSocket API commands."""
+from unittest.mock import patch
+
 from async_timeout import timeout
 
 from homeassistant.components.websocket_api import const
@@ -11,8 +13,10 @@ from homeassistant.components.websocket_api.const import URL
 from homeassistant.core import Context, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity
+from homeassistant.helpers.service import async_set_service_schema
 from homeassistant.loader import async_get_integration
-from homeassistant.setup import async_setup_component
+from homeassistant.setup import async_get_setup_timeline, async_setup_component
+from homeassistant.util.async_ import run_callback_threadsafe
 
 from tests.common import MockEntity, MockEntityPlatform, async_mock_service
 
@@ -206,6 +210,170 @@ async def test_get_states(hass, websocket_client):
     assert msg["result"] == states
 
 
+async def test_subscribe_entities(hass, websocket_client):
+    """Test subscribe_entities sends a snapshot, then only changes."""
+    hass.states.async_set("light.permitted", "off", {"color": "red", "brightness": 1})
+    hass.states.async_set("light.other", "off")
+    state = hass.states.get("light.permitted")
+
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_entities",
+            "entity_ids": ["light.permitted", "light.missing"],
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.permitted": {
+                "s": "off",
+                "a": {"color": "red", "brightness": 1},
+                "c": state.context.id,
+                "lc": state.last_changed.timestamp(),
+            }
+        }
+    }
+
+    hass.states.async_set("light.other", "on")
+    hass.states.async_set("light.permitted", "off", {"color": "blue"})
+    state = hass.states.get("light.permitted")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "a": {"color": "blue"},
+                    "c": state.context.id,
+                    "lu": state.last_updated.timestamp(),
+                },
+                "-": {"a": ["brightness"]},
+            }
+        }
+    }
+
+    hass.states.async_set("light.missing", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"]["light.missing"]["s"] == "on"
+
+    hass.states.async_remove("light.permitted")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"r": ["light.permitted"]}
+
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+
+
+async def test_subscribe_entities_filters_visible(
+    hass, websocket_client, hass_admin_user
+):
+    """Test subscribe_entities leaves out entities the user cannot read."""
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.permitted": True}}})
+    hass.states.async_set("light.permitted", "off")
+    hass.states.async_set("light.not_permitted", "off")
+
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "subscribe_entities",
+            "entity_ids": ["light.permitted", "light.not_permitted"],
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["light.permitted"]
+
+    hass.states.async_set("light.not_permitted", "on")
+    hass.states.async_set("light.permitted", "on")
+
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["c"]) == ["light.permitted"]
+    assert msg["event"]["c"]["light.permitted"]["+"]["s"] == "on"
+
+
+async def test_get_states_shared_serialization(hass, websocket_client):
+    """Test get_states serializes the states once until one changes."""
+    hass.states.async_set("greeting.hello", "world")
+
+    with patch(
+        "homeassistant.components.websocket_api.commands.const.JSON_DUMP",
+        wraps=const.JSON_DUMP,
+    ) as mock_dump:
+        for iden in (5, 6):
+            await websocket_client.send_json({"id": iden, "type": "get_states"})
+            msg = await websocket_client.receive_json()
+            assert msg["id"] == iden
+            assert msg["success"]
+            assert msg["result"][0]["state"] == "world"
+
+        assert mock_dump.call_count == 1
+
+        hass.states.async_set("greeting.hello", "universe")
+        await websocket_client.send_json({"id": 7, "type": "get_states"})
+        msg = await websocket_client.receive_json()
+        assert msg["result"][0]["state"] == "universe"
+        assert mock_dump.call_count == 2
+
+
+async def test_get_states_changed_while_serializing(hass, websocket_client):
+    """Test events after the states are taken are sent after the result."""
+    hass.states.async_set("greeting.hello", "world")
+    await websocket_client.send_json(
+        {"id": 5, "type": "subscribe_events", "event_type": "state_changed"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    dump = const.JSON_DUMP
+    calls = []
+
+    def change_state_and_dump(obj):
+        """Change a state while the states are serialized."""
+        if not isinstance(obj, list):
+            return dump(obj)
+        calls.append(obj)
+        run_callback_threadsafe(
+            hass.loop, hass.states.async_set, "greeting.hello", "universe"
+        ).result()
+        return dump(obj)
+
+    with patch(
+        "homeassistant.components.websocket_api.commands.const.JSON_DUMP",
+        new=change_state_and_dump,
+    ):
+        await websocket_client.send_json({"id": 6, "type": "get_states"})
+
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == 6
+        assert msg["result"][0]["state"] == "world"
+
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == 5
+        assert msg["event"]["data"]["new_state"]["state"] == "universe"
+
+    # Serialized once, from the loop
+    assert len(calls) == 1
+    assert hass.states.get("greeting.hello").state == "universe"
+
+
 async def test_get_services(hass, websocket_client):
     """Test get_services command."""
     await websocket_client.send_json({"id": 5, "type": "get_services"})
@@ -217,6 +385,27 @@ async def test_get_services(hass, websocket_client):
     assert msg["result"] == hass.services.async_services()
 
 
+async def test_get_services_updated(hass, websocket_client):
+    """Test get_services returns newly described services."""
+    await websocket_client.send_json({"id": 5, "type": "get_services"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert "new_service" not in msg["result"].get("websocket_api", {})
+
+    hass.services.async_register("websocket_api", "new_service", lambda call: None)
+    async_set_service_schema(
+        hass, "websocket_api", "new_service", {"description": "New service"}
+    )
+
+    await websocket_client.send_json({"id": 6, "type": "get_services"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["websocket_api"]["new_service"] == {
+        "description": "New service",
+        "fields": {},
+    }
+
+
 async def test_get_config(hass, websocket_client):
     """Test get_config command."""
     await websocket_client.send_json({"id": 5, "type": "get_config"})
@@ -304,6 +493,28 @@ async def test_subscribe_requires_admin(websocket_client, hass_admin_user):
     assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
 
 
+async def test_startup_timeline(hass, websocket_client, hass_admin_user):
+    """Test fetching the startup timeline."""
+    timeline = async_get_setup_timeline(hass)
+    timeline.add_span("http", "setup", timeline.origin, timeline.origin + 1)
+
+    await websocket_client.send_json({"id": 5, "type": "startup/timeline"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["spans"] == [
+        {"domain": "http", "phase": "setup", "start": 0, "end": 1}
+    ]
+    assert msg["result"]["critical_path"] == [{"domain": "http", "start": 0, "end": 1}]
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 6, "type": "startup/timeline"})
+
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 async def test_states_filters_visible(hass, hass_admin_user, websocket_client):
     """Test we only get entities that we're allowed to see."""
     hass_admin_user.mock_policy({"entities": {"entity_ids": {"test.entity": True}}})
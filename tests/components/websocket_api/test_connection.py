@@ -55,3 +55,28 @@ async def test_exception_handling():
         assert len(send_messages) == 1
         assert send_messages[0]["error"]["code"] == code
         assert send_messages[0]["error"]["message"] == err
+
+
+async def test_hold_messages():
+    """Test held messages are sent after the message holding them."""
+    send_messages = []
+    conn = websocket_api.ActiveConnection(
+        logging.getLogger(__name__), None, send_messages.append, None, None
+    )
+
+    first = conn.async_hold_messages()
+    conn.send_message("event 1")
+    second = conn.async_hold_messages()
+    conn.send_message("event 2")
+    third = conn.async_hold_messages()
+    assert send_messages == []
+
+    conn.async_release_messages(second, "result 2")
+    assert send_messages == []
+
+    conn.async_release_messages(first, "result 1")
+    assert send_messages == ["result 1", "event 1", "result 2", "event 2"]
+
+    conn.async_release_messages(third, None)
+    conn.send_message("event 3")
+    assert send_messages[4:] == ["event 3"]
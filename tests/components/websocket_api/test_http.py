@@ -6,6 +6,12 @@ from aiohttp import WSMsgType
 import pytest
 
 from homeassistant.components.websocket_api import const, http
+from homeassistant.components.websocket_api.auth import (
+    TYPE_AUTH,
+    TYPE_AUTH_OK,
+    TYPE_AUTH_REQUIRED,
+)
+from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
 
 from tests.common import async_fire_time_changed
@@ -80,3 +86,72 @@ async def test_non_json_message(hass, websocket_client, caplog):
         f"Unable to serialize to JSON. Bad data found at $.result[0](state: test_domain.entity).attributes.bad={bad_data}(<class 'object'>"
         in caplog.text
     )
+
+
+async def _async_connect(hass, aiohttp_client, hass_access_token, **auth_extra):
+    """Connect and authenticate, returning the client and its handler."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    client = await aiohttp_client(hass.http.app)
+    orig_handler = http.WebSocketHandler
+    instance = None
+
+    def instantiate_handler(*args):
+        nonlocal instance
+        instance = orig_handler(*args)
+        return instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket = await client.ws_connect(const.URL, compress=15)
+        assert (await websocket.receive_json())["type"] == TYPE_AUTH_REQUIRED
+        await websocket.send_json(
+            {"type": TYPE_AUTH, "access_token": hass_access_token, **auth_extra}
+        )
+        auth_ok = await websocket.receive_json()
+        assert auth_ok["type"] == TYPE_AUTH_OK
+
+    return websocket, instance, auth_ok
+
+
+async def test_coalesced_messages(hass, aiohttp_client, hass_access_token):
+    """Test pending messages are sent as one frame when the client opts in."""
+    websocket, instance, auth_ok = await _async_connect(
+        hass, aiohttp_client, hass_access_token, coalesce_messages=True
+    )
+    assert auth_ok[const.CONF_COALESCE_MESSAGES] is True
+
+    for idx in range(3):
+        instance._send_message({"id": idx, "type": "event"})
+
+    assert await websocket.receive_json() == [
+        {"id": 0, "type": "event"},
+        {"id": 1, "type": "event"},
+        {"id": 2, "type": "event"},
+    ]
+
+    await websocket.send_json({"id": 5, "type": "ping"})
+    assert await websocket.receive_json() == {"id": 5, "type": "pong"}
+
+
+async def test_messages_not_coalesced_by_default(
+    hass, aiohttp_client, hass_access_token
+):
+    """Test pending messages are sent one per frame without opt in."""
+    websocket, instance, auth_ok = await _async_connect(
+        hass, aiohttp_client, hass_access_token
+    )
+    assert const.CONF_COALESCE_MESSAGES not in auth_ok
+
+    for idx in range(3):
+        instance._send_message({"id": idx, "type": "event"})
+
+    for idx in range(3):
+        assert await websocket.receive_json() == {"id": idx, "type": "event"}
+
+
+async def test_permessage_deflate(hass, aiohttp_client, hass_access_token):
+    """Test compression is negotiated when the client offers it."""
+    websocket, _, _ = await _async_connect(hass, aiohttp_client, hass_access_token)
+    assert websocket.compress == 15
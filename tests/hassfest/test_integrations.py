@@ -0,0 +1,61 @@
+"""Tests for the hassfest manifest index."""
+import ast
+import pathlib
+
+from script.hassfest.integrations import generate_and_validate
+from script.hassfest.model import Integration
+
+
+def _integration(domain, **manifest):
+    """Return an integration with a manifest."""
+    return Integration(
+        pathlib.Path(domain), {"domain": domain, "name": domain, **manifest}
+    )
+
+
+def _generate(*integrations):
+    """Generate the index and return its values."""
+    module = ast.parse(generate_and_validate({itg.domain: itg for itg in integrations}))
+    return {
+        node.targets[0].id: ast.literal_eval(node.value)
+        for node in module.body
+        if isinstance(node, ast.Assign)
+    }
+
+
+def test_generate_index():
+    """Test the manifests and resolved dependencies are indexed."""
+    index = _generate(
+        _integration("api", dependencies=["http"], config_flow=True),
+        _integration("http", quality_scale=None),
+        _integration("hassio", dependencies=["api", "http"]),
+    )
+
+    assert index["MANIFESTS"]["api"] == {
+        "domain": "api",
+        "name": "api",
+        "dependencies": ["http"],
+        "config_flow": True,
+    }
+    assert index["MANIFESTS"]["http"]["quality_scale"] is None
+    assert index["ALL_DEPENDENCIES"] == {"api": ["http"], "hassio": ["api", "http"]}
+
+
+def test_generate_index_unresolvable_dependencies():
+    """Test missing and circular dependencies are left to the loader."""
+    index = _generate(
+        _integration("missing", dependencies=["unknown"]),
+        _integration("circle_a", dependencies=["circle_b"]),
+        _integration("circle_b", dependencies=["circle_a"]),
+        _integration("after", dependencies=["after_dep"]),
+        _integration("after_dep", after_dependencies=["after"]),
+    )
+
+    assert set(index["MANIFESTS"]) == {
+        "missing",
+        "circle_a",
+        "circle_b",
+        "after",
+        "after_dep",
+    }
+    assert index["ALL_DEPENDENCIES"] == {}
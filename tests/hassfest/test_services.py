@@ -0,0 +1,51 @@
+"""Tests for the hassfest service description index."""
+import json
+
+from script.hassfest.model import Integration
+from script.hassfest.services import generate_descriptions
+
+
+def test_generate_descriptions(tmp_path):
+    """Test only the keys used at runtime are indexed, in file order."""
+    (tmp_path / "light").mkdir()
+    (tmp_path / "light" / "services.yaml").write_text(
+        """
+turn_on:
+  description: Turn a light on.
+  fields:
+    entity_id:
+      description: Name of the light.
+      example: light.kitchen
+    brightness:
+      description: Brightness.
+  extra: ignored
+toggle:
+  description: Toggle a light.
+"""
+    )
+    (tmp_path / "broken").mkdir()
+    (tmp_path / "broken" / "services.yaml").write_text("turn_on: [")
+    (tmp_path / "no_services").mkdir()
+
+    integrations = {
+        domain: Integration(tmp_path / domain, {"domain": domain})
+        for domain in ("light", "broken", "no_services")
+    }
+    index = json.loads(generate_descriptions(integrations))
+
+    assert index == {
+        "light": {
+            "turn_on": {
+                "description": "Turn a light on.",
+                "fields": {
+                    "entity_id": {
+                        "description": "Name of the light.",
+                        "example": "light.kitchen",
+                    },
+                    "brightness": {"description": "Brightness."},
+                },
+            },
+            "toggle": {"description": "Toggle a light."},
+        }
+    }
+    assert list(index["light"]["turn_on"]["fields"]) == ["entity_id", "brightness"]
@@ -192,3 +192,23 @@ bla:
         assert err.domain == "bla"
         assert err.message == "Unexpected error calling config validator: Broken"
         assert err.config == {"value": 1}
+
+
+async def test_config_cached(hass):
+    """Test a second check takes unchanged files and validations from the cache."""
+    files = {YAML_CONFIG_FILE: BASE_CONFIG + "light:\n  platform: demo"}
+    with patch("os.path.isfile", return_value=True), patch_yaml_files(files):
+        res = await async_check_ha_config_file(hass)
+
+        with patch("homeassistant.util.yaml.loader._load_yaml") as mock_load, patch(
+            "homeassistant.components.light.PLATFORM_SCHEMA_BASE"
+        ) as mock_schema:
+            cached = await async_check_ha_config_file(hass)
+
+            assert not mock_load.called
+            assert not mock_schema.called
+            assert cached == res
+            assert not cached.errors
+
+            await async_check_ha_config_file(hass, use_cache=False)
+            assert mock_load.called
@@ -937,3 +937,139 @@ async def test_condition_template_invalid_results(hass):
         hass, {"condition": "template", "value_template": "{{ [1, 2, 3] }}"}
     )
     assert not test(hass)
+
+
+async def test_and_condition_evaluates_templates_last(hass):
+    """Test templates are only rendered when cheaper conditions pass."""
+    test = await condition.async_from_config(
+        hass,
+        {
+            "condition": "and",
+            "conditions": [
+                {
+                    "condition": "template",
+                    "value_template": '{{ states.sensor.temperature.state == "100" }}',
+                },
+                {
+                    "condition": "state",
+                    "entity_id": "sensor.temperature",
+                    "state": "100",
+                },
+            ],
+        },
+    )
+
+    hass.states.async_set("sensor.temperature", 120)
+    with patch(
+        "homeassistant.helpers.template.Template.async_render",
+        side_effect=AssertionError("template should not render"),
+    ):
+        assert not test(hass)
+
+    hass.states.async_set("sensor.temperature", 100)
+    assert test(hass)
+
+
+async def test_condition_cost():
+    """Test the relative cost of conditions."""
+    state_config = {
+        "condition": "state",
+        "entity_id": "sensor.temperature",
+        "state": "100",
+    }
+    template_config = {
+        "condition": "template",
+        "value_template": Template("{{ true }}"),
+    }
+
+    assert condition.async_condition_cost(state_config) == condition.COST_CHEAP
+    assert condition.async_condition_cost(template_config) == condition.COST_TEMPLATE
+    assert (
+        condition.async_condition_cost(Template("{{ true }}"))
+        == condition.COST_TEMPLATE
+    )
+    assert (
+        condition.async_condition_cost(
+            {
+                "condition": "numeric_state",
+                "entity_id": "sensor.temperature",
+                "below": 110,
+                "value_template": Template("{{ state.state }}"),
+            }
+        )
+        == condition.COST_TEMPLATE
+    )
+    assert (
+        condition.async_condition_cost(
+            {"condition": "or", "conditions": [state_config, template_config]}
+        )
+        == condition.COST_TEMPLATE
+    )
+    assert (
+        condition.async_condition_cost(
+            {"condition": "device", "device_id": "abcd", "domain": "light"}
+        )
+        == condition.COST_DEVICE
+    )
+
+
+async def test_numeric_state_caches_thresholds(hass):
+    """Test threshold entities are only parsed when they change."""
+    hass.states.async_set("input_number.high", "100")
+    test = await condition.async_from_config(
+        hass,
+        {
+            "condition": "numeric_state",
+            "entity_id": "sensor.temperature",
+            "below": "input_number.high",
+        },
+    )
+
+    hass.states.async_set("sensor.temperature", 42)
+    assert test(hass)
+
+    # Same state object, the cached threshold is used
+    hass.states.get("input_number.high").state = "10"
+    assert test(hass)
+
+    hass.states.async_set("input_number.high", "5")
+    assert not test(hass)
+
+
+async def test_condition_timings(hass):
+    """Test evaluation timings are recorded per condition."""
+    test = await condition.async_from_config(
+        hass,
+        {
+            "condition": "or",
+            "conditions": [
+                {
+                    "condition": "state",
+                    "entity_id": "sensor.temperature",
+                    "state": "100",
+                },
+                {
+                    "condition": "template",
+                    "value_template": "{{ false }}",
+                },
+            ],
+        },
+    )
+
+    hass.states.async_set("sensor.temperature", 100)
+    assert test(hass)
+    hass.states.async_set("sensor.temperature", 120)
+    assert not test(hass)
+
+    timings = {
+        timing["condition"]: timing
+        for timing in condition.async_get_condition_timings(hass)
+    }
+    assert timings["or"]["count"] == 2
+    assert timings["state sensor.temperature"]["count"] == 2
+    assert timings["template {{ false }}"]["count"] == 1
+    assert timings["or"]["total_time"] >= timings["template {{ false }}"]["total_time"]
+
+    del test
+    timings = condition.async_get_condition_timings(hass)
+    assert timings == []
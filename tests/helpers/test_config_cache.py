@@ -0,0 +1,104 @@
+"""Test the configuration cache."""
+from datetime import timedelta
+import logging
+from unittest.mock import Mock
+
+import pytest
+import voluptuous as vol
+
+from homeassistant.const import __version__
+from homeassistant.helpers import config_cache
+from homeassistant.helpers.template import Template
+import homeassistant.util.dt as dt_util
+
+from tests.common import async_fire_time_changed
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _validate(config):
+    """Validate a config, warning about a deprecated option."""
+    if "old" in config:
+        _LOGGER.warning("The old option is deprecated")
+    return {"name": config["name"], "template": Template(config["name"])}
+
+
+@pytest.fixture
+def integration():
+    """Return a mocked custom integration."""
+    return Mock(
+        domain="test",
+        is_built_in=False,
+        manifest={"version": "1"},
+        file_path="/does/not/exist",
+    )
+
+
+async def test_validation_persisted(hass, hass_storage, integration, caplog):
+    """Test validations are stored and reused until the config changes."""
+    validator = Mock(wraps=_validate)
+    cache = await config_cache.async_get_config_cache(hass)
+
+    validated = await cache.async_validate(
+        [integration], "test.CONFIG_SCHEMA", validator, {"name": "a", "old": 1}
+    )
+    assert validated == {"name": "a", "template": Template("a")}
+    assert caplog.text.count("The old option is deprecated") == 1
+
+    again = await cache.async_validate(
+        [integration], "test.CONFIG_SCHEMA", validator, {"name": "a", "old": 1}
+    )
+    assert again == validated
+    assert again is not validated
+    assert isinstance(again["template"], Template)
+    assert validator.call_count == 1
+    assert caplog.text.count("The old option is deprecated") == 2
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=config_cache.STORAGE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    assert len(hass_storage[config_cache.STORAGE_KEY]["data"]["validated"]) == 1
+
+    # Restart, the stored validation is used
+    hass.data.pop(config_cache.DATA_CONFIG_CACHE)
+    cache = await config_cache.async_get_config_cache(hass)
+    again = await cache.async_validate(
+        [integration], "test.CONFIG_SCHEMA", validator, {"name": "a", "old": 1}
+    )
+    assert again == validated
+    assert validator.call_count == 1
+
+    await cache.async_validate(
+        [integration], "test.CONFIG_SCHEMA", validator, {"name": "b"}
+    )
+    assert validator.call_count == 2
+
+    hass.data.pop(config_cache.DATA_CONFIG_CACHE)
+    cache = await config_cache.async_get_config_cache(hass)
+    integration.manifest["version"] = "2"
+    await cache.async_validate(
+        [integration], "test.CONFIG_SCHEMA", validator, {"name": "a", "old": 1}
+    )
+    assert validator.call_count == 3
+
+
+async def test_validation_not_cached(hass, integration):
+    """Test failed validations and results that can't be stored are not cached."""
+    cache = await config_cache.async_get_config_cache(hass)
+    invalid = Mock(side_effect=vol.Invalid("bad"))
+    unknown = Mock(return_value=object())
+
+    for _ in range(2):
+        with pytest.raises(vol.Invalid):
+            await cache.async_validate([integration], "invalid", invalid, {})
+        await cache.async_validate([integration], "unknown", unknown, {})
+
+    assert invalid.call_count == 2
+    assert unknown.call_count == 2
+
+
+async def test_built_in_integration_version(hass):
+    """Test built in integrations change with the version of Home Assistant."""
+    integration = Mock(is_built_in=True)
+    assert config_cache._integration_version(integration) == [__version__]
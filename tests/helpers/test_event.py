@@ -2764,6 +2764,121 @@ async def test_periodic_task_hour(hass):
     assert len(specific_runs) == 3
 
 
+async def test_periodic_tasks_share_one_timer(hass):
+    """Test time pattern listeners are driven by a single timer."""
+    minute_runs = []
+    other_minute_runs = []
+    second_runs = []
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+
+    def active_timers():
+        return [
+            task
+            for task in hass.loop._scheduled
+            if isinstance(task, asyncio.TimerHandle) and not task.cancelled()
+        ]
+
+    timers_before = len(active_timers())
+
+    with patch(
+        "homeassistant.util.dt.utcnow", return_value=time_that_will_not_match_right_away
+    ):
+        unsub_minute = async_track_utc_time_change(
+            hass, callback(lambda x: minute_runs.append(x)), minute="/5", second=0
+        )
+        unsub_other_minute = async_track_utc_time_change(
+            hass,
+            callback(lambda x: other_minute_runs.append(x)),
+            minute="/5",
+            second=0,
+        )
+        unsub_second = async_track_utc_time_change(
+            hass, callback(lambda x: second_runs.append(x)), second=[0, 30]
+        )
+
+    assert len(active_timers()) == timers_before + 1
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(minute_runs) == 1
+    assert len(other_minute_runs) == 1
+    assert len(second_runs) == 1
+    assert len(active_timers()) == timers_before + 1
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 30, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(minute_runs) == 1
+    assert len(other_minute_runs) == 1
+    assert len(second_runs) == 2
+
+    unsub_second()
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 5, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(minute_runs) == 2
+    assert len(other_minute_runs) == 2
+    assert len(second_runs) == 2
+
+    unsub_minute()
+    unsub_other_minute()
+    assert len(active_timers()) == timers_before
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 10, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(minute_runs) == 2
+    assert len(other_minute_runs) == 2
+
+
+async def test_periodic_task_unsub_other_listener_while_running(hass):
+    """Test a listener can remove another listener that is due at the same time."""
+    runs = []
+    unsubs = []
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+
+    @callback
+    def remove_all(now):
+        runs.append(now)
+        while unsubs:
+            unsubs.pop()()
+
+    with patch(
+        "homeassistant.util.dt.utcnow", return_value=time_that_will_not_match_right_away
+    ):
+        unsubs.append(async_track_utc_time_change(hass, remove_all, second=0))
+        unsubs.append(async_track_utc_time_change(hass, remove_all, second=0))
+        unsubs.append(async_track_utc_time_change(hass, remove_all, minute=0))
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs) == 1
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 1, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(runs) == 1
+
+
 async def test_periodic_task_wrong_input(hass):
     """Test periodic tasks with wrong input."""
     specific_runs = []
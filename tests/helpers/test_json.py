@@ -1,8 +1,12 @@
 """Test Home Assistant remote methods and classes."""
+from collections import namedtuple
+import json
+import math
+
 import pytest
 
 from homeassistant import core
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSONEncoder, json_bytes, json_dumps
 from homeassistant.util import dt as dt_util
 
 
@@ -19,3 +23,47 @@ def test_json_encoder(hass):
 
     now = dt_util.utcnow()
     assert ha_json_enc.default(now) == now.isoformat()
+
+
+@pytest.mark.parametrize("dump", [json_dumps, lambda obj: json_bytes(obj).decode()])
+def test_json_dump_semantics(dump):
+    """Test the JSON dump helpers convert like the JSON Encoder."""
+    now = dt_util.utcnow()
+    state = core.State("test.test", "hello", {"set": {1}}, last_changed=now)
+
+    assert json.loads(dump({"state": state, "now": now, 1: "one"})) == {
+        "state": json.loads(json.dumps(state.as_dict(), cls=JSONEncoder)),
+        "now": now.isoformat(),
+        "1": "one",
+    }
+
+    with pytest.raises(TypeError):
+        dump(object())
+
+
+@pytest.mark.parametrize("dump", [json_dumps, lambda *args: json_bytes(*args).decode()])
+def test_json_dump_like_stdlib(dump):
+    """Test the JSON dump helpers handle values like the standard library."""
+    point = namedtuple("Point", "x y")
+    data = {"point": point(1, 2), "big": 2 ** 70, "none": None}
+
+    assert json.loads(dump(data)) == {"point": [1, 2], "big": 2 ** 70, "none": None}
+
+    state = core.State("test.test", "hello", {"nan": float("nan"), "none": None})
+    with pytest.raises(ValueError):
+        dump({"state": state})
+
+    with pytest.raises(ValueError):
+        dump([float("inf"), None])
+
+    decoded = json.loads(dump({"nan": float("nan"), "none": None}, True))
+    assert math.isnan(decoded["nan"])
+    assert decoded["none"] is None
+
+
+def test_json_bytes_orjson():
+    """Test the orjson backend keeps isoformat datetimes."""
+    pytest.importorskip("orjson")
+    now = dt_util.utcnow()
+
+    assert json_bytes({"now": now}) == f'{{"now":"{now.isoformat()}"}}'.encode()
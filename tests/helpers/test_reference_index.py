@@ -0,0 +1,56 @@
+"""Test the reference index helper."""
+from homeassistant.helpers.reference_index import (
+    ReferenceIndex,
+    async_get_reference_index,
+)
+
+
+async def test_reference_index(hass):
+    """Test looking up references in both directions."""
+    references = {
+        "automation.a": ["light.kitchen", "light.living_room"],
+        "automation.b": ["light.kitchen"],
+    }
+    builds = []
+
+    def get_references():
+        builds.append(1)
+        return references.items()
+
+    index = ReferenceIndex(get_references)
+
+    assert index.async_referencing("light.kitchen") == [
+        "automation.a",
+        "automation.b",
+    ]
+    assert index.async_referencing("light.living_room") == ["automation.a"]
+    assert index.async_referencing("light.unknown") == []
+    assert index.async_referenced("automation.a") == [
+        "light.kitchen",
+        "light.living_room",
+    ]
+    assert index.async_referenced("automation.unknown") == []
+    assert len(builds) == 1
+
+    # Results are copies
+    index.async_referencing("light.kitchen").append("automation.c")
+    assert index.async_referencing("light.kitchen") == [
+        "automation.a",
+        "automation.b",
+    ]
+
+    references["automation.b"] = ["light.bedroom"]
+    assert index.async_referencing("light.bedroom") == []
+
+    index.async_invalidate()
+    assert index.async_referencing("light.bedroom") == ["automation.b"]
+    assert index.async_referencing("light.kitchen") == ["automation.a"]
+    assert len(builds) == 2
+
+
+async def test_get_reference_index(hass):
+    """Test the index is stored in hass.data."""
+    index = async_get_reference_index(hass, "test_index", lambda: [])
+
+    assert hass.data["test_index"] is index
+    assert async_get_reference_index(hass, "test_index", lambda: []) is index
@@ -1,5 +1,6 @@
 """The tests for the Restore component."""
-from datetime import datetime
+from datetime import datetime, timedelta
+import json
 from unittest.mock import patch
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START
@@ -8,14 +9,28 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE_TASK,
+    SNAPSHOT_KEY,
     STORAGE_KEY,
     RestoreEntity,
     RestoreStateData,
+    SnapshotStoredState,
+    StateSnapshot,
     StoredState,
 )
+from homeassistant.helpers.storage import STORAGE_DIR
 from homeassistant.util import dt as dt_util
 
 
+def _written_states(hass):
+    """Return the states in the snapshot, with whether they were alive."""
+    snapshot = StateSnapshot(hass.config.path(STORAGE_DIR, SNAPSHOT_KEY))
+    assert snapshot.load()
+    return {
+        entity_id: (alive, State.from_dict(json.loads(payload)))
+        for entity_id, (alive, _, payload) in snapshot.records.items()
+    }
+
+
 async def test_caching_data(hass):
     """Test that we cache data."""
     now = dt_util.utcnow()
@@ -27,7 +42,7 @@ async def test_caching_data(hass):
 
     data = await RestoreStateData.async_get_instance(hass)
     await hass.async_block_till_done()
-    await data.store.async_save([state.as_dict() for state in stored_states])
+    data.snapshot.write(stored_states, now)
 
     # Emulate a fresh load
     hass.data[DATA_RESTORE_STATE_TASK] = None
@@ -37,8 +52,8 @@ async def test_caching_data(hass):
     entity.entity_id = "input_boolean.b1"
 
     # Mock that only b1 is present this run
-    with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+    with patch.object(
+        StateSnapshot, "write", autospec=True, side_effect=StateSnapshot.write
     ) as mock_write_data:
         state = await entity.async_get_last_state()
         await hass.async_block_till_done()
@@ -63,7 +78,7 @@ async def test_hass_starting(hass):
 
     data = await RestoreStateData.async_get_instance(hass)
     await hass.async_block_till_done()
-    await data.store.async_save([state.as_dict() for state in stored_states])
+    data.snapshot.write(stored_states, now)
 
     # Emulate a fresh load
     hass.data[DATA_RESTORE_STATE_TASK] = None
@@ -75,7 +90,7 @@ async def test_hass_starting(hass):
     # Mock that only b1 is present this run
     states = [State("input_boolean.b1", "on")]
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.StateSnapshot.write"
     ) as mock_write_data, patch.object(hass.states, "async_all", return_value=states):
         state = await entity.async_get_last_state()
         await hass.async_block_till_done()
@@ -89,7 +104,7 @@ async def test_hass_starting(hass):
 
     # Finish hass startup
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
+        "homeassistant.helpers.restore_state.StateSnapshot.write"
     ) as mock_write_data:
         hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
         await hass.async_block_till_done()
@@ -98,7 +113,7 @@ async def test_hass_starting(hass):
     assert mock_write_data.called
 
 
-async def test_dump_data(hass):
+async def test_dump_data(hass, hass_storage):
     """Test that we cache data."""
     states = [
         State("input_boolean.b0", "on"),
@@ -131,14 +146,10 @@ async def test_dump_data(hass):
         "input_boolean.b5": StoredState(State("input_boolean.b5", "off"), now),
     }
 
-    with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
-    ) as mock_write_data, patch.object(hass.states, "async_all", return_value=states):
+    with patch.object(hass.states, "async_all", return_value=states):
         await data.async_dump_states()
 
-    assert mock_write_data.called
-    args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
+    written_states = _written_states(hass)
 
     # b0 should not be written, since it didn't extend RestoreEntity
     # b1 should be written, since it is present in the current run
@@ -146,30 +157,34 @@ async def test_dump_data(hass):
     # b3 should be written, since it is still not expired
     # b4 should not be written, since it is now expired
     # b5 should be written, since current state is restored by entity registry
-    assert len(written_states) == 3
-    assert written_states[0]["state"]["entity_id"] == "input_boolean.b1"
-    assert written_states[0]["state"]["state"] == "on"
-    assert written_states[1]["state"]["entity_id"] == "input_boolean.b3"
-    assert written_states[1]["state"]["state"] == "off"
-    assert written_states[2]["state"]["entity_id"] == "input_boolean.b5"
-    assert written_states[2]["state"]["state"] == "off"
+    assert list(written_states) == [
+        "input_boolean.b1",
+        "input_boolean.b3",
+        "input_boolean.b5",
+    ]
+    assert written_states["input_boolean.b1"][0] is True
+    assert written_states["input_boolean.b1"][1].state == "on"
+    assert written_states["input_boolean.b3"][0] is False
+    assert written_states["input_boolean.b3"][1].state == "off"
+    assert written_states["input_boolean.b5"][0] is False
+    assert written_states["input_boolean.b5"][1].state == "off"
 
     # Test that removed entities are not persisted
     await entity.async_remove()
+    size = len(hass_storage[SNAPSHOT_KEY])
 
-    with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
-    ) as mock_write_data, patch.object(hass.states, "async_all", return_value=states):
+    with patch.object(hass.states, "async_all", return_value=states):
         await data.async_dump_states()
 
-    assert mock_write_data.called
-    args = mock_write_data.mock_calls[0][1]
-    written_states = args[0]
-    assert len(written_states) == 2
-    assert written_states[0]["state"]["entity_id"] == "input_boolean.b3"
-    assert written_states[0]["state"]["state"] == "off"
-    assert written_states[1]["state"]["entity_id"] == "input_boolean.b5"
-    assert written_states[1]["state"]["state"] == "off"
+    written_states = _written_states(hass)
+    assert list(written_states) == ["input_boolean.b3", "input_boolean.b5"]
+    assert written_states["input_boolean.b3"][1].state == "off"
+    assert written_states["input_boolean.b5"][1].state == "off"
+
+    # Only the removal of b1 was appended
+    assert len(hass_storage[SNAPSHOT_KEY]) == size + StateSnapshot.RECORD.size + len(
+        "input_boolean.b1"
+    )
 
 
 async def test_dump_error(hass):
@@ -193,8 +208,8 @@ async def test_dump_error(hass):
     data = await RestoreStateData.async_get_instance(hass)
 
     with patch(
-        "homeassistant.helpers.restore_state.Store.async_save",
-        side_effect=HomeAssistantError,
+        "homeassistant.helpers.restore_state.StateSnapshot.write",
+        side_effect=OSError,
     ) as mock_write_data, patch.object(hass.states, "async_all", return_value=states):
         await data.async_dump_states()
 
@@ -271,3 +286,148 @@ async def test_restoring_invalid_entity_id(hass, hass_storage):
 
     state = await entity.async_get_last_state()
     assert state is None
+
+
+async def test_lazy_decoding(hass):
+    """Test only the restored states are decoded."""
+    now = dt_util.utcnow()
+    data = await RestoreStateData.async_get_instance(hass)
+    await hass.async_block_till_done()
+    data.snapshot.write(
+        [
+            StoredState(State("input_boolean.b0", "on"), now),
+            StoredState(State("input_boolean.b1", "off", {"a": 1}), now),
+        ],
+        now,
+    )
+
+    # Emulate a fresh load
+    hass.data[DATA_RESTORE_STATE_TASK] = None
+
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b1"
+
+    with patch("homeassistant.helpers.restore_state.StateSnapshot.write"):
+        state = await entity.async_get_last_state()
+        data = await RestoreStateData.async_get_instance(hass)
+
+    assert state.state == "off"
+    assert state.attributes == {"a": 1}
+
+    last_states = data.last_states
+    assert isinstance(last_states["input_boolean.b0"], SnapshotStoredState)
+    assert last_states["input_boolean.b0"]._state is None
+    assert last_states["input_boolean.b1"]._state is state
+    assert last_states["input_boolean.b0"].last_seen == now
+
+
+async def test_dump_unchanged_states(hass, hass_storage):
+    """Test states that did not change are not written again."""
+    entity = RestoreEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b1"
+    await entity.async_internal_added_to_hass()
+    hass.states.async_set("input_boolean.b1", "on")
+
+    data = await RestoreStateData.async_get_instance(hass)
+    await hass.async_block_till_done()
+    await data.async_dump_states()
+    content = hass_storage[SNAPSHOT_KEY]
+
+    with patch("homeassistant.helpers.restore_state.json.dumps") as mock_dumps:
+        await data.async_dump_states()
+
+    assert not mock_dumps.called
+    assert len(hass_storage[SNAPSHOT_KEY]) == len(content)
+    assert hass_storage[SNAPSHOT_KEY] != content
+
+    hass.states.async_set("input_boolean.b1", "off")
+    await data.async_dump_states()
+
+    assert len(hass_storage[SNAPSHOT_KEY]) > len(content)
+    assert _written_states(hass)["input_boolean.b1"][1].state == "off"
+
+
+async def test_migrate_json_store(hass, hass_storage):
+    """Test states stored as JSON are moved to the snapshot."""
+    last_seen = dt_util.utcnow() - timedelta(days=1)
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": [
+            StoredState(State("input_boolean.b0", "on"), last_seen).as_dict(),
+        ],
+    }
+
+    data = await RestoreStateData.async_get_instance(hass)
+    await hass.async_block_till_done()
+    await data.async_dump_states()
+
+    assert STORAGE_KEY not in hass_storage
+    assert _written_states(hass)["input_boolean.b0"][1].state == "on"
+
+    # Emulate a fresh load
+    hass.data[DATA_RESTORE_STATE_TASK] = None
+
+    with patch("homeassistant.helpers.restore_state.StateSnapshot.write"):
+        data = await RestoreStateData.async_get_instance(hass)
+
+    assert data.last_states["input_boolean.b0"].last_seen == last_seen
+
+
+def test_snapshot_file(tmp_path):
+    """Test the snapshot file is appended to and rewritten."""
+    path = str(tmp_path / SNAPSHOT_KEY)
+    now = dt_util.utcnow()
+
+    def write_and_load(snapshot, stored_states, time):
+        snapshot.write(stored_states, time)
+        loaded = StateSnapshot(path)
+        assert loaded.load()
+        assert loaded.dump_time == time.timestamp()
+        assert list(loaded.records) == [
+            stored_state.state.entity_id for stored_state in stored_states
+        ]
+        assert all(type(record[2]) is bytes for record in loaded.records.values())
+        return loaded
+
+    snapshot = StateSnapshot(path)
+    assert not snapshot.load()
+
+    states = [StoredState(State("light.kitchen", "on"), now)]
+    write_and_load(snapshot, states, now)
+    size = (tmp_path / SNAPSHOT_KEY).stat().st_size
+
+    # Changed states are appended
+    now += timedelta(seconds=1)
+    states.append(StoredState(State("light.hall", "on"), now))
+    write_and_load(snapshot, states, now)
+    assert (tmp_path / SNAPSHOT_KEY).stat().st_size > size
+
+    # The file is rewritten when it is mostly outdated records
+    for index in range(10):
+        now += timedelta(seconds=1)
+        states[1] = StoredState(State("light.hall", str(index)), now)
+        loaded = write_and_load(snapshot, states, now)
+
+    assert json.loads(loaded.records["light.hall"][2])["state"] == "9"
+    assert (tmp_path / SNAPSHOT_KEY).stat().st_size < 4 * size
+
+    # An interrupted write is ignored and rewritten
+    with open(path, "ab") as fp:
+        fp.write(b"\x10\x00")
+
+    snapshot = StateSnapshot(path)
+    assert snapshot.load()
+    assert list(snapshot.records) == ["light.kitchen", "light.hall"]
+
+    now += timedelta(seconds=1)
+    states = [
+        SnapshotStoredState("light.kitchen", snapshot.records["light.kitchen"][2], now)
+    ]
+    snapshot.write(states, now)
+    snapshot = StateSnapshot(path)
+    assert snapshot.load()
+    assert list(snapshot.records) == ["light.kitchen"]
+    assert snapshot.records["light.kitchen"][0] is True
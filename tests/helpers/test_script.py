@@ -17,7 +17,7 @@ from homeassistant import exceptions
 import homeassistant.components.scene as scene
 from homeassistant.const import ATTR_ENTITY_ID, SERVICE_TURN_ON
 from homeassistant.core import Context, CoreState, callback
-from homeassistant.helpers import config_validation as cv, script
+from homeassistant.helpers import condition, config_validation as cv, script
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
@@ -1067,6 +1067,51 @@ async def test_condition_all_cached(hass):
     assert len(script_obj._config_cache) == 2
 
 
+async def test_steps_prepared_once(hass):
+    """Test that step handlers and conditions are prepared once per script."""
+    event = "test_event"
+    events = async_capture_events(hass, event)
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"event": event},
+            {
+                "repeat": {
+                    "sequence": {"event": event},
+                    "while": {
+                        "condition": "template",
+                        "value_template": "{{ repeat.index <= 3 }}",
+                    },
+                }
+            },
+            {
+                "condition": "template",
+                "value_template": '{{ states.test.entity.state == "hello" }}',
+            },
+        ]
+    )
+    script_obj = script.Script(
+        hass, sequence, "Test Name", "test_domain", script_mode="parallel", max_runs=2
+    )
+    hass.states.async_set("test.entity", "hello")
+
+    with patch(
+        "homeassistant.helpers.script.cv.determine_script_action",
+        wraps=cv.determine_script_action,
+    ) as determine_action, patch(
+        "homeassistant.helpers.script.condition.async_from_config",
+        wraps=condition.async_from_config,
+    ) as async_from_config:
+        await script_obj.async_run(context=Context())
+        await script_obj.async_run(context=Context())
+        await hass.async_block_till_done()
+
+    assert len(events) == 8
+    # Top level sequence plus the repeat sequence, resolved on the first run only.
+    assert determine_action.call_count == 4
+    assert async_from_config.call_count == 2
+    assert len(script_obj._step_conditions) == 2
+
+
 async def test_repeat_count(hass):
     """Test repeat action w/ count option."""
     event = "test_event"
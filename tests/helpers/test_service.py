@@ -25,7 +25,9 @@ from homeassistant.helpers import (
     template,
 )
 import homeassistant.helpers.config_validation as cv
+from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+from homeassistant.util.yaml import load_yaml
 
 from tests.common import (
     MockEntity,
@@ -380,6 +382,36 @@ async def test_async_get_all_descriptions(hass):
     assert "fields" in descriptions[logger.DOMAIN]["set_level"]
 
 
+async def test_async_get_all_descriptions_index(hass):
+    """Test built-in integrations are described by the index and cached."""
+    await async_setup_component(hass, "group", {"group": {}})
+
+    with patch("homeassistant.helpers.service._load_services_files") as mock_load_files:
+        descriptions = await service.async_get_all_descriptions(hass)
+
+    assert not mock_load_files.called
+    integration = await async_get_integration(hass, "group")
+    services_yaml = load_yaml(str(integration.file_path / "services.yaml"))
+    assert descriptions["group"]["reload"] == {
+        "description": services_yaml["reload"]["description"],
+        "fields": services_yaml["reload"].get("fields", {}),
+    }
+    assert await service.async_get_all_descriptions(hass) is descriptions
+
+    hass.services.async_register("group", "new_service", lambda call: None)
+    service.async_set_service_schema(
+        hass, "group", "new_service", {"description": "New service"}
+    )
+    new_descriptions = await service.async_get_all_descriptions(hass)
+
+    assert new_descriptions is not descriptions
+    assert new_descriptions["group"]["new_service"] == {
+        "description": "New service",
+        "fields": {},
+    }
+    assert new_descriptions["group"]["reload"] == descriptions["group"]["reload"]
+
+
 async def test_call_with_required_features(hass, mock_entities):
     """Test service calls invoked only if entity has required features."""
     test_service_mock = AsyncMock(return_value=None)
@@ -2,6 +2,7 @@
 import asyncio
 from datetime import timedelta
 import json
+import os
 from unittest.mock import Mock, patch
 
 import pytest
@@ -21,6 +22,9 @@ MOCK_KEY = "storage-test"
 MOCK_DATA = {"hello": "world"}
 MOCK_DATA2 = {"goodbye": "cruel world"}
 
+# The storage of the hass fixture is mocked, keep the real writer
+WRITE_DATA = storage.Store._write_data
+
 
 @pytest.fixture
 def store(hass):
@@ -279,3 +283,124 @@ async def test_migrator_transforming_config(hass, store, hass_storage):
         "version": MOCK_VERSION,
         "data": data,
     }
+
+
+@pytest.mark.parametrize(
+    "old,new",
+    [
+        ({"a": 1, "b": [1, 2]}, {"a": 2, "c": {"d": None}}),
+        (
+            {"items": [{"id": 1}, {"id": 2}, {"id": 3}]},
+            {"items": [{"id": 1}, {"id": 3}]},
+        ),
+        ({"items": [{"id": 1, "x": 1}]}, {"items": [{"id": 1, "x": 2}]}),
+        ({"items": [1, 2]}, {"items": [0, 1, 2, 3]}),
+        ([1, 2], {"now": "a dict"}),
+        ({"a": 1, "c": 0, "f": 1}, {"a": True, "c": False, "f": 1.0}),
+        ({"items": [1, 0]}, {"items": [True, False]}),
+    ],
+)
+def test_json_diff(old, new):
+    """Test the journal operations turn old data into new data."""
+    ops = []
+    storage._json_diff(old, new, [], ops)
+    result = storage._json_apply(json.loads(json.dumps(old)), ops)
+    # Compare serialized, Python equality does not tell 1 and True apart
+    assert json.dumps(result) == json.dumps(new)
+
+
+async def _write(store, data, version=MOCK_VERSION):
+    """Write data to a store, bypassing the mocked storage."""
+    await store.hass.async_add_executor_job(
+        WRITE_DATA,
+        store,
+        store.path,
+        {"version": version, "key": MOCK_KEY, "data": data},
+    )
+
+
+async def _load(hass, **kwargs):
+    """Load the data of a new store, as after a restart."""
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, **kwargs)
+    data = await hass.async_add_executor_job(store._load_data)
+    return store, data["data"]
+
+
+async def test_journaled_store(hass, tmp_path):
+    """Test a journaled store appends changes and replays them when loading."""
+    hass.config.config_dir = str(tmp_path)
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+
+    await _write(store, {"items": [{"id": 1}, {"id": 2}]})
+    with open(store.path) as fp:
+        first_data_file = fp.read()
+    assert not os.path.exists(store.journal_path)
+
+    await _write(store, {"items": [{"id": 1}, {"id": 2, "name": "Two"}, {"id": 3}]})
+    await _write(store, {"items": [{"id": 2, "name": "Two"}, {"id": 3}]})
+
+    with open(store.path) as fp:
+        assert fp.read() == first_data_file
+    with open(store.journal_path) as fp:
+        assert len(fp.readlines()) == 2
+
+    expected = {"items": [{"id": 2, "name": "Two"}, {"id": 3}]}
+    store, data = await _load(hass, journal=True)
+    assert data == expected
+
+    # A store without journal reads the same data
+    _, data = await _load(hass)
+    assert data == expected
+
+    # Changes of an interrupted write are ignored
+    with open(store.journal_path, "a") as fp:
+        fp.write('{"id": "')
+    store, data = await _load(hass, journal=True)
+    assert data == expected
+
+    # Writing after an interrupted write starts a new journal
+    await _write(store, {"items": []})
+    assert not os.path.exists(store.journal_path)
+    await _write(store, {"items": [{"id": 4}]})
+    _, data = await _load(hass, journal=True)
+    assert data == {"items": [{"id": 4}]}
+
+    # Writing after loading continues the journal
+    store, data = await _load(hass, journal=True)
+    await _write(store, {"items": []})
+    _, data = await _load(hass, journal=True)
+    assert data == {"items": []}
+
+
+async def test_journaled_store_compacts(hass, tmp_path):
+    """Test the journal is merged into the data file."""
+    hass.config.config_dir = str(tmp_path)
+    store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+
+    with patch.object(storage, "JOURNAL_MIN_COMPACT_SIZE", 0):
+        await _write(store, {"counter": 0})
+        await _write(store, {"counter": 1})
+        assert os.path.exists(store.journal_path)
+
+        for counter in range(2, 10):
+            await _write(store, {"counter": counter})
+
+    with open(store.journal_path) as fp:
+        assert len(fp.readlines()) < 8
+    _, data = await _load(hass, journal=True)
+    assert data == {"counter": 9}
+
+    # A new version rewrites the data file
+    await _write(store, {"counter": 9}, version=2)
+    assert not os.path.exists(store.journal_path)
+    with open(store.path) as fp:
+        assert json.load(fp)["version"] == 2
+
+    # The final write leaves a complete data file
+    await _write(store, {"counter": 10}, version=2)
+    assert os.path.exists(store.journal_path)
+    store._journal_compact = True
+    await _write(store, {"counter": 11}, version=2)
+    assert not os.path.exists(store.journal_path)
+    with open(store.path) as fp:
+        assert json.load(fp)["data"] == {"counter": 11}
@@ -1,5 +1,7 @@
 """Test the translation helper."""
 import asyncio
+from datetime import timedelta
+import os
 from os import path
 import pathlib
 from unittest.mock import Mock, patch
@@ -10,6 +12,9 @@ from homeassistant.generated import config_flows
 from homeassistant.helpers import translation
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component, setup_component
+import homeassistant.util.dt as dt_util
+
+from tests.common import async_fire_time_changed
 
 
 @pytest.fixture
@@ -382,3 +387,111 @@ async def test_custom_component_translations(hass):
     hass.config.components.add("test_embedded")
     hass.config.components.add("test_package")
     assert await translation.async_get_translations(hass, "en", "state") == {}
+
+
+async def test_translations_persisted(hass, hass_storage, tmp_path):
+    """Test loaded translation files are stored and reused until they change."""
+    translation_file = tmp_path / "en.json"
+    translation_file.write_text('{"title": "world"}')
+    os.utime(translation_file, ns=(1, 1))
+    integration = Mock(
+        file_path=pathlib.Path(__file__), is_built_in=False, manifest={"version": "1"}
+    )
+    integration.name = "Component 1"
+
+    with patch(
+        "homeassistant.helpers.translation.component_translation_path",
+        return_value=str(translation_file),
+    ), patch(
+        "homeassistant.helpers.translation.async_get_integration",
+        return_value=integration,
+    ):
+        strings = await translation.async_get_component_strings(
+            hass, "en", {"component1"}
+        )
+        assert strings == {"component1": {"title": "world"}}
+
+        async_fire_time_changed(
+            hass,
+            dt_util.utcnow() + timedelta(seconds=translation.STORAGE_SAVE_DELAY),
+        )
+        await hass.async_block_till_done()
+        stored = hass_storage[translation.STORAGE_KEY]["data"]
+        assert stored["en"]["component1"] == {
+            "version": "1",
+            "mtime": 1,
+            "strings": {"title": "world"},
+        }
+
+        # Restart, the stored translations are used
+        hass.data.pop(translation.TRANSLATION_STORE)
+        with patch(
+            "homeassistant.helpers.translation.load_translations_files"
+        ) as mock_load:
+            strings = await translation.async_get_component_strings(
+                hass, "en", {"component1"}
+            )
+        assert strings == {"component1": {"title": "world"}}
+        assert not mock_load.called
+
+        integration.manifest["version"] = "2"
+        with patch(
+            "homeassistant.helpers.translation.load_translations_files",
+            return_value={"component1": {"title": "new version"}},
+        ):
+            strings = await translation.async_get_component_strings(
+                hass, "en", {"component1"}
+            )
+        assert strings == {"component1": {"title": "new version"}}
+
+        translation_file.write_text('{"title": "changed"}')
+        os.utime(translation_file, ns=(2, 2))
+        strings = await translation.async_get_component_strings(
+            hass, "en", {"component1"}
+        )
+        assert strings == {"component1": {"title": "changed"}}
+
+
+async def test_unused_translations_not_persisted(hass, hass_storage, tmp_path):
+    """Test translations not requested since the start are dropped when saving."""
+    translation_file = tmp_path / "en.json"
+    translation_file.write_text('{"title": "world"}')
+    integration = Mock(
+        file_path=pathlib.Path(__file__), is_built_in=False, manifest={"version": "1"}
+    )
+    integration.name = "Component"
+    mtime = translation_file.stat().st_mtime
+    hass_storage[translation.STORAGE_KEY] = {
+        "version": translation.STORAGE_VERSION,
+        "key": translation.STORAGE_KEY,
+        "data": {
+            "en": {
+                "removed": {"version": "1", "mtime": mtime, "strings": {"title": "x"}}
+            },
+            "fr": {
+                "component1": {
+                    "version": "1",
+                    "mtime": mtime,
+                    "strings": {"title": "x"},
+                }
+            },
+        },
+    }
+
+    with patch(
+        "homeassistant.helpers.translation.component_translation_path",
+        return_value=str(translation_file),
+    ), patch(
+        "homeassistant.helpers.translation.async_get_integration",
+        return_value=integration,
+    ):
+        await translation.async_get_component_strings(hass, "en", {"component1"})
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=translation.STORAGE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    stored = hass_storage[translation.STORAGE_KEY]["data"]
+    assert list(stored) == ["en"]
+    assert list(stored["en"]) == ["component1"]
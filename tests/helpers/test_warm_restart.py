@@ -0,0 +1,110 @@
+"""Tests for keeping the states across a restart."""
+from datetime import timedelta
+from unittest.mock import patch
+
+from homeassistant.const import (
+    ATTR_FRIENDLY_NAME,
+    ATTR_RESTORED,
+    EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STOP,
+    RESTART_EXIT_CODE,
+    STATE_UNAVAILABLE,
+)
+from homeassistant.core import CoreState
+from homeassistant.helpers import entity_registry, warm_restart
+import homeassistant.util.dt as dt_util
+
+from tests.common import MockEntity, MockEntityPlatform
+
+
+async def _async_restart(hass, exit_code=RESTART_EXIT_CODE):
+    """Save the states like a stop and remove them."""
+    await warm_restart.async_load(hass)
+    hass.exit_code = exit_code
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+    for entity_id in hass.states.async_entity_ids():
+        hass.states.async_remove(entity_id)
+
+
+async def test_restart(hass, hass_storage):
+    """Test the states are restored after a restart."""
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    hass.states.async_set("light.hall", "off")
+    hass.states.async_set("light.placeholder", "unavailable", {ATTR_RESTORED: True})
+    kitchen = hass.states.get("light.kitchen")
+
+    await _async_restart(hass)
+    assert warm_restart.SNAPSHOT_KEY in hass_storage
+
+    await warm_restart.async_load(hass)
+
+    # The snapshot is only used once
+    assert warm_restart.SNAPSHOT_KEY not in hass_storage
+
+    state = hass.states.get("light.kitchen")
+    assert state == kitchen
+    assert state.last_changed == kitchen.last_changed
+    assert hass.states.get("light.hall").state == "off"
+    assert hass.states.get("light.placeholder") is None
+
+    # The entity ID is used by the entity instead of generating a new one
+    platform = MockEntityPlatform(hass, domain="light")
+    await platform.async_add_entities([MockEntity(name="kitchen", state="off")])
+    assert hass.states.get("light.kitchen").state == "off"
+    assert hass.states.get("light.kitchen_2") is None
+
+    # Restored states that were not replaced are removed at start
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
+    await hass.async_block_till_done()
+    assert hass.states.get("light.kitchen").state == "off"
+    assert hass.states.get("light.hall") is None
+
+
+async def test_stop_without_restart(hass, hass_storage):
+    """Test the states are not saved when not restarting."""
+    hass.states.async_set("light.kitchen", "on")
+
+    await _async_restart(hass, exit_code=0)
+
+    assert warm_restart.SNAPSHOT_KEY not in hass_storage
+
+
+async def test_outdated_snapshot(hass, hass_storage):
+    """Test the states of an old restart are not restored."""
+    hass.states.async_set("light.kitchen", "on")
+
+    await _async_restart(hass)
+
+    with patch(
+        "homeassistant.helpers.warm_restart.dt_util.utcnow",
+        return_value=dt_util.utcnow() + timedelta(hours=1),
+    ):
+        await warm_restart.async_load(hass)
+
+    assert warm_restart.SNAPSHOT_KEY not in hass_storage
+    assert hass.states.get("light.kitchen") is None
+
+
+async def test_registered_entity_not_set_up(hass, hass_storage):
+    """Test a restored entity that is not set up again gets a placeholder."""
+    hass.state = CoreState.not_running
+    registry = await entity_registry.async_get_registry(hass)
+    registry.async_get_or_create(
+        "light", "hue", "1234", suggested_object_id="kitchen", original_name="Kitchen"
+    )
+    hass.states.async_set("light.kitchen", "on")
+
+    await _async_restart(hass)
+    await warm_restart.async_load(hass)
+    assert hass.states.get("light.kitchen").state == "on"
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("light.kitchen")
+    assert state.state == STATE_UNAVAILABLE
+    assert state.attributes[ATTR_RESTORED] is True
+    assert state.attributes[ATTR_FRIENDLY_NAME] == "Kitchen"
+    assert hass.states.async_restored_entity_ids() == []
@@ -6,7 +6,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from homeassistant import bootstrap, core, runner
+from homeassistant import bootstrap, core, loader, runner
 import homeassistant.config as config_util
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.util.dt as dt_util
@@ -100,6 +100,40 @@ async def test_setting_up_config(hass):
     assert "group" in hass.config.components
 
 
+async def test_preimport_integrations(hass):
+    """Test integrations and the platforms they need are preimported."""
+    hass.config_entries = Mock(async_domains=Mock(return_value=["hue"]))
+    integrations = {
+        domain: await loader.async_get_integration(hass, domain)
+        for domain in ("light", "hue", "group")
+    }
+
+    with patch.object(
+        loader.Integration, "async_preimport", autospec=True
+    ) as mock_preimport:
+        await bootstrap._async_preimport_integrations(
+            hass,
+            {
+                "light": [{"platform": "hue"}, {"platform": "not_existing"}],
+                "light 2": {"platform": "group"},
+                "hue": {},
+            },
+            integrations,
+        )
+
+    calls = {
+        (integration.domain, *(tuple(platforms) for platforms in args))
+        for _, (integration, *args), _ in mock_preimport.mock_calls
+    }
+    assert calls == {
+        ("light",),
+        ("hue", ("config_flow",)),
+        ("group",),
+        ("hue", ("light",)),
+        ("group", ("light",)),
+    }
+
+
 async def test_setup_after_deps_all_present(hass):
     """Test after_dependencies when all present."""
     order = []
@@ -2,6 +2,7 @@
 # pylint: disable=protected-access
 from collections import OrderedDict
 import copy
+from datetime import timedelta
 import os
 from unittest import mock
 from unittest.mock import AsyncMock, Mock, patch
@@ -28,14 +29,20 @@ from homeassistant.const import (
     __version__,
 )
 from homeassistant.core import SOURCE_STORAGE, HomeAssistantError
-from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import config_cache, config_validation as cv
 import homeassistant.helpers.check_config as check_config
 from homeassistant.helpers.entity import Entity
 from homeassistant.loader import async_get_integration
 from homeassistant.util import dt as dt_util
 from homeassistant.util.yaml import SECRET_YAML
 
-from tests.common import get_test_config_dir, patch_yaml_files
+from tests.common import (
+    MockModule,
+    async_fire_time_changed,
+    get_test_config_dir,
+    mock_integration,
+    patch_yaml_files,
+)
 
 CONFIG_DIR = get_test_config_dir()
 YAML_PATH = os.path.join(CONFIG_DIR, config_util.YAML_CONFIG_FILE)
@@ -1089,6 +1096,63 @@ async def test_component_config_exceptions(hass, caplog):
     )
 
 
+async def test_component_config_validation_cached(hass):
+    """Test component configs are only validated again when they change."""
+    config_schema = Mock(
+        wraps=vol.Schema({"comp": {"name": str}}, extra=vol.ALLOW_EXTRA)
+    )
+    platform_schema = Mock(wraps=vol.Schema({"name": str}))
+    mock_integration(hass, MockModule("comp", config_schema=config_schema))
+    mock_integration(hass, MockModule("platform_comp", platform_schema=platform_schema))
+    integration = await async_get_integration(hass, "comp")
+    platform_integration = await async_get_integration(hass, "platform_comp")
+    config = {"comp": {"name": "a"}, "platform_comp": [{"name": "b"}], "other": {}}
+
+    for _ in range(2):
+        assert (
+            await config_util.async_process_component_config(hass, config, integration)
+            == config
+        )
+        assert await config_util.async_process_component_config(
+            hass, config, platform_integration
+        ) == {**config, "platform_comp": [{"name": "b"}]}
+
+    assert config_schema.call_count == 1
+    assert config_schema.call_args[0][0] == {"comp": {"name": "a"}}
+    assert platform_schema.call_count == 1
+
+    config["comp"]["name"] = "changed"
+    config["other"]["changed"] = True
+    await config_util.async_process_component_config(hass, config, integration)
+    assert config_schema.call_count == 2
+
+
+async def test_yaml_config_cache_persisted(hass, hass_storage, tmp_path):
+    """Test the loaded configuration files are reused after a restart."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / config_util.YAML_CONFIG_FILE).write_text("light: !include light.yaml")
+    (tmp_path / "light.yaml").write_text("- platform: hue")
+
+    assert await config_util.async_hass_config_yaml(hass) == {
+        "light": [{"platform": "hue"}]
+    }
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=config_cache.STORAGE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    assert set(hass_storage[config_cache.STORAGE_KEY]["data"]["yaml"]) == {
+        str(tmp_path / config_util.YAML_CONFIG_FILE),
+        str(tmp_path / "light.yaml"),
+    }
+
+    hass.data.pop(config_cache.DATA_CONFIG_CACHE)
+    with patch("homeassistant.util.yaml.loader._load_yaml") as mock_load:
+        assert await config_util.async_hass_config_yaml(hass) == {
+            "light": [{"platform": "hue"}]
+        }
+    assert not mock_load.called
+
+
 @pytest.mark.parametrize(
     "domain, schema, expected",
     [
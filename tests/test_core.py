@@ -336,6 +336,15 @@ def test_state_as_dict():
     assert state.as_dict() is state.as_dict()
 
 
+def test_state_has_non_finite_float():
+    """Test finding NaN and infinite floats in the attributes of a State."""
+    assert not ha.State("happy.happy", "on", {"pig": 1.5}).has_non_finite_float()
+    assert ha.State(
+        "happy.happy", "on", {"pig": {"dog": [float("nan")]}}
+    ).has_non_finite_float()
+    assert ha.State("happy.happy", "on", {"pig": float("inf")}).has_non_finite_float()
+
+
 async def test_eventbus_add_remove_listener(hass):
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
@@ -1500,6 +1509,41 @@ async def test_reserving_states(hass):
     assert hass.states.async_available("light.bedroom") is True
 
 
+async def test_restoring_states(hass):
+    """Test restored states are replaced by the first state set."""
+    restored = ha.State("light.kitchen", "on", {"brightness": 100})
+    hass.states.async_set("light.bedroom", "off")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    hass.states.async_restore([restored, ha.State("light.bedroom", "on")])
+    await hass.async_block_till_done()
+
+    assert not events
+    assert hass.states.get("light.kitchen") is restored
+    assert hass.states.get("light.bedroom").state == "off"
+    assert hass.states.async_restored_entity_ids() == ["light.kitchen"]
+    assert hass.states.async_available("light.kitchen") is True
+    assert hass.states.async_available("light.bedroom") is False
+
+    hass.states.async_reserve("light.kitchen")
+    assert hass.states.async_available("light.kitchen") is False
+
+    # Setting the same state still replaces the restored state
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    await hass.async_block_till_done()
+
+    assert len(events) == 1
+    assert events[0].data["old_state"] is restored
+    state = hass.states.get("light.kitchen")
+    assert state is not restored
+    assert state.last_changed == restored.last_changed
+    assert hass.states.async_restored_entity_ids() == []
+
+    hass.states.async_restore([ha.State("light.hall", "on")])
+    hass.states.async_remove("light.hall")
+    assert hass.states.async_restored_entity_ids() == []
+
+
 async def test_state_change_events_match_state_time(hass):
     """Test last_updated and timed_fired only call utcnow once."""
 
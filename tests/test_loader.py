@@ -1,11 +1,13 @@
 """Test to verify that we can load components."""
+import pathlib
 from unittest.mock import ANY, patch
 
 import pytest
 
-from homeassistant import core, loader
-from homeassistant.components import http, hue
+from homeassistant import components, core, loader
+from homeassistant.components import api, http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.generated.integrations import ALL_DEPENDENCIES, MANIFESTS
 
 from tests.common import MockModule, async_mock_service, mock_integration
 
@@ -144,6 +146,48 @@ async def test_get_integration(hass):
     assert hue_light == integration.get_platform("light")
 
 
+async def test_get_integration_from_index(hass):
+    """Test built-in integrations are resolved from the manifest index."""
+    with patch.object(loader.Integration, "resolve_from_root") as mock_resolve:
+        integration = await loader.async_get_integration(hass, "api")
+
+    assert not mock_resolve.called
+    assert integration.pkg_path == "homeassistant.components.api"
+    assert integration.file_path == pathlib.Path(api.__file__).parent
+    assert integration.is_built_in
+    assert integration.all_dependencies_resolved
+    assert integration.all_dependencies == {"http"}
+
+    on_disk = loader.Integration.resolve_from_root(hass, components, "api")
+    assert integration.manifest == on_disk.manifest
+
+
+async def test_index_dependencies_match_loader(hass):
+    """Test the precomputed dependencies match resolving them at runtime."""
+    for domain, dependencies in ALL_DEPENDENCIES.items():
+        integration = loader.Integration(
+            hass,
+            f"homeassistant.components.{domain}",
+            None,
+            dict(MANIFESTS[domain]),
+        )
+        assert await integration.resolve_dependencies()
+        assert integration.all_dependencies == set(dependencies), domain
+
+
+async def test_index_dependencies_overridden_by_custom(hass):
+    """Test dependencies are resolved at runtime if a custom one overrides them."""
+    custom_http = _get_test_integration(hass, "http", False)
+
+    with patch(
+        "homeassistant.loader.async_get_custom_components",
+        return_value={"http": custom_http},
+    ):
+        integration = await loader.async_get_integration(hass, "api")
+
+    assert not integration.all_dependencies_resolved
+
+
 async def test_get_integration_legacy(hass):
     """Test resolving integration."""
     integration = await loader.async_get_integration(hass, "test_embedded")
@@ -261,6 +305,47 @@ async def test_integrations_only_once(hass):
     assert await int_1 is await int_2
 
 
+async def test_preimport(hass):
+    """Test importing the component and platforms in the executor."""
+    integration = await loader.async_get_integration(hass, "hue")
+
+    with patch("homeassistant.loader.importlib.import_module") as mock_import:
+        integration.async_preimport(["light"])
+        integration.async_preimport(["light"])
+        await integration.async_wait_preimport()
+        await integration.async_wait_preimport("light")
+
+    assert [call[1][0] for call in mock_import.mock_calls] == [
+        "homeassistant.components.hue",
+        "homeassistant.components.hue.light",
+    ]
+
+
+async def test_preimport_requirements_not_installed(hass):
+    """Test integrations are not imported before their requirements are installed."""
+    hass.config.skip_pip = False
+    integration = await loader.async_get_integration(hass, "hue")
+
+    with patch("homeassistant.util.package.is_installed", return_value=False), patch(
+        "homeassistant.loader.importlib.import_module"
+    ) as mock_import:
+        integration.async_preimport()
+        await integration.async_wait_preimport()
+
+    assert not mock_import.called
+
+
+async def test_preimport_errors_left_to_setup(hass):
+    """Test import errors during preimport are not raised."""
+    integration = await loader.async_get_integration(hass, "hue")
+
+    with patch("homeassistant.loader.importlib.import_module", side_effect=ImportError):
+        integration.async_preimport()
+        await integration.async_wait_preimport()
+
+    assert "hue" not in hass.data.get(loader.DATA_COMPONENTS, {})
+
+
 async def test_get_custom_components_internal(hass):
     """Test that we can a list of custom components."""
     # pylint: disable=protected-access
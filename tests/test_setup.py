@@ -3,7 +3,7 @@
 import asyncio
 import os
 import threading
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 import voluptuous as vol
@@ -11,7 +11,7 @@ import voluptuous as vol
 from homeassistant import config_entries, setup
 import homeassistant.config as config_util
 from homeassistant.const import EVENT_COMPONENT_LOADED, EVENT_HOMEASSISTANT_START
-from homeassistant.core import callback
+from homeassistant.core import CoreState, callback
 from homeassistant.helpers import discovery
 from homeassistant.helpers.config_validation import (
     PLATFORM_SCHEMA,
@@ -596,3 +596,43 @@ async def test_integration_disabled(hass, caplog):
     result = await setup.async_setup_component(hass, "test_component1", {})
     assert not result
     assert disabled_reason in caplog.text
+
+
+async def test_setup_timeline(hass):
+    """Test the phases of setting up integrations are recorded during startup."""
+    hass.state = CoreState.starting
+    MockConfigEntry(domain="comp").add_to_hass(hass)
+    mock_integration(hass, MockModule("dep"))
+    mock_integration(
+        hass,
+        MockModule(
+            "comp",
+            dependencies=["dep"],
+            async_setup_entry=AsyncMock(return_value=True),
+        ),
+    )
+    mock_entity_platform(hass, "config_flow.comp", None)
+
+    assert await setup.async_setup_component(hass, "comp", {})
+
+    timeline = setup.async_get_setup_timeline(hass)
+    phases = [(span.domain, span.phase) for span in timeline.spans]
+    assert phases == [
+        ("comp", "resolve"),
+        ("dep", "resolve"),
+        ("dep", "import"),
+        ("dep", "config"),
+        ("dep", "setup"),
+        ("comp", "dependencies"),
+        ("comp", "import"),
+        ("comp", "config"),
+        ("comp", "setup"),
+        ("comp", "setup_entry"),
+    ]
+    assert timeline.waits == {"comp": {"dep"}}
+    assert [step["domain"] for step in timeline.critical_path()] == ["dep", "comp"]
+
+    hass.state = CoreState.running
+    mock_integration(hass, MockModule("dep_2"))
+    assert await setup.async_setup_component(hass, "dep_2", {})
+    assert "dep_2" not in {span.domain for span in timeline.spans}
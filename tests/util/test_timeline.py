@@ -0,0 +1,78 @@
+"""Test the timeline util."""
+from homeassistant.util.timeline import Timeline
+
+
+def _timeline():
+    """Return a timeline of a small startup."""
+    timeline = Timeline(100)
+    timeline.add_span("http", "setup", 100, 101)
+    timeline.add_span("frontend", "dependencies", 100, 101)
+    timeline.add_span("frontend", "setup", 101, 103)
+    timeline.add_span("api", "dependencies", 100, 101)
+    timeline.add_span("api", "setup", 101, 101.5)
+    timeline.add_span("hue", "dependencies", 101, 103)
+    timeline.add_span("hue", "setup", 103, 104)
+    timeline.add_wait("frontend", ["http"])
+    timeline.add_wait("api", ["http"])
+    timeline.add_wait("hue", ["api", "frontend"])
+    return timeline
+
+
+def test_critical_path():
+    """Test the critical path follows the dependencies that finished last."""
+    assert _timeline().critical_path() == [
+        {"domain": "http", "start": 0, "end": 1},
+        {"domain": "frontend", "start": 0, "end": 3},
+        {"domain": "hue", "start": 1, "end": 4},
+    ]
+    assert Timeline().critical_path() == []
+
+
+def test_critical_path_circular_waits():
+    """Test circular waits do not loop forever."""
+    timeline = Timeline(0)
+    timeline.add_span("a", "setup", 0, 1)
+    timeline.add_span("b", "setup", 0, 2)
+    timeline.add_wait("a", ["b"])
+    timeline.add_wait("b", ["a"])
+
+    assert [step["domain"] for step in timeline.critical_path()] == ["a", "b"]
+
+
+def test_as_dict():
+    """Test the timeline as a dictionary."""
+    data = _timeline().as_dict()
+
+    assert data["spans"][0] == {
+        "domain": "http",
+        "phase": "setup",
+        "start": 0,
+        "end": 1,
+    }
+    assert data["waits"]["hue"] == ["api", "frontend"]
+    assert data["critical_path"][-1]["domain"] == "hue"
+
+
+def test_as_chrome_trace():
+    """Test the timeline in the Chrome trace format."""
+    trace = _timeline().as_chrome_trace()
+    events = trace["traceEvents"]
+
+    assert events[0] == {
+        "name": "thread_name",
+        "ph": "M",
+        "pid": 1,
+        "tid": 1,
+        "args": {"name": "http"},
+    }
+    assert events[1] == {
+        "name": "setup",
+        "cat": "http",
+        "ph": "X",
+        "pid": 1,
+        "tid": 1,
+        "ts": 0,
+        "dur": 1_000_000,
+    }
+    assert len([event for event in events if event["ph"] == "M"]) == 4
+    assert trace["otherData"]["critical_path"] == ["http", "frontend", "hue"]
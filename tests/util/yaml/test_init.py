@@ -1,5 +1,6 @@
 """Test Home Assistant yaml loader."""
 import io
+import json
 import logging
 import os
 import unittest
@@ -478,3 +479,210 @@ def test_input():
     """Test loading inputs."""
     data = {"hello": yaml.Input("test_name")}
     assert yaml.parse_yaml(yaml.dump(data)) == data
+
+
+def _write(path, content, mtime):
+    """Write a file and give it a distinct modification time."""
+    path.write_text(content)
+    os.utime(path, ns=(mtime, mtime))
+
+
+def test_yaml_cache(tmp_path):
+    """Test the cache only parses files again when their content changes."""
+    config = tmp_path / YAML_CONFIG_FILE
+    _write(config, "light: !include light.yaml\nname: Home", 1)
+    _write(tmp_path / "light.yaml", "- platform: hue", 1)
+    cache = yaml.YamlCache()
+
+    with patch.object(
+        yaml_loader, "_load_yaml", wraps=yaml_loader._load_yaml
+    ) as mock_load:
+        data = cache.load(str(config))
+        assert data == {"light": [{"platform": "hue"}], "name": "Home"}
+        assert mock_load.call_count == 2
+
+        data["light"].append("changed")
+        assert cache.load(str(config)) == {
+            "light": [{"platform": "hue"}],
+            "name": "Home",
+        }
+        assert mock_load.call_count == 2
+
+        # Only the content is compared
+        _write(tmp_path / "light.yaml", "- platform: hue", 2)
+        assert cache.load(str(config))["light"] == [{"platform": "hue"}]
+        assert mock_load.call_count == 2
+
+        _write(tmp_path / "light.yaml", "- platform: lifx", 3)
+        assert cache.load(str(config))["light"] == [{"platform": "lifx"}]
+        assert mock_load.call_count == 4
+
+        _write(config, "light: !include light.yaml\nname: Away", 2)
+        assert cache.load(str(config))["name"] == "Away"
+        assert mock_load.call_count == 5
+
+    os.unlink(config)
+    with pytest.raises(FileNotFoundError):
+        cache.load(str(config))
+
+
+def test_yaml_cache_stored(tmp_path):
+    """Test the entries of a cache can be stored and passed to a new cache."""
+    config = tmp_path / YAML_CONFIG_FILE
+    _write(config, "light: !include light.yaml\nremoved: !include removed.yaml", 1)
+    _write(tmp_path / "light.yaml", "- platform: hue", 1)
+    _write(tmp_path / "removed.yaml", "name: Home", 1)
+    cache = yaml.YamlCache()
+    cache.load(str(config))
+    assert cache.changed
+
+    _write(config, "light: !include light.yaml", 2)
+    cache.load(str(config))
+    stored = json.loads(json.dumps(cache.as_dict()))
+    assert set(stored) == {str(config), str(tmp_path / "light.yaml")}
+
+    cache = yaml.YamlCache(stored)
+    with patch.object(yaml_loader, "_load_yaml") as mock_load:
+        data = cache.load(str(config))
+
+    assert not mock_load.called
+    assert not cache.changed
+    assert data == {"light": [{"platform": "hue"}]}
+    assert data["light"].__config_file__ == str(config)
+    assert data["light"][0].__config_file__ == str(tmp_path / "light.yaml")
+    assert data["light"][0].__line__ == 0
+
+
+def test_yaml_cache_include_dir(tmp_path):
+    """Test the cache notices files added to an included directory."""
+    config = tmp_path / YAML_CONFIG_FILE
+    _write(config, "automation: !include_dir_merge_list automations", 1)
+    (tmp_path / "automations").mkdir()
+    _write(tmp_path / "automations" / "a.yaml", "- alias: a", 1)
+    cache = yaml.YamlCache()
+
+    assert cache.load(str(config)) == {"automation": [{"alias": "a"}]}
+
+    _write(tmp_path / "automations" / "b.yaml", "- alias: b", 1)
+    assert cache.load(str(config)) == {"automation": [{"alias": "a"}, {"alias": "b"}]}
+
+
+def test_yaml_cache_secrets_and_env(tmp_path, monkeypatch):
+    """Test the cache notices changed secrets and environment variables."""
+    config = tmp_path / YAML_CONFIG_FILE
+    _write(config, "password: !secret pwd\nuser: !env_var HA_TEST_USER", 1)
+    _write(tmp_path / yaml.SECRET_YAML, "pwd: one", 1)
+    monkeypatch.setenv("HA_TEST_USER", "paulus")
+    cache = yaml.YamlCache()
+
+    assert cache.load(str(config)) == {"password": "one", "user": "paulus"}
+
+    monkeypatch.setenv("HA_TEST_USER", "balloob")
+    assert cache.load(str(config))["user"] == "balloob"
+
+    _write(tmp_path / yaml.SECRET_YAML, "pwd: two", 2)
+    yaml.clear_secret_cache()
+    assert cache.load(str(config))["password"] == "two"
+
+
+def _parse_with(loader_class, path):
+    """Parse a YAML file with a loader class."""
+    with open(path, encoding="utf-8") as fp:
+        loader = loader_class(fp)
+        try:
+            return loader.get_single_data()
+        finally:
+            loader.dispose()
+
+
+def _assert_same_annotations(fast, python):
+    """Assert two loaded values are equal, including file and line references."""
+    assert type(fast) is type(python)
+    assert getattr(fast, "__config_file__", None) == getattr(
+        python, "__config_file__", None
+    )
+    assert getattr(fast, "__line__", None) == getattr(python, "__line__", None)
+
+    if isinstance(python, dict):
+        assert list(fast) == list(python)
+        for key, value in python.items():
+            _assert_same_annotations(fast[key], value)
+    elif isinstance(python, list):
+        assert len(fast) == len(python)
+        for fast_item, python_item in zip(fast, python):
+            _assert_same_annotations(fast_item, python_item)
+    else:
+        assert fast == python
+
+
+@pytest.mark.skipif(not yaml_loader.HAS_C_LOADER, reason="libyaml not available")
+def test_fast_loader_equivalent(tmp_path, monkeypatch):
+    """Test the C loader gives the same result as the pure Python loader."""
+    monkeypatch.setenv("HA_TEST_ENV", "from env")
+    config = tmp_path / YAML_CONFIG_FILE
+    config.write_text(
+        """
+homeassistant:
+  name: Home
+  latitude: 32.87336
+  unit_system: metric
+  customize: !include customize.yaml
+empty:
+anchors:
+  base: &base
+    a: 1
+  merged:
+    <<: *base
+    b: [1, 2.5, "3", yes, null]
+multiline: |
+  line one
+  line two
+folded: >-
+  folded
+  text
+env: !env_var HA_TEST_ENV
+password: !secret password
+automation:
+  - alias: Wake up
+    trigger:
+      platform: time
+      at: "07:00:00"
+    action:
+      - service: light.turn_on
+        data: {entity_id: light.bedroom, brightness: 255}
+input: !input some_input
+"""
+    )
+    (tmp_path / "customize.yaml").write_text("light.kitchen:\n  friendly_name: K\n")
+    (tmp_path / yaml.SECRET_YAML).write_text("password: pwhere\n")
+
+    _assert_same_annotations(
+        _parse_with(yaml_loader.FastSafeLoader, config),
+        _parse_with(yaml_loader.SafeLineLoader, config),
+    )
+
+
+@pytest.mark.skipif(not yaml_loader.HAS_C_LOADER, reason="libyaml not available")
+def test_fast_loader_equivalent_services():
+    """Test the C loader gives the same result for all service descriptions."""
+    components = os.path.join(os.path.dirname(yaml.__file__), "../../components")
+    paths = list(yaml_loader._find_files(components, "services.yaml"))
+    assert paths
+
+    for path in paths:
+        _assert_same_annotations(
+            _parse_with(yaml_loader.FastSafeLoader, path),
+            _parse_with(yaml_loader.SafeLineLoader, path),
+        )
+
+
+def test_fast_loader_errors_reported_like_python_loader(caplog):
+    """Test invalid YAML is reported by the pure Python loader."""
+    content = "key: value\n  bad: indentation"
+    with pytest.raises(yaml_loader.yaml.YAMLError) as python_error:
+        yaml_loader.yaml.load(io.StringIO(content), Loader=yaml_loader.SafeLineLoader)
+
+    with pytest.raises(HomeAssistantError) as err:
+        yaml.parse_yaml(io.StringIO(content))
+
+    assert str(err.value) == str(python_error.value)
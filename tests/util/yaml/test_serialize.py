@@ -0,0 +1,55 @@
+"""Test storing loaded YAML."""
+from datetime import date, datetime, time, timedelta
+
+import pytest
+
+from homeassistant.util.yaml import Input, parse_yaml, serialize
+from homeassistant.util.yaml.objects import NodeListClass, NodeStrClass
+
+
+def test_round_trip():
+    """Test the loaded types and their file references are kept."""
+    data = parse_yaml("light:\n  - platform: hue\n    name: Hall\n1: true")
+    data["light"][0]["input"] = Input("name")
+    data["extra"] = {
+        "tuple": (1, "a"),
+        "set": {2},
+        "string": NodeStrClass("included"),
+        "datetime": datetime(2021, 1, 2, 3, 4, 5),
+        "date": date(2021, 1, 2),
+        "time": time(3, 4),
+        "timedelta": timedelta(minutes=5),
+    }
+    setattr(data["extra"]["string"], "__config_file__", "other.yaml")
+    setattr(data["extra"]["string"], "__line__", 2)
+
+    restored = serialize.loads(serialize.dumps(data))
+
+    assert restored == data
+    assert restored is not data
+    assert type(restored["light"]) is NodeListClass
+    assert restored["light"].__line__ == 1
+    assert restored["light"][0].__line__ == 1
+    assert type(restored["extra"]) is dict
+    assert type(restored["extra"]["string"]) is NodeStrClass
+    assert restored["extra"]["string"].__config_file__ == "other.yaml"
+    assert restored["extra"]["string"].__line__ == 2
+
+
+def test_extension_types():
+    """Test types not known are stored through the default and object hook."""
+
+    class Custom:
+        def __init__(self, value):
+            self.value = value
+
+    with pytest.raises(TypeError):
+        serialize.dumps([Custom(1)])
+
+    stored = serialize.dumps([Custom([1, 2])], lambda obj: ("custom", obj.value))
+
+    with pytest.raises(TypeError):
+        serialize.loads(stored)
+
+    (restored,) = serialize.loads(stored, lambda tag, value: Custom(value))
+    assert restored.value == [1, 2]